@@ -3,6 +3,8 @@ __version__ = get_versions()['version']
 del get_versions
 
 from arkouda.client import *
+from arkouda.expression import *
+from arkouda import aio
 from arkouda.client_dtypes import *
 from arkouda.dtypes import *
 from arkouda.pdarrayclass import *
@@ -14,6 +16,7 @@ from arkouda.pdarrayIO import *
 from arkouda.groupbyclass import *
 from arkouda.strings import *
 from arkouda.join import *
+from arkouda.sketches import *
 from arkouda.categorical import *
 from arkouda.logger import *
 from arkouda.timeclass import *
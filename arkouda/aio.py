@@ -0,0 +1,298 @@
+"""
+Asynchronous (asyncio) interface to the Arkouda server.
+
+Requests are sent over a ``zmq.asyncio`` DEALER socket, so several requests
+issued by one process may be in flight at once; each returns an awaitable
+that resolves when the server replies. The connection parameters (server
+url, user and token) are taken from the synchronous client, so ak.connect()
+must be called first.
+
+Composite operations such as ``read`` and ``GroupBy``, which send several
+dependent messages, run the synchronous implementation on a pool of worker
+threads that each own a socket, so they do not block the event loop.
+
+Examples
+--------
+>>> import asyncio
+>>> ak.connect()
+>>> async def main():
+...     a = ak.arange(10)
+...     b, c = await asyncio.gather(ak.aio.to_ndarray(a),
+...                                 ak.aio.generic_msg('getconfig'))
+...     return b
+>>> asyncio.run(main())
+array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+"""
+import asyncio
+import collections
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast, Any, Callable, Deque, Optional, Tuple, Union
+import numpy as np # type: ignore
+import zmq # type: ignore
+import zmq.asyncio # type: ignore
+from arkouda import client
+from arkouda.dtypes import get_server_byteorder
+from arkouda.logger import getArkoudaLogger
+from arkouda.message import RequestMessage, MessageFormat
+
+__all__ = ["generic_msg", "to_ndarray", "read", "GroupBy", "run", "close"]
+
+# number of worker threads available to composite operations
+maxWorkersDefVal = 4
+maxWorkers = maxWorkersDefVal
+
+logger = getArkoudaLogger(name='Arkouda Async Client')
+
+class _Connection:
+    """
+    A DEALER socket connected to the Arkouda server, along with the futures
+    of the requests awaiting replies. The server replies to the requests of
+    a socket in the order they were sent, so the futures are resolved in
+    FIFO order by a single reader task.
+    """
+
+    def __init__(self, pspStr : str) -> None:
+        self.pspStr = pspStr
+        self.loop = asyncio.get_running_loop()
+        self.context = zmq.asyncio.Context.instance()
+        self.socket = self.context.socket(zmq.DEALER)
+        self.socket.connect(pspStr)
+        self.pending : Deque[Tuple[asyncio.Future, bool]] = collections.deque()
+        self.send_lock = asyncio.Lock()
+        self.reader : Optional[asyncio.Task] = None
+
+    async def request(self, frames : list, recv_binary : bool) -> Union[str, memoryview]:
+        future = self.loop.create_future()
+        # registering the future and sending the request must not interleave
+        # with another request, so that the FIFO matches the send order
+        async with self.send_lock:
+            self.pending.append((future, recv_binary))
+            try:
+                await self.socket.send_multipart(frames, copy=False)
+            except BaseException:
+                self.pending.pop()
+                raise
+        if self.reader is None or self.reader.done():
+            self.reader = self.loop.create_task(self._read_replies())
+        return await future
+
+    async def _read_replies(self) -> None:
+        while self.pending:
+            try:
+                # the first frame is the empty delimiter of the REQ/REP envelope
+                frames = await self.socket.recv_multipart(copy=False)
+            except BaseException as e:
+                # the socket is unusable, so fail every outstanding request
+                while self.pending:
+                    future, _ = self.pending.popleft()
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+            future, recv_binary = self.pending.popleft()
+            if future.cancelled():
+                continue
+            try:
+                if recv_binary:
+                    future.set_result(client._process_binary_reply(frames[-1]))
+                else:
+                    future.set_result(client._process_string_reply(frames[-1].bytes.decode()))
+            except (RuntimeError, ValueError) as e:
+                future.set_exception(e)
+
+    def close(self) -> None:
+        if self.reader is not None:
+            self.reader.cancel()
+        self.socket.close(linger=0)
+
+_connection : Optional[_Connection] = None
+_executor : Optional[ThreadPoolExecutor] = None
+_executorPspStr = ''
+
+def _get_connection() -> _Connection:
+    global _connection
+    if not client.connected:
+        raise RuntimeError("client is not connected to a server")
+    if _connection is None or _connection.pspStr != client.pspStr or \
+            _connection.loop is not asyncio.get_running_loop():
+        if _connection is not None:
+            _connection.close()
+        _connection = _Connection(client.pspStr)
+    return _connection
+
+def _init_worker(pspStr : str) -> None:
+    sock = client.context.socket(zmq.REQ)
+    sock.connect(pspStr)
+    client._local.socket = sock
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executorPspStr
+    if not client.connected:
+        raise RuntimeError("client is not connected to a server")
+    if _executor is None or _executorPspStr != client.pspStr:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executorPspStr = client.pspStr
+        _executor = ThreadPoolExecutor(max_workers=maxWorkers,
+                                       thread_name_prefix='arkouda-aio',
+                                       initializer=_init_worker,
+                                       initargs=(client.pspStr,))
+    return _executor
+
+async def generic_msg(cmd : str, args : str=None, payload : memoryview=None,
+                      send_binary : bool=False,
+                      recv_binary : bool=False) -> Union[str, memoryview]:
+    """
+    Sends a binary or string message composed of a command and corresponding
+    arguments to the arkouda_server without blocking the event loop, returning
+    the response sent by the server once it arrives.
+
+    Parameters
+    ----------
+    cmd : str
+        The server-side command to be executed
+    args : str
+        A space-delimited list of command arguments
+    payload : memoryview
+        The payload when sending binary data
+    send_binary : bool
+        Indicates if the message to be sent is a string or binary
+    recv_binary : bool
+        Indicates if the return message will be a string or binary
+
+    Returns
+    -------
+    Union[str, memoryview]
+        The string or binary return message
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the client is not connected to the server or if
+        there is a server-side error thrown
+    ValueError
+        Raised if the return message is malformed JSON or is missing 1..n
+        expected fields
+
+    Notes
+    -----
+    Commands sent with this function are not queued by an active ak.batch()
+    context, and arguments must not refer to pdarrays that are pending within
+    such a context.
+    """
+    conn = _get_connection()
+    client._update_metadata_cache(cmd, args)
+    if send_binary:
+        assert payload is not None
+        message = RequestMessage(user=client.username, token=client.token, cmd=cmd,
+                                 format=MessageFormat.BINARY, args=args)
+        logger.debug('sending message {}'.format(message))
+        frames = [b'', '{}BINARY_PAYLOAD'.format(json.dumps(message.asdict())).encode(),
+                  payload]
+    else:
+        assert payload is None
+        message = RequestMessage(user=client.username, token=client.token, cmd=cmd,
+                                 format=MessageFormat.STRING, args=args)
+        logger.debug('sending message {}'.format(message))
+        frames = [b'', json.dumps(message.asdict()).encode()]
+    try:
+        return await conn.request(frames, recv_binary)
+    finally:
+        client._update_metadata_cache(cmd, args)
+
+async def to_ndarray(pda) -> np.ndarray:
+    """
+    Awaitable variant of pdarray.to_ndarray. Arrays larger than
+    client.transferChunkBytes are streamed in chunks, with at most
+    client.transferWindow chunks in flight.
+
+    Parameters
+    ----------
+    pda : pdarray
+        The array to transfer to the client
+
+    Returns
+    -------
+    np.ndarray
+        A numpy ndarray with the same attributes and data as the pdarray
+
+    Raises
+    ------
+    RuntimeError
+        Raised if there is a server-side error thrown or if the bytes
+        received does not match expected number of bytes
+    """
+    if pda.size * pda.dtype.itemsize <= client.transferChunkBytes:
+        data = await generic_msg(cmd="tondarray", args="{}".format(pda.name), recv_binary=True)
+        return pda._ndarray_from_reply(cast(memoryview, data))
+
+    out = np.empty(pda.size, dtype=pda.dtype)
+    # The server sends us native-endian data; numpy swaps bytes on assignment
+    dt = np.dtype(pda.dtype).newbyteorder('>' if get_server_byteorder() == 'big' else '<')
+    step = max(1, client.transferChunkBytes // dt.itemsize)
+    window = asyncio.Semaphore(max(1, client.transferWindow))
+
+    async def transfer(start : int) -> None:
+        count = min(step, pda.size - start)
+        async with window:
+            data = await generic_msg(cmd="tondarrayChunk",
+                                     args="{} {} {}".format(pda.name, start, count),
+                                     recv_binary=True)
+        buf = cast(memoryview, data)
+        if len(buf) != count * dt.itemsize:
+            raise RuntimeError("Expected {} bytes but received {}".\
+                               format(count * dt.itemsize, len(buf)))
+        out[start:start + count] = np.frombuffer(buf, dt)
+
+    await asyncio.gather(*[transfer(start) for start in range(0, pda.size, step)])
+    return out
+
+async def run(func : Callable, *args, **kwargs) -> Any:
+    """
+    Runs a synchronous arkouda function on a worker thread with its own
+    connection to the server, returning its result once it completes.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to run, e.g. ak.argsort
+    *args, **kwargs
+        The arguments passed to func
+
+    Returns
+    -------
+    Any
+        The value returned by func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(),
+                                      functools.partial(func, *args, **kwargs))
+
+async def read(*args, **kwargs) -> Any:
+    """
+    Awaitable variant of ak.read; accepts the same arguments.
+    """
+    from arkouda.pdarrayIO import read as _read
+    return await run(_read, *args, **kwargs)
+
+async def GroupBy(*args, **kwargs) -> Any:
+    """
+    Awaitable variant of the ak.GroupBy constructor; accepts the same
+    arguments and returns the constructed GroupBy.
+    """
+    from arkouda.groupbyclass import GroupBy as _GroupBy
+    return await run(_GroupBy, *args, **kwargs)
+
+def close() -> None:
+    """
+    Closes the asynchronous connection and shuts down the worker threads.
+    They are re-created on the next request.
+    """
+    global _connection, _executor
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
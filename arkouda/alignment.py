@@ -1,9 +1,10 @@
 import numpy as np
 
+from arkouda.client import generic_msg
 from arkouda.strings import Strings
-from arkouda.pdarrayclass import pdarray, is_sorted
+from arkouda.pdarrayclass import pdarray, is_sorted, create_pdarray
 from arkouda.pdarraycreation import array, arange, ones, zeros
-from arkouda.pdarraysetops import concatenate, unique, in1d, argsort
+from arkouda.pdarraysetops import concatenate, unique, in1d, argsort, IN1D_METHODS
 from arkouda.numeric import cumsum
 from arkouda.categorical import Categorical
 from arkouda.groupbyclass import GroupBy, broadcast
@@ -100,7 +101,7 @@ class NonUniqueError(ValueError):
     pass
 
 
-def in1dmulti(a, b, assume_unique=False, symmetric=False):
+def in1dmulti(a, b, assume_unique=False, symmetric=False, method='auto'):
     """
     The multi-level analog of ak.in1d -- test membership of rows of a in the set of rows of b.
 
@@ -112,6 +113,9 @@ def in1dmulti(a, b, assume_unique=False, symmetric=False):
         Rows are elements of the set in which to test membership
     assume_unique : bool
         If true, assume rows of a and b are each unique and sorted. By default, sort and unique them explicitly.
+    method : str
+        'auto', 'hash', 'sort', or 'bloom'; see ak.in1d. Unless assume_unique is true, the rows are tested by
+        the server, by a 128-bit hash of each row.
 
     Returns
     -------
@@ -125,50 +129,58 @@ def in1dmulti(a, b, assume_unique=False, symmetric=False):
         if type(a) != type(b):
             raise TypeError("Arguments must have same type")
         if symmetric:
-            return in1d(a, b), in1d(b, a)
+            return in1d(a, b, method=method), in1d(b, a, method=method)
         else:
-            return in1d(a, b)
+            return in1d(a, b, method=method)
     atypes = np.array([ai.dtype for ai in a])
     btypes = np.array([bi.dtype for bi in b])
     if not (atypes == btypes).all():
         raise TypeError("Array dtypes of arguments must match")
     if not assume_unique:
-        ag = GroupBy(a)
-        ua = ag.unique_keys
-        bg = GroupBy(b)
-        ub = bg.unique_keys
-    else:
-        ua = a
-        ub = b
+        if symmetric:
+            return _in1d_rows(a, b, method), _in1d_rows(b, a, method)
+        return _in1d_rows(a, b, method)
     # Key for deinterleaving result
-    isa = concatenate((ones(ua[0].size, dtype=akbool), zeros(ub[0].size, dtype=akbool)), ordered=False)
-    c = [concatenate(x, ordered=False) for x in zip(ua, ub)]
+    isa = concatenate((ones(a[0].size, dtype=akbool), zeros(b[0].size, dtype=akbool)), ordered=False)
+    c = [concatenate(x, ordered=False) for x in zip(a, b)]
     g = GroupBy(c)
     k, ct = g.count()
-    if assume_unique:
-        # need to verify uniqueness, otherwise answer will be wrong
-        if (g.sum(isa)[1] > 1).any():
-            raise NonUniqueError("Called with assume_unique=True, but first argument is not unique")
-        if (g.sum(~isa)[1] > 1).any():
-            raise NonUniqueError("Called with assume_unique=True, but second argument is not unique")
+    # need to verify uniqueness, otherwise answer will be wrong
+    if (g.sum(isa)[1] > 1).any():
+        raise NonUniqueError("Called with assume_unique=True, but first argument is not unique")
+    if (g.sum(~isa)[1] > 1).any():
+        raise NonUniqueError("Called with assume_unique=True, but second argument is not unique")
     # Where value appears twice, it is present in both a and b
     # truth = answer in c domain
     truth = g.broadcast(ct == 2, permute=True)
-    if assume_unique:
-        # Deinterleave truth into a and b domains
-        if symmetric:
-            return truth[isa], truth[~isa]
-        else:
-            return truth[isa]
+    # Deinterleave truth into a and b domains
+    if symmetric:
+        return truth[isa], truth[~isa]
     else:
-        # If didn't start unique, first need to deinterleave into ua domain,
-        # then broadcast to a domain
-        atruth = ag.broadcast(truth[isa], permute=True)
-        if symmetric:
-            btruth = bg.broadcast(truth[~isa], permute=True)
-            return atruth, btruth
-        else:
-            return atruth
+        return truth[isa]
+
+
+def _in1d_rows(a, b, method):
+    """
+    Tests the rows of a for membership in the rows of b on the server.
+    """
+    from arkouda.join import _join_columns
+
+    if method not in IN1D_METHODS:
+        raise ValueError(f"method must be one of {IN1D_METHODS}")
+    acols, akinds = _join_columns(a)
+    bcols, bkinds = _join_columns(b)
+    if akinds != bkinds:
+        raise TypeError("Array dtypes of arguments must match")
+    if acols[0].size == 0:
+        return zeros(0, dtype=akbool)
+    if bcols[0].size == 0:
+        return zeros(acols[0].size, dtype=akbool)
+    repMsg = generic_msg(cmd="in1dMulti", args="{} {} {} {} {}".format(
+        False, method, len(acols),
+        ' '.join(c.name for c in acols),
+        ' '.join(c.name for c in bcols)))
+    return create_pdarray(repMsg)
 
 
 def lookup(keys, values, arguments, fillvalue=-1):
@@ -405,7 +405,7 @@ class Categorical:
         return categoriesendswith[self.codes]
 
     @typechecked
-    def in1d(self, test : Union[Strings,Categorical]) -> pdarray:
+    def in1d(self, test : Union[Strings,Categorical], method : str='auto') -> pdarray:
         """
         Test whether each element of the Categorical object is 
         also present in the test Strings or Categorical object.
@@ -417,6 +417,8 @@ class Categorical:
         ----------
         test : Union[Strings,Categorical]
             The values against which to test each value of 'self`.
+        method : str
+            How the categories are tested; see `ak.in1d`.
 
         Returns
         -------
@@ -454,9 +456,9 @@ class Categorical:
         reset_cat = self if self.uses_all_categories else self.reset_categories()
         if isinstance(test, Categorical):
             reset_test = test if test.uses_all_categories else test.reset_categories()
-            categoriesisin = in1d(reset_cat.categories, reset_test.categories)
+            categoriesisin = in1d(reset_cat.categories, reset_test.categories, method=method)
         else:
-            categoriesisin = in1d(reset_cat.categories, test)
+            categoriesisin = in1d(reset_cat.categories, test, method=method)
         return categoriesisin[reset_cat.codes]
 
     def unique(self) -> Categorical:
@@ -1,5 +1,7 @@
-import json, os
-from typing import cast, Mapping, Optional, Tuple, Union
+from __future__ import annotations
+import json, os, re, threading, weakref
+from itertools import count
+from typing import cast, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 import warnings
 import zmq # type: ignore
 import pyfiglet # type: ignore
@@ -8,12 +10,15 @@ from arkouda.logger import getArkoudaLogger
 from arkouda.message import RequestMessage, MessageFormat, ReplyMessage, \
      MessageType
 
-__all__ = ["connect", "disconnect", "shutdown", "get_config", "get_mem_used", "get_server_commands", "print_server_commands", "ruok"]
+__all__ = ["connect", "disconnect", "shutdown", "get_config", "get_mem_used", "get_server_commands", "print_server_commands", "ruok",
+           "batch"]
 
 # stuff for zmq connection
 pspStr = ''
 context = zmq.Context()
 socket = context.socket(zmq.REQ)
+# per-thread sockets used by the worker threads of arkouda.aio
+_local = threading.local()
 connected = False
 serverConfig = None
 # username and token for when basic authentication is enabled
@@ -27,8 +32,62 @@ pdarrayIterThreshDefVal = 100
 pdarrayIterThresh  = pdarrayIterThreshDefVal
 maxTransferBytesDefVal = 2**30
 maxTransferBytes = maxTransferBytesDefVal
+# size of the chunks and number of chunks in flight for streaming array transfers
+transferChunkBytesDefVal = 2**24
+transferChunkBytes = transferChunkBytesDefVal
+transferWindowDefVal = 4
+transferWindow = transferWindowDefVal
+# number of commands an ak.batch() context queues before sending them to the server
+batchMaxCommandsDefVal = 1024
+batchMaxCommands = batchMaxCommandsDefVal
+# number of deletions of out-of-scope pdarrays deferred before they are sent to the server
+deleteThresholdDefVal = 128
+deleteThreshold = deleteThresholdDefVal
+# request binary-encoded replies if the server supports them, negotiated on connect
+binaryRepliesDefVal = True
+binaryReplies = binaryRepliesDefVal
+_binary_replies = False
 regexMaxCaptures: int = -1
 
+class _MetadataCache:
+    """
+    Client-side cache of server metadata that does not change while the
+    client is connected to a server: the server byteorder, the server
+    commands, the registered objects, and the info entries (dtype, size, shape, registration status)
+    of the objects queried with ak.information. The registry and the info
+    entries are dropped whenever a command changes the registry, and
+    everything is dropped on connect, disconnect and shutdown.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.byteorder : Optional[str] = None
+        self.commands : Optional[Dict[str, str]] = None
+        self.clear_registry()
+
+    def clear_registry(self) -> None:
+        self.registry : Optional[List[Dict]] = None
+        self.entries : Dict[str, Dict] = {}
+
+_metadata_cache = _MetadataCache()
+
+"""
+Commands that add objects to or remove objects from the registry, which
+invalidate the registry and info entries held by the metadata cache.
+"""
+REGISTRY_CMDS = frozenset(["register", "unregister", "clear"])
+
+def _update_metadata_cache(cmd : str, args : Optional[str]) -> None:
+    """
+    Drops the cached metadata a command may invalidate.
+    """
+    if cmd in REGISTRY_CMDS:
+        _metadata_cache.clear_registry()
+    elif cmd == "delete" and args:
+        _metadata_cache.entries.pop(args, None)
+
 logger = getArkoudaLogger(name='Arkouda Client') 
 clientLogger = getArkoudaLogger(name='Arkouda User Logger', logFormat='%(message)s')   
 
@@ -39,17 +98,24 @@ print('Client Version: {}'.format(__version__)) # type: ignore
 # reset settings to default values
 def set_defaults() -> None:
     """
-    Sets client variables including verbose, maxTransferBytes and 
-    pdarrayIterThresh to default values.
+    Sets client variables including verbose, maxTransferBytes, 
+    pdarrayIterThresh, batchMaxCommands, transferChunkBytes, 
+    transferWindow, deleteThreshold and binaryReplies to default values.
     
     Returns
     -------
     None
     """
-    global verbose, maxTransferBytes, pdarrayIterThresh
+    global verbose, maxTransferBytes, pdarrayIterThresh, batchMaxCommands, \
+           transferChunkBytes, transferWindow, deleteThreshold, binaryReplies
     verbose = verboseDefVal
     pdarrayIterThresh  = pdarrayIterThreshDefVal
     maxTransferBytes = maxTransferBytesDefVal
+    batchMaxCommands = batchMaxCommandsDefVal
+    transferChunkBytes = transferChunkBytesDefVal
+    transferWindow = transferWindowDefVal
+    deleteThreshold = deleteThresholdDefVal
+    binaryReplies = binaryRepliesDefVal
 
 # create context, request end of socket, and connect to it
 def connect(server : str="localhost", port : int=5555, timeout : int=0, 
@@ -92,10 +158,16 @@ def connect(server : str="localhost", port : int=5555, timeout : int=0,
     On success, prints the connected address, as seen by the server. If called
     with an existing connection, the socket will be re-initialized.
     """
-    global context, socket, pspStr, connected, serverConfig, verbose, username, token, regexMaxCaptures
+    global context, socket, pspStr, connected, serverConfig, verbose, username, token, regexMaxCaptures, \
+           _active_batch, _binary_replies
 
     logger.debug("ZMQ version: {}".format(zmq.zmq_version()))
 
+    # commands queued against a previous connection cannot be replayed
+    _active_batch = None
+    # replies are JSON-formatted until binary replies are negotiated
+    _binary_replies = False
+
     if connect_url:
         url_values = _parse_url(connect_url)
         server = url_values[0]
@@ -142,6 +214,9 @@ def connect(server : str="localhost", port : int=5555, timeout : int=0,
     logger.debug("[Python] Received response: {}".format(str(return_message)))
     connected = True
 
+    # deletions deferred while connected to a previous server are moot
+    del _pending_deletes[:]
+    _metadata_cache.clear()
     serverConfig = _get_config_msg()
     if serverConfig['arkoudaVersion'] != __version__:
         warnings.warn(('Version mismatch between client ({}) and server ({}); ' +
@@ -149,6 +224,8 @@ def connect(server : str="localhost", port : int=5555, timeout : int=0,
                       'incorrectly! Updating arkouda is strongly recommended.').\
                       format(__version__, serverConfig['arkoudaVersion']), RuntimeWarning)
     regexMaxCaptures = serverConfig['regexMaxCaptures']  # type:ignore
+    # servers that do not report binaryReplies only send JSON-formatted replies
+    _binary_replies = binaryReplies and bool(serverConfig.get('binaryReplies', False))
     clientLogger.info(return_message)
 
 def _parse_url(url : str) -> Tuple[str,int,Optional[str]]:
@@ -297,6 +374,100 @@ def _start_tunnel(addr : str, tunnel_server : str) -> Tuple[str,object]:
     except Exception as e:
         raise ConnectionError(e)
 
+def _get_socket() -> zmq.Socket:
+    """
+    Returns the socket used for requests from the calling thread: the worker 
+    threads of arkouda.aio each own a socket, all other threads share the
+    module-level socket.
+    """
+    return getattr(_local, 'socket', socket)
+
+def _process_string_reply(raw_message : str) -> str:
+    """
+    Parses a JSON-formatted ReplyMessage, raising server-side errors and 
+    emitting server-side warnings.
+
+    Parameters
+    ----------
+    raw_message : str
+        The JSON-formatted reply sent by the Arkouda server
+
+    Returns
+    -------
+    str
+        The msg field of the reply
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the reply is an error message
+    ValueError
+        Raised if the reply is malformed JSON or is missing 1..n expected fields
+    """
+    try:
+        return_message = ReplyMessage.fromdict(json.loads(raw_message))
+
+        # raise errors or warnings sent back from the server
+        if return_message.msgType == MessageType.ERROR:
+            raise RuntimeError(return_message.msg)
+        elif return_message.msgType == MessageType.WARNING:
+            warnings.warn(return_message.msg)
+        return return_message.msg
+    except KeyError as ke:
+        raise ValueError('Return message is missing the {} field'.format(ke))
+    except json.decoder.JSONDecodeError:
+        raise ValueError('{} is not valid JSON, may be server-side error'.\
+                         format(raw_message))
+
+def _process_encoded_reply(raw_message : bytes) -> str:
+    """
+    Parses a reply to a request for a binary-encoded reply, raising server-side
+    errors and emitting server-side warnings. Replies the server sends before
+    parsing the request are JSON-formatted regardless.
+
+    Parameters
+    ----------
+    raw_message : bytes
+        The binary-encoded or JSON-formatted reply sent by the Arkouda server
+
+    Returns
+    -------
+    str
+        The msg field of the reply, a CreatedReply holding the attributes of
+        the created entries if the reply describes any
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the reply is an error message
+    ValueError
+        Raised if the reply is malformed
+    """
+    if raw_message[:1] == b'{':
+        return _process_string_reply(raw_message.decode())
+    return_message = ReplyMessage.frombinary(raw_message)
+    if return_message.msgType == MessageType.ERROR:
+        raise RuntimeError(return_message.msg)
+    elif return_message.msgType == MessageType.WARNING:
+        warnings.warn(return_message.msg)
+    return return_message.msg
+
+def _process_binary_reply(frame : zmq.Frame) -> memoryview:
+    """
+    Returns a view of a binary reply, raising the error the server sent 
+    in place of the binary data, if any.
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the reply is an error message
+    """
+    view = frame.buffer
+    # raise errors sent back from the server
+    if bytes(view[0:len(b"Error:")]) == b"Error:":
+        raise RuntimeError(frame.bytes.decode())
+    return view
+
 def _send_string_message(cmd : str, recv_binary : bool=False,
                          args : str=None) -> Union[str, memoryview]:
     """
@@ -327,36 +498,26 @@ def _send_string_message(cmd : str, recv_binary : bool=False,
         Raised if the return message is malformed JSON or is missing 1..n
         expected fields       
     """
+    binary_reply = _binary_replies and not recv_binary
     message = RequestMessage(user=username, token=token, cmd=cmd, 
-                          format=MessageFormat.STRING, args=args)
+                          format=MessageFormat.STRING, args=args,
+                          replyFormat=MessageFormat.BINARY if binary_reply else MessageFormat.STRING)
 
     logger.debug('sending message {}'.format(message))
 
-    socket.send_string(json.dumps(message.asdict()))
-
-    if recv_binary:
-        frame = socket.recv(copy=False)
-        view = frame.buffer
-        # raise errors sent back from the server
-        if bytes(view[0:len(b"Error:")]) == b"Error:":
-            raise RuntimeError(frame.bytes.decode())
-        return view
-    else:
-        raw_message = socket.recv_string()
-        try:
-            return_message = ReplyMessage.fromdict(json.loads(raw_message))
+    sock = _get_socket()
+    _local.sending = True
+    try:
+        sock.send_string(json.dumps(message.asdict()))
 
-            # raise errors or warnings sent back from the server
-            if return_message.msgType == MessageType.ERROR:
-                raise RuntimeError(return_message.msg)
-            elif return_message.msgType == MessageType.WARNING:
-                warnings.warn(return_message.msg)
-            return return_message.msg
-        except KeyError as ke:
-            raise ValueError('Return message is missing the {} field'.format(ke))
-        except json.decoder.JSONDecodeError:
-            raise ValueError('Return message is not valid JSON: {}'.\
-                             format(raw_message))
+        if recv_binary:
+            return _process_binary_reply(sock.recv(copy=False))
+        elif binary_reply:
+            return _process_encoded_reply(sock.recv())
+        else:
+            return _process_string_reply(sock.recv_string())
+    finally:
+        _local.sending = False
 
 
 def _send_binary_message(cmd : str, payload : memoryview, recv_binary : bool=False,
@@ -392,38 +553,29 @@ def _send_binary_message(cmd : str, payload : memoryview, recv_binary : bool=Fal
         Raised if the return message is malformed JSON or is missing 1..n
         expected fields
     """
+    binary_reply = _binary_replies and not recv_binary
     message = RequestMessage(user=username, token=token, cmd=cmd, 
-                                format=MessageFormat.BINARY, args=args)
+                                format=MessageFormat.BINARY, args=args,
+                                replyFormat=MessageFormat.BINARY if binary_reply \
+                                                                 else MessageFormat.STRING)
 
     logger.debug('sending message {}'.format(message))
 
-    socket.send('{}BINARY_PAYLOAD'.format(json.dumps(message.asdict())).encode(),
-                flags=zmq.SNDMORE)
-    socket.send(payload, copy=False)
-
-    if recv_binary:
-        frame = socket.recv(copy=False)
-        view = frame.buffer
-        # raise errors sent back from the server
-        if bytes(view[0:len(b"Error:")]) == b"Error:":
-            raise RuntimeError(frame.bytes.decode())
-        return view
-    else:
-        raw_message = socket.recv_string()
-        try:
-            return_message = ReplyMessage.fromdict(json.loads(raw_message))
-
-            # raise errors or warnings sent back from the server
-            if return_message.msgType == MessageType.ERROR:
-                raise RuntimeError(return_message.msg)
-            elif return_message.msgType == MessageType.WARNING:
-                warnings.warn(return_message.msg)
-            return return_message.msg
-        except KeyError as ke:
-            raise ValueError('Return message is missing the {} field'.format(ke))
-        except json.decoder.JSONDecodeError:
-            raise ValueError('{} is not valid JSON, may be server-side error'.\
-                             format(raw_message))
+    sock = _get_socket()
+    _local.sending = True
+    try:
+        sock.send('{}BINARY_PAYLOAD'.format(json.dumps(message.asdict())).encode(),
+                  flags=zmq.SNDMORE)
+        sock.send(payload, copy=False)
+
+        if recv_binary:
+            return _process_binary_reply(sock.recv(copy=False))
+        elif binary_reply:
+            return _process_encoded_reply(sock.recv())
+        else:
+            return _process_string_reply(sock.recv_string())
+    finally:
+        _local.sending = False
 
 # message arkouda server the client is disconnecting from the server
 def disconnect() -> None:
@@ -439,9 +591,20 @@ def disconnect() -> None:
     ConnectionError
         Raised if there's an error disconnecting from the Arkouda server
     """
-    global socket, pspStr, connected, serverConfig, verbose, token
+    global socket, pspStr, connected, serverConfig, verbose, token, _active_batch, _binary_replies
 
     if connected:
+        # send any commands still queued by an ak.batch() context
+        if _active_batch is not None:
+            try:
+                _active_batch.flush()
+            finally:
+                _active_batch = None
+        # send the deletions of out-of-scope pdarrays still deferred
+        try:
+            _flush_deletes()
+        except RuntimeError as e:
+            logger.error('error sending deferred deletions: {}'.format(e))
         # send disconnect message to server
         message = "disconnect"
         logger.debug("[Python] Sending request: {}".format(message))
@@ -453,6 +616,8 @@ def disconnect() -> None:
             raise ConnectionError(e)
         connected = False
         serverConfig = None
+        _binary_replies = False
+        _metadata_cache.clear()
         clientLogger.info(return_message)
     else:
         clientLogger.info("not connected; cannot disconnect")
@@ -477,7 +642,7 @@ def shutdown() -> None:
         Raised if the client is not connected to the Arkouda server or
         there is an error in disconnecting from the server
     """
-    global socket, pspStr, connected, serverConfig, verbose
+    global socket, pspStr, connected, serverConfig, verbose, _binary_replies
 
     if not connected:
         raise RuntimeError('not connected, cannot shutdown server')
@@ -494,9 +659,315 @@ def shutdown() -> None:
         raise RuntimeError(e)
     connected = False
     serverConfig = None
+    _binary_replies = False
+    del _pending_deletes[:]
+    _metadata_cache.clear()
+
+"""
+Commands whose replies are either discarded by the caller or consumed solely
+by create_pdarray, so they can be queued within an ak.batch() context and the
+reply resolved when the batch is sent to the server.
+"""
+BATCHABLE_CMDS = frozenset(["binopvv", "binopvs", "binopsv", "opeqvv", "opeqvs", "efunc",
+                            "[slice]", "[pdarray]", "[int]=val", "[pdarray]=val",
+                            "[pdarray]=pdarray", "[slice]=val", "[slice]=pdarray", "set",
+                            "create", "arange", "linspace", "randint", "randomNormal", "delete"])
+
+"""
+Commands the server processes outside of its command map, which therefore
+cannot be sent within a batch message
+"""
+_UNBATCHABLE_CMDS = frozenset(["array", "arrayChunk", "connect", "disconnect", "noop", "ruok",
+                               "shutdown", "batch"])
+
+"""
+Commands the server may run concurrently with the user's other read-only
+commands, as listed by RequestScheduler.isReadOnly, which therefore are not
+sent in a batch with the deferred deletions
+"""
+_READ_ONLY_CMDS = frozenset(["str", "repr", "info", "getconfig", "getmemused", "getCmdMap",
+                             "tondarray", "tondarrayChunk", "reduction", "[int]", "lsany",
+                             "getfiletype", "arrowIPC", "ruok", "noop"])
+
+_BATCH_PLACEHOLDER = re.compile(r'__batch_\d+__')
+_batch_ids = count()
+_active_batch = None
+
+def _is_batchable(cmd : str, args : Optional[str]) -> bool:
+    """
+    Indicates if the command can be deferred within an ak.batch() context
+    """
+    if cmd not in BATCHABLE_CMDS:
+        return False
+    # the hash efuncs return two "+"-delimited arrays, which the caller splits
+    return not (cmd == 'efunc' and cast(str, args).startswith('hash'))
+
+class BatchReply:
+    """
+    Placeholder for the reply to a command queued within an ak.batch() context.
+    The reply is available once the batch has been sent to the server; 
+    resolve() sends the batch if that has not already happened.
+
+    Attributes
+    ----------
+    placeholder : str
+        The name that refers to the entry created by the command until the
+        batch has been sent, valid as an argument to later batched commands
+    cmd : str
+        The server-side command
+    """
+    __slots__ = ('placeholder', 'cmd', '_batch', '_msg', '_error')
+
+    def __init__(self, placeholder : str, cmd : str, batch : Batch) -> None:
+        self.placeholder = placeholder
+        self.cmd = cmd
+        self._batch = batch
+        self._msg : Optional[str] = None
+        self._error : Optional[str] = None
+
+    @property
+    def resolved(self) -> bool:
+        return self._msg is not None or self._error is not None
+
+    def resolve(self) -> str:
+        """
+        Return the server reply, sending the queued batch first if needed
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the command, or an earlier command in the same batch,
+            resulted in a server-side error
+        """
+        if not self.resolved:
+            self._batch.flush()
+        if self._error is not None:
+            raise RuntimeError(self._error)
+        return cast(str, self._msg)
+
+    def __str__(self) -> str:
+        return self.resolve()
+
+class Batch:
+    """
+    Context manager that queues batchable commands client-side and sends them 
+    to the server as a single multi-command message, trading one round trip per 
+    command for one round trip per batch. Use via ak.batch().
+
+    Commands whose replies are needed immediately (e.g., reductions, to_ndarray,
+    or accessing the attributes of a pdarray created within the batch) send 
+    the queued commands first, so results are unchanged by batching.
+    """
+    def __init__(self, max_commands : Optional[int]=None) -> None:
+        self.max_commands = max_commands if max_commands else batchMaxCommands
+        self._queue : List[Tuple[str, str, str, BatchReply]] = []
+        self._names : Dict[str, str] = {}
+        self._tracked : List[weakref.ref] = []
+        self._depth = 0
+
+    def __enter__(self) -> Batch:
+        global _active_batch
+        self._depth += 1
+        _active_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        global _active_batch
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        _active_batch = None
+        try:
+            self.flush()
+        except Exception as e:
+            # don't mask the exception raised within the context
+            if exc_type is None:
+                raise e
+            logger.error('error sending batch while handling {}: {}'.format(exc_type.__name__, e))
+
+    def submit(self, cmd : str, args : Optional[str]) -> BatchReply:
+        """
+        Queue a command, sending the batch if max_commands are queued
+        """
+        reply = BatchReply('__batch_{}__'.format(next(_batch_ids)), cmd, self)
+        self._queue.append((reply.placeholder, cmd, args if args else '', reply))
+        if len(self._queue) >= self.max_commands:
+            self.flush()
+        return reply
+
+    def track(self, obj : object) -> None:
+        """
+        Register an object created from a BatchReply; its _resolve() method is
+        invoked when the batch is sent so that it refers to server-side names
+        """
+        self._tracked.append(weakref.ref(obj))
+
+    def substitute(self, args : str) -> str:
+        """
+        Replace placeholders of sent commands with the server-side names
+        """
+        return _BATCH_PLACEHOLDER.sub(lambda m: self._names.get(m.group(0), m.group(0)), args)
+
+    def flush(self) -> None:
+        """
+        Send the queued commands to the server and resolve their replies
+
+        Raises
+        ------
+        RuntimeError
+            Raised if a batched command resulted in a server-side error, in 
+            which case the remaining commands in the batch are not executed
+        """
+        if not self._queue:
+            return
+        queue, self._queue = self._queue, []
+        cmds : List[str] = []
+        for placeholder, cmd, args, _ in queue:
+            cmds.extend((placeholder, cmd, args))
+        logger.debug('sending batch of {} commands'.format(len(queue)))
+        raw_message = cast(str, _send_string_message(cmd='batch', 
+                                    args='{} {}'.format(len(queue), json.dumps(cmds))))
+        try:
+            replies = json.loads(raw_message)
+        except json.decoder.JSONDecodeError:
+            raise ValueError('Batch reply is not valid JSON: {}'.format(raw_message))
+
+        error = None
+        for i, (placeholder, cmd, _, reply) in enumerate(queue):
+            if i >= len(replies):
+                reply._error = 'batched {} not executed due to earlier error: {}'.\
+                                                                format(cmd, error)
+                continue
+            return_message = ReplyMessage.fromdict(json.loads(replies[i]))
+            if return_message.msgType == MessageType.ERROR:
+                reply._error = return_message.msg
+                error = return_message.msg
+                continue
+            if return_message.msgType == MessageType.WARNING:
+                warnings.warn(return_message.msg)
+            reply._msg = return_message.msg
+            if return_message.msg.startswith('created '):
+                self._names[placeholder] = return_message.msg.split()[1]
+
+        tracked, self._tracked = self._tracked, []
+        for ref in tracked:
+            obj = ref()
+            if obj is not None:
+                try:
+                    obj._resolve() # type: ignore
+                except RuntimeError:
+                    # the failed command's error is raised below
+                    pass
+        if error is not None:
+            raise RuntimeError(error)
+
+# names of out-of-scope pdarrays whose server-side deletion is deferred
+_pending_deletes : List[str] = []
+
+def _defer_delete(name : str) -> None:
+    """
+    Defers the deletion of the server-side array of an out-of-scope pdarray.
+    The deferred deletions are sent as a single delete message along with the
+    next command, or before it if it is read-only, once deleteThreshold
+    deletions are pending, or on disconnect.
+    Within an ak.batch() context the deletion is queued by the batch instead.
+    """
+    _metadata_cache.entries.pop(name, None)
+    if _active_batch is not None and not hasattr(_local, 'socket'):
+        generic_msg(cmd='delete', args=name)
+        return
+    _pending_deletes.append(name)
+    # __del__ may run while the thread is waiting for a reply, when the socket
+    # must not send, or on a thread that does not own the socket
+    if len(_pending_deletes) >= deleteThreshold and connected and \
+            not getattr(_local, 'sending', False) and not hasattr(_local, 'socket') and \
+            threading.current_thread() is threading.main_thread():
+        _flush_deletes()
+
+def _take_pending_deletes() -> List[str]:
+    """
+    Removes and returns the deferred deletions
+    """
+    names = _pending_deletes[:]
+    del _pending_deletes[:len(names)]
+    return names
+
+def _delete_args(names : List[str]) -> str:
+    return '{} {}'.format(len(names), json.dumps(names))
+
+def _flush_deletes() -> None:
+    """
+    Sends the deferred deletions to the server as a single delete message
+    """
+    names = _take_pending_deletes()
+    if names:
+        logger.debug('deleting {} pdarrays'.format(len(names)))
+        _send_string_message(cmd='delete', args=_delete_args(names))
+
+def _send_with_deletes(cmd : str, args : str) -> str:
+    """
+    Sends the deferred deletions and a command in a single batch message,
+    returning the reply to the command
+    """
+    names = _take_pending_deletes()
+    logger.debug('deleting {} pdarrays before {}'.format(len(names), cmd))
+    cmds = ['__batch_{}__'.format(next(_batch_ids)), 'delete', _delete_args(names),
+            '__batch_{}__'.format(next(_batch_ids)), cmd, args if args else '']
+    raw_message = cast(str, _send_string_message(cmd='batch', 
+                                args='2 {}'.format(json.dumps(cmds))))
+    try:
+        replies = json.loads(raw_message)
+    except json.decoder.JSONDecodeError:
+        raise ValueError('Batch reply is not valid JSON: {}'.format(raw_message))
+    if len(replies) < 2:
+        # the deletions failed, so the command was not executed
+        logger.error('error deleting pdarrays: {}'.format(
+                                     ReplyMessage.fromdict(json.loads(replies[0])).msg))
+        return cast(str, _send_string_message(cmd=cmd, args=args))
+    return _process_string_reply(replies[1])
+
+def batch(max_commands : Optional[int]=None) -> Batch:
+    """
+    Return a context manager that queues commands and sends them to the 
+    arkouda_server in batches, reducing the number of client-server round trips
+    for sequences of small operations.
+
+    Parameters
+    ----------
+    max_commands : int, optional
+        The number of commands queued before the batch is sent. Defaults to
+        client.batchMaxCommands.
+
+    Returns
+    -------
+    Batch
+        The batch context; if a batch is already active it is returned so 
+        that nested contexts share one queue
+
+    Notes
+    -----
+    pdarrays created within the batch refer to their server-side arrays by
+    placeholder names until the batch is sent. Accessing attributes of such a 
+    pdarray (e.g., dtype or size), or invoking a command whose reply is needed 
+    immediately, sends the queued commands first. Server-side errors in batched
+    commands are raised when the batch is sent, and the commands queued after 
+    the failing command are not executed.
+
+    Examples
+    --------
+    >>> a = ak.arange(10)
+    >>> with ak.batch():
+    ...     b = a * a
+    ...     c = b + a
+    >>> c
+    array([0 2 6 12 20 30 42 56 72 90])
+    """
+    if _active_batch is not None:
+        return _active_batch
+    return Batch(max_commands=max_commands)
 
 def generic_msg(cmd : str, args : str=None, payload : memoryview=None, send_binary : bool=False,
-                recv_binary : bool=False) -> Union[str, memoryview]:
+                recv_binary : bool=False) -> Union[str, memoryview, BatchReply]:
     """
     Sends a binary or string message composed of a command and corresponding 
     arguments to the arkouda_server, returning the response sent by the server.
@@ -516,8 +987,9 @@ def generic_msg(cmd : str, args : str=None, payload : memoryview=None, send_bina
 
     Returns
     -------
-    Union[str, memoryview]
-        The string or binary return message
+    Union[str, memoryview, BatchReply]
+        The string or binary return message, or a BatchReply if the command
+        was queued by an active ak.batch() context
     
     Raises
     ------
@@ -537,8 +1009,27 @@ def generic_msg(cmd : str, args : str=None, payload : memoryview=None, send_bina
 
     if not connected:
         raise RuntimeError("client is not connected to a server")
+
+    _update_metadata_cache(cmd, args)
+
+    # the worker threads of arkouda.aio bypass the batch of the main thread
+    if _active_batch is not None and not hasattr(_local, 'socket'):
+        if not send_binary and not recv_binary and _is_batchable(cmd, args):
+            return _active_batch.submit(cmd, args)
+        # the reply is needed now, so the queued commands must run first
+        _active_batch.flush()
+        if args:
+            args = _active_batch.substitute(args)
     
     try:
+        # the deferred deletions of out-of-scope pdarrays are sent first, along
+        # with the command if possible; read-only commands would then be
+        # scheduled as writes, so the deletions are sent on their own before them
+        if _pending_deletes and not hasattr(_local, 'socket'):
+            if not send_binary and not recv_binary and cmd not in _UNBATCHABLE_CMDS \
+                    and cmd not in _READ_ONLY_CMDS:
+                return _send_with_deletes(cmd, args)
+            _flush_deletes()
         if send_binary:
             assert payload is not None
             return _send_binary_message(cmd=cmd, payload=payload,
@@ -550,9 +1041,114 @@ def generic_msg(cmd : str, args : str=None, payload : memoryview=None, send_bina
     except KeyboardInterrupt as e:
         # if the user interrupts during command execution, the socket gets out 
         # of sync reset the socket before raising the interrupt exception
-        socket = context.socket(zmq.REQ)
-        socket.connect(pspStr)
+        if hasattr(_local, 'socket'):
+            _local.socket = context.socket(zmq.REQ)
+            _local.socket.connect(pspStr)
+        else:
+            socket = context.socket(zmq.REQ)
+            socket.connect(pspStr)
         raise e
+    finally:
+        # another thread may have cached metadata while the command was running
+        _update_metadata_cache(cmd, args)
+
+def _get_transfer_socket() -> zmq.Socket:
+    """
+    Returns the DEALER socket the calling thread uses for streaming transfers,
+    (re)connecting it if the client connected to a different server since it
+    was created. Unlike the REQ socket, it may have several requests in flight.
+    """
+    if getattr(_local, 'transfer_pspStr', None) != pspStr:
+        if getattr(_local, 'transfer_socket', None) is not None:
+            _local.transfer_socket.close(linger=0)
+        _local.transfer_socket = context.socket(zmq.DEALER)
+        _local.transfer_socket.connect(pspStr)
+        _local.transfer_pspStr = pspStr
+    return _local.transfer_socket
+
+def _stream_chunks(cmd : str, chunks : Iterable[Tuple[str, Optional[memoryview]]],
+                   on_reply : Callable[[int, Union[str, memoryview]], None],
+                   recv_binary : bool=False) -> None:
+    """
+    Sends one request per chunk to the arkouda_server, with at most
+    transferWindow requests in flight, and passes each reply to on_reply
+    along with the index of its chunk as soon as it arrives. The user should
+    not call this function directly.
+
+    Parameters
+    ----------
+    cmd : str
+        The server-side command executed for every chunk
+    chunks : Iterable[Tuple[str, Optional[memoryview]]]
+        The arguments and, for binary requests, the payload of each chunk
+    on_reply : Callable[[int, Union[str, memoryview]], None]
+        Consumes the reply to a chunk; binary replies are only valid for the 
+        duration of the call
+    recv_binary : bool
+        Indicates if the replies will be strings or binary
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the client is not connected to the server or if there is a
+        server-side error thrown for any chunk. The replies to the chunks 
+        already in flight are received before the error is raised.
+    """
+    if not connected:
+        raise RuntimeError("client is not connected to a server")
+    # queued commands may create the arrays being transferred
+    if _active_batch is not None and not hasattr(_local, 'socket'):
+        _active_batch.flush()
+
+    sock = _get_transfer_socket()
+    window = max(1, transferWindow)
+    sent = 0
+    received = 0
+    error : Optional[Exception] = None
+
+    def receive() -> None:
+        nonlocal received, error
+        frames = sock.recv_multipart(copy=False)
+        index = received
+        received += 1
+        if error is not None:
+            return
+        try:
+            if recv_binary:
+                on_reply(index, _process_binary_reply(frames[-1]))
+            else:
+                on_reply(index, _process_string_reply(frames[-1].bytes.decode()))
+        except Exception as e:
+            error = e
+
+    try:
+        for args, payload in chunks:
+            if error is not None:
+                break
+            if payload is None:
+                message = RequestMessage(user=username, token=token, cmd=cmd,
+                                         format=MessageFormat.STRING, args=args)
+                sock.send_multipart([b'', json.dumps(message.asdict()).encode()])
+            else:
+                message = RequestMessage(user=username, token=token, cmd=cmd,
+                                         format=MessageFormat.BINARY, args=args)
+                sock.send_multipart([b'', '{}BINARY_PAYLOAD'.format(
+                                     json.dumps(message.asdict())).encode(), payload],
+                                    copy=False)
+            sent += 1
+            while sent - received >= window:
+                receive()
+        while received < sent:
+            receive()
+    except KeyboardInterrupt as e:
+        # replies still in flight would be read by the next transfer, so
+        # discard the socket before raising the interrupt exception
+        _local.transfer_socket.close(linger=0)
+        _local.transfer_socket = None
+        _local.transfer_pspStr = None
+        raise e
+    if error is not None:
+        raise error
 
 def get_config() -> Mapping[str, Union[str, int, float]]:
     """
@@ -633,14 +1229,24 @@ def get_server_commands() -> Mapping[str, str]:
     ValueError
         Raised if there's an error in parsing the JSON-formatted server string
     """
+    if _metadata_cache.commands is not None:
+        return _metadata_cache.commands
     try:
         raw_message = cast(str,generic_msg(cmd="getCmdMap"))
-        return json.loads(raw_message)
+        _metadata_cache.commands = json.loads(raw_message)
+        return _metadata_cache.commands
     except json.decoder.JSONDecodeError:
         raise ValueError('Returned config is not valid JSON: {}'.format(raw_message))
     except Exception as e:
         raise RuntimeError('{} in retrieving Arkouda server config'.format(e))
 
+def _server_has_command(cmd : str) -> bool:
+    """
+    Whether the server registered the command, which depends on the modules
+    it was built with
+    """
+    return cmd in get_server_commands()
+
 def print_server_commands():
     """
     Print the list of the available Server commands
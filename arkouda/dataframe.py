@@ -3,13 +3,15 @@ from __future__ import annotations
 from collections import UserDict
 from warnings import warn
 import pandas as pd  # type: ignore
+import numpy as np  # type: ignore
+import json
 import random
 
 from arkouda.segarray import SegArray
-from arkouda.pdarrayclass import pdarray
+from arkouda.pdarrayclass import pdarray, create_pdarray
 from arkouda.categorical import Categorical
 from arkouda.strings import Strings
-from arkouda.pdarraycreation import arange, array
+from arkouda.pdarraycreation import arange, array, zeros
 from arkouda.groupbyclass import GroupBy as akGroupBy
 from arkouda.pdarraysetops import concatenate, unique, intersect1d, in1d
 from arkouda.pdarrayIO import save_all
@@ -17,11 +19,13 @@ from arkouda.dtypes import int64 as akint64
 from arkouda.dtypes import float64 as akfloat64
 from arkouda.sorting import argsort, coargsort
 from arkouda.numeric import where
-from arkouda.client import maxTransferBytes
+from arkouda.client import maxTransferBytes, generic_msg, _server_has_command
 from arkouda.row import Row
 from arkouda.alignment import in1dmulti
 from arkouda.series import Series
 from arkouda.index import Index
+from arkouda.timeclass import Datetime
+from arkouda.join import join_keys
 
 # This is necessary for displaying DataFrames with BitVector columns,
 # because pandas _html_repr automatically truncates the number of displayed bits
@@ -62,6 +66,32 @@ class GroupBy:
     def count(self):
         return Series(self.gb.count())
 
+    def agg(self, aggregations, skipna=True):
+        """Apply several reductions to several columns in one request.
+
+        Parameters
+        ----------
+
+        aggregations : dict
+            Maps a column name to the name of a reduction operator or a list of names
+        skipna : bool
+            If True (default), ignore NaN values in float64 columns
+
+        Returns
+        -------
+        A dict that maps each column name to a dict that maps each of its operators
+        to a Series of one aggregate value per group.
+
+        See Also
+        --------
+        arkouda.GroupBy.agg
+        """
+
+        keys, results = self.gb.agg({col: (self.df.data[col], ops)
+                                     for col, ops in aggregations.items()}, skipna=skipna)
+        return {col: {op: Series((keys, res)) for op, res in colres.items()}
+                for col, colres in results.items()}
+
     def broadcast(self, x, permute=True):
         """Fill each group’s segment with a constant value.
 
@@ -452,7 +482,36 @@ class DataFrame(UserDict):
 
     @classmethod
     def from_pandas(cls, pd_df):
-        return DataFrame(initialdata=pd_df)
+        """
+        Copy a pandas DataFrame to an arkouda DataFrame.
+
+        Parameters
+        ----------
+        pd_df : pandas.DataFrame
+            The DataFrame to copy
+
+        Returns
+        -------
+        DataFrame
+            The arkouda DataFrame holding the columns of pd_df
+
+        Notes
+        -----
+        If pyarrow is installed, the server was built with Parquet support
+        and every column holds integers, floats, bools, strings, categories
+        of strings or timezone-naive datetimes without missing values, all
+        columns are sent to the server in a single Arrow IPC stream, and
+        categorical and datetime columns become Categorical and Datetime
+        columns. Otherwise the columns are sent one at a time.
+        """
+        columns = _from_arrow_ipc(pd_df)
+        if columns is None:
+            return DataFrame(initialdata=pd_df)
+        if isinstance(pd_df.index, pd.RangeIndex):
+            index = arange(pd_df.index.start, pd_df.index.stop, pd_df.index.step)
+        else:
+            index = pd_df.index.values.tolist()
+        return DataFrame(columns, index=index)
 
     def _drop_column(self, keys):
         """
@@ -1027,13 +1086,17 @@ class DataFrame(UserDict):
             return None
 
         # Proceed with conversion if possible, ignore index column
-        pandas_data = {}
-        for key in self._columns:
-            val = self[key]
-            try:
-                pandas_data[key] = val.to_ndarray()
-            except TypeError as e:
-                raise IndexError("Bad index type or format.")
+        table = self._to_arrow_table()
+        if table is not None:
+            pandas_data = {key: table.column(i).to_pandas() for i, key in enumerate(self._columns)}
+        else:
+            pandas_data = {}
+            for key in self._columns:
+                val = self[key]
+                try:
+                    pandas_data[key] = val.to_ndarray()
+                except TypeError as e:
+                    raise IndexError("Bad index type or format.")
 
         # Return a new dataframe with original indices if requested.
         if retain_index and self.index is not None:
@@ -1042,6 +1105,71 @@ class DataFrame(UserDict):
         else:
             return pd.DataFrame(data=pandas_data)
 
+    def to_arrow(self):
+        """
+        Send this DataFrame to a pyarrow Table, transferring all columns in a
+        single Arrow IPC stream.
+
+        Returns
+        -------
+        pyarrow.Table
+            The table holding the columns of this DataFrame; Strings become
+            string columns, Categoricals dictionary columns and Datetimes
+            timestamp columns
+
+        Raises
+        ------
+        ModuleNotFoundError
+            Raised if pyarrow is not installed
+        RuntimeError
+            Raised if the server was built without Parquet support, which
+            provides Arrow IPC
+        TypeError
+            Raised if a column is not a pdarray of int64, uint64, float64 or
+            bool dtype, Strings, Categorical or Datetime
+        """
+        try:
+            import pyarrow  # type: ignore
+        except ImportError:
+            raise ModuleNotFoundError('pyarrow is not installed and is required for to_arrow')
+        if not _server_has_command("arrowIPC"):
+            raise RuntimeError('The server was built without Parquet support, which is required for to_arrow')
+        table = self._to_arrow_table()
+        if table is None:
+            raise TypeError("Only pdarray, Strings, Categorical and Datetime columns " +
+                            "can be transferred with Arrow IPC")
+        return table
+
+    def _to_arrow_table(self):
+        """
+        Transfers all columns in a single Arrow IPC stream, returning None if
+        pyarrow is not installed, the server was built without Parquet support
+        or a column cannot be represented in Arrow.
+        """
+        try:
+            import pyarrow as pa  # type: ignore
+        except ImportError:
+            return None
+        if len(self._columns) == 0 or not _server_has_command("arrowIPC"):
+            return None
+        specs = []
+        for key in self._columns:
+            val = self[key]
+            if isinstance(val, Datetime):
+                specs.append(f"datetime:{val.values.name}")
+            elif type(val) == pdarray and val.dtype.name in ('int64', 'uint64', 'float64', 'bool'):
+                specs.append(f"pdarray:{val.name}")
+            elif isinstance(val, Strings):
+                specs.append(f"str:{val.entry.name}")
+            elif isinstance(val, Categorical):
+                specs.append(f"category:{val.codes.name}:{val.categories.entry.name}")
+            else:
+                return None
+        args = "{} {} {}".format(len(specs), " ".join(specs),
+                                 json.dumps([str(key) for key in self._columns]))
+        data = generic_msg(cmd="arrowIPC", args=args, recv_binary=True)
+        return pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+
     def save(self, path, index=False):
         """
         Save DataFrame to disk, preserving column names.
@@ -1062,6 +1190,33 @@ class DataFrame(UserDict):
         tosave = {k: v for k, v in self.data.items() if (index or k != "index")}
         save_all(tosave, path)
 
+    def to_parquet(self, path, index=False, row_group_size=None, compression=None):
+        """
+        Save DataFrame to Parquet files, preserving column names.
+
+        Parameters
+        ----------
+        path : str
+            File path to save data
+        index : bool
+            If True, save the index column. By default, do not save the index.
+        row_group_size : int
+            Number of rows per row group, by default the server's
+        compression : {None | 'snappy' | 'zstd' | 'lz4' | 'gzip'}
+            Codec of the columns, by default uncompressed
+
+        Notes
+        -----
+        This method saves one file per locale of the arkouda server, holding
+        that locale's rows of every column as one Parquet table. All files
+        are prefixed by the path argument and suffixed by their locale
+        number. Column statistics are written so that `ak.read_parquet` can
+        skip row groups that do not match its filters.
+        """
+        tosave = {k: v for k, v in self.data.items() if (index or k != "index")}
+        save_all(tosave, path, file_format='Parquet', row_group_size=row_group_size,
+                 compression=compression)
+
     def argsort(self, key, ascending=True):
         """
         Return the permutation that sorts the dataframe by `key`.
@@ -1270,6 +1425,192 @@ class DataFrame(UserDict):
 
         return self.GroupBy(keys, use_series)
 
+    def merge(self, right, on=None, left_on=None, right_on=None, how='inner',
+              suffixes=('_x', '_y'), method='auto'):
+        """
+        Join the rows of this DataFrame with the rows of another DataFrame
+        whose key columns are equal.
+
+        Parameters
+        ----------
+        right : DataFrame
+            The DataFrame to join with.
+        on : str or list of str
+            Names of the key columns, which both DataFrames have.
+        left_on : str or list of str
+            Names of the key columns of this DataFrame, if not `on`.
+        right_on : str or list of str
+            Names of the key columns of `right`, if not `on`.
+        how : str (default='inner')
+            One of 'inner', 'left', 'right', 'outer'; see `ak.join_keys`.
+        suffixes : tuple of str (default=('_x', '_y'))
+            Appended to the names of the other columns the DataFrames share.
+        method : str (default='auto')
+            One of 'auto', 'hash', 'sort'; see `ak.join_keys`.
+
+        Returns
+        -------
+        DataFrame
+            A row for each joined pair of rows. The key columns named by `on`
+            appear once, holding the key of whichever row is present.
+
+        Notes
+        -----
+        Arkouda arrays have no missing values, so the columns of the table
+        missing from an unmatched row of a left, right, or outer join are
+        filled with NaN (float64), 0 (other numeric dtypes), False (bool),
+        '' (Strings), 'N/A' (Categorical), or an empty segment (SegArray).
+        The rows are not in any particular order.
+
+        See Also
+        --------
+        arkouda.join_keys
+        """
+        if not isinstance(right, DataFrame):
+            raise TypeError("right must be a DataFrame")
+        if on is not None:
+            if left_on is not None or right_on is not None:
+                raise ValueError("Pass either on or left_on and right_on, not both")
+            left_on = right_on = on
+        if left_on is None or right_on is None:
+            raise ValueError("Pass on, or both left_on and right_on")
+        if isinstance(left_on, str):
+            left_on = [left_on]
+        if isinstance(right_on, str):
+            right_on = [right_on]
+        if len(left_on) != len(right_on):
+            raise ValueError("left_on and right_on must name the same number of columns")
+        for k in left_on:
+            if k not in self._columns:
+                raise KeyError("Invalid column name '{}'.".format(k))
+        for k in right_on:
+            if k not in right._columns:
+                raise KeyError("Invalid column name '{}'.".format(k))
+
+        self.update_size()
+        right.update_size()
+        li, ri = join_keys([self[k] for k in left_on], [right[k] for k in right_on],
+                           how=how, method=method)
+        shared_keys = [lk for lk, rk in zip(left_on, right_on) if lk == rk]
+        result = {}
+        for k in self._columns:
+            if k in shared_keys:
+                result[k] = _take_key(self[k], right[k], li, ri)
+                continue
+            name = k
+            if k in right._columns:
+                name = f"{k}{suffixes[0]}"
+            result[name] = _take(self[k], li)
+        for k in right._columns:
+            if k in shared_keys:
+                continue
+            name = k
+            if k in self._columns:
+                name = f"{k}{suffixes[1]}"
+            result[name] = _take(right[k], ri)
+        return DataFrame(result)
+
+
+def _take(column, idx):
+    """
+    Gathers the rows idx of a DataFrame column, filling the rows where idx is
+    -1 with a missing value; see DataFrame.merge
+    """
+    from arkouda.util import concatenate as util_concatenate
+
+    missing = idx < 0
+    if not missing.any():
+        return column[idx]
+    idx = where(missing, column.size, idx)
+    if isinstance(column, Categorical):
+        categories = concatenate([column.categories, array(['N/A'])])
+        codes = concatenate([column.codes, array([column.categories.size])])
+        return Categorical.from_codes(codes[idx], categories)
+    if isinstance(column, Strings):
+        fill = array([''])
+    elif isinstance(column, SegArray):
+        fill = SegArray(zeros(1, dtype=akint64), column.values[:0])
+    elif type(column) != pdarray:
+        fill = type(column)(zeros(1, dtype=akint64))
+    elif column.dtype == akfloat64:
+        fill = array([np.nan])
+    else:
+        fill = zeros(1, dtype=column.dtype)
+    return util_concatenate([column, fill])[idx]
+
+
+def _take_key(left, right, li, ri):
+    """
+    Gathers the key of each joined pair of rows from the left row, or from
+    the right row for an unmatched right row
+    """
+    from arkouda.util import concatenate as util_concatenate
+
+    missing = li < 0
+    if not missing.any():
+        return left[li]
+    if isinstance(left, Categorical) or isinstance(right, Categorical):
+        left, right = [k.categories[k.codes] if isinstance(k, Categorical) else k for k in (left, right)]
+    return util_concatenate([left, right])[where(missing, ri + left.size, li)]
+
+
+def _from_arrow_ipc(pd_df):
+    """
+    Sends the columns of a pandas DataFrame to the server in a single Arrow IPC
+    stream, returning a dict of the created arkouda arrays or None if pyarrow is
+    not installed, the server was built without Parquet support or a column
+    cannot be transferred this way.
+    """
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError:
+        return None
+    if len(pd_df.columns) == 0 or not _server_has_command("fromArrowIPC"):
+        return None
+    arrays = []
+    for key in pd_df.columns:
+        try:
+            arr = pa.array(pd_df[key], from_pandas=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+        t = arr.type
+        if pa.types.is_signed_integer(t):
+            arr = arr.cast(pa.int64())
+        elif pa.types.is_unsigned_integer(t):
+            arr = arr.cast(pa.uint64())
+        elif pa.types.is_floating(t):
+            arr = arr.cast(pa.float64())
+        elif pa.types.is_timestamp(t) and t.tz is None:
+            arr = arr.cast(pa.timestamp('ns'))
+        elif pa.types.is_dictionary(t) and (pa.types.is_string(t.value_type) or
+                                            pa.types.is_large_string(t.value_type)):
+            pass
+        elif not (pa.types.is_boolean(t) or pa.types.is_string(t) or pa.types.is_large_string(t)):
+            return None
+        # arkouda arrays have no missing values
+        if arr.null_count > 0:
+            return None
+        arrays.append(arr)
+    batch = pa.RecordBatch.from_arrays(arrays, names=[str(key) for key in pd_df.columns])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    rep_msg = generic_msg(cmd="fromArrowIPC", payload=memoryview(sink.getvalue()),
+                          send_binary=True)
+
+    columns = {}
+    for key, (_, kind, *created) in zip(pd_df.columns, json.loads(rep_msg)):
+        if kind == "str":
+            columns[key] = Strings.from_return_msg(created[0])
+        elif kind == "category":
+            columns[key] = Categorical.from_codes(create_pdarray(created[0]),
+                                                  Strings.from_return_msg(created[1]))
+        elif kind == "datetime":
+            columns[key] = Datetime(create_pdarray(created[0]))
+        else:
+            columns[key] = create_pdarray(created[0])
+    return columns
+
 
 def sorted(df, column=False):
     """
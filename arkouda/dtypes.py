@@ -188,8 +188,10 @@ def get_server_byteorder() -> str:
     """
     Get the server's byteorder
     """
-    from arkouda.client import get_config
-    order = get_config()['byteorder']
-    if order not in ('little', 'big'):
-        raise ValueError("Server byteorder must be 'little' or 'big'")
-    return cast('str', order)
+    from arkouda.client import get_config, _metadata_cache
+    if _metadata_cache.byteorder is None:
+        order = get_config()['byteorder']
+        if order not in ('little', 'big'):
+            raise ValueError("Server byteorder must be 'little' or 'big'")
+        _metadata_cache.byteorder = cast('str', order)
+    return _metadata_cache.byteorder
@@ -0,0 +1,312 @@
+from __future__ import annotations
+import json
+from typing import cast, Dict, List, Optional, Tuple, Union
+import numpy as np # type: ignore
+from arkouda.client import generic_msg
+from arkouda.dtypes import resolve_scalar_dtype, numeric_and_bool_scalars, NUMBER_FORMAT_STRINGS
+from arkouda.logger import getArkoudaLogger
+
+__all__ = ["lazy", "evaluate"]
+
+logger = getArkoudaLogger(name='expression')
+
+"""
+Lazy evaluation builds an expression DAG from elementwise pdarray operations
+and sends the whole DAG to the server as one fusedexpr command when the
+value of the result is needed. The server evaluates fused expressions block
+by block, so neither full-size temporaries nor extra passes over memory are
+needed for the intermediate results.
+"""
+
+# dtypes supported by the server-side expression evaluator
+FUSIBLE_DTYPES = frozenset(['int64', 'float64', 'bool'])
+COMPARISON_OPS = frozenset(['<', '>', '<=', '>=', '==', '!='])
+UNARY_FUNCS = frozenset(['abs', 'log', 'exp', 'sin', 'cos'])
+
+# expressions with more nodes are evaluated before being extended further
+maxFusedNodesDefVal = 64
+maxFusedNodes = maxFusedNodesDefVal
+
+_lazy_depth = 0
+
+class ExprNode:
+    """
+    A node of a lazily evaluated elementwise expression. Leaves reference
+    materialized pdarrays (keeping them alive until the expression is
+    evaluated) or scalars; interior nodes reference their operands.
+    """
+    __slots__ = ('kind', 'dtype', 'op', 'children', 'array', 'value', 'size')
+
+    def __init__(self, kind : str, dtype : str, op : str='', children : Tuple=(),
+                 array=None, value : object=None) -> None:
+        self.kind = kind
+        self.dtype = dtype
+        self.op = op
+        self.children = children
+        self.array = array
+        self.value = value
+        self.size = 1 + sum(c.size for c in children)
+
+    def serialize(self) -> List[str]:
+        """
+        Return the node descriptions of the DAG rooted at this node in
+        evaluation order, with shared subexpressions and leaves emitted once
+        """
+        index : Dict[int, int] = {}
+        nodes : List[str] = []
+
+        def visit(node : ExprNode) -> int:
+            key = id(node.array) if node.kind == 'array' else id(node)
+            if key in index:
+                return index[key]
+            children = [str(visit(c)) for c in node.children]
+            if node.kind == 'array':
+                desc = 'array {} {}'.format(node.dtype, node.array.name)
+            elif node.kind == 'scalar':
+                desc = 'scalar {} {}'.format(node.dtype,
+                                            NUMBER_FORMAT_STRINGS[node.dtype].format(node.value))
+            elif node.kind in ('binop', 'unary'):
+                desc = '{} {} {} {}'.format(node.kind, node.dtype, node.op, ' '.join(children))
+            else:
+                desc = '{} {} {}'.format(node.kind, node.dtype, ' '.join(children))
+            index[key] = len(nodes)
+            nodes.append(desc)
+            return index[key]
+
+        visit(self)
+        return nodes
+
+class lazy:
+    """
+    Context manager enabling lazy evaluation of elementwise pdarray arithmetic,
+    comparisons, and the abs, log, exp, sin, cos, and where functions. Within
+    the context these operations return pdarrays whose values are computed by
+    a single fused server command once they are needed, e.g. by to_ndarray, a
+    reduction, or indexing, or explicitly via ak.evaluate.
+
+    Operations on uint64 arrays, and operations without a fused equivalent,
+    are evaluated eagerly as usual.
+
+    Examples
+    --------
+    >>> a, b, c = ak.arange(10), ak.ones(10), ak.arange(10)
+    >>> with ak.lazy():
+    ...     d = a*b + c - 1
+    >>> d  # one server command evaluates the whole expression
+    array([-1.00000000000000000 1.00000000000000000 ...])
+    """
+    def __enter__(self) -> lazy:
+        global _lazy_depth
+        _lazy_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        global _lazy_depth
+        _lazy_depth -= 1
+
+def is_lazy() -> bool:
+    """
+    Indicates if lazy evaluation is enabled
+    """
+    return _lazy_depth > 0
+
+def evaluate(*arrays) -> None:
+    """
+    Evaluate lazily defined pdarrays on the server, one fused command per array.
+    Arrays that have already been evaluated are ignored.
+
+    Parameters
+    ----------
+    arrays : pdarray
+        The arrays to evaluate
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    RuntimeError
+        Raised if there is a server-side error in evaluating an expression
+    """
+    for pda in arrays:
+        if _is_lazy_array(pda):
+            materialize(pda)
+
+def _is_lazy_array(obj) -> bool:
+    return '_expr' in getattr(obj, '__dict__', {})
+
+def _operand_node(obj) -> Optional[ExprNode]:
+    """
+    Return the node for a pdarray operand, or None if it is not fusible
+    """
+    if _is_lazy_array(obj):
+        return obj._expr
+    if obj.dtype.name not in FUSIBLE_DTYPES:
+        return None
+    return ExprNode('array', obj.dtype.name, array=obj)
+
+def _scalar_node(value : numeric_and_bool_scalars, pda) -> Optional[ExprNode]:
+    """
+    Return the node for a scalar operand of pda, converting the scalar to the
+    dtype of pda when that is lossless as the binopvs and binopsv commands do
+    """
+    if np.can_cast(value, pda.dtype):
+        dt = pda.dtype.name
+        value = pda.dtype.type(value)
+    else:
+        dt = resolve_scalar_dtype(value)
+    if dt not in FUSIBLE_DTYPES:
+        return None
+    return ExprNode('scalar', dt, value=value)
+
+def _as_dtype(node : ExprNode, dt : str) -> ExprNode:
+    if node.dtype == dt:
+        return node
+    return ExprNode('cast', dt, children=(node,))
+
+def _binop_dtypes(ldt : str, rdt : str, op : str) -> Optional[Tuple[str, str]]:
+    """
+    Return the (operand, result) dtypes of a fused binary operation following
+    the type rules of the binopvv command, or None if the operation is not fusible
+    """
+    if ldt == 'bool' and rdt == 'bool':
+        if op in ('&', '|', '^', '==', '!='):
+            return 'bool', 'bool'
+        return None
+    if ldt == 'bool' or rdt == 'bool':
+        # only arithmetic is defined between bool and numeric arrays
+        if op not in ('+', '-', '*'):
+            return None
+        operand = 'float64' if 'float64' in (ldt, rdt) else 'int64'
+        return operand, operand
+    operand = 'float64' if 'float64' in (ldt, rdt) else 'int64'
+    if op in COMPARISON_OPS:
+        return operand, 'bool'
+    if op == '/':
+        return operand, 'float64'
+    if operand == 'int64':
+        if op in ('+', '-', '*', '//', '%', '&', '|', '^', '<<', '>>'):
+            return operand, 'int64'
+        return None
+    if op in ('+', '-', '*', '//', '**'):
+        return operand, 'float64'
+    return None
+
+def _lazy_array(node : ExprNode, size : int):
+    """
+    Return a pdarray whose value is defined by the expression rooted at node.
+    The name of the array is assigned when the expression is evaluated.
+    """
+    from arkouda.pdarrayclass import pdarray
+
+    if node.size > maxFusedNodes:
+        # evaluate the operands so the expression sent to the server stays small
+        children = []
+        for child in node.children:
+            if child.kind in ('array', 'scalar'):
+                children.append(child)
+            else:
+                operand = _lazy_array(child, size)
+                materialize(operand)
+                children.append(ExprNode('array', child.dtype, array=operand))
+        node = ExprNode(node.kind, node.dtype, op=node.op, children=tuple(children))
+    pda = pdarray.__new__(pdarray)
+    dt = np.dtype(node.dtype)
+    pda.dtype = dt
+    pda.size = size
+    pda.ndim = 1
+    pda.shape = [size]
+    pda.itemsize = dt.itemsize
+    pda._expr = node
+    return pda
+
+def lazy_binop(left, right, op : str, reverse : bool=False):
+    """
+    Return a lazily evaluated pdarray for left op right (right op left if
+    reverse), or None if the operation must be evaluated eagerly. left is
+    always a pdarray; right is a pdarray or a scalar.
+    """
+    from arkouda.pdarrayclass import pdarray
+
+    lnode = _operand_node(left)
+    if lnode is None:
+        return None
+    if isinstance(right, pdarray):
+        if left.size != right.size:
+            return None
+        rnode = _operand_node(right)
+    else:
+        rnode = _scalar_node(right, left)
+    if rnode is None:
+        return None
+    if reverse:
+        lnode, rnode = rnode, lnode
+    dtypes = _binop_dtypes(lnode.dtype, rnode.dtype, op)
+    if dtypes is None:
+        return None
+    operand, result = dtypes
+    node = ExprNode('binop', result, op=op,
+                    children=(_as_dtype(lnode, operand), _as_dtype(rnode, operand)))
+    return _lazy_array(node, left.size)
+
+def lazy_efunc(func : str, pda):
+    """
+    Return a lazily evaluated pdarray for func(pda), or None if the function
+    must be evaluated eagerly
+    """
+    node = _operand_node(pda)
+    if func not in UNARY_FUNCS or node is None or node.dtype == 'bool':
+        return None
+    return _lazy_array(ExprNode('unary', 'float64', op=func,
+                                children=(_as_dtype(node, 'float64'),)), pda.size)
+
+def lazy_where(condition, A, B):
+    """
+    Return a lazily evaluated pdarray for where(condition, A, B), or None if
+    the operation must be evaluated eagerly
+    """
+    from arkouda.pdarrayclass import pdarray
+
+    if condition.dtype.name != 'bool':
+        return None
+    cnode = _operand_node(condition)
+    if isinstance(A, pdarray) and isinstance(B, pdarray):
+        if A.dtype != B.dtype or not (A.size == B.size == condition.size):
+            return None
+        anode, bnode = _operand_node(A), _operand_node(B)
+    elif isinstance(A, pdarray) and np.isscalar(B):
+        if A.size != condition.size:
+            return None
+        anode = _operand_node(A)
+        bnode = ExprNode('scalar', A.dtype.name, value=A.dtype.type(B))
+    elif isinstance(B, pdarray) and np.isscalar(A):
+        if B.size != condition.size:
+            return None
+        anode = ExprNode('scalar', B.dtype.name, value=B.dtype.type(A))
+        bnode = _operand_node(B)
+    else:
+        return None
+    if cnode is None or anode is None or bnode is None:
+        return None
+    return _lazy_array(ExprNode('where', anode.dtype, children=(cnode, anode, bnode)),
+                       condition.size)
+
+def materialize(pda) -> None:
+    """
+    Evaluate the expression of a lazily defined pdarray with one fusedexpr
+    command and point the pdarray at the result. The user should not call
+    this function directly.
+    """
+    from arkouda.pdarrayclass import _parse_created_fields
+
+    node = pda.__dict__.get('_expr')
+    if node is None:
+        return
+    nodes = node.serialize()
+    logger.debug('evaluating fused expression of {} nodes'.format(len(nodes)))
+    repMsg = cast(str, generic_msg(cmd='fusedexpr',
+                                   args='{} {}'.format(len(nodes), json.dumps(nodes))))
+    name, mydtype, size, ndim, shape, itemsize = _parse_created_fields(repMsg)
+    del pda._expr
+    pda.__init__(name, np.dtype(mydtype), size, ndim, shape, itemsize)
@@ -1,17 +1,18 @@
 from __future__ import annotations
 import enum
-from typing import cast, List, Sequence, Tuple, Union, TYPE_CHECKING, Any
+from typing import cast, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from arkouda.categorical import Categorical
 import numpy as np # type: ignore
 from typeguard import typechecked, check_type
 from arkouda.client import generic_msg
-from arkouda.pdarrayclass import pdarray, create_pdarray
+from arkouda.pdarrayclass import pdarray, create_pdarray, RegistrationError
 from arkouda.sorting import argsort, coargsort
 from arkouda.strings import Strings
 from arkouda.pdarraycreation import array, zeros, arange
 from arkouda.logger import getArkoudaLogger
-from arkouda.dtypes import int64, uint64
+from arkouda.infoclass import list_registry
+from arkouda.dtypes import int64, uint64, int_scalars
 
 __all__ = ["GroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES"]
 
@@ -29,6 +30,10 @@ class GroupByReductionType(enum.Enum):
     OR = 'or'
     AND = 'and'
     XOR = 'xor'
+    VAR = 'var'
+    STD = 'std'
+    MEDIAN = 'median'
+    QUANTILE = 'quantile'
     
     def __str__(self) -> str:
         """
@@ -47,6 +52,18 @@ class GroupByReductionType(enum.Enum):
 GROUPBY_REDUCTION_TYPES = frozenset([member.value for _, member 
                                   in GroupByReductionType.__members__.items()])
 
+# Reductions computed from the group ids of a hash-based GroupBy, without
+# permuting the values
+HASH_REDUCTION_TYPES = frozenset(['sum', 'prod', 'mean', 'min', 'max',
+                                  'any', 'all', 'or', 'and', 'xor'])
+
+GROUPBY_METHODS = frozenset(['sort', 'hash'])
+
+# Reductions whose result for a group can be combined with the result for
+# rows appended to the group, see GroupBy.update_aggregate
+UPDATE_REDUCTION_TYPES = frozenset(['sum', 'prod', 'min', 'max', 'any', 'all',
+                                    'or', 'and', 'xor'])
+
 groupable_element_type = Union[pdarray, Strings, 'Categorical']
 groupable = Union[groupable_element_type, Sequence[groupable_element_type]]
 
@@ -60,7 +77,19 @@ class GroupBy:
     keys : (list of) pdarray, Strings, or Categorical
         The array to group by value, or if list, the column arrays to group by row
     assume_sorted : bool
-        If True, assume keys is already sorted (Default: False)
+        If True, assume keys is already sorted (Default: False). Keys the
+        server knows to be sorted, such as the results of ak.sort,
+        ak.unique and ak.arange, are not sorted again either way.
+    hash_strings : bool
+        If True (default), group Strings by their 128-bit hashes
+    method : {'sort', 'hash'}
+        How the keys are grouped. 'sort' (default) sorts the keys. 'hash'
+        finds the unique keys with per-locale hash tables and gives each
+        row the index of its group, skipping the sort; aggregations that
+        support it are then computed without permuting the values. If the
+        keys have more than HashMaxGroups unique values, or if they cannot
+        be hashed (more than two grouping key arrays, or a Categorical),
+        'hash' falls back to 'sort'.
 
     Attributes
     ----------
@@ -69,7 +98,10 @@ class GroupBy:
     size : int
         The length of the input array(s), i.e. number of rows
     permutation : pdarray
-        The permutation that sorts the keys array(s) by value (row)
+        The permutation that sorts the keys array(s) by value (row). With
+        method='hash', it is computed the first time it is needed.
+    method : str
+        The method that grouped the keys, 'sort' or 'hash'
     unique_keys : (list of) pdarray, Strings, or Categorical
         The unique values of the keys array(s), in grouped order
     ngroups : int
@@ -98,11 +130,25 @@ class GroupBy:
     If the input is a single array with a .group() method defined, method 2
     will be used; otherwise, method 1 will be used.
 
+    If UseGroupingCache is True (default), the server caches the grouping of
+    pdarray and Strings keys grouped by sorting, so that grouping the same
+    keys again, unchanged since, reuses copies of the permutation, segments
+    and unique keys instead of sorting the keys again. The least recently used groupings are evicted
+    when the cache exceeds its share of the server memory (see the
+    groupingCachePct server option), and all of them when the symbol table
+    is cleared.
+
+    A GroupBy can be registered with register() and attached to in another
+    session with GroupBy.attach().
+
     """
     Reductions = GROUPBY_REDUCTION_TYPES
+    HashMaxGroups = 2**18
+    UseGroupingCache = True
 
     def __init__(self, keys: groupable,
-                 assume_sorted: bool = False, hash_strings: bool = True) -> None:
+                 assume_sorted: bool = False, hash_strings: bool = True,
+                 method: str = 'sort') -> None:
         # Type Checks required because @typechecked was removed for causing other issues
         # This prevents non-bool values that can be evaluated to true (ie non-empty arrays)
         # from causing unexpected results. Experienced when forgetting to wrap multiple key arrays in [].
@@ -111,12 +157,17 @@ class GroupBy:
             raise TypeError("assume_sorted must be of type bool.")
         if not isinstance(hash_strings, bool):
             raise TypeError("hash_strings must be of type bool.")
+        if method not in GROUPBY_METHODS:
+            raise ValueError("method must be one of {}".format(sorted(GROUPBY_METHODS)))
         from arkouda.categorical import Categorical
         self.logger = getArkoudaLogger(name=self.__class__.__name__)
+        self.name : Optional[str] = None
         self.assume_sorted = assume_sorted
         self.hash_strings = hash_strings
         self.keys : groupable
-        self.permutation : pdarray
+        self._permutation : Optional[pdarray] = None
+        self._group_ids : Optional[pdarray] = None
+        self.method = 'sort'
 
         # Get all grouping keys, even if not required for finding permutation
         # They will be required later for finding segment boundaries
@@ -140,24 +191,112 @@ class GroupBy:
                     # Type checks should ensure we never get here
                     raise TypeError("{} does not support grouping".format(type(k)))
                 self._grouping_keys.extend(cast(list, k._get_grouping_keys()))
+        if (method == 'hash' and not assume_sorted and not isinstance(self.keys, Categorical)
+                and len(self._grouping_keys) <= 2 and self._hash_group()):
+            return
+        keynames = None if assume_sorted else self._cache_key_names()
         # Get permutation
         if assume_sorted:
             # Permutation is identity
-            self.permutation = cast(pdarray, arange(self.size))
+            self._permutation = cast(pdarray, arange(self.size))
+        elif keynames is not None:
+            # Sorted on the server unless the grouping is cached
+            if self._cached_sort(keynames):
+                return
         elif hasattr(self.keys, "group"):
             # If an object wants to group itself (e.g. Categoricals),
             # let it set the permutation
             perm = self.keys.group() # type: ignore
-            self.permutation = cast(pdarray, perm)
+            self._permutation = cast(pdarray, perm)
         elif len(self._grouping_keys) == 1:
-            self.permutation = cast(pdarray, argsort(self._grouping_keys[0]))
+            self._permutation = cast(pdarray, argsort(self._grouping_keys[0]))
         else:
-            self.permutation = cast(pdarray, coargsort(self._grouping_keys))
+            self._permutation = cast(pdarray, coargsort(self._grouping_keys))
                 
-        # Finally, get segment offsets and unique keys 
-        self.find_segments()       
+        # Finally, get segment offsets and unique keys, caching the grouping
+        self._find_segments(keynames)
+
+    @property
+    def permutation(self) -> pdarray:
+        if self._permutation is None:
+            # Grouped by hashing, so order the rows by their group ids
+            repMsg = generic_msg(cmd="hashGroupPermutation",
+                                 args="{} {}".format(cast(pdarray, self._group_ids).name,
+                                                     self.segments.name))
+            self._permutation = create_pdarray(repMsg)
+        return self._permutation
+
+    def _cache_key_names(self) -> Optional[List[str]]:
+        """
+        The server names of the keys, if their groupings are cached: if the
+        keys are pdarrays and Strings and UseGroupingCache is True
+        """
+        if not self.UseGroupingCache:
+            return None
+        keys = [self.keys] if self.nkeys == 1 and hasattr(self.keys, "_get_grouping_keys") \
+            else cast(Sequence[groupable_element_type], self.keys)
+        names = []
+        for k in keys:
+            if isinstance(k, pdarray):
+                names.append(k.name)
+            elif isinstance(k, Strings):
+                names.append(k.entry.name)
+            else:
+                return None
+        return names
+
+    def _cached_sort(self, keynames: List[str]) -> bool:
+        """
+        Find the permutation that groups the keys with a single request,
+        which returns the permutation, segments and unique keys of the keys
+        if their grouping is in the server's grouping cache. Returns False if
+        the grouping is not cached, in which case only the permutation is set.
+        """
+        gkeynames = [k.name for k in self._grouping_keys]
+        repMsg = cast(str, generic_msg(cmd="groupingSort",
+                                       args="{} {} {} {}".format(len(keynames), ' '.join(keynames),
+                                                                 len(gkeynames), ' '.join(gkeynames))))
+        attrs = repMsg.split("+")
+        self._permutation = create_pdarray(attrs[0])
+        if len(attrs) == 1:
+            return False
+        self.logger.debug('found cached grouping of {}'.format(keynames))
+        self.segments = cast(pdarray, create_pdarray(attrs[1]))
+        self._set_unique_keys(create_pdarray(attrs[2]))
+        return True
+
+    def _hash_group(self) -> bool:
+        """
+        Group the keys with hash tables on the server, which returns the
+        group id of each row, the segments and the unique key indices.
+        Returns False if the keys have more than HashMaxGroups unique values,
+        in which case they must be sorted instead, if the server knows
+        them to be sorted already, or if they are not integers.
+        """
+        if any(k.dtype not in (int64, uint64) for k in self._grouping_keys):
+            self.logger.debug('keys are not integers, sorting instead')
+            return False
+        keynames = [k.name for k in self._grouping_keys]
+        args = "{} {} {}".format(self.HashMaxGroups, len(keynames), ' '.join(keynames))
+        repMsg = cast(str, generic_msg(cmd="hashGroup", args=args))
+        if not repMsg.startswith("created"):
+            self.logger.debug('keys sorted or more than {} groups, sorting instead'.format(self.HashMaxGroups))
+            return False
+        gidAttr, segAttr, uniqAttr = repMsg.split("+")
+        self.method = 'hash'
+        self._group_ids = create_pdarray(gidAttr)
+        self.segments = cast(pdarray, create_pdarray(segAttr))
+        self._set_unique_keys(create_pdarray(uniqAttr))
+        return True
             
     def find_segments(self) -> None:
+        self._find_segments(None)
+
+    def _find_segments(self, cache_keynames: Optional[List[str]]) -> None:
+        """
+        Find the segments and unique keys and, if cache_keynames are given,
+        have the server cache the grouping of the keys with these names
+        """
         from arkouda.categorical import Categorical
         cmd = "findSegments"
 
@@ -178,14 +317,18 @@ class GroupBy:
                                            effectiveKeys,
                                            ' '.join(keynames),
                                            ' '.join(keytypes))
+        if cache_keynames is not None:
+            args += " {} {}".format(len(cache_keynames), ' '.join(cache_keynames))
         repMsg = generic_msg(cmd=cmd,args=args)
         segAttr, uniqAttr = cast(str,repMsg).split("+")
         self.logger.debug('{},{}'.format(segAttr, uniqAttr))
         self.segments = cast(pdarray, create_pdarray(repMsg=cast(str,segAttr)))
-        unique_key_indices = create_pdarray(repMsg=cast(str,uniqAttr))
+        self._set_unique_keys(create_pdarray(repMsg=cast(str,uniqAttr)))
+
+    def _set_unique_keys(self, unique_key_indices: pdarray) -> None:
         if self.nkeys == 1:
             self.unique_keys = cast(groupable, 
-                                    self.keys[unique_key_indices])
+                                    cast(groupable_element_type, self.keys)[unique_key_indices])
             self.ngroups = cast(groupable_element_type, self.unique_keys).size
         else:
             self.unique_keys = cast(groupable, 
@@ -195,6 +338,376 @@ class GroupBy:
         del self._grouping_keys
 
 
+    def _get_components_dict(self) -> Dict:
+        """
+        Internal function that returns a dictionary with the components of
+        self that are registered: the permutation, the segments and the
+        unique keys, one component per key array if there are several
+
+        Returns
+        -------
+        Dict
+            Dictionary of the components of self
+                Keys: component names
+                Values: components of self
+        """
+        components : Dict[str, Any] = {"permutation": self.permutation,
+                                       "segments": self.segments}
+        if self.nkeys == 1 and hasattr(self.unique_keys, "_get_grouping_keys"):
+            components["unique_keys"] = self.unique_keys
+        else:
+            for i, k in enumerate(cast(Sequence[groupable_element_type], self.unique_keys)):
+                components[f"unique_keys_{i}"] = k
+        return components
+
+    def register(self, user_defined_name: str) -> GroupBy:
+        """
+        Register this GroupBy object and underlying components with the Arkouda server
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name the GroupBy is to be registered under,
+            this will be the root name for underlying components
+
+        Returns
+        -------
+        GroupBy
+            The same GroupBy which is now registered with the arkouda server and has an updated name.
+            This is an in-place modification, the original is returned to support a fluid programming style.
+            Please note you cannot register two different GroupBys with the same name.
+
+        Raises
+        ------
+        TypeError
+            Raised if user_defined_name is not a str
+        RegistrationError
+            If the server was unable to register the GroupBy with the user_defined_name
+
+        See also
+        --------
+        unregister, attach, unregister_groupby_by_name, is_registered
+
+        Notes
+        -----
+        Objects registered with the server are immune to deletion until
+        they are unregistered.
+
+        The keys are not registered with the GroupBy, which only needs its
+        permutation, segments and unique keys to aggregate values. A GroupBy
+        attached to with attach() has no keys.
+        """
+        if not isinstance(user_defined_name, str):
+            raise TypeError("user_defined_name must be of type str")
+        [p.register(f"{user_defined_name}.{n}") for n, p in self._get_components_dict().items()]
+        self.name = user_defined_name
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister this GroupBy object in the arkouda server which was previously
+        registered using register() and/or attached to using attach()
+
+        Raises
+        ------
+        RegistrationError
+            If the object is already unregistered or if there is a server error
+            when attempting to unregister
+
+        See also
+        --------
+        register, attach, unregister_groupby_by_name, is_registered
+
+        Notes
+        -----
+        Objects registered with the server are immune to deletion until
+        they are unregistered.
+        """
+        if not self.name:
+            raise RegistrationError("This item does not have a name and does not appear to be registered.")
+        [p.unregister() for p in self._get_components_dict().values()]
+        self.name = None
+
+    def is_registered(self) -> np.bool_:
+        """
+        Return True iff the object is contained in the registry
+
+        Returns
+        -------
+        numpy.bool
+            Indicates if the object is contained in the registry
+
+        Raises
+        ------
+        RegistrationError
+            Raised if there's a server-side error or a mis-match of registered components
+
+        See Also
+        --------
+        register, attach, unregister, unregister_groupby_by_name
+        """
+        parts_registered : List[np.bool_] = [p.is_registered() for p in self._get_components_dict().values()]
+        if np.any(parts_registered) and not np.all(parts_registered):
+            raise RegistrationError(f"Not all registerable components of GroupBy {self.name} are registered.")
+        return np.bool_(np.any(parts_registered))
+
+    @staticmethod
+    @typechecked
+    def attach(user_defined_name: str) -> GroupBy:
+        """
+        Function to return a GroupBy object attached to the registered name in the
+        arkouda server which was registered using register()
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name which GroupBy object was registered under
+
+        Returns
+        -------
+        GroupBy
+            The GroupBy object created by re-attaching to the corresponding server
+            components. Its keys are None.
+
+        Raises
+        ------
+        TypeError
+            if user_defined_name is not a string
+        RegistrationError
+            if no GroupBy is registered under user_defined_name
+
+        See Also
+        --------
+        register, is_registered, unregister, unregister_groupby_by_name
+        """
+        registry = list_registry()
+        if f"{user_defined_name}.segments" not in registry:
+            raise RegistrationError(f"No GroupBy is registered under {user_defined_name}")
+        g = GroupBy.__new__(GroupBy)
+        g.logger = getArkoudaLogger(name=GroupBy.__name__)
+        g.name = user_defined_name
+        g.assume_sorted = False
+        g.hash_strings = True
+        g.method = 'sort'
+        g.keys = None  # type: ignore
+        g._group_ids = None
+        g._permutation = pdarray.attach(f"{user_defined_name}.permutation")
+        g.segments = pdarray.attach(f"{user_defined_name}.segments")
+        g.size = cast(int, g._permutation.size)
+        if f"{user_defined_name}.unique_keys" in registry or \
+                f"{user_defined_name}.unique_keys.codes" in registry:
+            g.nkeys = 1
+            g.unique_keys = _attach_groupable(f"{user_defined_name}.unique_keys", registry)
+            g.ngroups = g.unique_keys.size
+        else:
+            unique_keys: List[groupable_element_type] = []
+            while f"{user_defined_name}.unique_keys_{len(unique_keys)}" in registry or \
+                    f"{user_defined_name}.unique_keys_{len(unique_keys)}.codes" in registry:
+                unique_keys.append(_attach_groupable(
+                    f"{user_defined_name}.unique_keys_{len(unique_keys)}", registry))
+            g.nkeys = len(unique_keys)
+            g.unique_keys = unique_keys
+            g.ngroups = unique_keys[0].size
+        return g
+
+    @staticmethod
+    @typechecked
+    def unregister_groupby_by_name(user_defined_name: str) -> None:
+        """
+        Function to unregister GroupBy object by name which was registered
+        with the arkouda server via register()
+
+        Parameters
+        ----------
+        user_defined_name : str
+            Name under which the GroupBy object was registered
+
+        Raises
+        -------
+        TypeError
+            if user_defined_name is not a string
+        RegistrationError
+            if there is an issue attempting to unregister any underlying components
+
+        See Also
+        --------
+        register, unregister, attach, is_registered
+        """
+        GroupBy.attach(user_defined_name).unregister()
+
+    def update(self, new_keys: groupable) -> GroupBy:
+        """
+        Group the rows of new_keys as if they were appended to the keys,
+        sorting only the new rows and merging them into the permutation and
+        segments of the existing groups.
+
+        Parameters
+        ----------
+        new_keys : (list of) pdarray or Strings
+            The keys of the appended rows, of the same number and types as
+            the keys
+
+        Returns
+        -------
+        GroupBy
+            The same GroupBy, now grouping the appended rows after the
+            original rows. This is an in-place modification, the original is
+            returned to support a fluid programming style.
+
+        Raises
+        ------
+        ValueError
+            Raised if new_keys has a different number of key arrays
+        TypeError
+            Raised if the keys or new_keys are Categoricals, whose codes
+            cannot be merged
+
+        See Also
+        --------
+        update_aggregate, update_count
+
+        Notes
+        -----
+        The result is the same as grouping the concatenation of the keys and
+        new_keys, but only the new rows and the unique keys are sorted. The
+        keys attribute is set to None, because the GroupBy no longer groups
+        a single array of keys, and the GroupBy is no longer registered.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([3, 1, 3]))
+        >>> _, counts = g.count()
+        >>> g.update(ak.array([2, 3])).update_count(counts)
+        (array([1, 2, 3]), array([1, 1, 3]))
+        """
+        from arkouda.categorical import Categorical
+        from arkouda.pdarraysetops import concatenate
+        batch = GroupBy(new_keys)
+        if batch.nkeys != self.nkeys:
+            raise ValueError("Expected {} key arrays but got {}".format(self.nkeys, batch.nkeys))
+        old_keys = self._unique_keys_list()
+        new_unique_keys = batch._unique_keys_list()
+        if isinstance(self.keys, Categorical) or isinstance(batch.keys, Categorical) or \
+                any(isinstance(k, Categorical) for k in old_keys + new_unique_keys):
+            raise TypeError("A GroupBy of Categorical keys cannot be updated")
+        # Grouping the unique keys of both groupings orders the merged groups
+        union = [concatenate([o, n]) for o, n in zip(old_keys, new_unique_keys)]
+        unique_grouping = GroupBy(union[0] if self.nkeys == 1 else union)
+        args = "{} {} {} {} {} {}".format(self.permutation.name, self.segments.name,
+                                          batch.permutation.name, batch.segments.name,
+                                          unique_grouping.permutation.name,
+                                          unique_grouping.segments.name)
+        repMsg = generic_msg(cmd="mergeGroupings", args=args)
+        permAttr, segAttr = cast(str, repMsg).split("+")
+        self._permutation = create_pdarray(permAttr)
+        self.segments = cast(pdarray, create_pdarray(segAttr))
+        self._group_ids = None
+        self.method = 'sort'
+        self.unique_keys = unique_grouping.unique_keys
+        self.ngroups = unique_grouping.ngroups
+        self.size += batch.size
+        self.keys = None  # type: ignore
+        self.name = None
+        # kept to combine the aggregates of the groups with those of the new rows
+        self._update_batch = batch
+        self._update_grouping = unique_grouping
+        return self
+
+    def _unique_keys_list(self) -> List[groupable_element_type]:
+        if self.nkeys == 1 and hasattr(self.unique_keys, "_get_grouping_keys"):
+            return [self.unique_keys]
+        return list(cast(Sequence[groupable_element_type], self.unique_keys))
+
+    def update_aggregate(self, values: pdarray, previous: pdarray, operator: str,
+                         skipna: bool=True) -> Tuple[groupable, pdarray]:
+        """
+        Aggregate the values of the rows appended by the last update() and
+        combine them with the aggregates of the groups before the update, so
+        the rows of the groups before the update are not reduced again.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values of the appended rows, of the same size as the new_keys
+            passed to update()
+        previous : pdarray
+            The result of aggregate() with the same operator just before
+            the update, one value per group before the update
+        operator : str
+            The name of the reduction, one of sum, prod, min, max, any, all,
+            or, and, xor
+        skipna : bool
+            If True (default), NaN values are ignored
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        aggregates : pdarray
+            One aggregate value per unique key
+
+        Raises
+        ------
+        ValueError
+            Raised if update() was not called, if the operator cannot be
+            combined, or if previous has a different size than the groups
+            before the update
+
+        See Also
+        --------
+        update, update_count, aggregate
+        """
+        if not hasattr(self, '_update_batch'):
+            raise ValueError("update() must be called before update_aggregate()")
+        if operator not in UPDATE_REDUCTION_TYPES:
+            raise ValueError("Only the {} reductions can be updated".format(sorted(UPDATE_REDUCTION_TYPES)))
+        _, batch_values = self._update_batch.aggregate(values, operator, skipna)
+        return self._combine_update(previous, batch_values, operator)
+
+    def update_count(self, previous: pdarray) -> Tuple[groupable, pdarray]:
+        """
+        Count the rows appended by the last update() and add the counts of
+        the groups before the update.
+
+        Parameters
+        ----------
+        previous : pdarray
+            The counts returned by count() just before the update
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        counts : pdarray
+            The number of rows of each unique key
+
+        Raises
+        ------
+        ValueError
+            Raised if update() was not called, or if previous has a different
+            size than the groups before the update
+
+        See Also
+        --------
+        update, update_aggregate, count
+        """
+        if not hasattr(self, '_update_batch'):
+            raise ValueError("update() must be called before update_count()")
+        _, batch_counts = self._update_batch.count()
+        return self._combine_update(previous, batch_counts, 'sum')
+
+    def _combine_update(self, previous: pdarray, batch_values: pdarray,
+                        operator: str) -> Tuple[groupable, pdarray]:
+        from arkouda.pdarraysetops import concatenate
+        nprevious = self._update_grouping.size - self._update_batch.ngroups
+        if previous.size != nprevious:
+            raise ValueError("Expected {} previous values but got {}".format(nprevious, previous.size))
+        # One value per old group and then per new group, which the grouping
+        # of their unique keys reduces to one value per merged group
+        _, combined = self._update_grouping.aggregate(
+                          concatenate([previous, batch_values]), operator)
+        return self.unique_keys, combined
+
     def count(self) -> Tuple[groupable,pdarray]:
         '''
         Count the number of elements in each group, i.e. the number of times
@@ -229,8 +742,8 @@ class GroupBy:
         self.logger.debug(repMsg)
         return self.unique_keys, create_pdarray(repMsg)
     
-    def aggregate(self, values: groupable, operator: str, skipna: bool=True) \
-                    -> Tuple[groupable, pdarray]:
+    def aggregate(self, values: groupable, operator: str, skipna: bool=True,
+                  ddof: int_scalars=1, q: float=0.5) -> Tuple[groupable, pdarray]:
         '''
         Using the permutation stored in the GroupBy instance, group another 
         array of values and apply a reduction to each group's values. 
@@ -241,6 +754,12 @@ class GroupBy:
             The values to group and reduce
         operator: str
             The name of the reduction operator to use
+        skipna : bool
+            If True (default), ignore NaN values in float64 values
+        ddof : int_scalars
+            "Delta Degrees of Freedom" of the 'var' and 'std' operators
+        q : float
+            The quantile computed by the 'quantile' operator, in [0, 1]
 
         Returns
         -------
@@ -281,14 +800,25 @@ class GroupBy:
             raise ValueError(("Unsupported reduction: {}\nMust be one of {}")\
                                   .format(operator, self.Reductions))
         
-        # TO DO: remove once logic is ported over to Chapel
-        if operator == 'nunique':
+        # Strings, Categoricals and lists of arrays are counted by regrouping
+        if operator == 'nunique' and not isinstance(values, pdarray):
             return self.nunique(values)
 
         # All other aggregations operate on pdarray
         if cast(pdarray, values).size != self.size:
             raise ValueError(("Attempt to group array using key array of " +
                              "different length"))
+
+        if self.method == 'hash' and operator in HASH_REDUCTION_TYPES:
+            # Reduce by group id, without permuting the values
+            args = "{} {} {} {} {}".format(cast(pdarray, values).name,
+                                           cast(pdarray, self._group_ids).name,
+                                           self.ngroups,
+                                           operator,
+                                           skipna)
+            repMsg = generic_msg(cmd="hashReduction", args=args)
+            self.logger.debug(repMsg)
+            return self.unique_keys, create_pdarray(repMsg)
         
         if self.assume_sorted:
             permuted_values = cast(pdarray, values)
@@ -296,10 +826,11 @@ class GroupBy:
             permuted_values = cast(pdarray, values)[cast(pdarray, self.permutation)]
 
         cmd = "segmentedReduction"
-        args = "{} {} {} {}".format(permuted_values.name,
-                                    self.segments.name,
-                                    operator,
-                                    skipna)
+        args = "{} {} {} {} {}".format(permuted_values.name,
+                                       self.segments.name,
+                                       operator,
+                                       skipna,
+                                       _reduction_arg(operator, ddof, q))
         repMsg = generic_msg(cmd=cmd,args=args)
         self.logger.debug(repMsg)
         if operator.startswith('arg'):
@@ -308,6 +839,113 @@ class GroupBy:
         else:
             return self.unique_keys, create_pdarray(repMsg)
 
+    def agg(self, aggregations: Dict[str, Tuple[pdarray, Union[str, Sequence[str]]]],
+            skipna: bool=True, ddof: int_scalars=1, q: float=0.5) \
+            -> Tuple[groupable, Dict[str, Dict[str, pdarray]]]:
+        '''
+        Apply several reductions to several arrays of values in one request.
+        Each array of values is grouped once, and all of its reductions are
+        computed from the grouped values, instead of grouping the values
+        again for every reduction as aggregate() does.
+
+        Parameters
+        ----------
+        aggregations : dict
+            Maps a label to a (values, operators) pair, where values is the
+            pdarray to group and reduce and operators is the name of a
+            reduction operator or a list of names
+        skipna : bool
+            If True (default), ignore NaN values in float64 values
+        ddof : int_scalars
+            "Delta Degrees of Freedom" of the 'var' and 'std' operators
+        q : float
+            The quantile computed by the 'quantile' operator, in [0, 1]
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        results : dict
+            Maps each label to a dict that maps each of its operators to one
+            aggregate value per unique key
+
+        Raises
+        ------
+        TypeError
+            Raised if a values array is not a pdarray
+        ValueError
+            Raised if a values array size does not match the key array size
+            or if an operator is not in the GroupBy.Reductions array
+        RuntimeError
+            Raised if a requested operator is not supported for the values
+            dtype
+
+        Examples
+        --------
+        >>> keys = ak.array([1, 2, 1, 2, 3])
+        >>> vals = ak.array([4, 1, 6, 3, 5])
+        >>> g = ak.GroupBy(keys)
+        >>> uk, res = g.agg({'vals': (vals, ['sum', 'max'])})
+        >>> res['vals']['sum']
+        array([10, 4, 5])
+        >>> res['vals']['max']
+        array([6, 3, 5])
+        '''
+        results : Dict[str, Dict[str, pdarray]] = {}
+        # (values, [(label, operator)]) for the operators reduced by each command
+        hashed : List[Tuple[pdarray, List[Tuple[str, str]]]] = []
+        segmented : List[Tuple[pdarray, List[Tuple[str, str]]]] = []
+        for label, (values, operators) in aggregations.items():
+            if not isinstance(values, pdarray):
+                raise TypeError("values for {} must be a pdarray".format(label))
+            if values.size != self.size:
+                raise ValueError(("Attempt to group array using key array of " +
+                                  "different length"))
+            if isinstance(operators, str):
+                operators = [operators]
+            results[label] = {}
+            hashops, segops = [], []
+            for op in operators:
+                op = op.lower()
+                if op not in self.Reductions:
+                    raise ValueError(("Unsupported reduction: {}\nMust be one of {}")\
+                                     .format(op, self.Reductions))
+                if self.method == 'hash' and op in HASH_REDUCTION_TYPES:
+                    hashops.append((label, op))
+                else:
+                    segops.append((label, op))
+            if hashops:
+                hashed.append((values, hashops))
+            if segops:
+                segmented.append((values, segops))
+
+        def token(op : str) -> str:
+            # operators that take an argument are sent as op:arg
+            if op in ('var', 'std', 'quantile'):
+                return "{}:{}".format(op, _reduction_arg(op, ddof, q))
+            return op
+
+        def send(cmd : str, prefix : str,
+                 requests : List[Tuple[pdarray, List[Tuple[str, str]]]]) -> None:
+            args = "{} {} {} {}".format(prefix, skipna, len(requests),
+                                        ' '.join("{} {}".format(values.name,
+                                                                ','.join(token(op) for _, op in ops))
+                                                 for values, ops in requests))
+            repMsg = generic_msg(cmd=cmd, args=args)
+            self.logger.debug(repMsg)
+            labels = [lop for _, ops in requests for lop in ops]
+            for (label, op), created in zip(labels, cast(str, repMsg).split('+')):
+                results[label][op] = create_pdarray(created)
+
+        if hashed:
+            send("hashAggregate", "{} {}".format(cast(pdarray, self._group_ids).name,
+                                                 self.ngroups), hashed)
+        if segmented:
+            send("segmentedAggregate", "{} {}".format('none' if self.assume_sorted else
+                                                      self.permutation.name,
+                                                      self.segments.name), segmented)
+        return self.unique_keys, results
+
     def sum(self, values : pdarray, skipna : bool=True) \
                          -> Tuple[groupable, pdarray]:
         """
@@ -449,6 +1087,189 @@ class GroupBy:
         (array([2, 3, 4]), array([2.6666666666666665, 2.7999999999999998, 3]))
         """
         return self.aggregate(values, "mean", skipna)
+
+    def var(self, values : pdarray, skipna : bool=True, ddof : int_scalars=1) \
+                    -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and compute the variance of each group's
+        values, in one pass over the grouped values.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and find the variance of
+        skipna : bool
+            If True (default), ignore NaN values in float64 values
+        ddof : int_scalars
+            "Delta Degrees of Freedom": the divisor of each group is its
+            number of values minus ddof (Default: 1)
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        group_vars : pdarray, float64
+            One variance per unique key in the GroupBy instance
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray object
+        ValueError
+            Raised if the key array size does not match the values size
+            or if the operator is not in the GroupBy.Reductions array
+        RuntimeError
+            Raised if var is not supported for the values dtype
+
+        Notes
+        -----
+        The return dtype is always float64. Groups with no more than ddof
+        values have a variance of NaN.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([1, 1, 2, 2, 2]))
+        >>> g.var(ak.array([1, 3, 2, 4, 6]))
+        (array([1, 2]), array([2, 4]))
+        """
+        return self.aggregate(values, "var", skipna, ddof=ddof)
+
+    def std(self, values : pdarray, skipna : bool=True, ddof : int_scalars=1) \
+                    -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and compute the standard deviation of each
+        group's values, the square root of its variance.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and find the standard deviation of
+        skipna : bool
+            If True (default), ignore NaN values in float64 values
+        ddof : int_scalars
+            "Delta Degrees of Freedom": the divisor of each group is its
+            number of values minus ddof (Default: 1)
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        group_stds : pdarray, float64
+            One standard deviation per unique key in the GroupBy instance
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray object
+        ValueError
+            Raised if the key array size does not match the values size
+            or if the operator is not in the GroupBy.Reductions array
+        RuntimeError
+            Raised if std is not supported for the values dtype
+
+        Notes
+        -----
+        The return dtype is always float64.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([1, 1, 2, 2, 2]))
+        >>> g.std(ak.array([1, 3, 2, 4, 6]))
+        (array([1, 2]), array([1.4142135623730951, 2]))
+        """
+        return self.aggregate(values, "std", skipna, ddof=ddof)
+
+    def median(self, values : pdarray, skipna : bool=True) \
+                    -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and compute the median of each group's
+        values.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and find the median of
+        skipna : bool
+            If True (default), ignore NaN values in float64 values
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        group_medians : pdarray, float64
+            One median per unique key in the GroupBy instance
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray object
+        ValueError
+            Raised if the key array size does not match the values size
+            or if the operator is not in the GroupBy.Reductions array
+        RuntimeError
+            Raised if median is not supported for the values dtype
+
+        Notes
+        -----
+        The return dtype is always float64. The median of a group with an
+        even number of values is the mean of its two middle values.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([1, 1, 2, 2, 2]))
+        >>> g.median(ak.array([1, 4, 2, 9, 6]))
+        (array([1, 2]), array([2.5, 6]))
+        """
+        return self.aggregate(values, "median", skipna)
+
+    def quantile(self, values : pdarray, q : float, skipna : bool=True) \
+                    -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, group
+        another array of values and compute the q-th quantile of each
+        group's values, interpolating linearly between the two nearest
+        values as numpy.quantile does by default.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and find the quantile of
+        q : float
+            The quantile to compute, in [0, 1]
+        skipna : bool
+            If True (default), ignore NaN values in float64 values
+
+        Returns
+        -------
+        unique_keys : (list of) pdarray or Strings
+            The unique keys, in grouped order
+        group_quantiles : pdarray, float64
+            One quantile per unique key in the GroupBy instance
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray object
+        ValueError
+            Raised if the key array size does not match the values size,
+            or if q is not in [0, 1]
+        RuntimeError
+            Raised if quantile is not supported for the values dtype
+
+        Notes
+        -----
+        The return dtype is always float64.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([1, 1, 2, 2, 2]))
+        >>> g.quantile(ak.array([1, 4, 2, 9, 6]), 0.25)
+        (array([1, 2]), array([1.75, 4]))
+        """
+        return self.aggregate(values, "quantile", skipna, q=q)
     
     def min(self, values : pdarray, skipna : bool=True) \
                     -> Tuple[groupable, pdarray]:
@@ -696,18 +1517,17 @@ class GroupBy:
         #    Group (3,3,3) has values [3,4,1] -> 3 unique values
         #    Group (4) has values [4] -> 1 unique value
         """
-        # TO DO: defer to self.aggregate once logic is ported over to Chapel
-        # return self.aggregate(values, "nunique")
-        
-        ukidx = self.broadcast(arange(self.ngroups), permute=True)
-        # Test if values is single array, i.e. either pdarray, Strings,
-        # or Categorical (the last two have a .group() method).
-        # Can't directly test Categorical due to circular import.
         if isinstance(values, pdarray):
             if cast(pdarray, values).dtype != int64 and cast(pdarray, values).dtype != uint64:
                 raise TypeError("nunique unsupported for this dtype")
-            togroup = [ukidx, values]
-        elif hasattr(values, "group"):
+            # Counted by the server from the grouped values
+            return self.aggregate(values, "nunique")
+
+        ukidx = self.broadcast(arange(self.ngroups), permute=True)
+        # Test if values is single array, i.e. either Strings or
+        # Categorical (both have a .group() method).
+        # Can't directly test Categorical due to circular import.
+        if hasattr(values, "group"):
             togroup = [ukidx, values]
         else:
             for v in values:
@@ -723,6 +1543,57 @@ class GroupBy:
         # Re-join unique counts with original keys (sorting guarantees same order)
         return self.unique_keys, nuniq
     
+    def approx_nunique(self, values : Union[pdarray, Strings],
+                       precision : int=10) -> Tuple[groupable, pdarray]:
+        """
+        Using the permutation stored in the GroupBy instance, estimate the
+        number of unique values in each group with a HyperLogLog sketch per
+        group, without sorting the values.
+
+        Parameters
+        ----------
+        values : pdarray or Strings
+            The values, of dtype int64, uint64, float64 or bool
+        precision : int
+            The log2 of the number of registers of the sketch of each group,
+            between 4 and 18 (default 10), for a relative error of about
+            1.04 / sqrt(2**precision)
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        group_nunique : pdarray, int64
+            Estimated number of unique values per unique key
+
+        Raises
+        ------
+        TypeError
+            Raised if values is not a pdarray or Strings, or has a dtype that
+            cannot be sketched
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if precision is out of range
+
+        See Also
+        --------
+        nunique, approx_nunique
+
+        Notes
+        -----
+        Each group takes 2**precision bytes of server memory while the
+        estimates are computed.
+        """
+        from arkouda.sketches import _sketch_args
+        if values.size != self.size:
+            raise ValueError("Attempt to group array using key array of different length")
+        args = "{} {} {} {}".format(_sketch_args(values), precision, self.permutation.name,
+                                    self.segments.name)
+        regs = create_pdarray(cast(str, generic_msg(cmd="hllBuild", args=args)))
+        repMsg = generic_msg(cmd="hllEstimate", args="{} {}".format(regs.name, precision))
+        return self.unique_keys, create_pdarray(cast(str, repMsg))
+
     def any(self, values : pdarray) \
                     -> Tuple[Union[pdarray,List[Union[pdarray,Strings]]],pdarray]:
         """
@@ -961,6 +1832,9 @@ class GroupBy:
         """
         if values.size != self.segments.size:
             raise ValueError("Must have one value per segment")
+        if self.method == 'hash' and permute:
+            # Each row's group id indexes its group's value
+            return cast(pdarray, values[cast(pdarray, self._group_ids)])
         cmd = "broadcast"
         args = "{} {} {} {} {}".format(self.permutation.name,
                                                 self.segments.name,
@@ -970,6 +1844,30 @@ class GroupBy:
         repMsg = generic_msg(cmd=cmd,args=args)
         return create_pdarray(repMsg)
 
+def _attach_groupable(user_defined_name : str, registry : List[str]) -> groupable_element_type:
+    """
+    Attach to the pdarray, Strings or Categorical registered under
+    user_defined_name, whichever it is
+    """
+    from arkouda.categorical import Categorical
+    if f"{user_defined_name}.codes" in registry:
+        return Categorical.attach(user_defined_name)
+    repMsg = cast(str, generic_msg(cmd="attach", args=user_defined_name))
+    if repMsg.split()[2] == "str":
+        return Strings.from_return_msg(repMsg)
+    return create_pdarray(repMsg)
+
+def _reduction_arg(operator : str, ddof : int_scalars, q : float) -> str:
+    '''
+    The argument sent with a reduction operator: the q of quantile, or else
+    the ddof of var and std, which the other operators ignore
+    '''
+    if operator == 'quantile':
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        return str(float(q))
+    return str(int(ddof))
+
 def broadcast(segments : pdarray, values : pdarray, size : Union[int,np.int64,np.uint64]=-1,
               permutation : Union[pdarray, None]=None):
     '''
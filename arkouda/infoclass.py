@@ -2,7 +2,7 @@ import json
 from json import JSONEncoder
 from typing import cast, List, Union
 from typeguard import typechecked
-from arkouda.client import generic_msg
+from arkouda.client import generic_msg, _metadata_cache
 
 __all__ = ["AllSymbols", "RegisteredSymbols", "information", "list_registry", "list_symbol_table",
            'pretty_print_information']
@@ -59,13 +59,42 @@ def information(names: Union[List[str], str] = RegisteredSymbols) -> str:
     RuntimeError
         Raised if a server-side error is thrown in the process of
         retrieving information about the objects in names
+
+    Notes
+    -----
+    The entries of named objects and of the registry are cached by the client
+    until a command changes the registry or the client reconnects, so only
+    ak.AllSymbols always queries the server.
     """
     if isinstance(names, str):
-        if names in [AllSymbols, RegisteredSymbols]:
-            return cast(str, generic_msg(cmd="info", args="{}".format(names)))
+        if names == AllSymbols:
+            rep_msg = cast(str, generic_msg(cmd="info", args="{}".format(names)))
+            _cache_entries(json.loads(rep_msg))
+            return rep_msg
+        elif names == RegisteredSymbols:
+            if _metadata_cache.registry is None:
+                registry = json.loads(cast(str, generic_msg(cmd="info", args=names)))
+                _cache_entries(registry)
+                _metadata_cache.registry = registry
+            return json.dumps(_metadata_cache.registry)
         else:
             names = [names]  # allows user to call ak.information(pda.name)
-    return cast(str, generic_msg(cmd="info", args=json.dumps(names)))
+    entries = _metadata_cache.entries
+    missing = [name for name in names if name not in entries]
+    if missing:
+        fetched = json.loads(cast(str, generic_msg(cmd="info", args=json.dumps(missing))))
+        _cache_entries(fetched)
+        entries = {**entries, **{entry['name']: entry for entry in fetched}}
+    return json.dumps([entries[name] for name in names])
+
+
+def _cache_entries(entries: List[dict]) -> None:
+    """
+    Internal method that adds the info entries returned by the server to the
+    client-side metadata cache
+    """
+    for entry in entries:
+        _metadata_cache.entries[entry['name']] = entry
 
 
 def list_registry() -> List[str]:
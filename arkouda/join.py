@@ -1,17 +1,19 @@
-from typing import cast, Tuple, Union
+from typing import cast, List, Sequence, Tuple, Union
 from typeguard import typechecked
 import numpy as np  # type: ignore
 from arkouda.client import generic_msg
 from arkouda.dtypes import int64 as akint64
 from arkouda.dtypes import resolve_scalar_dtype, NUMBER_FORMAT_STRINGS
 from arkouda.pdarrayclass import pdarray, create_pdarray
+from arkouda.strings import Strings
+from arkouda.categorical import Categorical
 from arkouda.pdarraycreation import array, ones, zeros, zeros_like, arange
 from arkouda.pdarraysetops import concatenate, in1d, intersect1d
 from arkouda.alignment import right_align
 from arkouda.numeric import cumsum
 from arkouda.groupbyclass import GroupBy, broadcast
 
-__all__ = ["join_on_eq_with_dt"]
+__all__ = ["join_on_eq_with_dt", "join_keys"]
 
 predicates = {"true_dt": 0, "abs_dt": 1, "pos_dt": 2}
 
@@ -101,6 +103,117 @@ def join_on_eq_with_dt(a1: pdarray, a2: pdarray, t1: pdarray,
     return (resI, resJ)
 
 
+JOIN_TYPES = frozenset(["inner", "left", "right", "outer"])
+JOIN_METHODS = frozenset(["auto", "hash", "sort"])
+
+groupable_key = Union[pdarray, Strings, Categorical]
+
+
+def _join_columns(keys: Union[groupable_key, Sequence[groupable_key]]) \
+        -> Tuple[List[pdarray], List[str]]:
+    """
+    Converts the key columns of a table to the numeric columns the server
+    joins on, along with the kind of each key column: Strings are joined on
+    the hash of each string, and Categoricals on the hash of the category of
+    each row, so that a Categorical joins with a Strings of the same values.
+    """
+    if isinstance(keys, (pdarray, Strings, Categorical)):
+        keys = [keys]
+    columns: List[pdarray] = []
+    kinds: List[str] = []
+    for k in keys:
+        if isinstance(k, pdarray):
+            columns.append(k)
+            kinds.append(k.dtype.name)
+        elif isinstance(k, Strings):
+            columns.extend(k.hash())
+            kinds.append('str')
+        elif isinstance(k, Categorical):
+            columns.extend(h[k.codes] for h in k.categories.hash())
+            kinds.append('str')
+        else:
+            raise TypeError("join keys must be pdarray, Strings, or Categorical")
+    if len(columns) == 0:
+        raise ValueError("at least one join key is required")
+    size = columns[0].size
+    if not all(c.size == size for c in columns):
+        raise ValueError("key columns of a table must all be the same size")
+    return columns, kinds
+
+
+def join_keys(left: Union[groupable_key, Sequence[groupable_key]],
+              right: Union[groupable_key, Sequence[groupable_key]],
+              how: str = 'inner', method: str = 'auto') -> Tuple[pdarray, pdarray]:
+    """
+    Joins two tables on equal keys, returning the row indices of the
+    joined pairs.
+
+    Parameters
+    ----------
+    left : pdarray, Strings, Categorical, or list of these
+        The key column(s) of the left table
+    right : pdarray, Strings, Categorical, or list of these
+        The key column(s) of the right table, matching the left key
+        columns in number and type
+    how : str
+        'inner' (default) keeps the matched pairs only, 'left' also the
+        unmatched left rows, 'right' also the unmatched right rows, and
+        'outer' the unmatched rows of both tables
+    method : str
+        'hash' joins by copying the smaller table to every locale and
+        looking up its rows by key, 'sort' by sorting the keys of both
+        tables together, and 'auto' (default) hashes unless the smaller
+        table is too large to copy
+
+    Returns
+    -------
+    leftInds : pdarray, int64
+        The left row of each pair, -1 for an unmatched right row
+    rightInds : pdarray, int64
+        The right row of each pair, -1 for an unmatched left row
+
+    Raises
+    ------
+    TypeError
+        Raised if the keys are not pdarray, Strings, or Categorical, or
+        the left and right key columns do not have the same types
+    ValueError
+        Raised if how or method is not one of the above, or if the key
+        columns of a table are not the same size
+
+    See Also
+    --------
+    DataFrame.merge
+
+    Notes
+    -----
+    The pairs are not returned in any particular order. Rows are matched by
+    a 128-bit hash of their key columns, like hash-based GroupBy, so a false
+    match is vanishingly unlikely. A key column joins only with a key column
+    of the same dtype, except that Strings and Categorical join each other.
+
+    Examples
+    --------
+    >>> l, r = ak.join_keys(ak.array([1, 2, 2, 3]), ak.array([2, 3, 4]))
+    >>> ak.array([1, 2, 2, 3])[l] == ak.array([2, 3, 4])[r]
+    array([True, True, True])
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"how must be one of {sorted(JOIN_TYPES)}")
+    if method not in JOIN_METHODS:
+        raise ValueError(f"method must be one of {sorted(JOIN_METHODS)}")
+    lcols, lkinds = _join_columns(left)
+    rcols, rkinds = _join_columns(right)
+    if lkinds != rkinds:
+        raise TypeError(f"left keys of types {lkinds} cannot be joined with right keys of types {rkinds}")
+    repMsg = generic_msg(cmd="join", args="{} {} {} {} {}".format(
+        how, method, len(lcols),
+        ' '.join(c.name for c in lcols),
+        ' '.join(c.name for c in rcols)))
+    leftAttr, rightAttr = cast(str, repMsg).split("+")
+    return create_pdarray(leftAttr), create_pdarray(rightAttr)
+
+
 def gen_ranges(starts, ends):
     """ Generate a segmented array of variable-length, contiguous
     ranges between pairs of start- and end-points.
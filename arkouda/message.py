@@ -1,7 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict
+import struct
+from typing import Dict, List, Tuple
 
 """
 The MessageFormat enum provides controlled vocabulary for the message
@@ -55,17 +56,19 @@ context of an Arkouda server request.
 @dataclass(frozen=True)
 class RequestMessage():
     
-    __slots = ('user', 'token', 'cmd', 'format', 'args')
+    __slots = ('user', 'token', 'cmd', 'format', 'args', 'replyFormat')
 
     user: str
     token: str
     cmd: str
     format: MessageFormat
     args: str
+    replyFormat: MessageFormat = field(default=MessageFormat.STRING, repr=False)
 
     def __init__(self, user : str, cmd : str, token : str=None, 
                  format : MessageFormat=MessageFormat.STRING, 
-                 args : str=None) -> None:
+                 args : str=None,
+                 replyFormat : MessageFormat=MessageFormat.STRING) -> None:
         """
         Overridden __init__ method sets instance attributes to 
         default values if the corresponding init params are missing.
@@ -83,6 +86,9 @@ class RequestMessage():
             The request message format 
         args : str
             The delimited string containing the command arguments
+        replyFormat : MessageFormat
+            The format of the reply, BINARY only if the server supports
+            binary-encoded replies
             
         Returns
         -------
@@ -93,6 +99,7 @@ class RequestMessage():
         object.__setattr__(self, 'cmd',cmd)
         object.__setattr__(self, 'format',format)
         object.__setattr__(self, 'args',args)
+        object.__setattr__(self, 'replyFormat',replyFormat)
 
     def asdict(self) -> Dict:
         """
@@ -108,11 +115,14 @@ class RequestMessage():
         # args and token logic will not be needed once Chapel supports nulls
         args = self.args if self.args else ''
         token = self.token if self.token else ''
+        # a binary reply is requested by appending its format to the request format
+        format = str(self.format) if self.replyFormat == MessageFormat.STRING \
+                                  else '{}/{}'.format(self.format, self.replyFormat)
 
         return {'user': self.user,
                 'token': token,
                 'cmd': self.cmd,
-                'format': str(self.format),
+                'format': format,
                 'args' : args}
 
 '''
@@ -155,3 +165,100 @@ class ReplyMessage():
                         msgType=MessageType(values['msgType']), user=values['user'])
         except KeyError as ke:
             raise ValueError('values dict missing {} field'.format(ke))
+
+    @staticmethod
+    def frombinary(data : bytes) -> ReplyMessage:
+        """
+        Generates a ReplyMessage from a binary-encoded reply returned by the
+        Arkouda server. If the reply describes created entries, the msg is a
+        CreatedReply holding their attributes.
+
+        Parameters
+        ----------
+        data : bytes
+            The binary-encoded reply; the layout is documented with
+            serializeBinary in Message.chpl
+
+        Returns
+        -------
+        ReplyMessage
+            The ReplyMessage decoded from data; the user is not encoded
+
+        Raises
+        ------
+        ValueError
+            Raised if data is truncated or contains malformed values
+        """
+        try:
+            msgType = _BINARY_MSG_TYPES[data[0]]
+            numEntries, = struct.unpack_from('<H', data, 1)
+            offset = 3
+            entries : Dict[int, Tuple] = {}
+            for _ in range(numEntries):
+                part, nameLen = struct.unpack_from('<HH', data, offset)
+                offset += 4
+                name = data[offset:offset+nameLen].decode()
+                offset += nameLen
+                dtypeLen = data[offset]
+                dtype = data[offset+1:offset+1+dtypeLen].decode()
+                offset += 1 + dtypeLen
+                size, ndim = struct.unpack_from('<qB', data, offset)
+                offset += 9
+                shape = list(struct.unpack_from('<{}q'.format(ndim), data, offset))
+                offset += 8*ndim
+                itemsize, = struct.unpack_from('<q', data, offset)
+                offset += 8
+                entries[part] = (name, dtype, size, ndim, shape, itemsize)
+            msg = data[offset:].decode()
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError('malformed binary reply: {}'.format(e))
+        if entries and not msg:
+            # replies made of created entries only are sent without the text
+            msg = '+'.join(_created_part(*entries[part]) for part in sorted(entries))
+        return ReplyMessage(msg=CreatedReply(msg, entries) if entries else msg,
+                            msgType=msgType, user='')
+
+_BINARY_MSG_TYPES = (MessageType.NORMAL, MessageType.WARNING, MessageType.ERROR)
+
+def _created_part(name : str, dtype : str, size : int, ndim : int, shape : List[int],
+                  itemsize : int) -> str:
+    """
+    Internal method that formats the attributes of a created entry like the
+    "created" reply part sent by the server
+    """
+    return 'created {} {} {} {} ({}) {}'.format(name, dtype, size, ndim,
+                                                ', '.join(str(dim) for dim in shape), itemsize)
+
+class CreatedReply(str):
+    """
+    The msg of a binary-encoded reply describing entries created by the
+    server, e.g. "created name dtype size ndim (shape) itemsize", which also
+    holds the attributes of the entries so that they need not be parsed
+    from the string.
+
+    Attributes
+    ----------
+    entries : Dict[int, Tuple]
+        The (name, dtype, size, ndim, shape, itemsize) of each created entry,
+        keyed by the index of its part among the "+"-delimited parts of the
+        reply
+    """
+
+    entries : Dict[int, Tuple]
+
+    def __new__(cls, msg : str, entries : Dict[int, Tuple]) -> CreatedReply:
+        reply = super().__new__(cls, msg)
+        reply.entries = entries
+        return reply
+
+    def split(self, sep=None, maxsplit=-1) -> List[str]: # type: ignore
+        """
+        Splitting on "+" returns the parts as CreatedReply objects holding
+        the attributes of their entries, so that the callers splitting
+        multi-entry replies keep the decoded attributes.
+        """
+        parts = super().split(sep, maxsplit)
+        if sep != '+':
+            return parts
+        return [CreatedReply(part, {0: self.entries[i]}) if i in self.entries else part
+                for i, part in enumerate(parts)]
@@ -7,6 +7,7 @@ from arkouda.dtypes import resolve_scalar_dtype, DTypes, isSupportedNumber, \
      int_scalars, numeric_scalars
 from arkouda.dtypes import _as_dtype
 from arkouda.pdarrayclass import pdarray, create_pdarray
+from arkouda.expression import is_lazy, lazy_efunc, lazy_where
 from arkouda.pdarraysetops import unique
 from arkouda.strings import Strings
 from enum import Enum
@@ -121,6 +122,10 @@ def abs(pda : pdarray) -> pdarray:
     >>> ak.abs(ak.linspace(-5,-1,5))
     array([5, 4, 3, 2, 1])    
     """
+    if is_lazy():
+        result = lazy_efunc("abs", pda)
+        if result is not None:
+            return result
     repMsg = generic_msg(cmd="efunc", args="{} {}".format("abs", pda.name))
     return create_pdarray(type_cast(str,repMsg))
 
@@ -161,6 +166,10 @@ def log(pda : pdarray) -> pdarray:
     >>> ak.log(A) / np.log(2)
     array([0, 3.3219280948873626, 6.6438561897747253])
     """
+    if is_lazy():
+        result = lazy_efunc("log", pda)
+        if result is not None:
+            return result
     repMsg = generic_msg(cmd="efunc", args="{} {}".format("log", pda.name))
     return create_pdarray(type_cast(str,repMsg))
 
@@ -193,6 +202,10 @@ def exp(pda : pdarray) -> pdarray:
     array([11.84010843172504, 46.454368507659211, 5.5571769623557188, 
            33.494295836924771, 13.478894913238722])
     """
+    if is_lazy():
+        result = lazy_efunc("exp", pda)
+        if result is not None:
+            return result
     repMsg = generic_msg(cmd="efunc", args="{} {}".format("exp", pda.name))
     return create_pdarray(type_cast(str,repMsg))
 
@@ -289,6 +302,10 @@ def sin(pda : pdarray) -> pdarray:
     TypeError
         Raised if the parameter is not a pdarray
     """
+    if is_lazy():
+        result = lazy_efunc("sin", pda)
+        if result is not None:
+            return result
     repMsg = generic_msg(cmd="efunc", args="{} {}".format("sin",pda.name))
     return create_pdarray(type_cast(str,repMsg))
 
@@ -312,6 +329,10 @@ def cos(pda : pdarray) -> pdarray:
     TypeError
         Raised if the parameter is not a pdarray
     """
+    if is_lazy():
+        result = lazy_efunc("cos", pda)
+        if result is not None:
+            return result
     repMsg = type_cast(str, generic_msg(cmd="efunc", args="{} {}".format("cos",pda.name)))
     return create_pdarray(type_cast(str,repMsg))
 
@@ -431,6 +452,10 @@ def where(condition : pdarray, A : Union[numeric_scalars, pdarray],
     if (not isSupportedNumber(A) and not isinstance(A,pdarray)) or \
                                       (not isSupportedNumber(B) and not isinstance(B,pdarray)):
         raise TypeError('both A and B must be an int, np.int64, float, np.float64, or pdarray')
+    if is_lazy():
+        result = lazy_where(condition, A, B)
+        if result is not None:
+            return result
     if isinstance(A, pdarray) and isinstance(B, pdarray):
         repMsg = generic_msg(cmd="efunc3vv", args="{} {} {} {}".\
                              format("where",
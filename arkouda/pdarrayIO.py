@@ -1,13 +1,15 @@
 from typeguard import typechecked
 import json, os, warnings
-from typing import cast, Dict, List, Mapping, Optional, Union
+from typing import cast, Any, Dict, List, Mapping, Optional, Tuple, Union
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
 
 from arkouda.client import generic_msg
 from arkouda.pdarrayclass import pdarray, create_pdarray
 from arkouda.strings import Strings
 from arkouda.categorical import Categorical
 
-__all__ = ["ls", "read", "load", "get_datasets",
+__all__ = ["ls", "read", "read_parquet", "read_csv", "load", "get_datasets",
            "load_all", "save_all",  "get_filetype"]
 
 ARKOUDA_HDF5_FILE_METADATA_GROUP = "_arkouda_metadata"
@@ -50,7 +52,8 @@ def read(filenames : Union[str, List[str]],
          strictTypes: bool = True,
          allow_errors: bool = False,
          calc_string_offsets = False,
-         file_format: str = 'infer')\
+         file_format: str = 'infer',
+         direct_io: bool = True)\
          -> Union[pdarray, Strings, Mapping[str,Union[pdarray,Strings]]]:
     """
     Read datasets from HDF5 or Parquet files.
@@ -83,6 +86,11 @@ def read(filenames : Union[str, List[str]],
         type checking will be skipped and will execute expecting all files in
         filenames to be of the specified type. Otherwise, will infer filetype
         based off of first file in filenames, expanded if a glob expression.
+    direct_io: bool
+        Default True, the server reads HDF5 datasets stored contiguously and
+        uncompressed directly from their files with large preads, bypassing
+        the HDF5 library and its chunk cache. If False, every dataset is read
+        through the HDF5 library. Ignored for Parquet files.
 
     Returns
     -------
@@ -148,43 +156,229 @@ def read(filenames : Union[str, List[str]],
         cmd = 'readany'
     if iterative == True: # iterative calls to server readhdf
         return {dset: read(filenames, dset, strictTypes=strictTypes, allow_errors=allow_errors, iterative=False,
-                           calc_string_offsets=calc_string_offsets)[dset] for dset in datasets}
+                           calc_string_offsets=calc_string_offsets, direct_io=direct_io)[dset]
+                for dset in datasets}
     else:
         rep_msg = generic_msg(cmd=cmd, args=
-        f"{strictTypes} {len(datasets)} {len(filenames)} {allow_errors} {calc_string_offsets} {json.dumps(datasets)} | {json.dumps(filenames)}"
+        f"{strictTypes} {len(datasets)} {len(filenames)} {allow_errors} {calc_string_offsets} {direct_io} {json.dumps(datasets)} | {json.dumps(filenames)}"
                           )
-        rep = json.loads(rep_msg)  # See GenSymIO._buildReadAllHdfMsgJson for json structure
-        items = rep["items"] if "items" in rep else []
-        file_errors = rep["file_errors"] if "file_errors" in rep else []
-        if allow_errors and file_errors:
-            file_error_count = rep["file_error_count"] if "file_error_count" in rep else -1
-            warnings.warn(f"There were {file_error_count} errors reading files on the server. " +
-                          f"Sample error messages {file_errors}", RuntimeWarning)
-
-        # We have a couple possible return conditions
-        # 1. We have multiple items returned i.e. multi pdarrays, multi strings, multi pdarrays & strings
-        # 2. We have a single pdarray
-        # 3. We have a single strings object
-        if len(items) > 1: #  DataSets condition
-            d: Dict[str, Union[pdarray, Strings]] = {}
-            for item in items:
-                if "seg_string" == item["arkouda_type"]:
-                    d[item["dataset_name"]] = Strings.from_return_msg(item["created"])
-                elif "pdarray" == item["arkouda_type"]:
-                    d[item["dataset_name"]] = create_pdarray(item["created"])
-                else:
-                    raise TypeError(f"Unknown arkouda type:{item['arkouda_type']}")
-            return d
-        elif len(items) == 1:
-            item = items[0]
-            if "pdarray" == item["arkouda_type"]:
-                return create_pdarray(item["created"])
-            elif "seg_string" == item["arkouda_type"]:
-                return Strings.from_return_msg(item["created"])
+        return _build_objects(cast(str, rep_msg), allow_errors)
+
+def _build_objects(rep_msg : str, allow_errors : bool = False) \
+        -> Union[pdarray, Strings, Mapping[str,Union[pdarray,Strings]]]:
+    """
+    Creates the arrays of the json reply of a read, a single array for a
+    single dataset and a dictionary of arrays by dataset name otherwise
+    """
+    rep = json.loads(rep_msg)  # See GenSymIO._buildReadAllHdfMsgJson for json structure
+    items = rep["items"] if "items" in rep else []
+    file_errors = rep["file_errors"] if "file_errors" in rep else []
+    if allow_errors and file_errors:
+        file_error_count = rep["file_error_count"] if "file_error_count" in rep else -1
+        warnings.warn(f"There were {file_error_count} errors reading files on the server. " +
+                      f"Sample error messages {file_errors}", RuntimeWarning)
+
+    # We have a couple possible return conditions
+    # 1. We have multiple items returned i.e. multi pdarrays, multi strings, multi pdarrays & strings
+    # 2. We have a single pdarray
+    # 3. We have a single strings object
+    if len(items) > 1: #  DataSets condition
+        d: Dict[str, Union[pdarray, Strings]] = {}
+        for item in items:
+            if "seg_string" == item["arkouda_type"]:
+                d[item["dataset_name"]] = Strings.from_return_msg(item["created"])
+            elif "pdarray" == item["arkouda_type"]:
+                d[item["dataset_name"]] = create_pdarray(item["created"])
             else:
                 raise TypeError(f"Unknown arkouda type:{item['arkouda_type']}")
+        return d
+    elif len(items) == 1:
+        item = items[0]
+        if "pdarray" == item["arkouda_type"]:
+            return create_pdarray(item["created"])
+        elif "seg_string" == item["arkouda_type"]:
+            return Strings.from_return_msg(item["created"])
         else:
-            raise RuntimeError("No items were returned")
+            raise TypeError(f"Unknown arkouda type:{item['arkouda_type']}")
+    else:
+        raise RuntimeError("No items were returned")
+
+PARQUET_FILTER_OPS = ('==', '!=', '<', '<=', '>', '>=', 'in')
+
+def _filter_value_str(value) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return str(value).lower()
+    if isinstance(value, (np.datetime64, pd.Timestamp)):
+        return str(pd.Timestamp(value).value)
+    return str(value)
+
+def read_parquet(filenames : Union[str, List[str]],
+                 columns : Optional[Union[str, List[str]]] = None,
+                 filters : Optional[List[Tuple[str, str, Any]]] = None) \
+        -> Union[pdarray, Strings, Mapping[str,Union[pdarray,Strings]]]:
+    """
+    Read columns from Parquet files, keeping only the rows that satisfy
+    every one of a list of predicates.
+
+    Parameters
+    ----------
+    filenames : list or str
+        Either a list of filenames or shell expression
+    columns : list or str or None
+        (List of) name(s) of column(s) to read (default: all available)
+    filters : list of (column, op, value) tuples or None
+        Predicates that every row read must satisfy, where op is one of
+        '==', '!=', '<', '<=', '>', '>=' or 'in', in which case value is a
+        list of values. Filter columns need not be among the columns read.
+
+    Returns
+    -------
+    For a single column returns an Arkouda pdarray or Arkouda Strings object
+    and for multiple columns returns a dictionary of Arkouda pdarrays or
+    Arkouda Strings.
+        Dictionary of {columnName: pdarray or String}
+
+    Raises
+    ------
+    ValueError
+        Raised if a filter has an unknown op, or if an 'in' filter has no
+        values
+    RuntimeError
+        Raised if one or more of the specified files cannot be opened or if
+        a filter value cannot be converted to the type of its column
+
+    See Also
+    --------
+    read, get_datasets
+
+    Notes
+    -----
+    The server skips the row groups whose column statistics, or dictionary
+    pages when every page of a column chunk is dictionary encoded, show that
+    none of their rows can satisfy a filter, and skips the files none of
+    whose row groups remain. It evaluates the filters on the rows of the
+    remaining row groups and decodes only the rows that satisfy them, so
+    that filtered-out rows never become arrays.
+
+    Rows with a null in a filter column satisfy no filter. Filter values on
+    timestamp columns are compared with the stored integers, to which
+    datetimes are converted in nanoseconds.
+
+    Examples
+    --------
+    >>> ak.read_parquet('events*', columns=['ts', 'user'],
+    ...                 filters=[('ts', '>=', t0), ('user', 'in', ['a', 'b'])])
+    """
+    if not filters:
+        return read(filenames, columns, file_format='parquet')
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    if columns is None:
+        columns = get_datasets(filenames[0])
+    if isinstance(columns, str):
+        columns = [columns]
+    fields: List[str] = []
+    for column, op, value in filters:
+        if op not in PARQUET_FILTER_OPS:
+            raise ValueError(f"Unknown filter op {op}, expected one of {PARQUET_FILTER_OPS}")
+        values = list(value) if op == 'in' else [value]
+        if len(values) == 0:
+            raise ValueError(f"Filter 'in' on column {column} has no values")
+        fields += [column, op, str(len(values))] + [_filter_value_str(v) for v in values]
+    rep_msg = generic_msg(cmd="readFilteredParquet", args=
+        f"{len(columns)} {len(filenames)} {len(fields)} {json.dumps(columns)} | {json.dumps(filenames)} | {json.dumps(fields)}"
+                          )
+    return _build_objects(cast(str, rep_msg))
+
+CSV_DTYPES = ('int64', 'float64', 'bool', 'str')
+
+def _csv_dtype_str(dt) -> str:
+    if dt is str or dt == 'str' or np.dtype(dt).kind in 'SU':
+        return 'str'
+    name = np.dtype(dt).name
+    if name not in CSV_DTYPES:
+        raise ValueError(f"Cannot read CSV columns as {dt}, expected one of {CSV_DTYPES}")
+    return name
+
+def read_csv(filenames : Union[str, List[str]],
+             columns : Optional[Union[str, List[str]]] = None,
+             dtypes : Optional[Mapping[str, Any]] = None,
+             delimiter : str = ',') \
+        -> Union[pdarray, Strings, Mapping[str,Union[pdarray,Strings]]]:
+    """
+    Read columns from CSV or other delimited text files, which the server
+    parses in parallel.
+
+    Parameters
+    ----------
+    filenames : list or str
+        Either a list of filenames or shell expression
+    columns : list or str or None
+        (List of) name(s) of column(s) to read (default: all available)
+    dtypes : dict or None
+        The dtype of some columns, one of int64, float64, bool or str, by
+        column name. The dtypes of the other columns are inferred.
+    delimiter : str
+        The single character separating the fields of a line
+
+    Returns
+    -------
+    For a single column returns an Arkouda pdarray or Arkouda Strings object
+    and for multiple columns returns a dictionary of Arkouda pdarrays or
+    Arkouda Strings.
+        Dictionary of {columnName: pdarray or String}
+
+    Raises
+    ------
+    ValueError
+        Raised if the delimiter is not a single character other than a quote
+        or a newline, or if a dtype is not one of int64, float64, bool or str
+    RuntimeError
+        Raised if a file cannot be opened, if the files have different
+        headers, if a column is not in the header, or if a value cannot be
+        read as the dtype of its column
+
+    See Also
+    --------
+    read, read_parquet
+
+    Notes
+    -----
+    The first line of every file is a header naming its columns, and must be
+    the same in every file. The server splits the rest of the files into one
+    byte range per task of each locale, and each task parses the lines that
+    start in its range, so the rows are read in the order of the files.
+
+    The dtype of a column not in dtypes is inferred from the first rows of
+    the first file: int64 if every value is an integer, else float64 if
+    every value is a number or empty, else bool if every value is true or
+    false, in any case, else str. Empty values of float64 columns are NaN.
+
+    A field may be quoted with double quotes, in which case it may hold the
+    delimiter and a doubled quote stands for a quote, but no field may hold a
+    newline.
+
+    Examples
+    --------
+    >>> ak.read_csv('logs/2022-*.csv', columns=['ts', 'user', 'bytes'],
+    ...             dtypes={'user': 'str'})
+    """
+    if len(delimiter.encode()) != 1 or delimiter in ('"', '\n', '\r'):
+        raise ValueError(f"The delimiter must be a single character other than a quote or a newline, got {delimiter!r}")
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    if columns is None:
+        columns = []
+    elif isinstance(columns, str):
+        columns = [columns]
+    dtype_pairs: List[str] = []
+    for column, dt in (dtypes or {}).items():
+        dtype_pairs += [column, _csv_dtype_str(dt)]
+    rep_msg = generic_msg(cmd="readcsv", args=
+        f"{ord(delimiter)} {len(columns)} {len(dtype_pairs) // 2} {len(filenames)} " +
+        f"{json.dumps(columns)} | {json.dumps(dtype_pairs)} | {json.dumps(filenames)}"
+                          )
+    return _build_objects(cast(str, rep_msg))
 
 @typechecked
 def load(path_prefix : str, dataset : str='array', calc_string_offsets:bool = False) -> Union[pdarray, Strings, Mapping[str,Union[pdarray,Strings]]]:
@@ -403,9 +597,10 @@ def load_all(path_prefix: str) -> Mapping[str, Union[pdarray, Strings, Categoric
                                    'the file prefix {}, check file format or permissions'.format(prefix))
 
 def save_all(columns : Union[Mapping[str,pdarray],List[pdarray]], prefix_path : str, 
-             names : List[str]=None, mode : str='truncate') -> None:
+             names : List[str]=None, mode : str='truncate', file_format : str='HDF5',
+             row_group_size : Optional[int]=None, compression : Optional[str]=None) -> None:
     """
-    Save multiple named pdarrays to HDF5 files.
+    Save multiple named pdarrays to HDF5 or Parquet files.
 
     Parameters
     ----------
@@ -418,6 +613,14 @@ def save_all(columns : Union[Mapping[str,pdarray],List[pdarray]], prefix_path :
     mode : {'truncate' | 'append'}
         By default, truncate (overwrite) the output files if they exist.
         If 'append', attempt to create new dataset in existing files.
+        Parquet files can only be truncated.
+    file_format : {'HDF5' | 'Parquet'}
+        By default, save to HDF5 files. If 'Parquet', each locale writes its
+        chunk of every column as one multi-column Parquet table.
+    row_group_size : int
+        Number of rows per Parquet row group, by default the server's
+    compression : {None | 'snappy' | 'zstd' | 'lz4' | 'gzip'}
+        Codec of the Parquet columns, by default uncompressed
 
     Returns
     -------
@@ -426,8 +629,9 @@ def save_all(columns : Union[Mapping[str,pdarray],List[pdarray]], prefix_path :
     Raises
     ------
     ValueError 
-        Raised if (1) the lengths of columns and values differ or (2) the mode 
-        is not 'truncate' or 'append'
+        Raised if (1) the lengths of columns and values differ, (2) the mode 
+        is not 'truncate' or 'append', (3) the file format or compression is
+        not supported or (4) mode is 'append' with file format 'Parquet'
 
     See Also
     --------
@@ -442,6 +646,10 @@ def save_all(columns : Union[Mapping[str,pdarray],List[pdarray]], prefix_path :
     specifies the 'append' mode, in which case arkouda will attempt to add
     <columns> as new datasets to existing files. If the wrong number of files
     is present or dataset names already exist, a RuntimeError is raised.
+
+    A Parquet save writes each locale's file in a single pass, with min/max
+    statistics for every column so that filtered reads with `read_parquet`
+    can skip row groups. Categorical columns are saved as their strings.
     """
     if names is not None:
         if len(names) != len(columns):
@@ -458,6 +666,14 @@ def save_all(columns : Union[Mapping[str,pdarray],List[pdarray]], prefix_path :
             datasetNames = [str(column) for column in range(len(columns))]
     if (mode.lower() not in 'append') and (mode.lower() not in 'truncate'):
         raise ValueError("Allowed modes are 'truncate' and 'append'")
+    if file_format.lower() == 'parquet':
+        if mode.lower() in 'append':
+            raise ValueError("Parquet tables cannot be appended to, please save with mode='truncate'")
+        _save_parquet_table(pdarrays, cast(List[str], datasetNames), prefix_path,
+                            row_group_size, compression)
+        return
+    elif file_format.lower() != 'hdf5':
+        raise ValueError("Supported file formats are 'HDF5' and 'Parquet'")
     first_iter = True
     for arr, name in zip(pdarrays, cast(List[str], datasetNames)):
         '''Append all pdarrays to existing files as new datasets EXCEPT the first one, 
@@ -467,3 +683,31 @@ def save_all(columns : Union[Mapping[str,pdarray],List[pdarray]], prefix_path :
             first_iter = False
         else:
             arr.save(prefix_path=prefix_path, dataset=name, mode='append')
+
+PARQUET_COMPRESSIONS = ('snappy', 'zstd', 'lz4', 'gzip')
+
+def _save_parquet_table(columns : List[Any], names : List[str], prefix_path : str,
+                        row_group_size : Optional[int], compression : Optional[str]) -> str:
+    """
+    Save columns of equal size as one Parquet table per locale, in a single
+    request to the server.
+    """
+    if compression is not None and compression.lower() not in PARQUET_COMPRESSIONS:
+        raise ValueError("Supported compressions are {}".format(PARQUET_COMPRESSIONS))
+    if row_group_size is not None and row_group_size <= 0:
+        raise ValueError("row_group_size must be positive")
+    specs = []
+    for col in columns:
+        if isinstance(col, Categorical):
+            col = col.categories[col.codes]
+        if isinstance(col, Strings):
+            specs.append("str:{}".format(col.entry.name))
+        elif isinstance(col, pdarray):
+            specs.append("pdarray:{}".format(col.name))
+        else:
+            raise TypeError("Parquet columns must be pdarray, Strings or Categorical, not {}".\
+                            format(type(col).__name__))
+    return cast(str, generic_msg(cmd="writeParquetTable", args="{} {} {} {} {}".\
+                format(len(specs), 0 if row_group_size is None else row_group_size,
+                       'none' if compression is None else compression.lower(),
+                       " ".join(specs), json.dumps([str(name) for name in names] + [prefix_path]))))
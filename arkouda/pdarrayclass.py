@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import cast, List, Sequence
+from typing import cast, List, Optional, Sequence, Union
 from typeguard import typechecked
 import json
 import numpy as np # type: ignore
-from arkouda.client import generic_msg
+from arkouda.client import generic_msg, BatchReply, _defer_delete
+from arkouda.message import CreatedReply
 from arkouda.dtypes import dtype, DTypes, resolve_scalar_dtype, \
      translate_np_dtype, NUMBER_FORMAT_STRINGS, \
      int_scalars, numeric_scalars, numeric_and_bool_scalars, numpy_scalars, get_server_byteorder
@@ -15,10 +16,11 @@ from arkouda.dtypes import bool as npbool
 from arkouda.dtypes import isSupportedInt
 from arkouda.logger import getArkoudaLogger
 from arkouda.infoclass import list_registry, information, pretty_print_information
+from arkouda.expression import is_lazy, lazy_binop, materialize, ExprNode
 import builtins
 
 __all__ = ["pdarray", "clear", "any", "all", "is_sorted", "sum", "prod", "min", "max", "argmin",
-           "argmax", "mean", "var", "std", "mink", "maxk", "argmink", "argmaxk", "popcount",
+           "argmax", "mean", "var", "std", "median", "quantile", "mink", "maxk", "argmink", "argmaxk", "popcount",
            "parity", "clz", "ctz", "rotl", "rotr", "attach_pdarray",
            "unregister_pdarray_by_name", "RegistrationError"]
 
@@ -104,6 +106,11 @@ class pdarray:
 
     __array_priority__ = 1000
 
+    # Set only on pdarrays created within an ak.batch() context, until the batch
+    # is sent, and on lazily evaluated pdarrays, until they are evaluated
+    _pending : BatchReply
+    _expr : Optional[ExprNode]
+
     def __init__(self, name : str, mydtype : np.dtype, size : int_scalars, 
                  ndim : int_scalars, shape: Sequence[int], 
                  itemsize : int_scalars) -> None:
@@ -114,10 +121,48 @@ class pdarray:
         self.shape = shape
         self.itemsize = itemsize
 
+    def __getattr__(self, attr):
+        # Only invoked for attributes missing from the instance, which is the case
+        # for pdarrays created within an ak.batch() context until the batch is sent
+        # and for lazily evaluated pdarrays, whose name is assigned on evaluation
+        if attr.startswith('__') or ('_pending' not in self.__dict__ and 
+                                     '_expr' not in self.__dict__):
+            raise AttributeError("'{}' object has no attribute '{}'".\
+                                 format(type(self).__name__, attr))
+        self._resolve()
+        return getattr(self, attr)
+
+    def _is_pending(self) -> builtins.bool:
+        """
+        Indicates if this pdarray was created by a batched command that has not 
+        yet been sent to the server. The user should not call this function directly.
+        """
+        return '_pending' in self.__dict__
+
+    def _resolve(self) -> None:
+        """
+        Set the attributes of a pdarray created within an ak.batch() context from
+        the reply to the batched command, sending the batch first if needed, or 
+        evaluate a lazily defined pdarray. The user should not call this function
+        directly.
+        """
+        if '_expr' in self.__dict__:
+            materialize(self)
+            return
+        pending = self.__dict__.get('_pending')
+        if pending is None:
+            return
+        name, mydtype, size, ndim, shape, itemsize = _parse_created_fields(pending.resolve())
+        del self._pending
+        self.__init__(name, dtype(mydtype), size, ndim, shape, itemsize) # type: ignore
+
     def __del__(self):
+        # lazily defined pdarrays that were never evaluated have no server-side array
+        if 'name' not in self.__dict__:
+            return
         try:
             logger.debug('deleting pdarray with name {}'.format(self.name))
-            generic_msg(cmd='delete', args='{}'.format(self.name))
+            _defer_delete(self.name)
         except:
             pass
 
@@ -202,9 +247,14 @@ class pdarray:
             return NotImplemented
         if op not in self.BinOps:
             raise ValueError("bad operator {}".format(op))
+        if is_lazy() and (isinstance(other, pdarray) or np.isscalar(other)):
+            result = lazy_binop(self, other, op)
+            if result is not None:
+                return result
         # pdarray binop pdarray
         if isinstance(other, pdarray):
-            if self.size != other.size:
+            # sizes of batched results are checked server-side to avoid sending the batch
+            if not (self._is_pending() or other._is_pending()) and self.size != other.size:
                 raise ValueError("size mismatch {} {}".format(self.size,other.size))
             cmd = "binopvv"
             args= "{} {} {}".format(op, self.name, other.name)
@@ -257,6 +307,10 @@ class pdarray:
 
         if op not in self.BinOps:
             raise ValueError("bad operator {}".format(op))
+        if is_lazy() and np.isscalar(other):
+            result = lazy_binop(self, other, op, reverse=True)
+            if result is not None:
+                return result
         # pdarray binop scalar
         if np.can_cast(other, self.dtype):
             # If scalar can be losslessly cast to array dtype, 
@@ -735,6 +789,19 @@ class pdarray:
         """
         return std(self, ddof=ddof)
 
+    def median(self) -> np.float64:
+        """
+        Return the median of the array. See ``arkouda.median`` for details.
+        """
+        return median(self)
+
+    def quantile(self, q : float) -> np.float64:
+        """
+        Return the q-th quantile of the array. See ``arkouda.quantile`` for
+        details.
+        """
+        return quantile(self, q)
+
     def mink(self, k : int_scalars) -> pdarray:
         """
         Compute the minimum "k" values.
@@ -878,32 +945,42 @@ class pdarray:
 
         return akcast(self, dtype)
     
-    def to_ndarray(self) -> np.ndarray:
+    def to_ndarray(self, out : Optional[Union[np.ndarray, memoryview, bytearray]] = None) -> np.ndarray:
         """
         Convert the array to a np.ndarray, transferring array data from the
-        Arkouda server to client-side Python. Note: if the pdarray size exceeds 
-        client.maxTransferBytes, a RuntimeError is raised.
+        Arkouda server to client-side Python. Arrays larger than 
+        client.transferChunkBytes are streamed in chunks.
+
+        Parameters
+        ----------
+        out : Union[np.ndarray, memoryview, bytearray], optional
+            A writable array, such as a np.memmap, or buffer with room for
+            exactly self.size elements of self.dtype into which the data is
+            written. If not supplied, a new np.ndarray is allocated.
 
         Returns
         -------
         np.ndarray
-            A numpy ndarray with the same attributes and data as the pdarray
+            A numpy ndarray with the same attributes and data as the pdarray;
+            if out is supplied, a view of out
 
         Raises
         ------
         RuntimeError
-            Raised if there is a server-side error thrown, if the pdarray size
-            exceeds the built-in client.maxTransferBytes size limit, or if the bytes
+            Raised if there is a server-side error thrown or if the bytes
             received does not match expected number of bytes
+        ValueError
+            Raised if out is read-only or does not match the size and dtype
+            of the pdarray
+
         Notes
         -----
-        The number of bytes in the array cannot exceed ``client.maxTransferBytes``,
-        otherwise a ``RuntimeError`` will be raised. This is to protect the user
-        from overflowing the memory of the system on which the Python client
-        is running, under the assumption that the server is running on a
-        distributed system with much more memory than the client. The user
-        may override this limit by setting client.maxTransferBytes to a larger
-        value, but proceed with caution.
+        Large arrays are transferred in chunks of ``client.transferChunkBytes``
+        bytes, with at most ``client.transferWindow`` chunks in flight, and 
+        each chunk is written directly into its place in the result. The 
+        memory used on the client beyond the result is therefore bounded by
+        the window, and a np.memmap supplied as out allows transferring 
+        arrays larger than the memory of the client.
 
         See Also
         --------
@@ -917,16 +994,57 @@ class pdarray:
 
         >>> type(a.to_ndarray())
         numpy.ndarray
+
+        >>> out = np.memmap('a.bin', dtype=np.int64, mode='w+', shape=(5,))
+        >>> a.to_ndarray(out=out)
+        memmap([0, 1, 2, 3, 4])
         """
-        from arkouda.client import maxTransferBytes
+        from arkouda.client import transferChunkBytes, _stream_chunks
         # Total number of bytes in the array data
         arraybytes = self.size * self.dtype.itemsize
-        # Guard against overflowing client memory
-        if arraybytes > maxTransferBytes:
-            raise RuntimeError(('Array exceeds allowed size for transfer. Increase ' +
-                               'client.maxTransferBytes to allow'))
-        # The reply from the server will be binary data
-        data = cast(memoryview,generic_msg(cmd="tondarray", args="{}".format(self.name), recv_binary=True))
+        if out is None and arraybytes <= transferChunkBytes:
+            # The reply from the server will be binary data
+            data = cast(memoryview,generic_msg(cmd="tondarray", args="{}".format(self.name), 
+                                               recv_binary=True))
+            return self._ndarray_from_reply(data)
+
+        if out is None:
+            out = np.empty(self.size, dtype=self.dtype)
+        elif not isinstance(out, np.ndarray):
+            out = np.frombuffer(out, dtype=self.dtype)
+        if out.shape != (self.size,) or out.dtype.newbyteorder('=') != np.dtype(self.dtype):
+            raise ValueError("out must have shape ({},) and dtype {}".format(self.size, self.dtype))
+        if not out.flags.writeable:
+            raise ValueError("out must be writable")
+
+        # The server sends us native-endian data; numpy swaps bytes on
+        # assignment if the byteorder of out differs
+        dt = np.dtype(self.dtype).newbyteorder('>' if get_server_byteorder() == 'big' else '<')
+        step = builtins.max(1, transferChunkBytes // dt.itemsize)
+        name = self.name
+        size = self.size
+
+        def chunks():
+            for start in range(0, size, step):
+                yield "{} {} {}".format(name, start, builtins.min(step, size - start)), None
+
+        def on_reply(index : int, data : Union[str, memoryview]) -> None:
+            start = index * step
+            count = builtins.min(step, size - start)
+            # the chunks are requested with recv_binary=True
+            buf = cast(memoryview, data)
+            if len(buf) != count * dt.itemsize:
+                raise RuntimeError("Expected {} bytes but received {}".\
+                                   format(count * dt.itemsize, len(buf)))
+            out[start:start + count] = np.frombuffer(buf, dt)
+
+        _stream_chunks("tondarrayChunk", chunks(), on_reply, recv_binary=True)
+        return out
+
+    def _ndarray_from_reply(self, data : memoryview) -> np.ndarray:
+        """
+        Converts the binary reply to a tondarray request into a np.ndarray
+        """
         # Make sure the received data has the expected length
         if len(data) != self.size*self.dtype.itemsize:
             raise RuntimeError("Expected {} bytes but received {}".\
@@ -1393,22 +1511,43 @@ class pdarray:
 
 #end pdarray class def
     
+def _parse_created_fields(repMsg : str) -> tuple:
+    """
+    Parse the name, datatype, size, dimension, shape, and itemsize from a
+    "created" reply message. The user should not call this function directly.
+    """
+    # binary-encoded replies hold the decoded attributes
+    if isinstance(repMsg, CreatedReply) and 0 in repMsg.entries:
+        return repMsg.entries[0]
+    try:
+        fields = repMsg.split()
+        name = fields[1]
+        mydtype = fields[2]
+        size = int(fields[3])
+        ndim = int(fields[4])
+        shape = [int(el) for el in fields[5][1:-1].split(',')]
+        itemsize = int(fields[6])
+    except Exception as e:
+        raise ValueError(e)
+    return name, mydtype, size, ndim, shape, itemsize
+
 # creates pdarray object
 #   only after:
 #       all values have been checked by python module and...
 #       server has created pdarray already before this is called
 #       server has created pdarray already befroe this is called
 @typechecked
-def create_pdarray(repMsg : str) -> pdarray:
+def create_pdarray(repMsg : Union[str, BatchReply]) -> pdarray:
     """
     Return a pdarray instance pointing to an array created by the arkouda server.
     The user should not call this function directly.
 
     Parameters
     ----------
-    repMsg : str
+    repMsg : Union[str, BatchReply]
         space-delimited string containing the pdarray name, datatype, size
-        dimension, shape,and itemsize
+        dimension, shape,and itemsize, or the pending reply of a command 
+        queued within an ak.batch() context
 
     Returns
     -------
@@ -1424,16 +1563,18 @@ def create_pdarray(repMsg : str) -> pdarray:
         Raised if a server-side error is thrown in the process of creating
         the pdarray instance
     """
-    try:
-        fields = repMsg.split()
-        name = fields[1]
-        mydtype = fields[2]
-        size = int(fields[3])
-        ndim = int(fields[4])
-        shape = [int(el) for el in fields[5][1:-1].split(',')]
-        itemsize = int(fields[6])
-    except Exception as e:
-        raise ValueError(e)
+    if isinstance(repMsg, BatchReply):
+        if repMsg.resolved:
+            repMsg = repMsg.resolve()
+        else:
+            # attributes are set from the reply once the batch has been sent
+            pda = pdarray.__new__(pdarray)
+            pda.name = repMsg.placeholder
+            pda._pending = repMsg
+            repMsg._batch.track(pda)
+            logger.debug("queued Chapel array with placeholder name: {}".format(pda.name))
+            return pda
+    name, mydtype, size, ndim, shape, itemsize = _parse_created_fields(repMsg)
     logger.debug(("created Chapel array with name: {} dtype: {} size: {} ndim: {} shape: {} " +
                   "itemsize: {}").format(name, mydtype, size, ndim, shape, itemsize))
     return pdarray(name, dtype(mydtype), size, ndim, shape, itemsize)
@@ -1744,11 +1885,15 @@ def var(pda : pdarray, ddof : int_scalars=0) -> np.float64:
     unbiased estimator of the variance of a hypothetical infinite population.
     ``ddof=0`` provides a maximum likelihood estimate of the variance for
     normally distributed variables.
+
+    The server computes the variance in one pass over the values, with
+    Welford's numerically stable update of the mean and of the sum of
+    squared deviations.
     """
     if ddof >= pda.size:
         raise ValueError("var: ddof must be less than number of values")
-    m = mean(pda)
-    return ((pda - m)**2).sum() / (pda.size - ddof)
+    repMsg = generic_msg(cmd="reduction", args="{} {} {}".format("var", pda.name, ddof))
+    return parse_single_value(cast(str,repMsg))
 
 @typechecked
 def std(pda : pdarray, ddof : int_scalars=0) -> np.float64:
@@ -1798,8 +1943,86 @@ def std(pda : pdarray, ddof : int_scalars=0) -> np.float64:
     """
     if ddof < 0:
         raise ValueError("ddof must be an integer 0 or greater")
+    if ddof >= pda.size:
+        raise ValueError("std: ddof must be less than number of values")
+    repMsg = generic_msg(cmd="reduction", args="{} {} {}".format("std", pda.name, ddof))
+    return parse_single_value(cast(str,repMsg))
 
-    return np.sqrt(var(pda, ddof=ddof))
+@typechecked
+def median(pda : pdarray) -> np.float64:
+    """
+    Return the median of values in the array.
+
+    Parameters
+    ----------
+    pda : pdarray
+        Values for which to calculate the median
+
+    Returns
+    -------
+    np.float64
+        The median of the array, the mean of its two middle values if the
+        array has an even number of values
+
+    Raises
+    ------
+    TypeError
+        Raised if pda is not a pdarray instance
+    RuntimeError
+        Raised if there's a server-side error thrown
+
+    See Also
+    --------
+    quantile, mean
+
+    Notes
+    -----
+    The median is NaN if the array is empty or contains NaN values.
+    """
+    repMsg = generic_msg(cmd="reduction", args="{} {}".format("median", pda.name))
+    return parse_single_value(cast(str,repMsg))
+
+@typechecked
+def quantile(pda : pdarray, q : float) -> np.float64:
+    """
+    Return the q-th quantile of values in the array.
+
+    Parameters
+    ----------
+    pda : pdarray
+        Values for which to calculate the quantile
+    q : float
+        The quantile to compute, in [0, 1]
+
+    Returns
+    -------
+    np.float64
+        The q-th quantile of the array
+
+    Raises
+    ------
+    TypeError
+        Raised if pda is not a pdarray instance
+    ValueError
+        Raised if q is not in [0, 1]
+    RuntimeError
+        Raised if there's a server-side error thrown
+
+    See Also
+    --------
+    median
+
+    Notes
+    -----
+    The quantile is selected from the sorted values and interpolated
+    linearly between the two nearest values, as numpy.quantile does by
+    default. It is NaN if the array is empty or contains NaN values.
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("q must be in [0, 1]")
+    repMsg = generic_msg(cmd="reduction", args="{} {} {}".format("quantile", pda.name,
+                                                                 float(q)))
+    return parse_single_value(cast(str,repMsg))
 
 @typechecked
 def mink(pda : pdarray, k : int_scalars) -> pdarray:
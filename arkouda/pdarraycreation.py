@@ -1,5 +1,4 @@
 import builtins
-import itertools
 import numpy as np # type: ignore
 import pandas as pd # type: ignore
 from typing import cast, Iterable, Optional, Union
@@ -10,7 +9,7 @@ from arkouda.dtypes import NUMBER_FORMAT_STRINGS, float64, int64, \
     int_scalars, numeric_scalars, get_byteorder, get_server_byteorder
 from arkouda.dtypes import dtype as akdtype
 from arkouda.pdarrayclass import pdarray, create_pdarray
-from arkouda.strings import Strings
+from arkouda.strings import Strings, _encode_strings
 
 __all__ = ["array", "zeros", "ones", "full", "zeros_like", "ones_like", "full_like",
            "arange", "linspace", "randint", "uniform", "standard_normal",
@@ -132,9 +131,8 @@ def array(a: Union[pdarray, np.ndarray, Iterable], dtype: Union[np.dtype, type,
         Raised if a is not a pdarray, np.ndarray, or Python Iterable such as a
         list, array, tuple, or deque
     RuntimeError
-        Raised if a is not one-dimensional, nbytes > maxTransferBytes, a.dtype is
-        not supported (not in DTypes), or if the product of a size and
-        a.itemsize > maxTransferBytes
+        Raised if a is not one-dimensional, a.dtype is not supported (not in
+        DTypes), or if a is an array of strings and nbytes > maxTransferBytes
     ValueError
         Raised if the returned message is malformed or does not contain the fields
         required to generate the array.
@@ -145,12 +143,16 @@ def array(a: Union[pdarray, np.ndarray, Iterable], dtype: Union[np.dtype, type,
 
     Notes
     -----
-    The number of bytes in the input array cannot exceed `arkouda.maxTransferBytes`,
-    otherwise a RuntimeError will be raised. This is to protect the user
-    from overwhelming the connection between the Python client and the arkouda
-    server, under the assumption that it is a low-bandwidth connection. The user
-    may override this limit by setting ak.maxTransferBytes to a larger value, 
-    but should proceed with caution.
+    Numeric arrays larger than `ak.client.transferChunkBytes` are streamed to
+    the server in chunks of that size, with at most `ak.client.transferWindow`
+    chunks in flight, so they are not copied as a whole on the client.
+
+    The number of bytes in an input array of strings cannot exceed 
+    `arkouda.maxTransferBytes`, otherwise a RuntimeError will be raised. This
+    is to protect the user from overwhelming the connection between the Python
+    client and the arkouda server, under the assumption that it is a 
+    low-bandwidth connection. The user may override this limit by setting 
+    ak.maxTransferBytes to a larger value, but should proceed with caution.
     
     If the pdrray or ndarray is of type U, this method is called twice recursively 
     to create the Strings object and the two corresponding pdarrays for string 
@@ -172,7 +174,7 @@ def array(a: Union[pdarray, np.ndarray, Iterable], dtype: Union[np.dtype, type,
     # If a is already a pdarray, do nothing
     if isinstance(a, pdarray):
         return a if dtype is None else akcast(a, dtype)
-    from arkouda.client import maxTransferBytes
+    from arkouda.client import maxTransferBytes, transferChunkBytes
     # If a is not already a numpy.ndarray, convert it
     if not isinstance(a, np.ndarray):
         try:
@@ -185,14 +187,13 @@ def array(a: Union[pdarray, np.ndarray, Iterable], dtype: Union[np.dtype, type,
         raise RuntimeError("Only rank-1 pdarrays or ndarrays supported")
     # Check if array of strings
     if 'U' in a.dtype.kind:
-        # encode each string and add a null byte terminator
-        encoded = [i for i in itertools.chain.from_iterable(map(lambda x: x.encode() + b"\x00", a))]
-        nbytes = len(encoded)
+        # encode the strings and add a null byte terminator to each
+        encoded_np = _encode_strings(a)
+        nbytes = encoded_np.size
         if nbytes > maxTransferBytes:
             raise RuntimeError(("Creating pdarray would require transferring {} bytes," +
                                 " which exceeds allowed transfer size. Increase " +
                                 "ak.maxTransferBytes to force.").format(nbytes))
-        encoded_np = np.array(encoded, dtype=np.uint8)
         args = f"{encoded_np.dtype.name} {encoded_np.size} seg_string={True}"
         rep_msg = generic_msg(cmd='array', args=args, payload=_array_memview(encoded_np), send_binary=True)
         parts = cast(str, rep_msg).split('+', maxsplit=3)
@@ -202,11 +203,11 @@ def array(a: Union[pdarray, np.ndarray, Iterable], dtype: Union[np.dtype, type,
     # If not strings, then check that dtype is supported in arkouda
     if a.dtype.name not in DTypes:
         raise RuntimeError("Unhandled dtype {}".format(a.dtype))
-    # Do not allow arrays that are too large
     size = a.size
-    if (size * a.itemsize) > maxTransferBytes:
-        raise RuntimeError(("Array exceeds allowed transfer size. Increase " +
-                            "ak.maxTransferBytes to allow"))
+    # Stream arrays larger than a single chunk
+    if (size * a.itemsize) > transferChunkBytes:
+        pda = _array_chunked(a)
+        return pda if dtype is None else akcast(pda, dtype)
     # Pack binary array data into a bytes object with a command header
     # including the dtype and size. If the server has a different byteorder
     # than our numpy array we need to swap to match since the server expects
@@ -217,6 +218,25 @@ def array(a: Union[pdarray, np.ndarray, Iterable], dtype: Union[np.dtype, type,
     return create_pdarray(rep_msg) if dtype is None else akcast(create_pdarray(rep_msg), dtype)
 
 
+def _array_chunked(a : np.ndarray) -> pdarray:
+    """
+    Creates a pdarray from a numeric np.ndarray by streaming chunks of
+    client.transferChunkBytes bytes into a newly created pdarray, with at most
+    client.transferWindow chunks in flight
+    """
+    from arkouda.client import transferChunkBytes, _stream_chunks
+    pda = create_pdarray(generic_msg(cmd="create", args="{} {}".format(a.dtype.name, a.size)))
+    step = max(1, transferChunkBytes // a.itemsize)
+    name = pda.name
+
+    def chunks():
+        for start in range(0, a.size, step):
+            yield "{} {}".format(name, start), \
+                  _array_memview(np.ascontiguousarray(a[start:start + step]))
+
+    _stream_chunks("arrayChunk", chunks(), lambda index, reply: None)
+    return pda
+
 def _array_memview(a) -> memoryview:
     if ((get_byteorder(a.dtype) == '<' and get_server_byteorder() == 'big') or
             (get_byteorder(a.dtype) == '>' and get_server_byteorder() == 'little')):
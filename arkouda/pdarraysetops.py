@@ -19,6 +19,8 @@ __all__ = ["unique", "in1d", "concatenate", "union1d", "intersect1d",
 
 logger = getArkoudaLogger(name='pdarraysetops')
 
+IN1D_METHODS = ('auto', 'hash', 'sort', 'bloom')
+
 
 @typechecked
 def unique(pda: Union[pdarray, Strings, 'Categorical'],  # type: ignore
@@ -93,7 +95,7 @@ def unique(pda: Union[pdarray, Strings, 'Categorical'],  # type: ignore
 
 
 def in1d(pda1: Union[pdarray, Strings, 'Categorical'], pda2: Union[pdarray, Strings, 'Categorical'],  # type: ignore
-         invert: bool = False) -> pdarray:  # type: ignore
+         invert: bool = False, method: str = 'auto') -> pdarray:  # type: ignore
     """
     Test whether each element of a 1-D array is also present in a second array.
 
@@ -112,6 +114,12 @@ def in1d(pda1: Union[pdarray, Strings, 'Categorical'], pda2: Union[pdarray, Stri
         False where an element of `pda1` is in `pda2` and True otherwise).
         Default is False. ``ak.in1d(a, b, invert=True)`` is equivalent
         to (but is faster than) ``~ak.in1d(a, b)``.
+    method : str, optional
+        'hash' copies `pda2` to every locale as a set, 'sort' sorts both
+        arrays together, and 'bloom' sorts `pda2` with only the elements of
+        `pda1` that pass a bloom filter of `pda2`, which is copied to every
+        locale. By default ('auto') the server chooses by the sizes of the
+        arrays and the number of locales.
 
     Returns
     -------
@@ -123,6 +131,8 @@ def in1d(pda1: Union[pdarray, Strings, 'Categorical'], pda2: Union[pdarray, Stri
     TypeError
         Raised if either pda1 or pda2 is not a pdarray, Strings, or 
         Categorical object or if invert is not a bool
+    ValueError
+        Raised if method is not 'auto', 'hash', 'sort', or 'bloom'
     RuntimeError
         Raised if the dtype of either array is not supported
 
@@ -149,6 +159,8 @@ def in1d(pda1: Union[pdarray, Strings, 'Categorical'], pda2: Union[pdarray, Stri
     """
     from arkouda.categorical import Categorical as Categorical_
     from arkouda.dtypes import bool as ak_bool
+    if method not in IN1D_METHODS:
+        raise ValueError(f"method must be one of {IN1D_METHODS}")
     if isinstance(pda1, pdarray) or isinstance(pda1, Strings) or isinstance(pda1, Categorical_):
         # While isinstance(thing, type) can be called on a tuple of types, this causes an issue with mypy for unknown reasons.
         if pda1.size == 0:
@@ -157,18 +169,19 @@ def in1d(pda1: Union[pdarray, Strings, 'Categorical'], pda2: Union[pdarray, Stri
         if pda2.size == 0:
             return zeros(pda1.size, dtype=ak_bool)
     if hasattr(pda1, 'categories'):
-        return cast(Categorical_, pda1).in1d(pda2)
+        return cast(Categorical_, pda1).in1d(pda2, method=method)
     elif isinstance(pda1, pdarray) and isinstance(pda2, pdarray):
-        repMsg = generic_msg(cmd="in1d", args="{} {} {}". \
-                             format(pda1.name, pda2.name, invert))
+        repMsg = generic_msg(cmd="in1d", args="{} {} {} {}". \
+                             format(pda1.name, pda2.name, invert, method))
         return create_pdarray(repMsg)
     elif isinstance(pda1, Strings) and isinstance(pda2, Strings):
-        repMsg = generic_msg(cmd="segmentedIn1d", args="{} {} {} {} {}". \
+        repMsg = generic_msg(cmd="segmentedIn1d", args="{} {} {} {} {} {}". \
                              format(pda1.objtype,
                                     pda1.entry.name,
                                     pda2.objtype,
                                     pda2.entry.name,
-                                    invert))
+                                    invert,
+                                    method))
         return create_pdarray(cast(str, repMsg))
     else:
         raise TypeError('Both pda1 and pda2 must be pdarray, Strings, or Categorical')
@@ -0,0 +1,570 @@
+from __future__ import annotations
+from typing import cast, List, Optional, Tuple, Union
+import numpy as np  # type: ignore
+from typeguard import typechecked
+from arkouda.client import generic_msg
+from arkouda.dtypes import int64, uint64, float64, bool as akbool
+from arkouda.pdarrayclass import pdarray, create_pdarray, RegistrationError
+from arkouda.pdarraycreation import array
+from arkouda.pdarraysetops import concatenate, unique
+from arkouda.sorting import argsort
+from arkouda.strings import Strings
+from arkouda.infoclass import list_registry
+from arkouda.logger import getArkoudaLogger
+
+__all__ = ["HyperLogLog", "CountMinSketch", "approx_nunique", "heavy_hitters"]
+
+SKETCH_DTYPES = frozenset([int64, uint64, float64, akbool])
+
+sketchable = Union[pdarray, Strings]
+
+
+def _sketch_args(values: sketchable) -> str:
+    """
+    The server name and object type of values, which must be a Strings or a
+    pdarray of a dtype that can be sketched
+    """
+    if isinstance(values, Strings):
+        return "{} {}".format(values.entry.name, values.objtype)
+    if values.dtype not in SKETCH_DTYPES:
+        raise TypeError("Cannot sketch values of dtype {}".format(values.dtype))
+    return "{} {}".format(values.name, values.objtype)
+
+
+class HyperLogLog:
+    """
+    A HyperLogLog sketch of the distinct values of an array, kept on the
+    arkouda server, which estimates their number without sorting them.
+
+    Parameters
+    ----------
+    values : pdarray or Strings
+        The values to sketch, of dtype int64, uint64, float64 or bool
+    precision : int
+        The log2 of the number of registers, between 4 and 18 (default 12).
+        The relative error of the estimates is about 1.04 / sqrt(2**precision).
+
+    Attributes
+    ----------
+    registers : pdarray
+        The 2**precision uint8 registers of the sketch
+    precision : int
+        The log2 of the number of registers
+    name : str
+        The name the sketch is registered under, or None
+
+    Notes
+    -----
+    Every locale sketches its own values and the sketches are merged, so
+    the values are never moved. Sketches of the same precision are merged
+    with merge(), so a sketch can be registered and kept up to date with
+    the batches of values that are appended to an array.
+    """
+    DefaultPrecision = 12
+
+    def __init__(self, values: Optional[sketchable],
+                 precision: int = DefaultPrecision, **kwargs) -> None:
+        self.logger = getArkoudaLogger(name=self.__class__.__name__)
+        if 'registers' in kwargs:
+            registers = kwargs['registers']
+            precision = int(registers.size).bit_length() - 1
+            if registers.size != 2**precision:
+                raise ValueError("The number of registers must be a power of 2")
+        else:
+            if values is None:
+                raise ValueError("values must be given to build a HyperLogLog")
+            repMsg = generic_msg(cmd="hllBuild",
+                                 args="{} {}".format(_sketch_args(values), precision))
+            registers = create_pdarray(cast(str, repMsg))
+        self.registers : pdarray = registers
+        self.precision = precision
+        self.name : Optional[str] = None
+
+    def update(self, values: sketchable) -> HyperLogLog:
+        """
+        Add values to the sketch
+
+        Parameters
+        ----------
+        values : pdarray or Strings
+            The values to add
+
+        Returns
+        -------
+        HyperLogLog
+            The same sketch, which now also sketches values. This is an
+            in-place modification, also of the registered sketch.
+        """
+        return self.merge(HyperLogLog(values, self.precision))
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        """
+        Merge another sketch into this one, so that it estimates the number
+        of distinct values of both
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            A sketch of the same precision
+
+        Returns
+        -------
+        HyperLogLog
+            The same sketch, merged with other. This is an in-place
+            modification, also of the registered sketch.
+
+        Raises
+        ------
+        ValueError
+            Raised if the sketches have different precisions
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of precisions {} and {}".format(
+                             self.precision, other.precision))
+        generic_msg(cmd="hllMerge", args="{} {}".format(self.registers.name,
+                                                         other.registers.name))
+        return self
+
+    def estimate(self) -> int:
+        """
+        The estimated number of distinct values of the sketch
+        """
+        repMsg = generic_msg(cmd="hllEstimate",
+                             args="{} {}".format(self.registers.name, self.precision))
+        return int(create_pdarray(cast(str, repMsg))[0])
+
+    def register(self, user_defined_name: str) -> HyperLogLog:
+        """
+        Register this sketch with the Arkouda server, so that it can be
+        attached to later with HyperLogLog.attach()
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name the sketch is to be registered under
+
+        Returns
+        -------
+        HyperLogLog
+            The same sketch, which is now registered with the arkouda server
+            and has an updated name.
+
+        Raises
+        ------
+        RegistrationError
+            If the server was unable to register the sketch
+
+        See also
+        --------
+        unregister, attach, is_registered
+        """
+        self.registers.register(f"{user_defined_name}.registers")
+        self.name = user_defined_name
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister this sketch in the arkouda server
+
+        Raises
+        ------
+        RegistrationError
+            If the sketch is not registered
+
+        See also
+        --------
+        register, attach, is_registered
+        """
+        if not self.name:
+            raise RegistrationError("This item does not have a name and does not appear to be registered.")
+        self.registers.unregister()
+        self.name = None
+
+    def is_registered(self) -> np.bool_:
+        """
+        Return True iff the sketch is contained in the registry
+        """
+        return self.registers.is_registered()
+
+    @staticmethod
+    @typechecked
+    def attach(user_defined_name: str) -> HyperLogLog:
+        """
+        Return the sketch registered under user_defined_name with register()
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name which the sketch was registered under
+
+        Returns
+        -------
+        HyperLogLog
+            The sketch attached to the registered registers
+
+        See also
+        --------
+        register, unregister, is_registered
+        """
+        h = HyperLogLog(None, registers=pdarray.attach(f"{user_defined_name}.registers"))
+        h.name = user_defined_name
+        return h
+
+
+class CountMinSketch:
+    """
+    A Count-Min sketch of the counts of the values of an array, kept on the
+    arkouda server, which estimates how often each value occurs and keeps
+    the values that occur most often.
+
+    Parameters
+    ----------
+    values : pdarray or Strings
+        The values to sketch, of dtype int64, uint64, float64 or bool
+    depth : int
+        The number of rows of counters (default 4). The estimates exceed
+        the true counts by more than the error below with probability
+        exp(-depth).
+    width : int
+        The number of counters in each row (default 2**16). The estimates
+        exceed the true counts by at most about e / width of the number of
+        values.
+    capacity : int
+        The number of the most frequent values the sketch keeps (default 100)
+
+    Attributes
+    ----------
+    counters : pdarray
+        The depth rows of width int64 counters, one after another
+    candidates : pdarray or Strings
+        The values with the largest estimated counts, at most capacity of them
+    name : str
+        The name the sketch is registered under, or None
+
+    Notes
+    -----
+    Every locale counts its own values and the counters are added, so the
+    values are never moved or sorted. Sketches of the same shape are merged
+    with merge(), so a sketch can be registered and kept up to date with the
+    batches of values that are appended to an array.
+    """
+    DefaultDepth = 4
+    DefaultWidth = 2**16
+    DefaultCapacity = 100
+    RegisterablePieces = frozenset(["counters", "candidates", "params"])
+
+    def __init__(self, values: Optional[sketchable], depth: int = DefaultDepth,
+                 width: int = DefaultWidth, capacity: int = DefaultCapacity, **kwargs) -> None:
+        self.logger = getArkoudaLogger(name=self.__class__.__name__)
+        if depth < 1 or width < 1 or capacity < 1:
+            raise ValueError("depth, width and capacity must be positive")
+        self.depth = depth
+        self.width = width
+        self.capacity = capacity
+        self.name : Optional[str] = None
+        if 'counters' in kwargs:
+            self.counters : pdarray = kwargs['counters']
+            self.candidates : sketchable = kwargs['candidates']
+        else:
+            if values is None:
+                raise ValueError("values must be given to build a CountMinSketch")
+            self.counters = self._count(values)
+            self.candidates = self._find_candidates(values)
+
+    def _count(self, values: sketchable) -> pdarray:
+        repMsg = generic_msg(cmd="cmsBuild", args="{} {} {}".format(_sketch_args(values),
+                                                                    self.depth, self.width))
+        return create_pdarray(cast(str, repMsg))
+
+    def _find_candidates(self, values: sketchable) -> sketchable:
+        """
+        The values with the largest counts estimated by the counters
+        """
+        args = "{} {} {} {} {}".format(_sketch_args(values), self.counters.name,
+                                       self.depth, self.width, self.capacity)
+        repMsg = generic_msg(cmd="heavyHitters", args=args)
+        idxAttr, _ = cast(str, repMsg).split("+")
+        return values[create_pdarray(idxAttr)]
+
+    def _keep_candidates(self, candidates: sketchable) -> None:
+        """
+        Keep the capacity candidates with the largest estimated counts
+        """
+        candidates = unique(candidates)
+        if candidates.size > self.capacity:
+            top = argsort(-self.estimate(candidates))[:self.capacity]
+            candidates = candidates[top]
+        if self.name:
+            self.candidates.unregister()
+            candidates.register(f"{self.name}.candidates")
+        self.candidates = candidates
+
+    def update(self, values: sketchable) -> CountMinSketch:
+        """
+        Add values to the sketch
+
+        Parameters
+        ----------
+        values : pdarray or Strings
+            The values to add, of the same type as the values of the sketch
+
+        Returns
+        -------
+        CountMinSketch
+            The same sketch, which now also counts values. This is an
+            in-place modification, also of the registered sketch.
+        """
+        self.counters += self._count(values)
+        self._keep_candidates(concatenate([self.candidates, self._find_candidates(values)]))
+        return self
+
+    def merge(self, other: CountMinSketch) -> CountMinSketch:
+        """
+        Merge another sketch into this one, so that it counts the values of
+        both
+
+        Parameters
+        ----------
+        other : CountMinSketch
+            A sketch of the same depth and width
+
+        Returns
+        -------
+        CountMinSketch
+            The same sketch, merged with other. This is an in-place
+            modification, also of the registered sketch.
+
+        Raises
+        ------
+        ValueError
+            Raised if the sketches have different depths or widths
+        """
+        if (other.depth, other.width) != (self.depth, self.width):
+            raise ValueError("Cannot merge sketches of shapes {} and {}".format(
+                             (self.depth, self.width), (other.depth, other.width)))
+        self.counters += other.counters
+        self._keep_candidates(concatenate([self.candidates, other.candidates]))
+        return self
+
+    def estimate(self, values: sketchable) -> pdarray:
+        """
+        The estimated count of each of values, which is never less than its
+        true count
+
+        Parameters
+        ----------
+        values : pdarray or Strings
+            The values whose counts to estimate
+
+        Returns
+        -------
+        pdarray, int64
+            The estimated count of each value
+        """
+        args = "{} {} {} {}".format(_sketch_args(values), self.counters.name,
+                                    self.depth, self.width)
+        return create_pdarray(cast(str, generic_msg(cmd="cmsEstimate", args=args)))
+
+    def heavy_hitters(self, k: int) -> Tuple[sketchable, pdarray]:
+        """
+        The k values with the largest estimated counts
+
+        Parameters
+        ----------
+        k : int
+            The number of values, at most the capacity of the sketch
+
+        Returns
+        -------
+        keys : pdarray or Strings
+            The values, by decreasing estimated count
+        counts : pdarray, int64
+            The estimated count of each value
+        """
+        if k > self.capacity:
+            raise ValueError("k must be at most the capacity {}".format(self.capacity))
+        counts = self.estimate(self.candidates)
+        top = argsort(-counts)[:k]
+        return self.candidates[top], counts[top]
+
+    def _get_components_dict(self) -> dict:
+        return {"counters": self.counters, "candidates": self.candidates}
+
+    def register(self, user_defined_name: str) -> CountMinSketch:
+        """
+        Register this sketch and its components with the Arkouda server, so
+        that it can be attached to later with CountMinSketch.attach()
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name the sketch is to be registered under,
+            this will be the root name for its components
+
+        Returns
+        -------
+        CountMinSketch
+            The same sketch, which is now registered with the arkouda server
+            and has an updated name.
+
+        Raises
+        ------
+        RegistrationError
+            If the server was unable to register the sketch
+
+        See also
+        --------
+        unregister, attach, is_registered
+        """
+        [p.register(f"{user_defined_name}.{n}") for n, p in self._get_components_dict().items()]
+        array([self.depth, self.width, self.capacity]).register(f"{user_defined_name}.params")
+        self.name = user_defined_name
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister this sketch in the arkouda server
+
+        Raises
+        ------
+        RegistrationError
+            If the sketch is not registered
+
+        See also
+        --------
+        register, attach, is_registered
+        """
+        if not self.name:
+            raise RegistrationError("This item does not have a name and does not appear to be registered.")
+        [p.unregister() for p in self._get_components_dict().values()]
+        pdarray.attach(f"{self.name}.params").unregister()
+        self.name = None
+
+    def is_registered(self) -> np.bool_:
+        """
+        Return True iff the sketch is contained in the registry
+        """
+        parts_registered : List[np.bool_] = [p.is_registered()
+                                             for p in self._get_components_dict().values()]
+        if np.any(parts_registered) and not np.all(parts_registered):
+            raise RegistrationError(f"Not all registerable components of CountMinSketch {self.name} are registered.")
+        return np.bool_(np.any(parts_registered))
+
+    @staticmethod
+    @typechecked
+    def attach(user_defined_name: str) -> CountMinSketch:
+        """
+        Return the sketch registered under user_defined_name with register()
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name which the sketch was registered under
+
+        Returns
+        -------
+        CountMinSketch
+            The sketch attached to the registered components
+
+        Raises
+        ------
+        RegistrationError
+            If no sketch is registered under user_defined_name
+
+        See also
+        --------
+        register, unregister, is_registered
+        """
+        if f"{user_defined_name}.params" not in list_registry():
+            raise RegistrationError(f"No CountMinSketch is registered under {user_defined_name}")
+        from arkouda.util import attach
+        depth, width, capacity = pdarray.attach(f"{user_defined_name}.params").to_ndarray().tolist()
+        c = CountMinSketch(None, depth, width, capacity,
+                           counters=pdarray.attach(f"{user_defined_name}.counters"),
+                           candidates=attach(f"{user_defined_name}.candidates"))
+        c.name = user_defined_name
+        return c
+
+
+@typechecked
+def approx_nunique(values: Union[pdarray, Strings],
+                   precision: int = HyperLogLog.DefaultPrecision) -> int:
+    """
+    Estimate the number of distinct values of an array with a HyperLogLog
+    sketch, without sorting it
+
+    Parameters
+    ----------
+    values : pdarray or Strings
+        The values, of dtype int64, uint64, float64 or bool
+    precision : int
+        The log2 of the number of registers of the sketch, between 4 and 18
+        (default 12), for a relative error of about 1.04 / sqrt(2**precision)
+
+    Returns
+    -------
+    int
+        The estimated number of distinct values
+
+    Raises
+    ------
+    TypeError
+        Raised if values is not a pdarray or Strings, or has another dtype
+    RuntimeError
+        Raised if precision is out of range
+
+    See Also
+    --------
+    HyperLogLog, unique, GroupBy.approx_nunique
+
+    Examples
+    --------
+    >>> ak.approx_nunique(ak.arange(1000) % 10)
+    10
+    """
+    return HyperLogLog(values, precision).estimate()
+
+
+@typechecked
+def heavy_hitters(values: Union[pdarray, Strings], k: int,
+                  depth: int = CountMinSketch.DefaultDepth,
+                  width: int = CountMinSketch.DefaultWidth) -> Tuple[sketchable, pdarray]:
+    """
+    Find the k most frequent values of an array with a Count-Min sketch,
+    without sorting it
+
+    Parameters
+    ----------
+    values : pdarray or Strings
+        The values, of dtype int64, uint64, float64 or bool
+    k : int
+        The number of values to find
+    depth : int
+        The number of rows of counters of the sketch (default 4)
+    width : int
+        The number of counters in each row of the sketch (default 2**16)
+
+    Returns
+    -------
+    keys : pdarray or Strings
+        The k values with the largest estimated counts, by decreasing count
+    counts : pdarray, int64
+        The estimated count of each value, which is never less than its
+        true count
+
+    Raises
+    ------
+    TypeError
+        Raised if values is not a pdarray or Strings, or has another dtype
+
+    See Also
+    --------
+    CountMinSketch, value_counts
+
+    Examples
+    --------
+    >>> ak.heavy_hitters(ak.array([1, 2, 2, 3, 3, 3]), 2)
+    (array([3, 2]), array([3, 2]))
+    """
+    sketch = CountMinSketch(values, depth, width, max(k, CountMinSketch.DefaultCapacity))
+    return sketch.heavy_hitters(k)
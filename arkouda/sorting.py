@@ -12,7 +12,7 @@ numeric_dtypes = {int64,uint64,float64}
 
 __all__ = ["argsort", "coargsort", "sort", "SortingAlgorithm"]
 
-SortingAlgorithm = Enum('SortingAlgorithm', ['RadixSortLSD', 'TwoArrayRadixSort'])
+SortingAlgorithm = Enum('SortingAlgorithm', ['RadixSortLSD', 'TwoArrayRadixSort', 'SampleSort', 'Auto'])
 
 def argsort(pda : Union[pdarray,Strings,'Categorical'], algorithm : SortingAlgorithm = SortingAlgorithm.RadixSortLSD) -> pdarray: # type: ignore
     """
@@ -22,6 +22,8 @@ def argsort(pda : Union[pdarray,Strings,'Categorical'], algorithm : SortingAlgor
     ----------
     pda : pdarray or Strings or Categorical
         The array to sort (int64, uint64, or float64)
+    algorithm : SortingAlgorithm
+        The sort to use for numeric arrays
 
     Returns
     -------
@@ -39,8 +41,13 @@ def argsort(pda : Union[pdarray,Strings,'Categorical'], algorithm : SortingAlgor
 
     Notes
     -----
-    Uses a least-significant-digit radix sort, which is stable and
-    resilient to non-uniformity in data but communication intensive.
+    By default uses a least-significant-digit radix sort, which is stable and
+    resilient to non-uniformity in data but communication intensive. The
+    SampleSort algorithm instead partitions the keys into one range per
+    locale and moves them only once, which is faster for wide keys (such as
+    float64 or large int64 values) on many locales. Auto chooses between the
+    two by key bit width and locale count. Strings are always sorted by the
+    server's string sort.
 
     Examples
     --------
@@ -71,6 +78,8 @@ def coargsort(arrays: Sequence[Union[Strings, pdarray, 'Categorical']], algorith
     ----------
     arrays : Sequence[Union[Strings, pdarray, Categorical]]
         The columns (int64, uint64, float64, Strings, or Categorical) to sort by row
+    algorithm : SortingAlgorithm
+        The sort to use; SampleSort and Auto are described in argsort
 
     Returns
     -------
@@ -148,6 +157,8 @@ def sort(pda : pdarray, algorithm : SortingAlgorithm = SortingAlgorithm.RadixSor
     ----------
     pda : pdarray or Categorical
         The array to sort (int64, uint64, or float64)
+    algorithm : SortingAlgorithm
+        The sort to use; SampleSort and Auto are described in argsort
 
     Returns
     -------
@@ -1314,17 +1314,30 @@ class Strings:
         '''
         return list(self.hash())
     
-    def to_ndarray(self) -> np.ndarray:
+    def to_ndarray(self, format : str = 'str') -> np.ndarray:
         """
         Convert the array to a np.ndarray, transferring array data from the
         arkouda server to Python. If the array exceeds a built-in size limit,
         a RuntimeError is raised.
 
+        Parameters
+        ----------
+        format : {'str', 'bytes', 'object'}
+            The kind of np.ndarray returned: fixed-width unicode ('<U'), 
+            fixed-width UTF-8 encoded bytes ('S'), which avoids decoding, or
+            an object array of Python str, which avoids padding every string
+            to the length of the longest one
+
         Returns
         -------
         np.ndarray
             A numpy ndarray with the same strings as this array
 
+        Raises
+        ------
+        ValueError
+            Raised if format is not one of 'str', 'bytes' or 'object'
+
         Notes
         -----
         The number of bytes in the array cannot exceed ``arkouda.maxTransferBytes``,
@@ -1337,7 +1350,7 @@ class Strings:
 
         See Also
         --------
-        array
+        array, to_arrow
 
         Examples
         --------
@@ -1346,20 +1359,48 @@ class Strings:
         array(['hello', 'my', 'world'], dtype='<U5')
         >>> type(a.to_ndarray())
         numpy.ndarray
+        >>> a.to_ndarray(format='bytes')
+        array([b'hello', b'my', b'world'], dtype='|S5')
+        """
+        if format not in ('str', 'bytes', 'object'):
+            raise ValueError("format must be one of 'str', 'bytes' or 'object'")
+        return _decode_strings(self._comp_to_ndarray("offsets"),
+                               self._comp_to_ndarray("values"), format)
+
+    def to_arrow(self):
+        """
+        Convert the array to a pyarrow LargeStringArray, transferring array 
+        data from the arkouda server to Python. The arrow array is built on the
+        transferred buffers, after removing the null terminators, without
+        converting individual strings to Python objects.
+
+        Returns
+        -------
+        pyarrow.LargeStringArray
+            An arrow array with the same strings as this array
+
+        Raises
+        ------
+        ModuleNotFoundError
+            Raised if pyarrow is not installed
+
+        Notes
+        -----
+        The number of bytes in the array cannot exceed ``arkouda.maxTransferBytes``,
+        as for to_ndarray.
+
+        See Also
+        --------
+        to_ndarray
         """
-        # Get offsets and append total bytes for length calculation
-        npoffsets = np.hstack((self._comp_to_ndarray("offsets"), np.array([self.nbytes])))
-        # Get contents of strings (will error if too large)
-        npvalues = self._comp_to_ndarray("values")
-        # Compute lengths, discounting null terminators
-        lengths = np.diff(npoffsets) - 1
-        # Numpy dtype is based on max string length
-        dt = '<U{}'.format(lengths.max())
-        res = np.empty(self.size, dtype=dt)
-        # Form a string from each segment and store in numpy array
-        for i, (o, l) in enumerate(zip(npoffsets, lengths)):
-            res[i] = np.str_(''.join(chr(b) for b in npvalues[o:o+l]))
-        return res
+        try:
+            import pyarrow as pa # type: ignore
+        except ImportError:
+            raise ModuleNotFoundError('pyarrow is not installed and is required for to_arrow')
+        offsets, data = _compact_strings(self._comp_to_ndarray("offsets"),
+                                         self._comp_to_ndarray("values"))
+        return pa.LargeStringArray.from_buffers(offsets.size - 1, pa.py_buffer(offsets),
+                                                pa.py_buffer(data))
 
     def _comp_to_ndarray(self, comp: str) -> np.ndarray:
         """
@@ -1403,7 +1444,8 @@ class Strings:
             raise RuntimeError(('Array exceeds allowed size for transfer. Increase ' +
                                'client.maxTransferBytes to allow'))
         # The reply from the server will be a bytes object
-        rep_msg = generic_msg(cmd=CMD_TO_NDARRAY, args="{} {}".format(self.entry.name, comp), recv_binary=True)
+        rep_msg = cast(memoryview, generic_msg(cmd=CMD_TO_NDARRAY, args="{} {}".format(self.entry.name, comp),
+                                               recv_binary=True))
 
         # Make sure the received data has the expected length
         if len(rep_msg) != array_bytes:
@@ -1745,3 +1787,62 @@ class Strings:
         """
         unregister_pdarray_by_name(user_defined_name)
         
+
+
+def _compact_strings(offsets : np.ndarray, values : np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts the offsets and null-terminated bytes of a Strings object into
+    native-endian offsets with one entry per string plus the total length, and
+    the bytes without null terminators, as used by arrow.
+    """
+    offsets = offsets.astype(np.int64)
+    ends = np.append(offsets[1:], values.size)
+    keep = np.ones(values.size, dtype=bool)
+    keep[ends - 1] = False
+    # every preceding string loses its null terminator
+    compact = np.append(offsets - np.arange(offsets.size), values.size - offsets.size)
+    return compact, values[keep]
+
+def _decode_strings(offsets : np.ndarray, values : np.ndarray, format : str = 'str') -> np.ndarray:
+    """
+    Converts the offsets and null-terminated bytes of a Strings object into 
+    a np.ndarray of 'str' (fixed-width unicode), 'bytes' (fixed-width UTF-8)
+    or 'object' (Python str) dtype, in bulk operations over the buffers.
+    """
+    compact_offsets, data = _compact_strings(offsets, values)
+    ascii = data.size == 0 or data.max() < 0x80
+    if format == 'object':
+        # decode all strings at once and slice by character offsets, which
+        # differ from byte offsets only for multi-byte UTF-8 characters
+        text = data.tobytes().decode('utf-8')
+        if not ascii:
+            starts = np.cumsum((data & 0xC0) != 0x80)
+            compact_offsets = np.append(0, starts)[compact_offsets]
+        bounds = compact_offsets.tolist()
+        result = np.empty(len(bounds) - 1, dtype=object)
+        result[:] = [text[b:e] for b, e in zip(bounds[:-1], bounds[1:])]
+        return result
+    lengths = np.diff(compact_offsets)
+    width = max(int(lengths.max()), 1) if lengths.size > 0 else 1
+    # scatter the bytes of each string into a row of a zero-padded matrix,
+    # which is the memory layout of a fixed-width bytes array
+    matrix = np.zeros((lengths.size, width), dtype=np.uint8)
+    matrix[np.arange(width) < lengths[:, None]] = data
+    fixed = matrix.view('S{}'.format(width)).reshape(lengths.size)
+    if format == 'bytes':
+        return fixed
+    if ascii:
+        # ASCII needs no UTF-8 decoding
+        return fixed.astype('U{}'.format(width))
+    return np.char.decode(fixed, 'utf-8')
+
+def _encode_strings(a : np.ndarray) -> np.ndarray:
+    """
+    Encodes an array of str as UTF-8 bytes with each string followed by a null
+    terminator, the bytes representation of a Strings object, using a single
+    bulk join and encode rather than per-character operations.
+    """
+    if a.size == 0:
+        return np.zeros(0, dtype=np.uint8)
+    encoded = ('\x00'.join(a.tolist()) + '\x00').encode('utf-8')
+    return np.frombuffer(encoded, dtype=np.uint8)
@@ -109,7 +109,7 @@ def register_all(data, prefix, overwrite=True):
     elif isinstance(data, tuple):
         return tuple([register(v, f'{prefix}{i}') for i, v in enumerate(data)])
     elif isinstance(data, GroupBy):
-        data.permutation = register(data.permutation, f'{prefix}permutation')
+        data._permutation = register(data.permutation, f'{prefix}permutation')
         data.segments = register(data.segments, f'{prefix}segments')
         data.unique_keys = register_all(data.unique_keys, f'{prefix}unique_keys_')
         return data
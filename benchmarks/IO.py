@@ -36,8 +36,10 @@ def time_ak_write(N_per_locale, numfiles, trials, dtype, path, seed, parquet, co
     nb = a.size * a.itemsize * numfiles
     print("write Average rate = {:.2f} GiB/sec".format(nb/2**30/avgwrite))
 
-def time_ak_read(N_per_locale, numfiles, trials, dtype, path, seed, parquet):
-    if not parquet:
+def time_ak_read(N_per_locale, numfiles, trials, dtype, path, seed, parquet, direct_io=True):
+    if not parquet and not direct_io:
+        print(">>> arkouda HDF5 {} read through the HDF5 library".format(dtype))
+    elif not parquet:
         print(">>> arkouda HDF5 {} read".format(dtype))
     else:
         print(">>> arkouda Parquet {} read".format(dtype))
@@ -49,7 +51,7 @@ def time_ak_read(N_per_locale, numfiles, trials, dtype, path, seed, parquet):
     readtimes = []
     for i in range(trials):
         start = time.time()
-        a = ak.read(path+'*')
+        a = ak.read(path+'*', direct_io=direct_io)
         end = time.time()
         readtimes.append(end - start)
     avgread = sum(readtimes) / trials
@@ -58,6 +60,16 @@ def time_ak_read(N_per_locale, numfiles, trials, dtype, path, seed, parquet):
 
     nb = a.size * a.itemsize
     print("read Average rate = {:.2f} GiB/sec".format(nb/2**30/avgread))
+    return avgread
+
+def compare_direct_read(N_per_locale, numfiles, trials, dtype, path, seed):
+    """
+    Times HDF5 reads of the same files through the HDF5 library and with
+    direct preads of their contiguous datasets.
+    """
+    library = time_ak_read(N_per_locale, numfiles, trials, dtype, path, seed, False, direct_io=False)
+    direct = time_ak_read(N_per_locale, numfiles, trials, dtype, path, seed, False, direct_io=True)
+    print("direct read speedup = {:.2f}x".format(library/direct))
 
 def remove_files(path):
     for f in glob(path+'*'):
@@ -108,6 +120,7 @@ def create_parser():
     parser.add_argument('-f', '--only-delete', default=False, action='store_true', help="Only delete files created from writing with this benchmark")
     parser.add_argument('-l', '--files-per-loc', type=int, default=1, help='Number of files to create per locale')
     parser.add_argument('-c', '--compressed', default=False, action='store_true', help='Write with Snappy compression and RLE encoding')
+    parser.add_argument('--compare-direct', default=False, action='store_true', help='Compare HDF5 reads through the HDF5 library and with direct preads')
     return parser
 
 if __name__ == "__main__":
@@ -127,7 +140,15 @@ if __name__ == "__main__":
     print("array size = {:,}".format(args.size))
     print("number of trials = ", args.trials)
 
-    if args.only_write:
+    if args.compare_direct:
+        if args.parquet:
+            raise ValueError("Direct reads only apply to HDF5 files")
+        if not args.only_read:
+            time_ak_write(args.size, args.files_per_loc, args.trials, args.dtype, args.path, args.seed, False)
+        compare_direct_read(args.size, args.files_per_loc, args.trials, args.dtype, args.path, args.seed)
+        if not args.only_read:
+            remove_files(args.path)
+    elif args.only_write:
         time_ak_write(args.size, args.files_per_loc, args.trials, args.dtype, args.path, args.seed, args.parquet, args.compressed)
     elif args.only_read:
         time_ak_read(args.size, args.files_per_loc, args.trials, args.dtype, args.path, args.seed, args.parquet)
@@ -24,6 +24,7 @@ module ArgSortMsg
     use ServerErrorStrings;
 
     use RadixSortLSD;
+    use SampleSort;
     use SegmentedArray;
     use Reflection;
     use ServerErrors;
@@ -48,10 +49,26 @@ module ArgSortMsg
 
     enum SortingAlgorithm {
       RadixSortLSD,
-      TwoArrayRadixSort
+      TwoArrayRadixSort,
+      SampleSort,
+      Auto
     };
     config const defaultSortAlgorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD;
 
+    /*
+    Key bit width above which Auto chooses the sample sort on more than one
+    locale, since the radix sort exchanges the keys once per 16-bit digit
+    */
+    config const sampleSortMinBits = 32;
+
+    /* The algorithm Auto chooses for sorting A */
+    proc chooseSortAlgorithm(A:[?D] ?t): SortingAlgorithm {
+      if numLocales == 1 then return SortingAlgorithm.RadixSortLSD;
+      const (nBits, _) = getBitWidth(A);
+      return if nBits > sampleSortMinBits then SortingAlgorithm.SampleSort
+                                          else SortingAlgorithm.RadixSortLSD;
+    }
+
     // proc DefaultComparator.keyPart(x: _tuple, i:int) where !isHomogeneousTuple(x) &&
     // (isInt(x(0)) || isUint(x(0)) || isReal(x(0))) {
     
@@ -118,7 +135,8 @@ module ArgSortMsg
        permutation vector and further permuting it in the manner required
        to sort an array of keys.
      */
-    proc incrementalArgSort(g: GenSymEntry, iv: [?aD] int): [] int throws {
+    proc incrementalArgSort(g: GenSymEntry, iv: [?aD] int,
+                            algorithm: SortingAlgorithm = defaultSortAlgorithm): [] int throws {
       // Store the incremental permutation to be applied on top of the initial perm
       var deltaIV: [aD] int;
       // Discover the dtype of the entry holding the keys array
@@ -133,7 +151,7 @@ module ArgSortMsg
                   agg.copy(newai, olda[idx]);
               }
               // Generate the next incremental permutation
-              deltaIV = argsortDefault(newa);
+              deltaIV = argsortDefault(newa, algorithm=algorithm);
           }
           when DType.UInt64 {
               var e = toSymEntry(g, uint);
@@ -145,7 +163,7 @@ module ArgSortMsg
                   agg.copy(newai, olda[idx]);
               }
               // Generate the next incremental permutation
-              deltaIV = argsortDefault(newa);
+              deltaIV = argsortDefault(newa, algorithm=algorithm);
           }
           when DType.Float64 {
               var e = toSymEntry(g, real);
@@ -154,7 +172,7 @@ module ArgSortMsg
               forall (newai, idx) in zip(newa, iv) with (var agg = newSrcAggregator(real)) {
                   agg.copy(newai, olda[idx]);
               }
-              deltaIV = argsortDefault(newa);
+              deltaIV = argsortDefault(newa, algorithm=algorithm);
           }
           otherwise { throw getErrorWithContext(
                                 msg="Unsupported DataType: %t".format(dtype2str(g.dtype)),
@@ -174,13 +192,14 @@ module ArgSortMsg
       return newIV;
     }
 
-    proc incrementalArgSort(s: SegString, iv: [?aD] int): [] int throws {
+    proc incrementalArgSort(s: SegString, iv: [?aD] int,
+                            algorithm: SortingAlgorithm = defaultSortAlgorithm): [] int throws {
       var hashes = s.hash();
       var newHashes: [aD] 2*uint;
       forall (nh, idx) in zip(newHashes, iv) with (var agg = newSrcAggregator((2*uint))) {
         agg.copy(nh, hashes[idx]);
       }
-      var deltaIV = argsortDefault(newHashes);
+      var deltaIV = argsortDefault(newHashes, algorithm=algorithm);
       // var (newOffsets, newVals) = s[iv];
       // var deltaIV = newStr.argGroup();
       var newIV: [aD] int;
@@ -204,6 +223,26 @@ module ArgSortMsg
     /*   return cumulativeIV; */
     /* } */
 
+    /* The permutation that leaves n keys in place, which is the stable argsort
+       of keys that are already sorted */
+    proc identityPermutation(n: int) {
+        var iv = makeDistArray(n, int);
+        forall (v, i) in zip(iv, iv.domain) do v = i;
+        return iv;
+    }
+
+    /* Whether the named keys are known to be in lexicographic order: if every
+       key is sorted, or the first is sorted and has no duplicates */
+    proc keysInOrder(names, types, st: borrowed SymTab): bool throws {
+      for (name, objtype, i) in zip(names, types, 0..) {
+        if objtype == "str" then return false;
+        var g = getGenericTypedArrayEntry(name, st);
+        if !g.isSorted() then return false;
+        if i == 0 && g.isUnique() then return true;
+      }
+      return true;
+    }
+
     /* Find the permutation that sorts multiple arrays, treating each array as a
        new level of the sorting key.
      */
@@ -281,6 +320,15 @@ module ArgSortMsg
         
       }
 
+      if keysInOrder(names, types, st) {
+        var ivname = st.nextName();
+        st.addEntry(ivname, new shared SymEntry(identityPermutation(size)));
+        repMsg = "created " + st.attrib(ivname);
+        asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "keys already sorted: %s".format(repMsg));
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(ivname));
+      }
+
       // If there were no string arrays, merge the arrays into a single array and sort
       // that. This eliminates having to merge index vectors, but has a memory overhead
       // and increases the size of the comm we have to do since the KEY is larger). We
@@ -388,22 +436,23 @@ module ArgSortMsg
                         types.domain.low..types.domain.high by -1) {
         if (types[j] == "str") {
           var strings = getSegString(names[i], st);
-          iv.a = incrementalArgSort(strings, iv.a);
+          iv.a = incrementalArgSort(strings, iv.a, algorithm);
         } else {
           var g: borrowed GenSymEntry = getGenericTypedArrayEntry(names[i], st);
           // Perform the coArgSort and store in the new SymEntry
-          iv.a = incrementalArgSort(g, iv.a);
+          iv.a = incrementalArgSort(g, iv.a, algorithm);
         }
       }
       repMsg = "created " + st.attrib(rname);
       asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     
     proc argsortDefault(A:[?D] ?t, algorithm:SortingAlgorithm=defaultSortAlgorithm):[D] int throws {
       var t1 = Time.getCurrentTime();
       var iv: [D] int;
-      select algorithm {
+      const algo = if algorithm == SortingAlgorithm.Auto then chooseSortAlgorithm(A) else algorithm;
+      select algo {
         when SortingAlgorithm.TwoArrayRadixSort {
           var AI = [(a, i) in zip(A, D)] (a, i);
           Sort.TwoArrayRadixSort.twoArrayRadixSort(AI, comparator=myDefaultComparator);
@@ -412,6 +461,9 @@ module ArgSortMsg
         when SortingAlgorithm.RadixSortLSD {
           iv = radixSortLSD_ranks(A);
         }
+        when SortingAlgorithm.SampleSort {
+          iv = sampleSort_ranks(A);
+        }
         otherwise {
           throw getErrorWithContext(
                                     msg="Unrecognized sorting algorithm: %s".format(algorithm:string),
@@ -423,7 +475,7 @@ module ArgSortMsg
         }
       }
       try! asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                             "argsort time = %i".format(Time.getCurrentTime() - t1));
+                             "%s argsort time = %i".format(algo:string, Time.getCurrentTime() - t1));
       return iv;
     }
     
@@ -458,7 +510,9 @@ module ArgSortMsg
             // check and throw if over memory limit
             overMemLimit(radixSortLSD_memEst(gEnt.size, gEnt.itemsize));
         
-            select (gEnt.dtype) {
+            if gEnt.isSorted() {
+                st.addEntry(ivname, new shared SymEntry(identityPermutation(gEnt.size)));
+            } else select (gEnt.dtype) {
                 when (DType.Int64) {
                     var e = toSymEntry(gEnt,int);
                     var iv = argsortDefault(e.a, algorithm=algorithm);
@@ -471,7 +525,7 @@ module ArgSortMsg
                 }
                 when (DType.Float64) {
                     var e = toSymEntry(gEnt, real);
-                    var iv = argsortDefault(e.a);
+                    var iv = argsortDefault(e.a, algorithm=algorithm);
                     st.addEntry(ivname, new shared SymEntry(iv));
                 }
                 otherwise {
@@ -498,7 +552,7 @@ module ArgSortMsg
 
         repMsg = "created " + st.attrib(ivname);
         asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(ivname));
     }
 
     proc registerMe() {
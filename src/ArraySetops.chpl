@@ -16,15 +16,21 @@ module ArraySetops
     use AryUtil;
     use In1d;
 
+    // returns the array, or its sorted unique values if it is not unique
+    proc uniqueIfNeeded(a: [] ?t, isUnique: bool) throws {
+      if isUnique then return a;
+      return uniqueSort(a, false);
+    }
+
     // returns intersection of 2 arrays
     proc intersect1d(a: [] ?t, b: [] t, assume_unique: bool) throws {
+      return intersect1d(a, b, assume_unique, assume_unique);
+    }
+
+    // returns intersection of 2 arrays, each of which may be known to be unique
+    proc intersect1d(a: [] ?t, b: [] t, aUnique: bool, bUnique: bool) throws {
       //if not unique, unique sort arrays then perform operation
-      if (!assume_unique) {
-        var a1  = uniqueSort(a, false);
-        var b1  = uniqueSort(b, false);
-        return intersect1dHelper(a1, b1);
-      }
-      return intersect1dHelper(a,b);
+      return intersect1dHelper(uniqueIfNeeded(a, aUnique), uniqueIfNeeded(b, bUnique));
     }
 
     proc intersect1dHelper(a: [] ?t, b: [] t) throws {
@@ -42,13 +48,13 @@ module ArraySetops
     
     // returns the exclusive-or of 2 arrays
     proc setxor1d(a: [] ?t, b: [] t, assume_unique: bool) throws {
+      return setxor1d(a, b, assume_unique, assume_unique);
+    }
+
+    // returns the exclusive-or of 2 arrays, each of which may be known to be unique
+    proc setxor1d(a: [] ?t, b: [] t, aUnique: bool, bUnique: bool) throws {
       //if not unique, unique sort arrays then perform operation
-      if (!assume_unique) {
-        var a1  = uniqueSort(a, false);
-        var b1  = uniqueSort(b, false);
-        return  setxor1dHelper(a1, b1);
-      }
-      return setxor1dHelper(a,b);
+      return setxor1dHelper(uniqueIfNeeded(a, aUnique), uniqueIfNeeded(b, bUnique));
     }
 
     // Gets xor of 2 arrays
@@ -79,13 +85,13 @@ module ArraySetops
 
     // returns the set difference of 2 arrays
     proc setdiff1d(a: [] ?t, b: [] t, assume_unique: bool) throws {
+      return setdiff1d(a, b, assume_unique, assume_unique);
+    }
+
+    // returns the set difference of 2 arrays, each of which may be known to be unique
+    proc setdiff1d(a: [] ?t, b: [] t, aUnique: bool, bUnique: bool) throws {
       //if not unique, unique sort arrays then perform operation
-      if (!assume_unique) {
-        var a1  = uniqueSort(a, false);
-        var b1  = uniqueSort(b, false);
-        return setdiff1dHelper(a1, b1);
-      }
-      return setdiff1dHelper(a,b);
+      return setdiff1dHelper(uniqueIfNeeded(a, aUnique), uniqueIfNeeded(b, bUnique));
     }
     
     // Gets diff of 2 arrays
@@ -104,11 +110,11 @@ module ArraySetops
     // first concatenates the 2 arrays, then
     // sorts resulting array and ensures that
     // values are unique
-    proc union1d(a: [] ?t, b: [] t) throws {
+    proc union1d(a: [] ?t, b: [] t, aUnique: bool = false, bUnique: bool = false) throws {
       var aux;
       // Artificial scope to clean up temporary arrays
       {
-        aux = concatArrays(uniqueSort(a,false), uniqueSort(b,false));
+        aux = concatArrays(uniqueIfNeeded(a, aUnique), uniqueIfNeeded(b, bUnique));
       }
       return uniqueSort(aux, false);
     }
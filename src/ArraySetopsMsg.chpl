@@ -58,23 +58,27 @@ module ArraySetopsMsg
             var e = toSymEntry(gEnt,int);
             var f = toSymEntry(gEnt2,int);
 
-            var aV = intersect1d(e.a, f.a, isUnique);
-            st.addEntry(vname, new shared SymEntry(aV));
+            var aV = intersect1d(e.a, f.a, isUnique || e.isUnique(), isUnique || f.isUnique());
+            var ve = new shared SymEntry(aV);
+            ve.setSorted(unique=true);
+            st.addEntry(vname, ve);
 
             repMsg = "created " + st.attrib(vname);
             asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-            return new MsgTuple(repMsg, MsgType.NORMAL);
+            return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
           }
           when (DType.UInt64, DType.UInt64) {
             var e = toSymEntry(gEnt,uint);
             var f = toSymEntry(gEnt2,uint);
 
-            var aV = intersect1d(e.a, f.a, isUnique);
-            st.addEntry(vname, new shared SymEntry(aV));
+            var aV = intersect1d(e.a, f.a, isUnique || e.isUnique(), isUnique || f.isUnique());
+            var ve = new shared SymEntry(aV);
+            ve.setSorted(unique=true);
+            st.addEntry(vname, ve);
 
             repMsg = "created " + st.attrib(vname);
             asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-            return new MsgTuple(repMsg, MsgType.NORMAL);
+            return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
           }
           otherwise {
             var errorMsg = notImplementedError("intersect1d",gEnt.dtype);
@@ -114,23 +118,27 @@ module ArraySetopsMsg
              var e = toSymEntry(gEnt,int);
              var f = toSymEntry(gEnt2,int);
              
-             var aV = setxor1d(e.a, f.a, isUnique);
-             st.addEntry(vname, new shared SymEntry(aV));
+             var aV = setxor1d(e.a, f.a, isUnique || e.isUnique(), isUnique || f.isUnique());
+             var ve = new shared SymEntry(aV);
+             ve.setSorted(unique=true);
+             st.addEntry(vname, ve);
 
              repMsg = "created " + st.attrib(vname);
              asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-             return new MsgTuple(repMsg, MsgType.NORMAL);
+             return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
            }
            when (DType.UInt64, DType.UInt64) {
              var e = toSymEntry(gEnt,uint);
              var f = toSymEntry(gEnt2,uint);
              
-             var aV = setxor1d(e.a, f.a, isUnique);
-             st.addEntry(vname, new shared SymEntry(aV));
+             var aV = setxor1d(e.a, f.a, isUnique || e.isUnique(), isUnique || f.isUnique());
+             var ve = new shared SymEntry(aV);
+             ve.setSorted(unique=true);
+             st.addEntry(vname, ve);
 
              repMsg = "created " + st.attrib(vname);
              asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-             return new MsgTuple(repMsg, MsgType.NORMAL);
+             return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
            }
            otherwise {
                var errorMsg = notImplementedError("setxor1d",gEnt.dtype);
@@ -170,23 +178,33 @@ module ArraySetopsMsg
              var e = toSymEntry(gEnt,int);
              var f = toSymEntry(gEnt2, int);
              
-             var aV = setdiff1d(e.a, f.a, isUnique);
-             st.addEntry(vname, new shared SymEntry(aV));
+             const aUnique = isUnique || e.isUnique();
+             var aV = setdiff1d(e.a, f.a, aUnique, isUnique || f.isUnique());
+             // the values of e, in their order
+             var ve = new shared SymEntry(aV);
+             ve.setUnique();
+             if !aUnique || e.isSorted() then ve.setSorted();
+             st.addEntry(vname, ve);
 
              var repMsg = "created " + st.attrib(vname);
              asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-             return new MsgTuple(repMsg, MsgType.NORMAL);
+             return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
            }
            when (DType.UInt64, DType.UInt64) {
              var e = toSymEntry(gEnt,uint);
              var f = toSymEntry(gEnt2, uint);
              
-             var aV = setdiff1d(e.a, f.a, isUnique);
-             st.addEntry(vname, new shared SymEntry(aV));
+             const aUnique = isUnique || e.isUnique();
+             var aV = setdiff1d(e.a, f.a, aUnique, isUnique || f.isUnique());
+             // the values of e, in their order
+             var ve = new shared SymEntry(aV);
+             ve.setUnique();
+             if !aUnique || e.isSorted() then ve.setSorted();
+             st.addEntry(vname, ve);
 
              var repMsg = "created " + st.attrib(vname);
              asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-             return new MsgTuple(repMsg, MsgType.NORMAL);
+             return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
            }
            otherwise {
                var errorMsg = notImplementedError("setdiff1d",gEnt.dtype);
@@ -225,23 +243,27 @@ module ArraySetopsMsg
            var e = toSymEntry(gEnt,int);
            var f = toSymEntry(gEnt2,int);
 
-           var aV = union1d(e.a, f.a);
-           st.addEntry(vname, new shared SymEntry(aV));
+           var aV = union1d(e.a, f.a, e.isUnique(), f.isUnique());
+           var ve = new shared SymEntry(aV);
+           ve.setSorted(unique=true);
+           st.addEntry(vname, ve);
 
            var repMsg = "created " + st.attrib(vname);
            asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-           return new MsgTuple(repMsg, MsgType.NORMAL);
+           return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
          }
          when (DType.UInt64, DType.UInt64) {
            var e = toSymEntry(gEnt,uint);
            var f = toSymEntry(gEnt2,uint);
 
-           var aV = union1d(e.a, f.a);
-           st.addEntry(vname, new shared SymEntry(aV));
+           var aV = union1d(e.a, f.a, e.isUnique(), f.isUnique());
+           var ve = new shared SymEntry(aV);
+           ve.setSorted(unique=true);
+           st.addEntry(vname, ve);
 
            var repMsg = "created " + st.attrib(vname);
            asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-           return new MsgTuple(repMsg, MsgType.NORMAL);
+           return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
          }
          otherwise {
              var errorMsg = notImplementedError("newUnion1d",gEnt.dtype);
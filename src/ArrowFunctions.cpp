@@ -65,249 +65,63 @@ int64_t cpp_getNumRows(const char* filename, char** errMsg) {
   }
 }
 
-int cpp_getType(const char* filename, const char* colname, char** errMsg) {
-  try {
-    std::shared_ptr<arrow::io::ReadableFile> infile;
-    ARROWRESULT_OK(arrow::io::ReadableFile::Open(filename, arrow::default_memory_pool()),
-                   infile);
-
-    std::unique_ptr<parquet::arrow::FileReader> reader;
-    ARROWSTATUS_OK(parquet::arrow::OpenFile(infile, arrow::default_memory_pool(), &reader));
-
-    std::shared_ptr<arrow::Schema> sc;
-    std::shared_ptr<arrow::Schema>* out = &sc;
-    ARROWSTATUS_OK(reader->GetSchema(out));
-
-    int idx = sc -> GetFieldIndex(colname);
-    // Since this doesn't actually throw a Parquet error, we have to generate
-    // our own error message for this case
-    if(idx == -1) {
-      std::string fname(filename);
-      std::string dname(colname);
-      std::string msg = "Dataset: " + dname + " does not exist in file: " + filename; 
-      *errMsg = strdup(msg.c_str());
-      return ARROWERROR;
-    }
-    auto myType = sc -> field(idx) -> type();
-
-    if(myType->id() == arrow::Type::INT64)
-      return ARROWINT64;
-    else if(myType->id() == arrow::Type::INT32)
-      return ARROWINT32;
-    else if(myType->id() == arrow::Type::UINT64)
-      return ARROWUINT64;
-    else if(myType->id() == arrow::Type::UINT32)
-      return ARROWUINT32;
-    else if(myType->id() == arrow::Type::TIMESTAMP)
-      return ARROWTIMESTAMP;
-    else if(myType->id() == arrow::Type::BOOL)
-      return ARROWBOOLEAN;
-    else if(myType->id() == arrow::Type::STRING ||
-            myType->id() == arrow::Type::BINARY)
-      return ARROWSTRING;
-    else if(myType->id() == arrow::Type::FLOAT)
-      return ARROWFLOAT;
-    else if(myType->id() == arrow::Type::DOUBLE)
-      return ARROWDOUBLE;
-    else {
-      std::string fname(filename);
-      std::string dname(colname);
-      std::string msg = "Unsupported type on column: " + dname + " in " + filename; 
-      *errMsg = strdup(msg.c_str());
-      return ARROWERROR;
-    }
-  } catch (const std::exception& e) {
-    *errMsg = strdup(e.what());
+// The type of a column of an open file, one of the ARROW* type codes
+static int columnType(parquet::arrow::FileReader* reader, const char* filename,
+                      const char* colname, char** errMsg) {
+  std::shared_ptr<arrow::Schema> sc;
+  std::shared_ptr<arrow::Schema>* out = &sc;
+  ARROWSTATUS_OK(reader->GetSchema(out));
+
+  int idx = sc -> GetFieldIndex(colname);
+  // Since this doesn't actually throw a Parquet error, we have to generate
+  // our own error message for this case
+  if(idx == -1) {
+    std::string fname(filename);
+    std::string dname(colname);
+    std::string msg = "Dataset: " + dname + " does not exist in file: " + filename; 
+    *errMsg = strdup(msg.c_str());
     return ARROWERROR;
   }
-}
-
-int64_t cpp_getStringColumnNumBytes(const char* filename, const char* colname, void* chpl_offsets, int64_t numElems, int64_t startIdx, char** errMsg) {
-  try {
-    int64_t ty = cpp_getType(filename, colname, errMsg);
-    auto offsets = (int64_t*)chpl_offsets;
-    int64_t byteSize = 0;
-
-    if(ty == ARROWSTRING) {
-      std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
-        parquet::ParquetFileReader::OpenFile(filename, false);
-
-      std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
-      int num_row_groups = file_metadata->num_row_groups();
-
-      int64_t i = 0;
-      for (int r = 0; r < num_row_groups; r++) {
-        std::shared_ptr<parquet::RowGroupReader> row_group_reader =
-          parquet_reader->RowGroup(r);
-
-        int64_t values_read = 0;
-
-        std::shared_ptr<parquet::ColumnReader> column_reader;
-
-        auto idx = file_metadata -> schema() -> ColumnIndex(colname);
-
-        if(idx < 0) {
-          std::string dname(colname);
-          std::string fname(filename);
-          std::string msg = "Dataset: " + dname + " does not exist in file: " + fname; 
-          *errMsg = strdup(msg.c_str());
-          return ARROWERROR;
-        }
-        column_reader = row_group_reader->Column(idx);
-        int16_t definition_level;
-        parquet::ByteArrayReader* ba_reader =
-          static_cast<parquet::ByteArrayReader*>(column_reader.get());
-
-        int64_t numRead = 0;
-        while (ba_reader->HasNext() && numRead < numElems) {
-          parquet::ByteArray value;
-          (void)ba_reader->ReadBatch(1, &definition_level, nullptr, &value, &values_read);
-          if(values_read > 0) {
-            offsets[i] = value.len + 1;
-            byteSize += value.len + 1;
-            numRead += values_read;
-          } else {
-            offsets[i] = 1;
-            byteSize+=1;
-            numRead+=1;
-          }
-          i++;
-        }
-      }
-      return byteSize;
-    }
-    return ARROWERROR;
-  } catch (const std::exception& e) {
-    *errMsg = strdup(e.what());
+  auto myType = sc -> field(idx) -> type();
+
+  if(myType->id() == arrow::Type::INT64)
+    return ARROWINT64;
+  else if(myType->id() == arrow::Type::INT32)
+    return ARROWINT32;
+  else if(myType->id() == arrow::Type::UINT64)
+    return ARROWUINT64;
+  else if(myType->id() == arrow::Type::UINT32)
+    return ARROWUINT32;
+  else if(myType->id() == arrow::Type::TIMESTAMP)
+    return ARROWTIMESTAMP;
+  else if(myType->id() == arrow::Type::BOOL)
+    return ARROWBOOLEAN;
+  else if(myType->id() == arrow::Type::STRING ||
+          myType->id() == arrow::Type::BINARY)
+    return ARROWSTRING;
+  else if(myType->id() == arrow::Type::FLOAT)
+    return ARROWFLOAT;
+  else if(myType->id() == arrow::Type::DOUBLE)
+    return ARROWDOUBLE;
+  else {
+    std::string fname(filename);
+    std::string dname(colname);
+    std::string msg = "Unsupported type on column: " + dname + " in " + filename; 
+    *errMsg = strdup(msg.c_str());
     return ARROWERROR;
   }
 }
 
-int cpp_readColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg) {
+int cpp_getType(const char* filename, const char* colname, char** errMsg) {
   try {
-    int64_t ty = cpp_getType(filename, colname, errMsg);
-  
-    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
-      parquet::ParquetFileReader::OpenFile(filename, false);
-
-    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
-    int num_row_groups = file_metadata->num_row_groups();
-
-    int64_t i = 0;
-    for (int r = 0; r < num_row_groups; r++) {
-      std::shared_ptr<parquet::RowGroupReader> row_group_reader =
-        parquet_reader->RowGroup(r);
-
-      int64_t values_read = 0;
-
-      std::shared_ptr<parquet::ColumnReader> column_reader;
-
-      auto idx = file_metadata -> schema() -> ColumnIndex(colname);
+    std::shared_ptr<arrow::io::ReadableFile> infile;
+    ARROWRESULT_OK(arrow::io::ReadableFile::Open(filename, arrow::default_memory_pool()),
+                   infile);
 
-      if(idx < 0) {
-        std::string dname(colname);
-        std::string fname(filename);
-        std::string msg = "Dataset: " + dname + " does not exist in file: " + fname; 
-        *errMsg = strdup(msg.c_str());
-        return ARROWERROR;
-      }
-      
-      column_reader = row_group_reader->Column(idx);
-
-      // Since int64 and uint64 Arrow dtypes share a physical type and only differ
-      // in logical type, they must be read from the file in the same way
-      if(ty == ARROWINT64 || ty == ARROWUINT64) {
-        auto chpl_ptr = (int64_t*)chpl_arr;
-        parquet::Int64Reader* reader =
-          static_cast<parquet::Int64Reader*>(column_reader.get());
-        reader->Skip(startIdx);
-
-        while (reader->HasNext() && i < numElems) {
-          if((numElems - i) < batchSize)
-            batchSize = numElems - i;
-          (void)reader->ReadBatch(batchSize, nullptr, nullptr, &chpl_ptr[i], &values_read);
-          i+=values_read;
-        }
-      } else if(ty == ARROWINT32 || ty == ARROWUINT32) {
-        auto chpl_ptr = (int64_t*)chpl_arr;
-        parquet::Int32Reader* reader =
-          static_cast<parquet::Int32Reader*>(column_reader.get());
-        reader->Skip(startIdx);
-
-        int32_t* tmpArr = (int32_t*)malloc(batchSize * sizeof(int32_t));
-        while (reader->HasNext() && i < numElems) {
-          if((numElems - i) < batchSize)
-            batchSize = numElems - i;
-          // Can't read directly into chpl_ptr because it is int64
-          (void)reader->ReadBatch(batchSize, nullptr, nullptr, tmpArr, &values_read);
-          for (int64_t j = 0; j < values_read; j++)
-            chpl_ptr[i+j] = (int64_t)tmpArr[j];
-          i+=values_read;
-        }
-        free(tmpArr);
-      } else if(ty == ARROWBOOLEAN) {
-        auto chpl_ptr = (bool*)chpl_arr;
-        parquet::BoolReader* reader =
-          static_cast<parquet::BoolReader*>(column_reader.get());
-        reader->Skip(startIdx);
-
-        while (reader->HasNext() && i < numElems) {
-          if((numElems - i) < batchSize)
-            batchSize = numElems - i;
-          (void)reader->ReadBatch(batchSize, nullptr, nullptr, &chpl_ptr[i], &values_read);
-          i+=values_read;
-        }
-      } else if(ty == ARROWSTRING) {
-        auto chpl_ptr = (unsigned char*)chpl_arr;
-        int16_t definition_level;
-        parquet::ByteArrayReader* reader =
-          static_cast<parquet::ByteArrayReader*>(column_reader.get());
+    std::unique_ptr<parquet::arrow::FileReader> reader;
+    ARROWSTATUS_OK(parquet::arrow::OpenFile(infile, arrow::default_memory_pool(), &reader));
 
-        while (reader->HasNext()) {
-          parquet::ByteArray value;
-          (void)reader->ReadBatch(1, &definition_level, nullptr, &value, &values_read);
-          // if values_read is 0, that means that it was a null value
-          if(values_read > 0) {
-            for(int j = 0; j < value.len; j++) {
-              chpl_ptr[i] = value.ptr[j];
-              i++;
-            }
-          }
-          i++; // skip one space so the strings are null terminated with a 0
-        }
-      } else if(ty == ARROWFLOAT) {
-        auto chpl_ptr = (double*)chpl_arr;
-        parquet::FloatReader* reader =
-          static_cast<parquet::FloatReader*>(column_reader.get());
-        reader->Skip(startIdx);
-
-        float* tmpArr = (float*)malloc(batchSize * sizeof(float));
-        while (reader->HasNext() && i < numElems) {
-          if((numElems - i) < batchSize)
-            batchSize = numElems - i;
-          // Can't read directly into chpl_ptr because it is a double
-          (void)reader->ReadBatch(batchSize, nullptr, nullptr, tmpArr, &values_read);
-          for (int64_t j = 0; j < values_read; j++)
-            chpl_ptr[i+j] = (double)tmpArr[j];
-          i+=values_read;
-        }
-        free(tmpArr);
-      } else if(ty == ARROWDOUBLE) {
-        auto chpl_ptr = (double*)chpl_arr;
-        parquet::DoubleReader* reader =
-          static_cast<parquet::DoubleReader*>(column_reader.get());
-        reader->Skip(startIdx);
-
-        while (reader->HasNext() && i < numElems) {
-          if((numElems - i) < batchSize)
-            batchSize = numElems - i;
-          (void)reader->ReadBatch(batchSize, nullptr, nullptr, &chpl_ptr[i], &values_read);
-          i+=values_read;
-        }
-      }
-      return 0;
-    }
-    return ARROWERROR;
+    return columnType(reader.get(), filename, colname, errMsg);
   } catch (const std::exception& e) {
     *errMsg = strdup(e.what());
     return ARROWERROR;
@@ -469,6 +283,100 @@ int cpp_writeStrColumnToParquet(const char* filename, void* chpl_arr, void* chpl
   }
 }
 
+static parquet::Compression::type toParquetCompression(int64_t compression) {
+  switch(compression) {
+    case COMPRESSIONSNAPPY: return parquet::Compression::SNAPPY;
+    case COMPRESSIONZSTD: return parquet::Compression::ZSTD;
+    case COMPRESSIONLZ4: return parquet::Compression::LZ4;
+    case COMPRESSIONGZIP: return parquet::Compression::GZIP;
+  }
+  return parquet::Compression::UNCOMPRESSED;
+}
+
+// Writes all columns of a table to one file in a single pass, one row group
+// of every column at a time. Strings are passed as their null terminated
+// bytes and numelems+1 offsets.
+int cpp_writeMultiColumnToParquet(const char* filename, int64_t ncols, const char** colnames,
+                                  int64_t* dtypes, void** data, void** offsets,
+                                  int64_t numelems, int64_t rowGroupSize, int64_t compression,
+                                  char** errMsg) {
+  try {
+    using FileClass = ::arrow::io::FileOutputStream;
+    std::shared_ptr<FileClass> out_file;
+    ARROWRESULT_OK(FileClass::Open(filename), out_file);
+
+    parquet::schema::NodeVector fields;
+    for(int64_t c = 0; c < ncols; c++) {
+      if(dtypes[c] == ARROWINT64)
+        fields.push_back(parquet::schema::PrimitiveNode::Make(colnames[c], parquet::Repetition::REQUIRED, parquet::Type::INT64, parquet::ConvertedType::NONE));
+      else if(dtypes[c] == ARROWUINT64)
+        fields.push_back(parquet::schema::PrimitiveNode::Make(colnames[c], parquet::Repetition::REQUIRED, parquet::Type::INT64, parquet::ConvertedType::UINT_64));
+      else if(dtypes[c] == ARROWBOOLEAN)
+        fields.push_back(parquet::schema::PrimitiveNode::Make(colnames[c], parquet::Repetition::REQUIRED, parquet::Type::BOOLEAN, parquet::ConvertedType::NONE));
+      else if(dtypes[c] == ARROWDOUBLE)
+        fields.push_back(parquet::schema::PrimitiveNode::Make(colnames[c], parquet::Repetition::REQUIRED, parquet::Type::DOUBLE, parquet::ConvertedType::NONE));
+      else if(dtypes[c] == ARROWSTRING)
+        fields.push_back(parquet::schema::PrimitiveNode::Make(colnames[c], parquet::Repetition::OPTIONAL, parquet::Type::BYTE_ARRAY, parquet::ConvertedType::UTF8));
+      else {
+        std::string msg = "Unrecognized Parquet dtype";
+        *errMsg = strdup(msg.c_str());
+        return ARROWERROR;
+      }
+    }
+    std::shared_ptr<parquet::schema::GroupNode> schema = std::static_pointer_cast<parquet::schema::GroupNode>
+      (parquet::schema::GroupNode::Make("schema", parquet::Repetition::REQUIRED, fields));
+
+    parquet::WriterProperties::Builder builder;
+    builder.compression(toParquetCompression(compression));
+    // min/max statistics let filtered reads skip row groups
+    builder.enable_statistics();
+    std::shared_ptr<parquet::WriterProperties> props = builder.build();
+
+    std::shared_ptr<parquet::ParquetFileWriter> file_writer =
+      parquet::ParquetFileWriter::Open(out_file, schema, props);
+
+    std::vector<parquet::ByteArray> values;
+    std::vector<int16_t> definition_levels;
+    for(int64_t start = 0; start < numelems; start += rowGroupSize) {
+      int64_t batchSize = std::min(rowGroupSize, numelems - start);
+      parquet::RowGroupWriter* rg_writer = file_writer->AppendRowGroup();
+      for(int64_t c = 0; c < ncols; c++) {
+        parquet::ColumnWriter* writer = rg_writer->NextColumn();
+        if(dtypes[c] == ARROWINT64 || dtypes[c] == ARROWUINT64) {
+          auto chpl_ptr = (int64_t*)data[c];
+          static_cast<parquet::Int64Writer*>(writer)->WriteBatch(batchSize, nullptr, nullptr, &chpl_ptr[start]);
+        } else if(dtypes[c] == ARROWBOOLEAN) {
+          auto chpl_ptr = (bool*)data[c];
+          static_cast<parquet::BoolWriter*>(writer)->WriteBatch(batchSize, nullptr, nullptr, &chpl_ptr[start]);
+        } else if(dtypes[c] == ARROWDOUBLE) {
+          auto chpl_ptr = (double*)data[c];
+          static_cast<parquet::DoubleWriter*>(writer)->WriteBatch(batchSize, nullptr, nullptr, &chpl_ptr[start]);
+        } else {
+          auto chpl_ptr = (uint8_t*)data[c];
+          auto chpl_offsets = (int64_t*)offsets[c];
+          values.resize(batchSize);
+          definition_levels.assign(batchSize, 1);
+          for(int64_t j = 0; j < batchSize; j++) {
+            values[j].ptr = &chpl_ptr[chpl_offsets[start + j]];
+            // subtract 1 since we have the null terminator
+            values[j].len = chpl_offsets[start + j + 1] - chpl_offsets[start + j] - 1;
+          }
+          static_cast<parquet::ByteArrayWriter*>(writer)->WriteBatch(batchSize, definition_levels.data(),
+                                                                      nullptr, values.data());
+        }
+      }
+    }
+
+    file_writer->Close();
+    ARROWSTATUS_OK(out_file->Close());
+
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
 int cpp_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
                                bool compressed, char** errMsg) {
   try {
@@ -640,6 +548,815 @@ int cpp_getDatasetNames(const char* filename, char** dsetResult, char** errMsg)
   }
 }
 
+/*
+  Parquet Row Group Helpers
+  -------------------------
+  Filtered reads first ask, for each row group, whether any of its rows
+  can satisfy a predicate, using the minimum and maximum in the column
+  statistics and, when every data page is dictionary encoded, the values
+  of the dictionary page. They then evaluate the predicates on the rows
+  of the surviving row groups and decode only the rows that satisfy all
+  of them.
+
+  Predicate values are passed as an array of the type the column is read
+  as: int64 for int64, int32 and timestamp columns, uint64 for uint64
+  columns, double for float and double columns, bool for boolean columns
+  and C strings for string columns.
+*/
+
+static int columnIndex(parquet::ParquetFileReader* reader, const char* filename,
+                       const char* colname, char** errMsg) {
+  int idx = reader->metadata()->schema()->ColumnIndex(colname);
+  if(idx < 0) {
+    std::string dname(colname);
+    std::string fname(filename);
+    std::string msg = "Dataset: " + dname + " does not exist in file: " + fname;
+    *errMsg = strdup(msg.c_str());
+  }
+  return idx;
+}
+
+template <typename T, typename C>
+static T toValue(const C& x) {
+  return static_cast<T>(x);
+}
+
+template <>
+std::string toValue<std::string, parquet::ByteArray>(const parquet::ByteArray& x) {
+  return std::string(reinterpret_cast<const char*>(x.ptr), x.len);
+}
+
+template <typename T>
+static bool matchesValue(const T& x, int64_t op, const T* values, int64_t nvalues) {
+  switch(op) {
+    case FILTEREQ: return x == values[0];
+    case FILTERNE: return x != values[0];
+    case FILTERLT: return x < values[0];
+    case FILTERLE: return x <= values[0];
+    case FILTERGT: return x > values[0];
+    case FILTERGE: return x >= values[0];
+    case FILTERIN:
+      for(int64_t j = 0; j < nvalues; j++)
+        if(x == values[j])
+          return true;
+      return false;
+  }
+  return true;
+}
+
+// Whether a value between lo and hi can satisfy the predicate
+template <typename T>
+static bool rangeMayMatch(const T& lo, const T& hi, int64_t op, const T* values, int64_t nvalues) {
+  switch(op) {
+    case FILTEREQ: return !(values[0] < lo || hi < values[0]);
+    case FILTERLT: return lo < values[0];
+    case FILTERLE: return !(values[0] < lo);
+    case FILTERGT: return values[0] < hi;
+    case FILTERGE: return !(hi < values[0]);
+    case FILTERIN:
+      for(int64_t j = 0; j < nvalues; j++)
+        if(!(values[j] < lo || hi < values[j]))
+          return true;
+      return false;
+  }
+  // statistics leave out NaNs, which satisfy !=
+  return true;
+}
+
+static bool allDictionaryEncoded(const parquet::ColumnChunkMetaData& meta) {
+  if(!meta.has_dictionary_page() || meta.encoding_stats().empty())
+    return false;
+  for(auto& s : meta.encoding_stats()) {
+    if((s.page_type == parquet::PageType::DATA_PAGE ||
+        s.page_type == parquet::PageType::DATA_PAGE_V2) &&
+       s.encoding != parquet::Encoding::PLAIN_DICTIONARY &&
+       s.encoding != parquet::Encoding::RLE_DICTIONARY)
+      return false;
+  }
+  return true;
+}
+
+template <typename ParquetType, typename T>
+static bool rowGroupMayMatchImpl(parquet::RowGroupReader* rowGroup, int idx, int64_t op,
+                                 const T* values, int64_t nvalues) {
+  using C = typename ParquetType::c_type;
+  auto meta = rowGroup->metadata()->ColumnChunk(idx);
+  if(meta->is_stats_set()) {
+    auto stats = std::static_pointer_cast<parquet::TypedStatistics<ParquetType>>(meta->statistics());
+    if(stats && stats->HasMinMax() &&
+       !rangeMayMatch(toValue<T>(stats->min()), toValue<T>(stats->max()), op, values, nvalues))
+      return false;
+  }
+  if(allDictionaryEncoded(*meta)) {
+    auto page = rowGroup->GetColumnPageReader(idx)->NextPage();
+    if(page && page->type() == parquet::PageType::DICTIONARY_PAGE) {
+      auto dictPage = std::static_pointer_cast<parquet::DictionaryPage>(page);
+      auto decoder = parquet::MakeTypedDecoder<ParquetType>(parquet::Encoding::PLAIN,
+                                                            rowGroup->metadata()->schema()->Column(idx));
+      decoder->SetData(dictPage->num_values(), dictPage->data(), dictPage->size());
+      std::unique_ptr<C[]> dict(new C[dictPage->num_values()]);
+      int n = decoder->Decode(dict.get(), dictPage->num_values());
+      for(int j = 0; j < n; j++)
+        if(matchesValue(toValue<T>(dict[j]), op, values, nvalues))
+          return true;
+      return false;
+    }
+  }
+  return true;
+}
+
+// Calls f(row, value) on each row of a column chunk, with a null value
+// for a null row
+template <typename ParquetType, typename F>
+static void forEachRow(parquet::ColumnReader* column_reader, int64_t batchSize, F f) {
+  using C = typename ParquetType::c_type;
+  auto reader = static_cast<parquet::TypedColumnReader<ParquetType>*>(column_reader);
+  std::unique_ptr<C[]> vals(new C[batchSize]);
+  std::unique_ptr<int16_t[]> defLevels(new int16_t[batchSize]);
+  const int16_t maxDef = reader->descr()->max_definition_level();
+  int64_t row = 0;
+  while(reader->HasNext()) {
+    int64_t values_read = 0;
+    int64_t levels_read = reader->ReadBatch(batchSize, defLevels.get(), nullptr, vals.get(), &values_read);
+    int64_t v = 0;
+    for(int64_t j = 0; j < levels_read; j++, row++) {
+      if(maxDef > 0 && defLevels[j] < maxDef)
+        f(row, (const C*)nullptr);
+      else
+        f(row, &vals[v++]);
+    }
+  }
+}
+
+template <typename ParquetType, typename T>
+static void filterRows(parquet::ColumnReader* column_reader, int64_t op, const T* values,
+                       int64_t nvalues, bool* mask, int64_t batchSize) {
+  using C = typename ParquetType::c_type;
+  // nulls satisfy no predicate
+  forEachRow<ParquetType>(column_reader, batchSize, [&](int64_t row, const C* x) {
+    mask[row] = mask[row] && x != nullptr && matchesValue(toValue<T>(*x), op, values, nvalues);
+  });
+}
+
+// Reads the listed rows, in increasing order, or every row if rows is null
+template <typename ParquetType, typename T>
+static int64_t readRows(parquet::ColumnReader* column_reader, void* chpl_arr, const int64_t* rows,
+                     int64_t nrows, int64_t batchSize) {
+  using C = typename ParquetType::c_type;
+  auto chpl_ptr = (T*)chpl_arr;
+  int64_t k = 0;
+  forEachRow<ParquetType>(column_reader, batchSize, [&](int64_t row, const C* x) {
+    if(rows == nullptr || (k < nrows && rows[k] == row)) {
+      chpl_ptr[k] = (x != nullptr) ? toValue<T>(*x) : T();
+      k++;
+    }
+  });
+  return k;
+}
+
+// Writes the length, with its null terminator, of each listed string into
+// lengths and, if chpl_arr is not null, its null terminated bytes into
+// chpl_arr, returning the number of bytes
+static int64_t readStringRows(parquet::ColumnReader* column_reader, void* chpl_arr,
+                              int64_t* lengths, const int64_t* rows, int64_t nrows,
+                              int64_t batchSize) {
+  auto chpl_ptr = (unsigned char*)chpl_arr;
+  int64_t k = 0;
+  int64_t pos = 0;
+  forEachRow<parquet::ByteArrayType>(column_reader, batchSize,
+                                     [&](int64_t row, const parquet::ByteArray* x) {
+    if(rows == nullptr || (k < nrows && rows[k] == row)) {
+      int64_t len = (x != nullptr) ? x->len : 0;
+      if(chpl_ptr != nullptr) {
+        if(len > 0)
+          memcpy(chpl_ptr + pos, x->ptr, len);
+        chpl_ptr[pos + len] = 0;
+      }
+      if(lengths != nullptr)
+        lengths[k] = len + 1;
+      pos += len + 1;
+      k++;
+    }
+  });
+  return pos;
+}
+
+// Reads numRows rows of a column chunk, starting at startRow, straight
+// into chpl_arr when the column has no nulls and the Chapel type
+template <typename ParquetType, typename T>
+static int64_t readRowRange(parquet::ColumnReader* column_reader, void* chpl_arr, int64_t startRow,
+                            int64_t numRows, int64_t batchSize) {
+  using C = typename ParquetType::c_type;
+  auto reader = static_cast<parquet::TypedColumnReader<ParquetType>*>(column_reader);
+  auto chpl_ptr = (T*)chpl_arr;
+  const int16_t maxDef = reader->descr()->max_definition_level();
+  const bool direct = maxDef == 0 && std::is_same<C, T>::value;
+  std::unique_ptr<C[]> vals(direct ? nullptr : new C[batchSize]);
+  std::unique_ptr<int16_t[]> defLevels(new int16_t[batchSize]);
+  reader->Skip(startRow);
+
+  int64_t i = 0;
+  while(reader->HasNext() && i < numRows) {
+    int64_t values_read = 0;
+    int64_t toRead = std::min(batchSize, numRows - i);
+    if(direct) {
+      (void)reader->ReadBatch(toRead, nullptr, nullptr, reinterpret_cast<C*>(&chpl_ptr[i]), &values_read);
+      i += values_read;
+    } else {
+      int64_t levels_read = reader->ReadBatch(toRead, defLevels.get(), nullptr, vals.get(), &values_read);
+      int64_t v = 0;
+      for(int64_t j = 0; j < levels_read; j++, i++) {
+        if(maxDef > 0 && defLevels[j] < maxDef)
+          chpl_ptr[i] = T();
+        else
+          chpl_ptr[i] = toValue<T>(vals[v++]);
+      }
+    }
+  }
+  return i;
+}
+
+// Reads every string of a column chunk in one pass into a buffer allocated
+// with malloc, starting at capacity bytes and grown as needed, writing the
+// length of each string, with its null terminator, into lengths and
+// returning the number of bytes
+static int64_t readStringChunk(parquet::ColumnReader* column_reader, int64_t* lengths,
+                               uint8_t** bytes, int64_t capacity, int64_t batchSize) {
+  capacity = std::max(capacity, (int64_t)1);
+  uint8_t* buf = (uint8_t*)malloc(capacity);
+  if(buf == nullptr)
+    throw std::bad_alloc();
+  int64_t pos = 0;
+  try {
+    forEachRow<parquet::ByteArrayType>(column_reader, batchSize,
+                                       [&](int64_t row, const parquet::ByteArray* x) {
+      int64_t len = (x != nullptr) ? x->len : 0;
+      if(pos + len + 1 > capacity) {
+        while(pos + len + 1 > capacity)
+          capacity *= 2;
+        uint8_t* grown = (uint8_t*)realloc(buf, capacity);
+        if(grown == nullptr)
+          throw std::bad_alloc();
+        buf = grown;
+      }
+      if(len > 0)
+        memcpy(buf + pos, x->ptr, len);
+      buf[pos + len] = 0;
+      lengths[row] = len + 1;
+      pos += len + 1;
+    });
+  } catch (...) {
+    free(buf);
+    throw;
+  }
+  *bytes = buf;
+  return pos;
+}
+
+static std::vector<std::string> toStrings(void* values, int64_t nvalues) {
+  auto strs = (const char**)values;
+  std::vector<std::string> res;
+  for(int64_t j = 0; j < nvalues; j++)
+    res.push_back(std::string(strs[j]));
+  return res;
+}
+
+int64_t cpp_getNumRowGroups(const char* filename, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+    return parquet_reader->metadata()->num_row_groups();
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+// A file opened once for the calls that plan and read a filtered read
+struct ParquetFile {
+  std::string filename;
+  std::unique_ptr<parquet::arrow::FileReader> reader;
+};
+
+// Opens a file for a filtered read, returning its number of row groups
+int64_t cpp_openParquetFile(const char* filename, void** file, char** errMsg) {
+  try {
+    std::shared_ptr<arrow::io::ReadableFile> infile;
+    ARROWRESULT_OK(arrow::io::ReadableFile::Open(filename, arrow::default_memory_pool()),
+                   infile);
+
+    std::unique_ptr<ParquetFile> pqFile(new ParquetFile());
+    pqFile->filename = filename;
+    ARROWSTATUS_OK(parquet::arrow::OpenFile(infile, arrow::default_memory_pool(), &pqFile->reader));
+    int64_t ngroups = pqFile->reader->parquet_reader()->metadata()->num_row_groups();
+    *file = pqFile.release();
+    return ngroups;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+void cpp_closeParquetFile(void* file) {
+  delete (ParquetFile*)file;
+}
+
+int64_t cpp_getRowGroupNumRows(void* file, int64_t rowGroup, char** errMsg) {
+  try {
+    auto pqFile = (ParquetFile*)file;
+    return pqFile->reader->parquet_reader()->metadata()->RowGroup(rowGroup)->num_rows();
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_rowGroupMayMatch(void* file, const char* colname, int64_t rowGroup,
+                         int64_t op, void* values, int64_t nvalues, char** errMsg) {
+  try {
+    auto pqFile = (ParquetFile*)file;
+    int64_t ty = columnType(pqFile->reader.get(), pqFile->filename.c_str(), colname, errMsg);
+    if(ty == ARROWERROR)
+      return ARROWERROR;
+    auto parquet_reader = pqFile->reader->parquet_reader();
+    int idx = columnIndex(parquet_reader, pqFile->filename.c_str(), colname, errMsg);
+    if(idx < 0)
+      return ARROWERROR;
+    auto rg = parquet_reader->RowGroup(rowGroup);
+
+    bool mayMatch = true;
+    if(ty == ARROWINT64)
+      mayMatch = rowGroupMayMatchImpl<parquet::Int64Type>(rg.get(), idx, op, (int64_t*)values, nvalues);
+    else if(ty == ARROWUINT64)
+      mayMatch = rowGroupMayMatchImpl<parquet::Int64Type>(rg.get(), idx, op, (uint64_t*)values, nvalues);
+    else if(ty == ARROWINT32)
+      mayMatch = rowGroupMayMatchImpl<parquet::Int32Type>(rg.get(), idx, op, (int64_t*)values, nvalues);
+    else if(ty == ARROWBOOLEAN)
+      mayMatch = rowGroupMayMatchImpl<parquet::BooleanType>(rg.get(), idx, op, (bool*)values, nvalues);
+    else if(ty == ARROWFLOAT)
+      mayMatch = rowGroupMayMatchImpl<parquet::FloatType>(rg.get(), idx, op, (double*)values, nvalues);
+    else if(ty == ARROWDOUBLE)
+      mayMatch = rowGroupMayMatchImpl<parquet::DoubleType>(rg.get(), idx, op, (double*)values, nvalues);
+    else if(ty == ARROWSTRING) {
+      auto strs = toStrings(values, nvalues);
+      mayMatch = rowGroupMayMatchImpl<parquet::ByteArrayType>(rg.get(), idx, op, strs.data(), nvalues);
+    } else
+      return ARROWERROR;
+    return mayMatch ? 1 : 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_filterRowGroup(void* file, const char* colname, int64_t rowGroup,
+                       int64_t op, void* values, int64_t nvalues, bool* mask,
+                       int64_t batchSize, char** errMsg) {
+  try {
+    auto pqFile = (ParquetFile*)file;
+    int64_t ty = columnType(pqFile->reader.get(), pqFile->filename.c_str(), colname, errMsg);
+    if(ty == ARROWERROR)
+      return ARROWERROR;
+    auto parquet_reader = pqFile->reader->parquet_reader();
+    int idx = columnIndex(parquet_reader, pqFile->filename.c_str(), colname, errMsg);
+    if(idx < 0)
+      return ARROWERROR;
+    auto column_reader = parquet_reader->RowGroup(rowGroup)->Column(idx);
+
+    if(ty == ARROWINT64)
+      filterRows<parquet::Int64Type>(column_reader.get(), op, (int64_t*)values, nvalues, mask, batchSize);
+    else if(ty == ARROWUINT64)
+      filterRows<parquet::Int64Type>(column_reader.get(), op, (uint64_t*)values, nvalues, mask, batchSize);
+    else if(ty == ARROWINT32)
+      filterRows<parquet::Int32Type>(column_reader.get(), op, (int64_t*)values, nvalues, mask, batchSize);
+    else if(ty == ARROWBOOLEAN)
+      filterRows<parquet::BooleanType>(column_reader.get(), op, (bool*)values, nvalues, mask, batchSize);
+    else if(ty == ARROWFLOAT)
+      filterRows<parquet::FloatType>(column_reader.get(), op, (double*)values, nvalues, mask, batchSize);
+    else if(ty == ARROWDOUBLE)
+      filterRows<parquet::DoubleType>(column_reader.get(), op, (double*)values, nvalues, mask, batchSize);
+    else if(ty == ARROWSTRING) {
+      auto strs = toStrings(values, nvalues);
+      filterRows<parquet::ByteArrayType>(column_reader.get(), op, strs.data(), nvalues, mask, batchSize);
+    } else
+      return ARROWERROR;
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+// Returns the number of values read, or of bytes for a string column
+int64_t cpp_readRowGroupByName(void* file, void* chpl_arr, const char* colname,
+                               int64_t rowGroup, int64_t* rows, int64_t nrows,
+                               int64_t batchSize, char** errMsg) {
+  try {
+    auto pqFile = (ParquetFile*)file;
+    int64_t ty = columnType(pqFile->reader.get(), pqFile->filename.c_str(), colname, errMsg);
+    if(ty == ARROWERROR)
+      return ARROWERROR;
+    auto parquet_reader = pqFile->reader->parquet_reader();
+    int idx = columnIndex(parquet_reader, pqFile->filename.c_str(), colname, errMsg);
+    if(idx < 0)
+      return ARROWERROR;
+    auto column_reader = parquet_reader->RowGroup(rowGroup)->Column(idx);
+
+    // int64 and uint64 only differ in logical type, so they are read the same way
+    if(ty == ARROWINT64 || ty == ARROWUINT64)
+      return readRows<parquet::Int64Type, int64_t>(column_reader.get(), chpl_arr, rows, nrows, batchSize);
+    else if(ty == ARROWINT32)
+      return readRows<parquet::Int32Type, int64_t>(column_reader.get(), chpl_arr, rows, nrows, batchSize);
+    else if(ty == ARROWBOOLEAN)
+      return readRows<parquet::BooleanType, bool>(column_reader.get(), chpl_arr, rows, nrows, batchSize);
+    else if(ty == ARROWFLOAT)
+      return readRows<parquet::FloatType, double>(column_reader.get(), chpl_arr, rows, nrows, batchSize);
+    else if(ty == ARROWDOUBLE)
+      return readRows<parquet::DoubleType, double>(column_reader.get(), chpl_arr, rows, nrows, batchSize);
+    else if(ty == ARROWSTRING)
+      return readStringRows(column_reader.get(), chpl_arr, nullptr, rows, nrows, batchSize);
+    return ARROWERROR;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int64_t cpp_getRowGroupStringNumBytes(void* file, const char* colname,
+                                      int64_t rowGroup, int64_t* rows, int64_t nrows,
+                                      void* chpl_lengths, int64_t batchSize, char** errMsg) {
+  try {
+    auto pqFile = (ParquetFile*)file;
+    auto parquet_reader = pqFile->reader->parquet_reader();
+    int idx = columnIndex(parquet_reader, pqFile->filename.c_str(), colname, errMsg);
+    if(idx < 0)
+      return ARROWERROR;
+    auto column_reader = parquet_reader->RowGroup(rowGroup)->Column(idx);
+    return readStringRows(column_reader.get(), nullptr, (int64_t*)chpl_lengths,
+                          rows, nrows, batchSize);
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_getRowGroupSizes(const char* filename, int64_t* sizes, char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+    std::shared_ptr<parquet::FileMetaData> file_metadata = parquet_reader->metadata();
+    for(int r = 0; r < file_metadata->num_row_groups(); r++)
+      sizes[r] = file_metadata->RowGroup(r)->num_rows();
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+// Returns the number of values read
+int64_t cpp_readRowGroupRange(const char* filename, void* chpl_arr, const char* colname,
+                              int64_t rowGroup, int64_t startRow, int64_t numRows,
+                              int64_t batchSize, char** errMsg) {
+  try {
+    int64_t ty = cpp_getType(filename, colname, errMsg);
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+    int idx = columnIndex(parquet_reader.get(), filename, colname, errMsg);
+    if(idx < 0)
+      return ARROWERROR;
+    auto column_reader = parquet_reader->RowGroup(rowGroup)->Column(idx);
+
+    // int64 and uint64 only differ in logical type, so they are read the same way
+    if(ty == ARROWINT64 || ty == ARROWUINT64)
+      return readRowRange<parquet::Int64Type, int64_t>(column_reader.get(), chpl_arr, startRow, numRows, batchSize);
+    else if(ty == ARROWINT32)
+      return readRowRange<parquet::Int32Type, int64_t>(column_reader.get(), chpl_arr, startRow, numRows, batchSize);
+    else if(ty == ARROWBOOLEAN)
+      return readRowRange<parquet::BooleanType, bool>(column_reader.get(), chpl_arr, startRow, numRows, batchSize);
+    else if(ty == ARROWFLOAT)
+      return readRowRange<parquet::FloatType, double>(column_reader.get(), chpl_arr, startRow, numRows, batchSize);
+    else if(ty == ARROWDOUBLE)
+      return readRowRange<parquet::DoubleType, double>(column_reader.get(), chpl_arr, startRow, numRows, batchSize);
+    return ARROWERROR;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+// Returns the number of bytes read into *bytes, which the caller must free.
+// The buffer starts at the uncompressed size of the column chunk, which
+// holds every string of a plain encoded chunk.
+int64_t cpp_readRowGroupStrings(const char* filename, const char* colname, int64_t rowGroup,
+                                void* chpl_lengths, void** bytes, int64_t batchSize,
+                                char** errMsg) {
+  try {
+    std::unique_ptr<parquet::ParquetFileReader> parquet_reader =
+      parquet::ParquetFileReader::OpenFile(filename, false);
+    int idx = columnIndex(parquet_reader.get(), filename, colname, errMsg);
+    if(idx < 0)
+      return ARROWERROR;
+    auto rg = parquet_reader->RowGroup(rowGroup);
+    int64_t capacity = rg->metadata()->ColumnChunk(idx)->total_uncompressed_size();
+    auto column_reader = rg->Column(idx);
+    return readStringChunk(column_reader.get(), (int64_t*)chpl_lengths, (uint8_t**)bytes,
+                           capacity, batchSize);
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+/*
+  Arrow IPC Helpers
+  -----------------
+  Arkouda stores Strings as null terminated bytes indexed by the
+  offset of the first byte of each string, while Arrow stores the
+  bytes without terminators and one offset past the end of the last
+  string. These helpers convert between the two representations.
+*/
+
+static arrow::Status stringsToArrow(const uint8_t* chpl_vals, const int64_t* chpl_offsets,
+                                    int64_t numelems, int64_t nbytes,
+                                    std::shared_ptr<arrow::Array>* out) {
+  std::shared_ptr<arrow::Buffer> offsetBuf;
+  std::shared_ptr<arrow::Buffer> dataBuf;
+  ARROW_ASSIGN_OR_RAISE(offsetBuf, arrow::AllocateBuffer((numelems+1)*sizeof(int64_t)));
+  ARROW_ASSIGN_OR_RAISE(dataBuf, arrow::AllocateBuffer(nbytes - numelems));
+  auto offs = reinterpret_cast<int64_t*>(offsetBuf->mutable_data());
+  auto vals = dataBuf->mutable_data();
+  int64_t pos = 0;
+  for(int64_t i = 0; i < numelems; i++) {
+    int64_t end = (i + 1 < numelems) ? chpl_offsets[i+1] : nbytes;
+    // subtract 1 since we have the null terminator
+    int64_t len = end - chpl_offsets[i] - 1;
+    offs[i] = pos;
+    memcpy(vals + pos, chpl_vals + chpl_offsets[i], len);
+    pos += len;
+  }
+  offs[numelems] = pos;
+  *out = std::make_shared<arrow::LargeStringArray>(numelems, offsetBuf, dataBuf);
+  return arrow::Status::OK();
+}
+
+template <typename ArrayType>
+static int64_t stringsNumBytesImpl(const ArrayType& arr) {
+  // one null terminator per string
+  int64_t nbytes = arr.length();
+  for(int64_t i = 0; i < arr.length(); i++) {
+    if(arr.IsValid(i))
+      nbytes += arr.value_length(i);
+  }
+  return nbytes;
+}
+
+static int64_t stringsNumBytes(const std::shared_ptr<arrow::Array>& arr) {
+  if(arr->type_id() == arrow::Type::LARGE_STRING)
+    return stringsNumBytesImpl(static_cast<const arrow::LargeStringArray&>(*arr));
+  return stringsNumBytesImpl(static_cast<const arrow::StringArray&>(*arr));
+}
+
+template <typename ArrayType>
+static void arrowToStringsImpl(const ArrayType& arr, uint8_t* chpl_vals, int64_t* chpl_offsets) {
+  int64_t pos = 0;
+  for(int64_t i = 0; i < arr.length(); i++) {
+    chpl_offsets[i] = pos;
+    if(arr.IsValid(i)) {
+      auto view = arr.GetView(i);
+      memcpy(chpl_vals + pos, view.data(), view.size());
+      pos += view.size();
+    }
+    chpl_vals[pos++] = 0x00;
+  }
+}
+
+static void arrowToStrings(const std::shared_ptr<arrow::Array>& arr, void* chpl_vals,
+                           void* chpl_offsets) {
+  if(arr->type_id() == arrow::Type::LARGE_STRING)
+    arrowToStringsImpl(static_cast<const arrow::LargeStringArray&>(*arr),
+                       (uint8_t*)chpl_vals, (int64_t*)chpl_offsets);
+  else
+    arrowToStringsImpl(static_cast<const arrow::StringArray&>(*arr),
+                       (uint8_t*)chpl_vals, (int64_t*)chpl_offsets);
+}
+
+static bool isArrowString(const std::shared_ptr<arrow::DataType>& type) {
+  return type->id() == arrow::Type::STRING || type->id() == arrow::Type::LARGE_STRING;
+}
+
+static int64_t ipcColumnType(const std::shared_ptr<arrow::DataType>& type) {
+  switch(type->id()) {
+    case arrow::Type::INT64: return ARROWINT64;
+    case arrow::Type::UINT64: return ARROWUINT64;
+    case arrow::Type::BOOL: return ARROWBOOLEAN;
+    case arrow::Type::DOUBLE: return ARROWDOUBLE;
+    case arrow::Type::STRING:
+    case arrow::Type::LARGE_STRING: return ARROWSTRING;
+    case arrow::Type::TIMESTAMP:
+      if(std::static_pointer_cast<arrow::TimestampType>(type)->unit() == arrow::TimeUnit::NANO)
+        return ARROWTIMESTAMPNS;
+      return ARROWERROR;
+    case arrow::Type::DICTIONARY:
+      if(isArrowString(std::static_pointer_cast<arrow::DictionaryType>(type)->value_type()))
+        return ARROWDICTIONARY;
+      return ARROWERROR;
+    default: return ARROWERROR;
+  }
+}
+
+// Tables are combined into a single chunk per column when read, but
+// a table without rows has no chunks
+static std::shared_ptr<arrow::Array> ipcColumn(const std::shared_ptr<arrow::Table>& table,
+                                               int64_t col) {
+  auto column = table->column(col);
+  if(column->num_chunks() == 0)
+    return nullptr;
+  return column->chunk(0);
+}
+
+template <typename ArrayType>
+static void copyValues(const std::shared_ptr<arrow::Array>& arr, void* chpl_arr) {
+  auto& typed = static_cast<const ArrayType&>(*arr);
+  memcpy(chpl_arr, typed.raw_values(), typed.length() * sizeof(*typed.raw_values()));
+}
+
+int cpp_writeArrowIPC(int64_t ncols, const char** colnames, int64_t* dtypes, int64_t numelems,
+                      void** data, void** offsets, int64_t* nbytes,
+                      void** dictData, void** dictOffsets, int64_t* dictSizes, int64_t* dictNbytes,
+                      void** result, int64_t* resultSize, char** errMsg) {
+  try {
+    arrow::FieldVector fields;
+    arrow::ArrayVector arrays;
+    for(int64_t c = 0; c < ncols; c++) {
+      std::shared_ptr<arrow::Array> values;
+      // numeric columns are wrapped without copying
+      auto buf = std::make_shared<arrow::Buffer>((const uint8_t*)data[c],
+                                                 numelems*sizeof(int64_t));
+      if(dtypes[c] == ARROWINT64) {
+        values = std::make_shared<arrow::Int64Array>(numelems, buf);
+      } else if(dtypes[c] == ARROWUINT64) {
+        values = std::make_shared<arrow::UInt64Array>(numelems, buf);
+      } else if(dtypes[c] == ARROWDOUBLE) {
+        values = std::make_shared<arrow::DoubleArray>(numelems, buf);
+      } else if(dtypes[c] == ARROWTIMESTAMPNS) {
+        values = std::make_shared<arrow::TimestampArray>(arrow::timestamp(arrow::TimeUnit::NANO),
+                                                         numelems, buf);
+      } else if(dtypes[c] == ARROWBOOLEAN) {
+        // arrow booleans are bit packed
+        arrow::BooleanBuilder builder;
+        ARROWSTATUS_OK(builder.AppendValues((uint8_t*)data[c], numelems, nullptr));
+        ARROWSTATUS_OK(builder.Finish(&values));
+      } else if(dtypes[c] == ARROWSTRING) {
+        ARROWSTATUS_OK(stringsToArrow((uint8_t*)data[c], (int64_t*)offsets[c], numelems,
+                                      nbytes[c], &values));
+      } else if(dtypes[c] == ARROWDICTIONARY) {
+        std::shared_ptr<arrow::Array> categories;
+        ARROWSTATUS_OK(stringsToArrow((uint8_t*)dictData[c], (int64_t*)dictOffsets[c],
+                                      dictSizes[c], dictNbytes[c], &categories));
+        // negative codes mark missing values
+        auto codes = (int64_t*)data[c];
+        std::vector<uint8_t> valid(numelems);
+        for(int64_t i = 0; i < numelems; i++)
+          valid[i] = codes[i] >= 0;
+        arrow::Int64Builder builder;
+        std::shared_ptr<arrow::Array> indices;
+        ARROWSTATUS_OK(builder.AppendValues(codes, numelems, valid.data()));
+        ARROWSTATUS_OK(builder.Finish(&indices));
+        ARROWRESULT_OK(arrow::DictionaryArray::FromArrays(arrow::dictionary(arrow::int64(),
+                                                                            arrow::large_utf8()),
+                                                          indices, categories), values);
+      } else {
+        std::string msg = "Unsupported Arrow IPC dtype";
+        *errMsg = strdup(msg.c_str());
+        return ARROWERROR;
+      }
+      fields.push_back(arrow::field(colnames[c], values->type()));
+      arrays.push_back(values);
+    }
+    auto schema = arrow::schema(fields);
+    auto batch = arrow::RecordBatch::Make(schema, numelems, arrays);
+
+    std::shared_ptr<arrow::io::BufferOutputStream> sink;
+    ARROWRESULT_OK(arrow::io::BufferOutputStream::Create(), sink);
+    std::shared_ptr<arrow::ipc::RecordBatchWriter> writer;
+    ARROWRESULT_OK(arrow::ipc::MakeStreamWriter(sink, schema), writer);
+    ARROWSTATUS_OK(writer->WriteRecordBatch(*batch));
+    ARROWSTATUS_OK(writer->Close());
+    std::shared_ptr<arrow::Buffer> buffer;
+    ARROWRESULT_OK(sink->Finish(), buffer);
+
+    *resultSize = buffer->size();
+    *result = malloc(buffer->size());
+    memcpy(*result, buffer->data(), buffer->size());
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_readArrowIPC(void* buf, int64_t size, void** handle, int64_t* ncols, int64_t* nrows,
+                     char** errMsg) {
+  try {
+    // the arrays of the table refer to buf, which must outlive the handle
+    auto input = std::make_shared<arrow::io::BufferReader>(
+                   std::make_shared<arrow::Buffer>((const uint8_t*)buf, size));
+    std::shared_ptr<arrow::ipc::RecordBatchStreamReader> reader;
+    ARROWRESULT_OK(arrow::ipc::RecordBatchStreamReader::Open(input), reader);
+    std::shared_ptr<arrow::Table> table;
+    ARROWRESULT_OK(arrow::Table::FromRecordBatchReader(reader.get()), table);
+    ARROWRESULT_OK(table->CombineChunks(), table);
+
+    *handle = new std::shared_ptr<arrow::Table>(table);
+    *ncols = table->num_columns();
+    *nrows = table->num_rows();
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_getArrowIPCColumnInfo(void* handle, int64_t col, int64_t* dtype, int64_t* nbytes,
+                              int64_t* dictSize, int64_t* dictNbytes, char** colname,
+                              char** errMsg) {
+  try {
+    auto table = *static_cast<std::shared_ptr<arrow::Table>*>(handle);
+    auto field = table->schema()->field(col);
+    *dtype = ipcColumnType(field->type());
+    if(*dtype == ARROWERROR) {
+      std::string msg = "Unsupported Arrow type " + field->type()->ToString() +
+        " for column " + field->name();
+      *errMsg = strdup(msg.c_str());
+      return ARROWERROR;
+    }
+    *colname = strdup(field->name().c_str());
+    *nbytes = 0;
+    *dictSize = 0;
+    *dictNbytes = 0;
+    auto arr = ipcColumn(table, col);
+    if(arr) {
+      if(*dtype == ARROWSTRING) {
+        *nbytes = stringsNumBytes(arr);
+      } else if(*dtype == ARROWDICTIONARY) {
+        auto dict = static_cast<const arrow::DictionaryArray&>(*arr).dictionary();
+        *dictSize = dict->length();
+        *dictNbytes = stringsNumBytes(dict);
+      }
+    }
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+int cpp_readArrowIPCColumn(void* handle, int64_t col, void* data, void* offsets,
+                           void* dictData, void* dictOffsets, char** errMsg) {
+  try {
+    auto table = *static_cast<std::shared_ptr<arrow::Table>*>(handle);
+    auto arr = ipcColumn(table, col);
+    if(!arr)
+      return 0;
+    int64_t dtype = ipcColumnType(arr->type());
+    if(dtype == ARROWINT64) {
+      copyValues<arrow::Int64Array>(arr, data);
+    } else if(dtype == ARROWUINT64) {
+      copyValues<arrow::UInt64Array>(arr, data);
+    } else if(dtype == ARROWDOUBLE) {
+      copyValues<arrow::DoubleArray>(arr, data);
+    } else if(dtype == ARROWTIMESTAMPNS) {
+      copyValues<arrow::TimestampArray>(arr, data);
+    } else if(dtype == ARROWBOOLEAN) {
+      auto& typed = static_cast<const arrow::BooleanArray&>(*arr);
+      auto chpl_ptr = (uint8_t*)data;
+      for(int64_t i = 0; i < typed.length(); i++)
+        chpl_ptr[i] = typed.Value(i);
+    } else if(dtype == ARROWSTRING) {
+      arrowToStrings(arr, data, offsets);
+    } else if(dtype == ARROWDICTIONARY) {
+      auto& typed = static_cast<const arrow::DictionaryArray&>(*arr);
+      auto chpl_ptr = (int64_t*)data;
+      for(int64_t i = 0; i < typed.length(); i++)
+        chpl_ptr[i] = typed.IsValid(i) ? typed.GetValueIndex(i) : -1;
+      arrowToStrings(typed.dictionary(), dictData, dictOffsets);
+    } else {
+      std::string msg = "Unsupported Arrow type " + arr->type()->ToString();
+      *errMsg = strdup(msg.c_str());
+      return ARROWERROR;
+    }
+    return 0;
+  } catch (const std::exception& e) {
+    *errMsg = strdup(e.what());
+    return ARROWERROR;
+  }
+}
+
+void cpp_freeArrowIPC(void* handle) {
+  delete static_cast<std::shared_ptr<arrow::Table>*>(handle);
+}
+
 void cpp_free_string(void* ptr) {
   free(ptr);
 }
@@ -659,10 +1376,6 @@ extern "C" {
     return cpp_getNumRows(chpl_str, errMsg);
   }
 
-  int c_readColumnByName(const char* filename, void* chpl_arr, const char* colname, int64_t numElems, int64_t startIdx, int64_t batchSize, char** errMsg) {
-    return cpp_readColumnByName(filename, chpl_arr, colname, numElems, startIdx, batchSize, errMsg);
-  }
-
   int c_getType(const char* filename, const char* colname, char** errMsg) {
     return cpp_getType(filename, colname, errMsg);
   }
@@ -684,6 +1397,14 @@ extern "C" {
                                        dsetname, numelems, rowGroupSize, dtype, compressed, errMsg);
   }
 
+  int c_writeMultiColumnToParquet(const char* filename, int64_t ncols, const char** colnames,
+                                  int64_t* dtypes, void** data, void** offsets,
+                                  int64_t numelems, int64_t rowGroupSize, int64_t compression,
+                                  char** errMsg) {
+    return cpp_writeMultiColumnToParquet(filename, ncols, colnames, dtypes, data, offsets,
+                                         numelems, rowGroupSize, compression, errMsg);
+  }
+
   int c_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
                                bool compressed, char** errMsg) {
     return cpp_createEmptyParquetFile(filename, dsetname, dtype, compressed, errMsg);
@@ -699,8 +1420,64 @@ extern "C" {
                                      errMsg);
   }
 
-  int64_t c_getStringColumnNumBytes(const char* filename, const char* colname, void* chpl_offsets, int64_t numElems, int64_t startIdx, char** errMsg) {
-    return cpp_getStringColumnNumBytes(filename, colname, chpl_offsets, numElems, startIdx, errMsg);
+  int c_getRowGroupSizes(const char* filename, int64_t* sizes, char** errMsg) {
+    return cpp_getRowGroupSizes(filename, sizes, errMsg);
+  }
+
+  int64_t c_readRowGroupRange(const char* filename, void* chpl_arr, const char* colname,
+                              int64_t rowGroup, int64_t startRow, int64_t numRows,
+                              int64_t batchSize, char** errMsg) {
+    return cpp_readRowGroupRange(filename, chpl_arr, colname, rowGroup, startRow, numRows,
+                                 batchSize, errMsg);
+  }
+
+  int64_t c_readRowGroupStrings(const char* filename, const char* colname, int64_t rowGroup,
+                                void* chpl_lengths, void** bytes, int64_t batchSize,
+                                char** errMsg) {
+    return cpp_readRowGroupStrings(filename, colname, rowGroup, chpl_lengths, bytes,
+                                   batchSize, errMsg);
+  }
+
+  int64_t c_getNumRowGroups(const char* filename, char** errMsg) {
+    return cpp_getNumRowGroups(filename, errMsg);
+  }
+
+  int64_t c_openParquetFile(const char* filename, void** file, char** errMsg) {
+    return cpp_openParquetFile(filename, file, errMsg);
+  }
+
+  void c_closeParquetFile(void* file) {
+    cpp_closeParquetFile(file);
+  }
+
+  int64_t c_getRowGroupNumRows(void* file, int64_t rowGroup, char** errMsg) {
+    return cpp_getRowGroupNumRows(file, rowGroup, errMsg);
+  }
+
+  int c_rowGroupMayMatch(void* file, const char* colname, int64_t rowGroup,
+                         int64_t op, void* values, int64_t nvalues, char** errMsg) {
+    return cpp_rowGroupMayMatch(file, colname, rowGroup, op, values, nvalues, errMsg);
+  }
+
+  int c_filterRowGroup(void* file, const char* colname, int64_t rowGroup,
+                       int64_t op, void* values, int64_t nvalues, bool* mask,
+                       int64_t batchSize, char** errMsg) {
+    return cpp_filterRowGroup(file, colname, rowGroup, op, values, nvalues, mask,
+                              batchSize, errMsg);
+  }
+
+  int64_t c_readRowGroupByName(void* file, void* chpl_arr, const char* colname,
+                               int64_t rowGroup, int64_t* rows, int64_t nrows,
+                               int64_t batchSize, char** errMsg) {
+    return cpp_readRowGroupByName(file, chpl_arr, colname, rowGroup, rows, nrows,
+                                  batchSize, errMsg);
+  }
+
+  int64_t c_getRowGroupStringNumBytes(void* file, const char* colname,
+                                      int64_t rowGroup, int64_t* rows, int64_t nrows,
+                                      void* chpl_lengths, int64_t batchSize, char** errMsg) {
+    return cpp_getRowGroupStringNumBytes(file, colname, rowGroup, rows, nrows,
+                                         chpl_lengths, batchSize, errMsg);
   }
 
   const char* c_getVersionInfo(void) {
@@ -711,6 +1488,36 @@ extern "C" {
     return cpp_getDatasetNames(filename, dsetResult, errMsg);
   }
 
+  int c_writeArrowIPC(int64_t ncols, const char** colnames, int64_t* dtypes, int64_t numelems,
+                      void** data, void** offsets, int64_t* nbytes,
+                      void** dictData, void** dictOffsets, int64_t* dictSizes, int64_t* dictNbytes,
+                      void** result, int64_t* resultSize, char** errMsg) {
+    return cpp_writeArrowIPC(ncols, colnames, dtypes, numelems, data, offsets, nbytes,
+                             dictData, dictOffsets, dictSizes, dictNbytes,
+                             result, resultSize, errMsg);
+  }
+
+  int c_readArrowIPC(void* buf, int64_t size, void** handle, int64_t* ncols, int64_t* nrows,
+                     char** errMsg) {
+    return cpp_readArrowIPC(buf, size, handle, ncols, nrows, errMsg);
+  }
+
+  int c_getArrowIPCColumnInfo(void* handle, int64_t col, int64_t* dtype, int64_t* nbytes,
+                              int64_t* dictSize, int64_t* dictNbytes, char** colname,
+                              char** errMsg) {
+    return cpp_getArrowIPCColumnInfo(handle, col, dtype, nbytes, dictSize, dictNbytes,
+                                     colname, errMsg);
+  }
+
+  int c_readArrowIPCColumn(void* handle, int64_t col, void* data, void* offsets,
+                           void* dictData, void* dictOffsets, char** errMsg) {
+    return cpp_readArrowIPCColumn(handle, col, data, offsets, dictData, dictOffsets, errMsg);
+  }
+
+  void c_freeArrowIPC(void* handle) {
+    cpp_freeArrowIPC(handle);
+  }
+
   void c_free_string(void* ptr) {
     cpp_free_string(ptr);
   }
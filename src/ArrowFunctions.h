@@ -9,7 +9,10 @@
 #include <parquet/arrow/reader.h>
 #include <parquet/arrow/writer.h>
 #include <parquet/column_reader.h>
+#include <parquet/column_page.h>
 #include <parquet/api/writer.h>
+#include <parquet/encoding.h>
+#include <arrow/ipc/api.h>
 extern "C" {
 #endif
 
@@ -22,8 +25,26 @@ extern "C" {
 #define ARROWDOUBLE 7
 #define ARROWTIMESTAMP ARROWINT64
 #define ARROWSTRING 6
+#define ARROWDICTIONARY 8
+#define ARROWTIMESTAMPNS 9
 #define ARROWERROR -1
 
+// Compression codecs of multi-column writes
+#define COMPRESSIONNONE 0
+#define COMPRESSIONSNAPPY 1
+#define COMPRESSIONZSTD 2
+#define COMPRESSIONLZ4 3
+#define COMPRESSIONGZIP 4
+
+// Comparisons of the predicates of filtered reads
+#define FILTEREQ 0
+#define FILTERNE 1
+#define FILTERLT 2
+#define FILTERLE 3
+#define FILTERGT 4
+#define FILTERGE 5
+#define FILTERIN 6
+
   // Each C++ function contains the actual implementation of the
   // functionality, and there is a corresponding C function that
   // Chapel can call into through C interoperability, since there
@@ -31,17 +52,60 @@ extern "C" {
   int64_t c_getNumRows(const char*, char** errMsg);
   int64_t cpp_getNumRows(const char*, char** errMsg);
 
-  int c_readColumnByName(const char* filename, void* chpl_arr,
-                         const char* colname, int64_t numElems, int64_t startIdx,
+  int64_t c_getNumRowGroups(const char* filename, char** errMsg);
+  int64_t cpp_getNumRowGroups(const char* filename, char** errMsg);
+
+  int c_getRowGroupSizes(const char* filename, int64_t* sizes, char** errMsg);
+  int cpp_getRowGroupSizes(const char* filename, int64_t* sizes, char** errMsg);
+
+  int64_t c_readRowGroupRange(const char* filename, void* chpl_arr, const char* colname,
+                              int64_t rowGroup, int64_t startRow, int64_t numRows,
+                              int64_t batchSize, char** errMsg);
+  int64_t cpp_readRowGroupRange(const char* filename, void* chpl_arr, const char* colname,
+                                int64_t rowGroup, int64_t startRow, int64_t numRows,
+                                int64_t batchSize, char** errMsg);
+
+  int64_t c_readRowGroupStrings(const char* filename, const char* colname, int64_t rowGroup,
+                                void* chpl_lengths, void** bytes, int64_t batchSize,
+                                char** errMsg);
+  int64_t cpp_readRowGroupStrings(const char* filename, const char* colname, int64_t rowGroup,
+                                  void* chpl_lengths, void** bytes, int64_t batchSize,
+                                  char** errMsg);
+
+  int64_t c_openParquetFile(const char* filename, void** file, char** errMsg);
+  int64_t cpp_openParquetFile(const char* filename, void** file, char** errMsg);
+
+  void c_closeParquetFile(void* file);
+  void cpp_closeParquetFile(void* file);
+
+  int64_t c_getRowGroupNumRows(void* file, int64_t rowGroup, char** errMsg);
+  int64_t cpp_getRowGroupNumRows(void* file, int64_t rowGroup, char** errMsg);
+
+  int c_rowGroupMayMatch(void* file, const char* colname, int64_t rowGroup,
+                         int64_t op, void* values, int64_t nvalues, char** errMsg);
+  int cpp_rowGroupMayMatch(void* file, const char* colname, int64_t rowGroup,
+                           int64_t op, void* values, int64_t nvalues, char** errMsg);
+
+  int c_filterRowGroup(void* file, const char* colname, int64_t rowGroup,
+                       int64_t op, void* values, int64_t nvalues, bool* mask,
+                       int64_t batchSize, char** errMsg);
+  int cpp_filterRowGroup(void* file, const char* colname, int64_t rowGroup,
+                         int64_t op, void* values, int64_t nvalues, bool* mask,
                          int64_t batchSize, char** errMsg);
-  int cpp_readColumnByName(const char* filename, void* chpl_arr,
-                           const char* colname, int64_t numElems, int64_t startIdx,
-                           int64_t batchSize, char** errMsg);
 
-  int64_t cpp_getStringColumnNumBytes(const char* filename, const char* colname,
-                                      void* chpl_offsets, int64_t numElems, int64_t startIdx, char** errMsg);
-  int64_t c_getStringColumnNumBytes(const char* filename, const char* colname,
-                                    void* chpl_offsets, int64_t numElems, int64_t startIdx, char** errMsg);
+  int64_t c_readRowGroupByName(void* file, void* chpl_arr, const char* colname,
+                               int64_t rowGroup, int64_t* rows, int64_t nrows,
+                               int64_t batchSize, char** errMsg);
+  int64_t cpp_readRowGroupByName(void* file, void* chpl_arr, const char* colname,
+                                 int64_t rowGroup, int64_t* rows, int64_t nrows,
+                                 int64_t batchSize, char** errMsg);
+
+  int64_t c_getRowGroupStringNumBytes(void* file, const char* colname,
+                                      int64_t rowGroup, int64_t* rows, int64_t nrows,
+                                      void* chpl_lengths, int64_t batchSize, char** errMsg);
+  int64_t cpp_getRowGroupStringNumBytes(void* file, const char* colname,
+                                        int64_t rowGroup, int64_t* rows, int64_t nrows,
+                                        void* chpl_lengths, int64_t batchSize, char** errMsg);
 
   int c_getType(const char* filename, const char* colname, char** errMsg);
   int cpp_getType(const char* filename, const char* colname, char** errMsg);
@@ -63,6 +127,15 @@ extern "C" {
                                   int64_t rowGroupSize, int64_t dtype, bool compressed,
                                   char** errMsg);
   
+  int c_writeMultiColumnToParquet(const char* filename, int64_t ncols, const char** colnames,
+                                  int64_t* dtypes, void** data, void** offsets,
+                                  int64_t numelems, int64_t rowGroupSize, int64_t compression,
+                                  char** errMsg);
+  int cpp_writeMultiColumnToParquet(const char* filename, int64_t ncols, const char** colnames,
+                                    int64_t* dtypes, void** data, void** offsets,
+                                    int64_t numelems, int64_t rowGroupSize, int64_t compression,
+                                    char** errMsg);
+
   int c_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
                                bool compressed, char** errMsg);
   int cpp_createEmptyParquetFile(const char* filename, const char* dsetname, int64_t dtype,
@@ -83,6 +156,35 @@ extern "C" {
   int c_getDatasetNames(const char* filename, char** dsetResult, char** errMsg);
   int cpp_getDatasetNames(const char* filename, char** dsetResult, char** errMsg);
 
+  int c_writeArrowIPC(int64_t ncols, const char** colnames, int64_t* dtypes, int64_t numelems,
+                      void** data, void** offsets, int64_t* nbytes,
+                      void** dictData, void** dictOffsets, int64_t* dictSizes, int64_t* dictNbytes,
+                      void** result, int64_t* resultSize, char** errMsg);
+  int cpp_writeArrowIPC(int64_t ncols, const char** colnames, int64_t* dtypes, int64_t numelems,
+                        void** data, void** offsets, int64_t* nbytes,
+                        void** dictData, void** dictOffsets, int64_t* dictSizes, int64_t* dictNbytes,
+                        void** result, int64_t* resultSize, char** errMsg);
+
+  int c_readArrowIPC(void* buf, int64_t size, void** handle, int64_t* ncols, int64_t* nrows,
+                     char** errMsg);
+  int cpp_readArrowIPC(void* buf, int64_t size, void** handle, int64_t* ncols, int64_t* nrows,
+                       char** errMsg);
+
+  int c_getArrowIPCColumnInfo(void* handle, int64_t col, int64_t* dtype, int64_t* nbytes,
+                              int64_t* dictSize, int64_t* dictNbytes, char** colname,
+                              char** errMsg);
+  int cpp_getArrowIPCColumnInfo(void* handle, int64_t col, int64_t* dtype, int64_t* nbytes,
+                                int64_t* dictSize, int64_t* dictNbytes, char** colname,
+                                char** errMsg);
+
+  int c_readArrowIPCColumn(void* handle, int64_t col, void* data, void* offsets,
+                           void* dictData, void* dictOffsets, char** errMsg);
+  int cpp_readArrowIPCColumn(void* handle, int64_t col, void* data, void* offsets,
+                             void* dictData, void* dictOffsets, char** errMsg);
+
+  void c_freeArrowIPC(void* handle);
+  void cpp_freeArrowIPC(void* handle);
+
   void c_free_string(void* ptr);
   void cpp_free_string(void* ptr);
   
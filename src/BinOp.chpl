@@ -97,7 +97,7 @@ module BinOp
           }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     // Since we know that both `l` and `r` are of type `int` and that
     // the resultant type is not bool (checked in first `if`), we know
@@ -178,7 +178,7 @@ module BinOp
         }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     else if (e.etype == int && r.etype == uint) ||
             (e.etype == uint && r.etype == int) {
@@ -202,7 +202,7 @@ module BinOp
         }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if (l.etype == uint && r.etype == int) ||
               (l.etype == int && r.etype == uint) {
       select op {
@@ -219,7 +219,7 @@ module BinOp
         }   
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     // If either RHS or LHS type is real, the same operations are supported and the
     // result will always be a `real`, so all 3 of these cases can be shared.
@@ -254,7 +254,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if ((l.etype == int && r.etype == bool) || (l.etype == bool && r.etype == int)) {
       select op {
           when "+" {
@@ -276,7 +276,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if ((l.etype == real && r.etype == bool) || (l.etype == bool && r.etype == real)) {
       select op {
           when "+" {
@@ -295,7 +295,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     var errorMsg = notImplementedError(pn,l.dtype,op,r.dtype);
     omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -362,7 +362,7 @@ module BinOp
           }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     // Since we know that both `l` and `r` are of type `int` and that
     // the resultant type is not bool (checked in first `if`), we know
@@ -436,7 +436,7 @@ module BinOp
         }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     else if (e.etype == int && val.type == uint) ||
             (e.etype == uint && val.type == int) {
@@ -466,7 +466,7 @@ module BinOp
         }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     // If either RHS or LHS type is real, the same operations are supported and the
     // result will always be a `real`, so all 3 of these cases can be shared.
@@ -500,7 +500,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if ((l.etype == int && val.type == bool) || (l.etype == bool && val.type == int)) {
       select op {
           when "+" {
@@ -522,7 +522,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if ((l.etype == real && val.type == bool) || (l.etype == bool && val.type == real)) {
       select op {
           when "+" {
@@ -541,7 +541,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     var errorMsg = unrecognizedTypeError(pn, "("+dtype2str(l.dtype)+","+dtype2str(dtype)+")");
     omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -608,7 +608,7 @@ module BinOp
           }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     // Since we know that both `l` and `r` are of type `int` and that
     // the resultant type is not bool (checked in first `if`), we know
@@ -687,7 +687,7 @@ module BinOp
         }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if (val.type == int && r.etype == uint) {
       select op {
         when ">>" {
@@ -715,7 +715,7 @@ module BinOp
         }
       }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     // If either RHS or LHS type is real, the same operations are supported and the
     // result will always be a `real`, so all 3 of these cases can be shared.
@@ -749,7 +749,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if ((r.etype == int && val.type == bool) || (r.etype == bool && val.type == int)) {
       select op {
           when "+" {
@@ -771,7 +771,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     } else if ((r.etype == real && val.type == bool) || (r.etype == bool && val.type == real)) {
       select op {
           when "+" {
@@ -790,7 +790,7 @@ module BinOp
           }
         }
       var repMsg = "created %s".format(st.attrib(rname));
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     var errorMsg = unrecognizedTypeError(pn, "("+dtype2str(dtype)+","+dtype2str(r.dtype)+")");
     omLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -118,7 +118,7 @@ module BroadcastMsg {
     }
     var repMsg = "created " + st.attrib(rname); 
     bmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-    return new MsgTuple(repMsg, MsgType.NORMAL);    
+    return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));    
   }
 
   proc registerMe() {
@@ -0,0 +1,448 @@
+/* delimited text ingest
+ reads the columns of CSV files into pdarrays and Strings. the data bytes of
+ the files, less their header lines, are split into one byte range per task of
+ each locale, and each task parses the lines that start in its range, so that
+ every line is parsed once, in parallel, by the locale that will hold it.
+
+ the first line of every file is a header naming the columns, and must be the
+ same in every file. the type of each column is int64, float64, bool or str,
+ inferred from the first rows of the first file unless given. a field may be
+ quoted with double quotes, in which case it may hold the delimiter and a
+ doubled quote stands for a quote, but no field may hold a newline.
+ */
+module CSVMsg
+{
+    use ServerConfig;
+
+    use IO;
+    use FileSystem;
+    use List;
+    use Sort;
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use NumPyDType;
+    use SegmentedArray;
+    use GenSymIO;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const csvLogger = new Logger(logLevel);
+
+    /*
+    Number of rows of the first file from which the types of the columns are
+    inferred
+    */
+    config const csvInferRows = 1000;
+
+    private param QUOTE = 0x22: uint(8);
+    private param NEWLINE = 0x0a: uint(8);
+    private param RETURN = 0x0d: uint(8);
+
+    /*
+    The rows a task parsed, each column held by the list of its type, and for
+    str columns the bytes of its values, each with a null terminator, and
+    their lengths
+    */
+    record csvChunk {
+        var nrows: int;
+        var cD: domain(1);
+        var ints: [cD] list(int);
+        var reals: [cD] list(real);
+        var bools: [cD] list(bool);
+        var chars: [cD] list(uint(8));
+        var lens: [cD] list(int);
+    }
+
+    /*
+    Splits a line, less its newline, into its fields, unquoting quoted fields
+    */
+    proc splitFields(const ref line: bytes, delim: uint(8), ref fields: list(bytes)) {
+        fields.clear();
+        const n = line.numBytes;
+        var i = 0;
+        while true {
+            var field: bytes;
+            if i < n && line.byte(i) == QUOTE {
+                // a quoted field ends at the first quote that is not doubled
+                i += 1;
+                var start = i;
+                while i < n {
+                    if line.byte(i) == QUOTE {
+                        field += line[start..<i];
+                        if i + 1 < n && line.byte(i+1) == QUOTE {
+                            i += 1;
+                            start = i;
+                        } else {
+                            i += 1;
+                            start = -1;
+                            break;
+                        }
+                    }
+                    i += 1;
+                }
+                if start >= 0 then field += line[start..<i];
+                while i < n && line.byte(i) != delim {
+                    i += 1;
+                }
+            } else {
+                const start = i;
+                while i < n && line.byte(i) != delim {
+                    i += 1;
+                }
+                field = line[start..<i];
+            }
+            fields.append(field);
+            if i >= n then break;
+            i += 1;
+        }
+    }
+
+    /*
+    Reads a line into line, less its newline, returning false at the end of
+    the file
+    */
+    proc readLine(r, ref line: bytes): bool throws {
+        if !r.readline(line) then return false;
+        var n = line.numBytes;
+        while n > 0 && (line.byte(n-1) == NEWLINE || line.byte(n-1) == RETURN) {
+            n -= 1;
+        }
+        if n < line.numBytes then line = line[0..<n];
+        return true;
+    }
+
+    proc parseInt(const ref field: bytes, ref x: int): bool {
+        try {
+            x = field.decode(decodePolicy.replace).strip(): int;
+            return true;
+        } catch {
+            return false;
+        }
+    }
+
+    // an empty field is a missing value
+    proc parseReal(const ref field: bytes, ref x: real): bool {
+        const s = field.decode(decodePolicy.replace).strip();
+        if s.isEmpty() {
+            x = nan;
+            return true;
+        }
+        try {
+            x = s: real;
+            return true;
+        } catch {
+            return false;
+        }
+    }
+
+    proc parseBool(const ref field: bytes, ref x: bool): bool {
+        const s = field.strip().toLower();
+        if s == b"true" {
+            x = true;
+        } else if s == b"false" {
+            x = false;
+        } else {
+            return false;
+        }
+        return true;
+    }
+
+    /*
+    Infers the type of each column from the first csvInferRows rows after the
+    header of a file: int64 if every value is an integer, else float64 if
+    every value is a number or empty, else bool if every value is true or
+    false, else str
+    */
+    proc inferTypes(filename: string, dataStart: int, nfields: int, delim: uint(8)): [] DType throws {
+        var isInt, isReal, isBool: [0..#nfields] bool = true;
+        var f = open(filename, iomode.r);
+        defer { f.close(); }
+        var r = f.reader(kind=ionative, start=dataStart, locking=false);
+        defer { r.close(); }
+        var line: bytes;
+        var fields: list(bytes);
+        var nrows = 0;
+        while nrows < csvInferRows && readLine(r, line) {
+            if line.isEmpty() then continue;
+            splitFields(line, delim, fields);
+            if fields.size != nfields then break;
+            for j in 0..#nfields {
+                var i: int, x: real, b: bool;
+                if isInt[j] then isInt[j] = parseInt(fields[j], i);
+                if isReal[j] then isReal[j] = parseReal(fields[j], x);
+                if isBool[j] then isBool[j] = parseBool(fields[j], b);
+            }
+            nrows += 1;
+        }
+        return [j in 0..#nfields] if nrows == 0 then DType.Strings
+                                  else if isInt[j] then DType.Int64
+                                  else if isReal[j] then DType.Float64
+                                  else if isBool[j] then DType.Bool
+                                  else DType.Strings;
+    }
+
+    /*
+    Parses the lines that start in the bytes [lo, hi) of the data of a file,
+    appending the values of the columns read to chunk
+    */
+    proc parseRange(ref chunk: csvChunk, filename: string, dataStart: int, lo: int, hi: int,
+                    nfields: int, delim: uint(8), const ref fieldOf: [] int,
+                    const ref types: [] DType) throws {
+        var f = open(filename, iomode.r);
+        defer { f.close(); }
+        // a line starts in the range if the byte before it is a newline
+        var r = f.reader(kind=ionative, start=if lo == dataStart then lo else lo-1, locking=false);
+        defer { r.close(); }
+        var line: bytes;
+        if lo != dataStart then r.readline(line);
+        var fields: list(bytes);
+        while r.offset() < hi {
+            const lineStart = r.offset();
+            if !readLine(r, line) then break;
+            if line.isEmpty() then continue;
+            splitFields(line, delim, fields);
+            if fields.size != nfields {
+                throw getErrorWithContext(
+                          msg="Expected %i fields but found %i in the line at byte %i of %s".format(
+                              nfields, fields.size, lineStart, filename),
+                          lineNumber=getLineNumber(),
+                          routineName=getRoutineName(),
+                          moduleName=getModuleName(),
+                          errorClass="IllegalArgumentError");
+            }
+            for (j, k) in zip(fieldOf.domain, fieldOf) {
+                const ref field = fields[k];
+                var ok = true;
+                select types[j] {
+                    when DType.Int64 {
+                        var x: int;
+                        ok = parseInt(field, x);
+                        chunk.ints[j].append(x);
+                    }
+                    when DType.Float64 {
+                        var x: real;
+                        ok = parseReal(field, x);
+                        chunk.reals[j].append(x);
+                    }
+                    when DType.Bool {
+                        var x: bool;
+                        ok = parseBool(field, x);
+                        chunk.bools[j].append(x);
+                    }
+                    otherwise {
+                        for b in field.bytes() do chunk.chars[j].append(b);
+                        chunk.chars[j].append(0:uint(8));
+                        chunk.lens[j].append(field.numBytes + 1);
+                    }
+                }
+                if !ok {
+                    throw getErrorWithContext(
+                              msg="Could not read %s as %s in the line at byte %i of %s".format(
+                                  field.decode(decodePolicy.replace), dtype2str(types[j]),
+                                  lineStart, filename),
+                              lineNumber=getLineNumber(),
+                              routineName=getRoutineName(),
+                              moduleName=getModuleName(),
+                              errorClass="IllegalArgumentError");
+                }
+            }
+            chunk.nrows += 1;
+        }
+    }
+
+    /*
+    Copies a column of the parsed chunks into a block distributed array
+    */
+    proc gatherColumn(const ref chunks: [?cD] csvChunk, const ref rowStarts: [] int,
+                      n: int, j: int, type t) throws {
+        var a = makeDistArray(n, t);
+        forall c in cD with (ref a) {
+            const ref chunk = chunks[c];
+            if chunk.nrows > 0 {
+                if t == int then a[rowStarts[c]..#chunk.nrows] = chunk.ints[j].toArray();
+                else if t == real then a[rowStarts[c]..#chunk.nrows] = chunk.reals[j].toArray();
+                else a[rowStarts[c]..#chunk.nrows] = chunk.bools[j].toArray();
+            }
+        }
+        return a;
+    }
+
+    /*
+    Reads columns from CSV files.
+
+    :arg reqMsg: request containing (cmd,delimiter,ncols,ndtypes,nfiles,columns | dtypes | filenames)
+                 where delimiter is the value of its byte, no columns means
+                 every column and dtypes alternates columns and their types
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the json of the arrays read, as for readAllHdf
+    */
+    proc readCSVMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        var (delimStr, ncolsStr, ndtypesStr, nfilesStr, arraysStr) = payload.splitMsgToTuple(5);
+        const delim = delimStr: uint(8);
+        const ncols = ncolsStr: int, ndtypes = ndtypesStr: int, nfiles = nfilesStr: int;
+        var (jsoncols, jsondtypes, jsonfiles) = arraysStr.splitMsgToTuple(" | ", 3);
+        var colD = {0..#ncols};
+        var cols: [colD] string;
+        var dtypeList: [0..#(2*ndtypes)] string;
+        var filelist: [0..#nfiles] string;
+        try {
+            if ncols > 0 then cols = jsonToPdArray(jsoncols, ncols);
+            if ndtypes > 0 then dtypeList = jsonToPdArray(jsondtypes, 2*ndtypes);
+            filelist = jsonToPdArray(jsonfiles, nfiles);
+        } catch {
+            var errorMsg = "Could not decode json columns, dtypes or filenames (%s | %s | %s)".format(
+                               jsoncols, jsondtypes, jsonfiles);
+            csvLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        var files: list(string);
+        for name in filelist {
+            var matches = glob(name);
+            if matches.size == 0 {
+                var errorMsg = "No files match %s".format(name);
+                csvLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            sort(matches);
+            for m in matches do files.append(m);
+        }
+        const filenames = files.toArray();
+        const fD = filenames.domain;
+
+        // the header of each file, and where its data starts
+        var header: list(bytes);
+        var dataStarts, dataBytes: [fD] int;
+        for (name, i) in zip(filenames, fD) {
+            var f = open(name, iomode.r);
+            var r = f.reader(kind=ionative, locking=false);
+            var line: bytes;
+            readLine(r, line);
+            dataStarts[i] = r.offset();
+            dataBytes[i] = f.size - dataStarts[i];
+            r.close();
+            f.close();
+            var fields: list(bytes);
+            splitFields(line, delim, fields);
+            if i == fD.low {
+                header = fields;
+            } else if fields != header {
+                var errorMsg = "The header of %s differs from the header of %s".format(name, filenames[fD.low]);
+                csvLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        const nfields = header.size;
+        const names = [h in header.toArray()] h.decode(decodePolicy.replace).strip();
+
+        // the field of each column read, and its type
+        if ncols == 0 {
+            colD = {0..#nfields};
+            cols = names;
+        }
+        var fieldOf: [cols.domain] int;
+        for (c, k) in zip(cols, fieldOf) {
+            const (found, idx) = names.find(c);
+            if !found {
+                var errorMsg = "No column %s in %s".format(c, filenames[fD.low]);
+                csvLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            k = idx;
+        }
+        const inferred = inferTypes(filenames[fD.low], dataStarts[fD.low], nfields, delim);
+        var types = [k in fieldOf] inferred[k];
+        for d in 0..#ndtypes {
+            const (found, j) = cols.find(dtypeList[2*d]);
+            const dt = str2dtype(dtypeList[2*d+1]);
+            if found && (dt == DType.Int64 || dt == DType.Float64 || dt == DType.Bool || dt == DType.Strings) {
+                types[j] = dt;
+            } else {
+                var errorMsg = "Cannot read column %s as %s".format(dtypeList[2*d], dtypeList[2*d+1]);
+                csvLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        csvLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                        "reading columns %t as %t from %i files".format(cols, types, filenames.size));
+
+        // split the data of all files into one byte range per task of each locale
+        const fileStarts = (+ scan dataBytes) - dataBytes;
+        const total = + reduce dataBytes;
+        const nchunks = numLocales * here.maxTaskPar;
+        const chunkD = makeDistDom(nchunks);
+        var chunks: [chunkD] csvChunk;
+        forall c in chunkD with (ref chunks) {
+            const glo = (c * total) / nchunks, ghi = ((c + 1) * total) / nchunks;
+            ref chunk = chunks[c];
+            chunk.cD = cols.domain;
+            const locFieldOf = fieldOf, locTypes = types;
+            for i in fD {
+                const lo = max(glo, fileStarts[i]), hi = min(ghi, fileStarts[i] + dataBytes[i]);
+                if lo < hi {
+                    parseRange(chunk, filenames[i], dataStarts[i], dataStarts[i] + lo - fileStarts[i],
+                               dataStarts[i] + hi - fileStarts[i], nfields, delim, locFieldOf, locTypes);
+                }
+            }
+        }
+
+        const nrows = [c in chunks] c.nrows;
+        const rowStarts = (+ scan nrows) - nrows;
+        const n = + reduce nrows;
+        var rnames: list((string, string, string));
+        for (j, col) in zip(cols.domain, cols) {
+            select types[j] {
+                when DType.Int64 {
+                    var valName = st.nextName();
+                    st.addEntry(valName, new shared SymEntry(gatherColumn(chunks, rowStarts, n, j, int)));
+                    rnames.append((col, "pdarray", valName));
+                }
+                when DType.Float64 {
+                    var valName = st.nextName();
+                    st.addEntry(valName, new shared SymEntry(gatherColumn(chunks, rowStarts, n, j, real)));
+                    rnames.append((col, "pdarray", valName));
+                }
+                when DType.Bool {
+                    var valName = st.nextName();
+                    st.addEntry(valName, new shared SymEntry(gatherColumn(chunks, rowStarts, n, j, bool)));
+                    rnames.append((col, "pdarray", valName));
+                }
+                otherwise {
+                    const nbytes = [c in chunks] c.chars[j].size;
+                    const byteStarts = (+ scan nbytes) - nbytes;
+                    var segs = makeDistArray(n, int);
+                    var vals = makeDistArray(+ reduce nbytes, uint(8));
+                    forall c in chunkD with (ref segs, ref vals) {
+                        const ref chunk = chunks[c];
+                        if chunk.nrows > 0 {
+                            segs[rowStarts[c]..#chunk.nrows] = chunk.lens[j].toArray();
+                            vals[byteStarts[c]..#nbytes[c]] = chunk.chars[j].toArray();
+                        }
+                    }
+                    segs = (+ scan segs) - segs;
+                    var stringsEntry = assembleSegStringFromParts(new shared SymEntry(segs),
+                                                                  new shared SymEntry(vals), st);
+                    rnames.append((col, "seg_string", "%s+%t".format(stringsEntry.name, stringsEntry.nBytes)));
+                }
+            }
+        }
+
+        var fileErrors: list(string);
+        var repMsg = _buildReadAllMsgJson(rnames, false, 0, fileErrors, st);
+        csvLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    proc registerMe() {
+        use CommandMap;
+        registerFunction("readcsv", readCSVMsg, getModuleName());
+    }
+}
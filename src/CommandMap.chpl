@@ -24,14 +24,25 @@ module CommandMap {
     return nb;
   }
 
+  /**
+   * Just like akMsgSign, but Messages which receive a binary payload
+   * following the request require a different signature
+   */
+  proc akPayloadMsgSign(a: string, b: string, c: bytes, d: borrowed SymTab): MsgTuple throws {
+    var rep = new MsgTuple("dummy-msg", MsgType.NORMAL);
+    return rep;
+  }
+
   private var f = akMsgSign;
   private var b = akBinMsgSign;
+  private var p = akPayloadMsgSign;
 
   var commandMap: map(string, f.type);
   var commandMapBinary: map(string, b.type);
+  var commandMapPayload: map(string, p.type);
   var moduleMap: map(string, string);
   use Set;
-  var usedModules: set(string);
+  var usedModules: set(string, parSafe=true);
 
   /**
    * Register command->function in the CommandMap
@@ -69,15 +80,35 @@ module CommandMap {
     moduleMap.add(cmd, modName);
   }
 
+  /**
+   * Register command->function in the CommandMap for functions receiving a binary
+   * payload. This binds a server command to its corresponding function matching
+   * the standard function signature with the payload following the arguments
+   */
+  proc registerPayloadFunction(cmd: string, fcf: p.type) {
+    commandMapPayload.add(cmd, fcf);
+  }
+
+  proc registerPayloadFunction(cmd: string, fcf: p.type, modName: string) {
+    commandMapPayload.add(cmd, fcf);
+    moduleMap.add(cmd, modName);
+  }
+
   /**
    * Dump the combined contents of the command maps as a single json encoded string
    */
   proc dumpCommandMap(): string throws {
     var cm1:string = "%jt".format(commandMap);
     var cm2:string = "%jt".format(commandMapBinary);
-    // Join these two together
+    var cm3:string = "%jt".format(commandMapPayload);
+    // Join these together
     var idx_close = cm1.rfind("}"):int;
-    return cm1(0..idx_close-1) + ", " + cm2(1..cm2.size-1);
+    var joined = cm1(0..idx_close-1) + ", " + cm2(1..cm2.size-1);
+    if commandMapPayload.size > 0 {
+      idx_close = joined.rfind("}"):int;
+      joined = joined(0..idx_close-1) + ", " + cm3(1..cm3.size-1);
+    }
+    return joined;
   }
 
   proc executeCommand(cmd: string, args, st) throws {
@@ -342,7 +342,7 @@ module ConcatenateMsg
 
                 repMsg = "created " + st.attrib(rname);
                 cmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                return new MsgTuple(repMsg, MsgType.NORMAL);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
             }
             otherwise { 
                 var errorMsg = notImplementedError(pn, objtype); 
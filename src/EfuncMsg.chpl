@@ -389,7 +389,7 @@ module EfuncMsg
 
         repMsg = "created " + st.attrib(rname);
         eLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-        return new MsgTuple(repMsg, MsgType.NORMAL); 
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname)); 
     }
 
     /*
@@ -502,7 +502,7 @@ module EfuncMsg
 
         repMsg = "created " + st.attrib(rname);
         eLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-        return new MsgTuple(repMsg, MsgType.NORMAL); 
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname)); 
     }
 
     /*
@@ -615,7 +615,7 @@ module EfuncMsg
 
         repMsg = "created " + st.attrib(rname);
         eLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-        return new MsgTuple(repMsg, MsgType.NORMAL); 
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname)); 
     }
 
     /*
@@ -723,7 +723,7 @@ module EfuncMsg
 
         repMsg = "created " + st.attrib(rname);
         eLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-        return new MsgTuple(repMsg, MsgType.NORMAL); 
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname)); 
     }
 
     /* The 'where' function takes a boolean array and two other arguments A and B, and 
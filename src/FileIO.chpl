@@ -311,7 +311,7 @@ module FileIO {
     }
 
     proc readAnyMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
-      var (strictFlag, ndsetsStr, nfilesStr, allowErrorsFlag, calcStringOffsetsFlag, arraysStr) = payload.splitMsgToTuple(6);
+      var (strictFlag, ndsetsStr, nfilesStr, allowErrorsFlag, calcStringOffsetsFlag, directReadFlag, arraysStr) = payload.splitMsgToTuple(7);
       var (jsondsets, jsonfiles) = arraysStr.splitMsgToTuple(" | ",2);
 
       if (!checkCast(nfilesStr, int)) {
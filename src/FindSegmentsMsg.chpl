@@ -16,13 +16,15 @@ module FindSegmentsMsg
 
     use PrivateDist;
     use CommAggregation;
+    use Merge only mergeGroupings;
+    use GroupingCache;
 
     private config const logLevel = ServerConfig.logLevel;
     const fsLogger = new Logger(logLevel);
 
     /*
 
-    :arg reqMsg: request containing (cmd,kname,pname)
+    :arg reqMsg: request containing (cmd,pname,nkeys,knames,ktypes[,ncache,cnames])
     :type reqMsg: string 
 
     :arg st: SymTab to act on
@@ -39,7 +41,15 @@ module FindSegmentsMsg
         var (pname, nkeysStr, rest) = payload.splitMsgToTuple(3);
         var nkeys = nkeysStr:int; // number of key arrays
         var fields = rest.split(); // split request into fields
-        if (fields.size != 2*nkeys) { 
+        // the grouping is cached for the key arrays optionally named after
+        // the grouping keys, given by (ncache,cnames)
+        var cacheD: domain(1);
+        var cacheNames: [cacheD] string;
+        if fields.size > 2*nkeys && fields.size == 2*nkeys + 1 + fields[2*nkeys]:int {
+            cacheD = {0..#fields[2*nkeys]:int};
+            cacheNames = fields[2*nkeys+1..];
+        }
+        if (fields.size != 2*nkeys + (if cacheD.size > 0 then cacheD.size + 1 else 0)) { 
              var errorMsg = incompatibleArgumentsError(pn, 
                        "Expected %i arrays but got %i".format(nkeys, (fields.size - 3)/2));
              fsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -210,14 +220,70 @@ module FindSegmentsMsg
           agg.copy(u, pa[s]);
         }
 
+        if cacheNames.size > 0 && groupingCachePct > 0 {
+            groupingCache.store(new shared CachedGrouping(keysGroupingKey(cacheNames, st),
+                                                          st.lookupShared(pname),
+                                                          st.lookupShared(sname),
+                                                          st.lookupShared(uname)));
+        }
+
         // Return entry names of segments and unique key indices
         repMsg =  try! "created " + st.attrib(sname) + " +created " + st.attrib(uname);
         fsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
         return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+    /*
+    Merges the grouping of a list of key arrays with the grouping of rows
+    appended to them, given the grouping of their unique keys.
+
+    :arg reqMsg: request containing (cmd,oldperm,oldsegs,newperm,newsegs,uperm,usegs)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the permutation and segments of all the rows
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc mergeGroupingsMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (oldPermName, oldSegName, newPermName, newSegName, upermName, usegName) = payload.splitMsgToTuple(6);
+        var names = [oldPermName, oldSegName, newPermName, newSegName, upermName, usegName];
+        for name in names {
+            var g = getGenericTypedArrayEntry(name, st);
+            if g.dtype != DType.Int64 {
+                var errorMsg = notImplementedError(pn,"(%s dtype %s)".format(name, dtype2str(g.dtype)));
+                fsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        var oldPerm = toSymEntry(getGenericTypedArrayEntry(oldPermName, st), int);
+        var oldSegs = toSymEntry(getGenericTypedArrayEntry(oldSegName, st), int);
+        var newPerm = toSymEntry(getGenericTypedArrayEntry(newPermName, st), int);
+        var newSegs = toSymEntry(getGenericTypedArrayEntry(newSegName, st), int);
+        var uperm = toSymEntry(getGenericTypedArrayEntry(upermName, st), int);
+        var usegs = toSymEntry(getGenericTypedArrayEntry(usegName, st), int);
+        if uperm.size != oldSegs.size + newSegs.size {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i unique keys but got %i".format(oldSegs.size + newSegs.size,
+                                                                            uperm.size));
+            fsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var (perm, segs) = mergeGroupings(oldPerm.a, oldSegs.a, newPerm.a, newSegs.a, uperm.a, usegs.a);
+        var pname = st.nextName();
+        st.addEntry(pname, new shared SymEntry(perm));
+        var sname = st.nextName();
+        st.addEntry(sname, new shared SymEntry(segs));
+        var repMsg = "created " + st.attrib(pname) + " +created " + st.attrib(sname);
+        fsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     proc registerMe() {
       use CommandMap;
       registerFunction("findSegments", findSegmentsMsg, getModuleName());
+      registerFunction("mergeGroupings", mergeGroupingsMsg, getModuleName());
     }
 }
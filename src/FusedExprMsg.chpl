@@ -0,0 +1,373 @@
+module FusedExprMsg
+{
+    use ServerConfig;
+
+    use Math;
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use AryUtil;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const feLogger = new Logger(logLevel);
+
+    /*
+    Number of elements of each intermediate result a task holds at a time.
+    Expressions are evaluated one block at a time, so intermediate results
+    never occupy more than numNodes*fusedBlockSize elements per task.
+    */
+    config const fusedBlockSize = 2048;
+
+    enum ExprKind {Array, Scalar, Binop, Unary, Cast, Where}
+
+    /*
+    A node of an elementwise expression DAG. Children are referenced by their
+    index in the node list and always precede their parent, so evaluating the
+    nodes in order guarantees the operands of a node are available. The client
+    inserts Cast nodes so that both operands of a Binop share a dtype.
+    */
+    record ExprNode {
+        var kind: ExprKind;
+        var dtype: DType;
+        var op: string;
+        var children: 3*int;
+        var name: string;
+        var ival: int;
+        var rval: real;
+        var bval: bool;
+    }
+
+    /*
+    Parses a node description, one of
+
+        array <dtype> <name>
+        scalar <dtype> <value>
+        binop <dtype> <op> <left> <right>
+        unary <dtype> <func> <child>
+        cast <dtype> <child>
+        where <dtype> <cond> <a> <b>
+
+    :arg desc: node description
+    :type desc: string
+
+    :arg idx: index of the node in the node list
+    :type idx: int
+
+    :returns: ExprNode
+    */
+    proc parseExprNode(desc: string, idx: int): ExprNode throws {
+        var node: ExprNode;
+        var (kind, dtypestr, rest) = desc.splitMsgToTuple(3);
+        node.dtype = str2dtype(dtypestr);
+
+        proc child(s: string): int throws {
+            var c = s:int;
+            if c < 0 || c >= idx {
+                throw new owned ErrorWithMsg("invalid operand %i of expression node %i".format(c, idx));
+            }
+            return c;
+        }
+
+        select kind {
+            when "array" {
+                node.kind = ExprKind.Array;
+                node.name = rest;
+            }
+            when "scalar" {
+                node.kind = ExprKind.Scalar;
+                select node.dtype {
+                    when DType.Int64 { node.ival = rest:int; }
+                    when DType.Float64 { node.rval = rest:real; }
+                    when DType.Bool { node.bval = rest.toLower():bool; }
+                    otherwise {
+                        throw new owned ErrorWithMsg(unrecognizedTypeError("fusedexpr", dtypestr));
+                    }
+                }
+            }
+            when "binop" {
+                node.kind = ExprKind.Binop;
+                var (op, l, r) = rest.splitMsgToTuple(3);
+                node.op = op;
+                node.children = (child(l), child(r), -1);
+            }
+            when "unary" {
+                node.kind = ExprKind.Unary;
+                var (op, c) = rest.splitMsgToTuple(2);
+                node.op = op;
+                node.children = (child(c), -1, -1);
+            }
+            when "cast" {
+                node.kind = ExprKind.Cast;
+                node.children = (child(rest), -1, -1);
+            }
+            when "where" {
+                node.kind = ExprKind.Where;
+                var (c, a, b) = rest.splitMsgToTuple(3);
+                node.children = (child(c), child(a), child(b));
+            }
+            otherwise {
+                throw new owned ErrorWithMsg("unrecognized expression node %s".format(kind));
+            }
+        }
+        return node;
+    }
+
+    /*
+    Evaluates one node over a block of len elements starting at blockLow, writing
+    into the block buffer of the node. The buffer of node k occupies elements
+    k*fusedBlockSize..#len of the buffer matching its dtype.
+    */
+    proc evalNode(k: int, const ref nodes: [] ExprNode, const ref leaves, blockLow: int, len: int,
+                  ref ibuf: [] int, ref rbuf: [] real, ref bbuf: [] bool) throws {
+        const ref node = nodes[k];
+        const o = k*fusedBlockSize;
+        const a = node.children(0)*fusedBlockSize;
+        const b = node.children(1)*fusedBlockSize;
+
+        select node.kind {
+            when ExprKind.Array {
+                select node.dtype {
+                    when DType.Int64 {
+                        var e = toSymEntry(leaves[k]!, int);
+                        for j in 0..#len do ibuf[o+j] = e.a[blockLow+j];
+                    }
+                    when DType.Float64 {
+                        var e = toSymEntry(leaves[k]!, real);
+                        for j in 0..#len do rbuf[o+j] = e.a[blockLow+j];
+                    }
+                    otherwise {
+                        var e = toSymEntry(leaves[k]!, bool);
+                        for j in 0..#len do bbuf[o+j] = e.a[blockLow+j];
+                    }
+                }
+            }
+            when ExprKind.Scalar {
+                select node.dtype {
+                    when DType.Int64 { for j in 0..#len do ibuf[o+j] = node.ival; }
+                    when DType.Float64 { for j in 0..#len do rbuf[o+j] = node.rval; }
+                    otherwise { for j in 0..#len do bbuf[o+j] = node.bval; }
+                }
+            }
+            when ExprKind.Cast {
+                select (nodes[node.children(0)].dtype, node.dtype) {
+                    when (DType.Int64, DType.Float64) { for j in 0..#len do rbuf[o+j] = ibuf[a+j]:real; }
+                    when (DType.Bool, DType.Float64) { for j in 0..#len do rbuf[o+j] = bbuf[a+j]:real; }
+                    when (DType.Bool, DType.Int64) { for j in 0..#len do ibuf[o+j] = bbuf[a+j]:int; }
+                    otherwise {
+                        throw new owned ErrorWithMsg("unsupported cast in expression node %i".format(k));
+                    }
+                }
+            }
+            when ExprKind.Unary {
+                // the client casts the operands of transcendental functions to float64
+                select node.op {
+                    when "abs" { for j in 0..#len do rbuf[o+j] = abs(rbuf[a+j]); }
+                    when "log" { for j in 0..#len do rbuf[o+j] = log(rbuf[a+j]); }
+                    when "exp" { for j in 0..#len do rbuf[o+j] = exp(rbuf[a+j]); }
+                    when "sin" { for j in 0..#len do rbuf[o+j] = sin(rbuf[a+j]); }
+                    when "cos" { for j in 0..#len do rbuf[o+j] = cos(rbuf[a+j]); }
+                    otherwise {
+                        throw new owned ErrorWithMsg(notImplementedError("fusedexpr", node.op, node.dtype));
+                    }
+                }
+            }
+            when ExprKind.Where {
+                const c = node.children(0)*fusedBlockSize;
+                const d = node.children(2)*fusedBlockSize;
+                select node.dtype {
+                    when DType.Int64 {
+                        for j in 0..#len do ibuf[o+j] = if bbuf[c+j] then ibuf[b+j] else ibuf[d+j];
+                    }
+                    when DType.Float64 {
+                        for j in 0..#len do rbuf[o+j] = if bbuf[c+j] then rbuf[b+j] else rbuf[d+j];
+                    }
+                    otherwise {
+                        for j in 0..#len do bbuf[o+j] = if bbuf[c+j] then bbuf[b+j] else bbuf[d+j];
+                    }
+                }
+            }
+            when ExprKind.Binop {
+                select nodes[node.children(0)].dtype {
+                    when DType.Int64 { evalBinop(ibuf, a, b, o, len, node, ibuf, rbuf, bbuf); }
+                    when DType.Float64 { evalBinop(rbuf, a, b, o, len, node, ibuf, rbuf, bbuf); }
+                    otherwise { evalBinop(bbuf, a, b, o, len, node, ibuf, rbuf, bbuf); }
+                }
+            }
+        }
+    }
+
+    /*
+    Evaluates a binary operation whose operands are both held in operand buffer x,
+    following the semantics of the corresponding binopvv operation in BinOp.chpl
+    */
+    proc evalBinop(const ref x: [] ?t, a: int, b: int, o: int, len: int, const ref node: ExprNode,
+                   ref ibuf: [] int, ref rbuf: [] real, ref bbuf: [] bool) throws {
+        // equality is shared by all operand types
+        if node.op == "==" {
+            for j in 0..#len do bbuf[o+j] = x[a+j] == x[b+j];
+            return;
+        } else if node.op == "!=" {
+            for j in 0..#len do bbuf[o+j] = x[a+j] != x[b+j];
+            return;
+        }
+        if t == bool {
+            select node.op {
+                when "&" { for j in 0..#len do bbuf[o+j] = x[a+j] & x[b+j]; }
+                when "|" { for j in 0..#len do bbuf[o+j] = x[a+j] | x[b+j]; }
+                when "^" { for j in 0..#len do bbuf[o+j] = x[a+j] ^ x[b+j]; }
+                otherwise {
+                    throw new owned ErrorWithMsg(notImplementedError("fusedexpr", "bool", node.op, "bool"));
+                }
+            }
+        } else if t == int {
+            select node.op {
+                when "<" { for j in 0..#len do bbuf[o+j] = x[a+j] < x[b+j]; }
+                when ">" { for j in 0..#len do bbuf[o+j] = x[a+j] > x[b+j]; }
+                when "<=" { for j in 0..#len do bbuf[o+j] = x[a+j] <= x[b+j]; }
+                when ">=" { for j in 0..#len do bbuf[o+j] = x[a+j] >= x[b+j]; }
+                when "+" { for j in 0..#len do ibuf[o+j] = x[a+j] + x[b+j]; }
+                when "-" { for j in 0..#len do ibuf[o+j] = x[a+j] - x[b+j]; }
+                when "*" { for j in 0..#len do ibuf[o+j] = x[a+j] * x[b+j]; }
+                when "/" { for j in 0..#len do rbuf[o+j] = x[a+j]:real / x[b+j]:real; }
+                when "//" { for j in 0..#len do ibuf[o+j] = if x[b+j] != 0 then x[a+j] / x[b+j] else 0; }
+                when "%" { for j in 0..#len do ibuf[o+j] = if x[b+j] != 0 then x[a+j] % x[b+j] else 0; }
+                when "&" { for j in 0..#len do ibuf[o+j] = x[a+j] & x[b+j]; }
+                when "|" { for j in 0..#len do ibuf[o+j] = x[a+j] | x[b+j]; }
+                when "^" { for j in 0..#len do ibuf[o+j] = x[a+j] ^ x[b+j]; }
+                when "<<" { for j in 0..#len do ibuf[o+j] = x[a+j] << x[b+j]; }
+                when ">>" { for j in 0..#len do ibuf[o+j] = x[a+j] >> x[b+j]; }
+                otherwise {
+                    throw new owned ErrorWithMsg(notImplementedError("fusedexpr", "int64", node.op, "int64"));
+                }
+            }
+        } else {
+            select node.op {
+                when "<" { for j in 0..#len do bbuf[o+j] = x[a+j] < x[b+j]; }
+                when ">" { for j in 0..#len do bbuf[o+j] = x[a+j] > x[b+j]; }
+                when "<=" { for j in 0..#len do bbuf[o+j] = x[a+j] <= x[b+j]; }
+                when ">=" { for j in 0..#len do bbuf[o+j] = x[a+j] >= x[b+j]; }
+                when "+" { for j in 0..#len do rbuf[o+j] = x[a+j] + x[b+j]; }
+                when "-" { for j in 0..#len do rbuf[o+j] = x[a+j] - x[b+j]; }
+                when "*" { for j in 0..#len do rbuf[o+j] = x[a+j] * x[b+j]; }
+                when "/" { for j in 0..#len do rbuf[o+j] = x[a+j] / x[b+j]; }
+                when "//" { for j in 0..#len do rbuf[o+j] = if x[b+j] != 0 then floor(x[a+j] / x[b+j]) else NAN; }
+                when "**" { for j in 0..#len do rbuf[o+j] = x[a+j] ** x[b+j]; }
+                otherwise {
+                    throw new owned ErrorWithMsg(notImplementedError("fusedexpr", "float64", node.op, "float64"));
+                }
+            }
+        }
+    }
+
+    /*
+    Evaluates the expression into the result entry e block by block, so that each
+    element of each operand is read once and no full-size temporaries are created
+    */
+    proc evalExpr(e, const ref nodes: [] ExprNode, const ref leaves) throws {
+        const numNodes = nodes.size;
+        const root = numNodes - 1;
+        const ro = root*fusedBlockSize;
+        const bufSize = numNodes*fusedBlockSize;
+
+        coforall loc in Locales do on loc {
+            const locNodes = nodes;
+            const myDom = e.a.localSubdomain();
+            forall blockLow in myDom.low..myDom.high by fusedBlockSize
+                            with (var ibuf: [0..#bufSize] int,
+                                  var rbuf: [0..#bufSize] real,
+                                  var bbuf: [0..#bufSize] bool) {
+                const len = min(fusedBlockSize, myDom.high - blockLow + 1);
+                for k in 0..#numNodes {
+                    evalNode(k, locNodes, leaves, blockLow, len, ibuf, rbuf, bbuf);
+                }
+                if e.etype == int {
+                    for j in 0..#len do e.a[blockLow+j] = ibuf[ro+j];
+                } else if e.etype == real {
+                    for j in 0..#len do e.a[blockLow+j] = rbuf[ro+j];
+                } else {
+                    for j in 0..#len do e.a[blockLow+j] = bbuf[ro+j];
+                }
+            }
+        }
+    }
+
+    /*
+    Parse, execute, and respond to a fusedexpr message, which evaluates an
+    elementwise expression DAG over int64, float64, and bool pdarrays in a single
+    pass and stores the result of the last node in a new pdarray
+
+    :arg payload: request containing (numNodes, jsonNodes) where jsonNodes is a JSON
+                  list of node descriptions in evaluation order
+    :type payload: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple)
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc fusedExprMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (numNodesStr, jsonNodes) = payload.splitMsgToTuple(2);
+        var numNodes = numNodesStr:int;
+        var descs = jsonToPdArray(jsonNodes, numNodes);
+
+        var nodes: [0..#numNodes] ExprNode;
+        var leaves: [0..#numNodes] borrowed GenSymEntry?;
+        var size = -1;
+        for k in 0..#numNodes {
+            nodes[k] = parseExprNode(descs[k], k);
+            if nodes[k].kind == ExprKind.Array {
+                var g = getGenericTypedArrayEntry(nodes[k].name, st);
+                if g.dtype != nodes[k].dtype {
+                    var errorMsg = "dtype mismatch for %s: expected %s but found %s".format(
+                                      nodes[k].name, dtype2str(nodes[k].dtype), dtype2str(g.dtype));
+                    feLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return new MsgTuple(errorMsg, MsgType.ERROR);
+                }
+                if size >= 0 && g.size != size {
+                    var errorMsg = "size mismatch %i %i".format(size, g.size);
+                    feLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return new MsgTuple(errorMsg, MsgType.ERROR);
+                }
+                size = g.size;
+                leaves[k] = g;
+            }
+        }
+        if size < 0 {
+            var errorMsg = "expression does not reference any pdarray";
+            feLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        feLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s nodes: %i size: %i".format(cmd, numNodes, size));
+
+        var rname = st.nextName();
+        select nodes[numNodes-1].dtype {
+            when DType.Int64 { evalExpr(st.addEntry(rname, size, int), nodes, leaves); }
+            when DType.Float64 { evalExpr(st.addEntry(rname, size, real), nodes, leaves); }
+            when DType.Bool { evalExpr(st.addEntry(rname, size, bool), nodes, leaves); }
+            otherwise {
+                var errorMsg = notImplementedError(pn, nodes[numNodes-1].dtype);
+                feLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+
+        var repMsg = "created %s".format(st.attrib(rname));
+        feLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    proc registerMe() {
+      use CommandMap;
+      registerFunction("fusedexpr", fusedExprMsg, getModuleName());
+    }
+}
@@ -169,6 +169,94 @@ module GenSymIO {
        return arrayBytes;
     }
 
+    /*
+     * Outputs count elements of the pdarray starting at index start as a
+     * Chapel Bytes object, so that large arrays can be transferred to the
+     * client in chunks
+     */
+    proc tondarrayChunkMsg(cmd: string, payload: string, st: 
+                                          borrowed SymTab): bytes throws {
+        var (name, startStr, countStr) = payload.splitMsgToTuple(3);
+        const start = startStr:int;
+        const count = countStr:int;
+        var abstractEntry = st.lookup(name);
+        if !abstractEntry.isAssignableTo(SymbolEntryType.TypedArraySymEntry) {
+            var errorMsg = "Error: Unhandled SymbolEntryType %s".format(abstractEntry.entryType);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return errorMsg.encode(); // return as bytes
+        }
+        var entry:borrowed GenSymEntry = abstractEntry: borrowed GenSymEntry;
+        if start < 0 || count < 0 || start + count > entry.size {
+            var errorMsg = "Error: chunk [%i, %i) out of bounds for pdarray of size %i".format(
+                                                      start, start + count, entry.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return errorMsg.encode(); // return as bytes
+        }
+
+        overMemLimit(count * entry.itemsize);
+
+        proc chunkToBytes(A: [?D] ?eltType) {
+            var ptr = c_malloc(eltType, count);
+            var localA = makeArrayFromPtr(ptr, count:uint);
+            localA = A[start..#count];
+            const size = count*c_sizeof(eltType):int;
+            return createBytesWithOwnedBuffer(ptr:c_ptr(uint(8)), size, size);
+        }
+
+        select entry.dtype {
+            when DType.Int64 { return chunkToBytes(toSymEntry(entry, int).a); }
+            when DType.UInt64 { return chunkToBytes(toSymEntry(entry, uint).a); }
+            when DType.Float64 { return chunkToBytes(toSymEntry(entry, real).a); }
+            when DType.Bool { return chunkToBytes(toSymEntry(entry, bool).a); }
+            when DType.UInt8 { return chunkToBytes(toSymEntry(entry, uint(8)).a); }
+            otherwise {
+                var errorMsg = "Error: Unhandled dtype %s".format(entry.dtype);
+                gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return errorMsg.encode(); // return as bytes
+            }
+        }
+    }
+
+    /*
+     * Copies the binary payload into an existing pdarray starting at index
+     * start, so that large arrays can be transferred from the client in chunks
+     */
+    proc arrayChunkMsg(cmd: string, args: string, ref data: bytes, st: borrowed SymTab): MsgTuple throws {
+        var (name, startStr) = args.splitMsgToTuple(" ", 2);
+        const start = startStr:int;
+        var entry:borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+
+        proc bytesToChunk(type t) throws {
+            const count = data.size / c_sizeof(t):int;
+            if data.size % c_sizeof(t):int != 0 || start < 0 || start + count > entry.size {
+                throw getErrorWithContext(
+                    msg="chunk of %i bytes at index %i does not fit pdarray %s".format(
+                                                              data.size, start, name),
+                    lineNumber=getLineNumber(),
+                    routineName=getRoutineName(),
+                    moduleName=getModuleName(),
+                    errorClass="IllegalArgumentError");
+            }
+            var localA = makeArrayFromPtr(data.c_str():c_void_ptr:c_ptr(t), count:uint);
+            entry.modified();
+            toSymEntry(entry, t).a[start..#count] = localA;
+        }
+
+        select entry.dtype {
+            when DType.Int64 { bytesToChunk(int); }
+            when DType.UInt64 { bytesToChunk(uint); }
+            when DType.Float64 { bytesToChunk(real); }
+            when DType.Bool { bytesToChunk(bool); }
+            when DType.UInt8 { bytesToChunk(uint(8)); }
+            otherwise {
+                var errorMsg = "Unhandled data type %s".format(dtype2str(entry.dtype));
+                gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        return new MsgTuple("success", MsgType.NORMAL);
+    }
+
     /*
      * Utility proc to test casting a string to a specified type
      * :arg c: String to cast
@@ -0,0 +1,161 @@
+/* cache of groupings
+ remembers the permutation, segments and unique key indices that grouped a
+ list of key arrays, so that grouping the same keys again returns them instead
+ of sorting the keys again.
+
+ a grouping is found by the generations of its key arrays, which change
+ whenever an array is created or modified in place, so a grouping is never
+ returned for keys whose values have changed, even if they are registered
+ under the same name. the least recently used groupings are evicted once the
+ cached arrays occupy more than groupingCachePct percent of the memory limit.
+ */
+module GroupingCache
+{
+    use ServerConfig;
+
+    use List;
+    use Reflection;
+    use Logging;
+    use MultiTypeSymEntry;
+    use MultiTypeSymbolTable;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const gcLogger = new Logger(logLevel);
+
+    /*
+    Percentage of the memory limit, over all locales, that the arrays of the
+    cached groupings may occupy. 0 disables the cache.
+    */
+    config const groupingCachePct = 10;
+
+    /*
+    Key of the grouping of entries, made of their generations in order
+    */
+    proc groupingKey(entries): string {
+        var key: string;
+        for e in entries do key += e.generation:string + " ";
+        return key;
+    }
+
+    /*
+    Key of the grouping of the named key arrays
+    */
+    proc keysGroupingKey(knames, st: borrowed SymTab): string throws {
+        var key: string;
+        for n in knames do key += st.lookup(n).generation:string + " ";
+        return key;
+    }
+
+    /*
+    The arrays that grouped the key arrays whose generations are key. They
+    are shared with the symbol table entries they are returned as, so the
+    generations of the arrays themselves are kept too, to notice if one of
+    them was modified in place.
+    */
+    class CachedGrouping {
+        const key: string;
+        const perm: shared AbstractSymEntry;
+        const segments: shared AbstractSymEntry;
+        const ukeyinds: shared AbstractSymEntry;
+        const generations: string;
+
+        proc init(key: string, perm: shared AbstractSymEntry, segments: shared AbstractSymEntry,
+                  ukeyinds: shared AbstractSymEntry) {
+            this.key = key;
+            this.perm = perm;
+            this.segments = segments;
+            this.ukeyinds = ukeyinds;
+            this.generations = groupingKey((perm, segments, ukeyinds));
+        }
+
+        /*
+        Whether none of the arrays was modified since the grouping was cached
+        */
+        proc unchanged(): bool {
+            return groupingKey((perm, segments, ukeyinds)) == generations;
+        }
+
+        proc bytes(): int {
+            return perm.getSizeEstimate() + segments.getSizeEstimate() + ukeyinds.getSizeEstimate();
+        }
+    }
+
+    class GroupingCacheTable {
+        /* least recently used first */
+        var groupings: list(shared CachedGrouping);
+        var bytes = 0;
+        var lock: sync bool = true;
+
+        /*
+        Maximum number of bytes of the cached arrays
+        */
+        proc capacity(): int {
+            return ((groupingCachePct:real / 100.0) * getMemLimit():real * numLocales):int;
+        }
+
+        /*
+        Returns the grouping of key, or nil if it is not cached, and marks it
+        the most recently used
+        */
+        proc lookup(key: string): shared CachedGrouping? throws {
+            lock.readFE();
+            defer { lock.writeEF(true); }
+            for i in 0..#groupings.size {
+                if groupings[i].key == key {
+                    const g = groupings.pop(i);
+                    if !g.unchanged() {
+                        bytes -= g.bytes();
+                        gcLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                       "evicted modified grouping of %s".format(key));
+                        return nil;
+                    }
+                    groupings.append(g);
+                    gcLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                   "found grouping of %s".format(key));
+                    return g;
+                }
+            }
+            return nil;
+        }
+
+        /*
+        Caches a grouping, replacing any grouping of the same key, then evicts
+        the least recently used groupings until the cache fits its capacity
+        */
+        proc store(in grouping: shared CachedGrouping) throws {
+            lock.readFE();
+            defer { lock.writeEF(true); }
+            for i in 0..#groupings.size by -1 {
+                if groupings[i].key == grouping.key {
+                    bytes -= groupings.pop(i).bytes();
+                }
+            }
+            const cap = capacity();
+            if grouping.bytes() > cap {
+                gcLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                               "grouping of %s exceeds the capacity %i".format(grouping.key, cap));
+                return;
+            }
+            bytes += grouping.bytes();
+            groupings.append(grouping);
+            while bytes > cap {
+                const evicted = groupings.pop(0);
+                bytes -= evicted.bytes();
+                gcLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                               "evicted grouping of %s".format(evicted.key));
+            }
+        }
+
+        /*
+        Evicts every grouping
+        */
+        proc clear() {
+            lock.readFE();
+            groupings.clear();
+            bytes = 0;
+            lock.writeEF(true);
+        }
+    }
+
+    const groupingCache = new owned GroupingCacheTable();
+}
@@ -0,0 +1,81 @@
+module GroupingCacheMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use GroupingCache;
+    use ArgSortMsg only coargsortMsg, defaultSortAlgorithm;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const gcmLogger = new Logger(logLevel);
+
+    /*
+    Finds the permutation that groups a list of key arrays, from the
+    grouping cache if the keys were grouped before. Caching the grouping
+    is left to findSegments, which is passed the names of the keys.
+
+    :arg reqMsg: request containing (cmd,nkeys,knames,ngkeys,gknames), the
+                 key arrays and the pdarrays they are grouped by
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) copies of the permutation, the segments and the
+              unique key indices of the keys if they are cached, otherwise
+              the permutation that coargsorts the grouping keys
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc groupingSortMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (nkeysStr, rest) = payload.splitMsgToTuple(2);
+        const nkeys = nkeysStr:int;
+        var fields = rest.split();
+        if fields.size <= nkeys || fields.size != nkeys + 1 + fields[nkeys]:int {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i key arrays and their grouping keys".format(nkeys));
+            gcmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const knames = fields[0..#nkeys];
+        const gknames = fields[nkeys+1..];
+
+        if groupingCachePct > 0 {
+            const cached = groupingCache.lookup(keysGroupingKey(knames, st));
+            if cached != nil {
+                const g = cached!;
+                var rnames: [0..#3] string;
+                for (entry, rname) in zip((g.perm, g.segments, g.ukeyinds), rnames) {
+                    // copies, so that modifying the arrays of one GroupBy in
+                    // place affects neither the cache nor the other GroupBys
+                    const src = toSymEntry(toGenSymEntry(entry.borrow()), int);
+                    rname = st.nextName();
+                    var dst = st.addEntry(rname, src.size, int);
+                    dst.a = src.a;
+                }
+                var repMsg = "created " + st.attrib(rnames[0]) + "+created " + st.attrib(rnames[1]) +
+                             "+created " + st.attrib(rnames[2]);
+                gcmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rnames[0], rnames[1], rnames[2]));
+            }
+            gcmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                            "no grouping of %s".format(" ".join(knames)));
+        }
+        const types = " pdarray" * gknames.size;
+        return coargsortMsg("coargsort", "%s %i %s%s".format(defaultSortAlgorithm:string, gknames.size,
+                                                            " ".join(gknames), types), st);
+    }
+
+    proc registerMe() {
+        use CommandMap;
+        registerFunction("groupingSort", groupingSortMsg, getModuleName());
+    }
+}
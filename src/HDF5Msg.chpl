@@ -25,10 +25,19 @@ module HDF5Msg {
     use Sort;
 
     require "c_helpers/help_h5ls.h", "c_helpers/help_h5ls.c";
+    require "c_helpers/help_hdf5_direct.h", "c_helpers/help_hdf5_direct.c";
 
     private config const logLevel = ServerConfig.logLevel;
     const h5Logger = new Logger(logLevel);
 
+    /*
+     * Size in bytes of the blocks of a contiguous dataset that the tasks of a
+     * locale read directly in parallel, and of the preads each block is read
+     * with, the next of which is read ahead
+     */
+    config const hdf5DirectReadBlockBytes = 64 * 1024 * 1024;
+    config const hdf5DirectReadAheadBytes = 4 * 1024 * 1024;
+
     // Constants etc. related to intenral HDF5 file metadata
     const ARKOUDA_HDF5_FILE_METADATA_GROUP = "/_arkouda_metadata";
     const ARKOUDA_HDF5_ARKOUDA_VERSION_KEY = "arkouda_version"; // see ServerConfig.arkoudaVersion
@@ -132,6 +141,9 @@ module HDF5Msg {
     private extern proc c_strlen(s:c_ptr(c_char)):c_size_t;
     private extern proc c_incrementCounter(data:c_void_ptr);
     private extern proc c_append_HDF5_fieldname(data:c_void_ptr, name:c_string);
+    private extern proc c_contiguous_data_offset(dataset:C_HDF5.hid_t, mem_type:C_HDF5.hid_t):int(64);
+    private extern proc c_pread_contiguous(filename:c_string, offset:int(64), nbytes:int(64),
+                                           buf:c_void_ptr, readahead:int(64)):int(64);
 
     /**
      * Simulate h5ls call by using HDF5 API (top level datasets and groups only, not recursive)
@@ -524,9 +536,42 @@ module HDF5Msg {
         return (subdoms, (+ reduce lengths), skips);
     }
 
-    /* This function gets called when A is a BlockDist or DefaultRectangular array. */
+    /*
+     * Reads size elements of type t of a contiguous dataset, starting at
+     * element start of the data at dataOffset in its file, into the local
+     * memory at ptr. The tasks of the locale each read blocks of
+     * hdf5DirectReadBlockBytes with large preads.
+     */
+    proc readContiguous(filename: string, dataOffset: int, start: int, size: int,
+                        ptr: c_ptr(?t)) throws {
+        const blockElems = max(1, hdf5DirectReadBlockBytes / numBytes(t));
+        const nblocks = (size + blockElems - 1) / blockElems;
+        forall b in 0..#nblocks {
+            const lo = b * blockElems;
+            const nbytes = min(blockElems, size - lo) * numBytes(t);
+            const nread = c_pread_contiguous(filename.c_str(), dataOffset + (start + lo) * numBytes(t),
+                                             nbytes, (ptr + lo): c_void_ptr, hdf5DirectReadAheadBytes);
+            if nread != nbytes {
+                throw getErrorWithContext(
+                          msg="Read %i of %i bytes at offset %i of %s".format(
+                              max(nread, 0), nbytes, dataOffset + (start + lo) * numBytes(t), filename),
+                          lineNumber=getLineNumber(),
+                          routineName=getRoutineName(),
+                          moduleName=getModuleName(),
+                          errorClass="HDF5FileFormatError");
+            }
+        }
+    }
+
+    /*
+     * This function gets called when A is a BlockDist or DefaultRectangular array.
+     * If directRead, the datasets stored contiguously, uncompressed, with the
+     * element type of A are read directly from their files with readContiguous
+     * instead of through the HDF5 library.
+     */
     proc read_files_into_distributed_array(A, filedomains: [?FD] domain(1), 
-                                                 filenames: [FD] string, dsetName: string, skips: set(string)) throws 
+                                                 filenames: [FD] string, dsetName: string, skips: set(string),
+                                                 directRead: bool = true) throws 
         where (MyDmap == Dmap.blockDist || MyDmap == Dmap.defaultRectangular)
     {
             h5Logger.debug(getModuleName(),getRoutineName(),getLineNumber(),
@@ -546,6 +591,8 @@ module HDF5Msg {
                     var isopen = false;
                     var file_id: C_HDF5.hid_t;
                     var dataset: C_HDF5.hid_t;
+                    // offset of the data in the file if it can be read directly, else -1
+                    var dataOffset = -1;
 
                     if (skips.contains(filename)) {
                         h5Logger.debug(getModuleName(),getRoutineName(),getLineNumber(),
@@ -562,6 +609,16 @@ module HDF5Msg {
                                     var locDsetName = try! getReadDsetName(file_id,dsetName);
                                     try! dataset = C_HDF5.H5Dopen(file_id, locDsetName.c_str(), C_HDF5.H5P_DEFAULT);
                                     isopen = true;
+                                    if directRead then
+                                        dataOffset = c_contiguous_data_offset(dataset, getHDF5Type(A.eltType));
+                                }
+                                if dataOffset >= 0 {
+                                    h5Logger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                            "Locale %t intersection %t read directly from offset %i of %s".format(
+                                            loc, intersection, dataOffset, filename));
+                                    readContiguous(filename, dataOffset, intersection.low - filedom.low,
+                                                   intersection.size, c_ptrTo(A.localSlice(intersection)));
+                                    continue;
                                 }
                                 // do A[intersection] = file[intersection - offset]
                                 var dataspace = C_HDF5.H5Dget_space(dataset);
@@ -1829,12 +1886,14 @@ module HDF5Msg {
     proc readAllHdfMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
         var repMsg: string;
         // May need a more robust delimiter then " | "
-        var (strictFlag, ndsetsStr, nfilesStr, allowErrorsFlag, calcStringOffsetsFlag, arraysStr) = payload.splitMsgToTuple(6);
+        var (strictFlag, ndsetsStr, nfilesStr, allowErrorsFlag, calcStringOffsetsFlag, directReadFlag, arraysStr) = payload.splitMsgToTuple(7);
         var strictTypes: bool = true;
         if (strictFlag.toLower().strip() == "false") {
           strictTypes = false;
         }
 
+        var directRead: bool = (directReadFlag.toLower() != "false"); // default is true
+
         var allowErrors: bool = "true" == allowErrorsFlag.toLower(); // default is false
         if allowErrors {
             h5Logger.warn(getModuleName(), getRoutineName(), getLineNumber(), "Allowing file read errors");
@@ -2018,7 +2077,7 @@ module HDF5Msg {
 
                     // Load the strings bytes/values first
                     var entryVal = new shared SymEntry(len, uint(8));
-                    read_files_into_distributed_array(entryVal.a, subdoms, filenames, dsetName + "/" + SEGARRAY_VALUE_NAME, skips);
+                    read_files_into_distributed_array(entryVal.a, subdoms, filenames, dsetName + "/" + SEGARRAY_VALUE_NAME, skips, directRead);
 
                     proc _buildEntryCalcOffsets(): shared SymEntry throws {
                         var offsetsArray = segmentedCalcOffsets(entryVal.a, entryVal.aD);
@@ -2027,7 +2086,7 @@ module HDF5Msg {
 
                     proc _buildEntryLoadOffsets() throws {
                         var offsetsEntry = new shared SymEntry(nSeg, int);
-                        read_files_into_distributed_array(offsetsEntry.a, segSubdoms, filenames, dsetName + "/" + SEGARRAY_OFFSET_NAME, skips);
+                        read_files_into_distributed_array(offsetsEntry.a, segSubdoms, filenames, dsetName + "/" + SEGARRAY_OFFSET_NAME, skips, directRead);
                         fixupSegBoundaries(offsetsEntry.a, segSubdoms, subdoms);
                         return offsetsEntry;
                     }
@@ -2050,7 +2109,7 @@ module HDF5Msg {
                     if (!isSigned && 8 == bytesize) { // uint64
                         var entryUInt = new shared SymEntry(len, uint);
                         h5Logger.debug(getModuleName(),getRoutineName(),getLineNumber(), "Initialized uint entry for dataset %s".format(dsetName));
-                        read_files_into_distributed_array(entryUInt.a, subdoms, filenames, dsetName, skips);
+                        read_files_into_distributed_array(entryUInt.a, subdoms, filenames, dsetName, skips, directRead);
                         var rname = st.nextName();
                         
                         /*
@@ -2068,7 +2127,7 @@ module HDF5Msg {
                     } else {
                         var entryInt = new shared SymEntry(len, int);
                         h5Logger.debug(getModuleName(),getRoutineName(),getLineNumber(), "Initialized int entry for dataset %s".format(dsetName));
-                        read_files_into_distributed_array(entryInt.a, subdoms, filenames, dsetName, skips);
+                        read_files_into_distributed_array(entryInt.a, subdoms, filenames, dsetName, skips, directRead);
                         var rname = st.nextName();
                         
                         /*
@@ -2092,7 +2151,7 @@ module HDF5Msg {
                     var entryReal = new shared SymEntry(len, real);
                     h5Logger.debug(getModuleName(),getRoutineName(),getLineNumber(),
                                                                       "Initialized float entry");
-                    read_files_into_distributed_array(entryReal.a, subdoms, filenames, dsetName, skips);
+                    read_files_into_distributed_array(entryReal.a, subdoms, filenames, dsetName, skips, directRead);
                     var rname = st.nextName();
                     st.addEntry(rname, entryReal);
                     rnames.append((dsetName, "pdarray", rname));
@@ -0,0 +1,321 @@
+/* hash-based grouping
+ finds the unique keys of one or two key arrays with per-task hash tables on
+ each locale, merged across locales, and gives each row the index of its key
+ among the sorted unique keys, so the rows are grouped without a global sort.
+
+ the group ids are enough to count and reduce the groups; the permutation
+ that orders the rows by group is only built, with a stable counting sort, if
+ it is needed.
+ */
+module HashGroup
+{
+    use ServerConfig;
+
+    use Map;
+    use List;
+    use Sort;
+    use Search;
+    use PrivateDist;
+    use CommAggregation;
+    use SymArrayDmap;
+    use Reflection;
+    use Logging;
+    use Sketches only taskRange;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const hgLogger = new Logger(logLevel);
+
+    /*
+    Maps a key to an unsigned value with the same order, so that the unique
+    keys sort in the order in which coargsort sorts the keys
+    */
+    inline proc orderedKey(k: int): uint {
+        return (k:uint) ^ (1:uint << 63);
+    }
+
+    inline proc orderedKey(k: uint): uint {
+        return k;
+    }
+
+    /*
+    Key of row i of one (if single) or two key arrays
+    */
+    inline proc rowKey(const ref k0, const ref k1, i: int, param single: bool): 2*uint {
+        if single {
+            return (orderedKey(k0[i]), 0:uint);
+        } else {
+            return (orderedKey(k0[i]), orderedKey(k1[i]));
+        }
+    }
+
+    /*
+    Finds the unique keys of k0 (if single) or of k0 and k1 together, along
+    with the index of the first row of each key. Every task of every locale
+    builds a hash table of the keys in its share of the rows; the tables are
+    merged on each locale and then across locales. Gives up, setting fits to
+    false, as soon as more than maxGroups distinct keys are found.
+
+    :arg k0: first key array
+    :arg k1: second key array, ignored if single
+    :arg single: whether there is only one key array
+    :arg maxGroups: the largest number of groups to find
+    :arg fits: set to whether there are at most maxGroups unique keys
+
+    :returns: [] (2*uint, int) sorted unique keys and their first row index
+    */
+    proc hashUniqueKeys(const ref k0: [?D] ?t0, const ref k1: [D] ?t1, param single: bool,
+                        maxGroups: int, out fits: bool): [] (2*uint, int) throws {
+        var localKeys: [PrivateSpace] list((2*uint, int));
+        var overflow: atomic bool;
+
+        coforall loc in Locales with (ref localKeys) do on loc {
+            const myD = k0.localSubdomain();
+            const nTasks = here.maxTaskPar;
+            var taskKeys: [0..#nTasks] map(2*uint, int);
+            coforall t in 0..#nTasks with (ref taskKeys) {
+                ref mine = taskKeys[t];
+                for i in taskRange(myD, t, nTasks) {
+                    // rows are visited in order, so the first row of a key is kept
+                    if mine.add(rowKey(k0, k1, i, single), i) && mine.size > maxGroups {
+                        overflow.write(true);
+                    }
+                    if (i & 0xffff) == 0 && overflow.read() then break;
+                }
+            }
+            if !overflow.read() {
+                var merged: map(2*uint, int);
+                for tk in taskKeys {
+                    for (k, i) in tk.items() {
+                        if !merged.add(k, i) then merged[k] = min(merged[k], i);
+                    }
+                }
+                if merged.size > maxGroups {
+                    overflow.write(true);
+                } else {
+                    for (k, i) in merged.items() do localKeys[here.id].append((k, i));
+                }
+            }
+        }
+
+        var none: [0..#0] (2*uint, int);
+        if overflow.read() {
+            fits = false;
+            return none;
+        }
+
+        var merged: map(2*uint, int);
+        for l in PrivateSpace {
+            const lk = localKeys[l].toArray();
+            for (k, i) in lk {
+                if !merged.add(k, i) then merged[k] = min(merged[k], i);
+            }
+            if merged.size > maxGroups {
+                fits = false;
+                return none;
+            }
+        }
+        var uniq: [0..#merged.size] (2*uint, int);
+        for (u, (k, i)) in zip(uniq, merged.items()) do u = (k, i);
+        // keys are unique, so this sorts by key
+        sort(uniq);
+        hgLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "found %i unique keys".format(uniq.size));
+        fits = true;
+        return uniq;
+    }
+
+    /*
+    Gives each row the index of its key in the sorted unique keys. The unique
+    keys are copied to every locale, where the rows look up their key.
+
+    :arg k0: first key array
+    :arg k1: second key array, ignored if single
+    :arg single: whether there is only one key array
+    :arg uniq: the sorted unique keys, as returned by hashUniqueKeys
+
+    :returns: [] int group id of each row
+    */
+    proc hashGroupIds(const ref k0: [?D] ?t0, const ref k1: [D] ?t1, param single: bool,
+                      const ref uniq: [] (2*uint, int)) throws {
+        var gids = makeDistArray(D.size, int);
+        const keys = [u in uniq] u(0);
+        coforall loc in Locales with (ref gids) do on loc {
+            const localKeys = keys;
+            forall i in gids.localSubdomain() {
+                const (_, g) = binarySearch(localKeys, rowKey(k0, k1, i, single));
+                gids[i] = g;
+            }
+        }
+        return gids;
+    }
+
+    /*
+    Number of rows in each group
+    */
+    proc groupCounts(const ref gids: [] int, ngroups: int): [0..#ngroups] int {
+        var counts: [0..#ngroups] int;
+        forall g in gids with (+ reduce counts) {
+            counts[g] += 1;
+        }
+        return counts;
+    }
+
+    /*
+    Permutation that stably orders the rows by group id, found with a counting
+    sort: every task counts the rows of each group in its share of the rows,
+    and then writes the indices of those rows after the rows of the same group
+    on the preceding locales and tasks.
+
+    :arg gids: group id of each row
+    :arg segments: index of the first row of each group in grouped order
+
+    :returns: [] int permutation
+    */
+    proc groupPermutation(const ref gids: [?D] int, const ref segments: [?sD] int) throws {
+        const ngroups = sD.size;
+        const nTasks = here.maxTaskPar;
+        var perm = makeDistArray(D.size, int);
+
+        // check there's enough room for the per-task counts on each locale
+        overMemLimit(numBytes(int) * nTasks * ngroups);
+        var taskCounts: [PrivateSpace] [0..#nTasks, 0..#ngroups] int;
+        var localeCounts: [PrivateSpace] [0..#ngroups] int;
+
+        coforall loc in Locales with (ref taskCounts, ref localeCounts) do on loc {
+            const myD = gids.localSubdomain();
+            ref myCounts = taskCounts[here.id];
+            coforall t in 0..#nTasks with (ref myCounts) {
+                for i in taskRange(myD, t, nTasks) do myCounts[t, gids[i]] += 1;
+            }
+            ref myTotals = localeCounts[here.id];
+            forall g in 0..#ngroups with (ref myTotals) {
+                for t in 0..#nTasks do myTotals[g] += myCounts[t, g];
+            }
+        }
+
+        coforall loc in Locales with (ref perm) do on loc {
+            const myD = gids.localSubdomain();
+            // each group's rows on this locale follow those on the preceding locales
+            var offsets: [0..#ngroups] int = segments;
+            for l in 0..<here.id do offsets += localeCounts[l];
+            const ref myCounts = taskCounts[here.id];
+            coforall t in 0..#nTasks with (ref perm) {
+                var next: [0..#ngroups] int = offsets;
+                for t2 in 0..<t do next += myCounts[t2, ..];
+                var agg = newDstAggregator(int);
+                for i in taskRange(myD, t, nTasks) {
+                    const g = gids[i];
+                    agg.copy(perm[next[g]], i);
+                    next[g] += 1;
+                }
+                agg.flush();
+            }
+        }
+        return perm;
+    }
+
+    private proc groupIdentity(type t, param op: string): t {
+        if op == "prod" {
+            return 1:t;
+        } else if op == "min" {
+            return max(t);
+        } else if op == "max" {
+            return min(t);
+        } else if op == "and" {
+            if t == bool then return true; else return ~(0:t);
+        } else {
+            return 0:t;
+        }
+    }
+
+    private inline proc groupCombine(x, y, param op: string) {
+        if op == "prod" {
+            return x * y;
+        } else if op == "min" {
+            return min(x, y);
+        } else if op == "max" {
+            return max(x, y);
+        } else if op == "or" {
+            return x | y;
+        } else if op == "and" {
+            return x & y;
+        } else if op == "xor" {
+            return x ^ y;
+        } else {
+            return x + y;
+        }
+    }
+
+    /*
+    Reduces the values of each group with op, one of sum, prod, min, max, or,
+    and, or xor. Every task reduces its share of the rows into a table of one
+    value per group; the tables are combined on each locale and then across
+    locales, so the values are never permuted.
+
+    :arg values: values to reduce
+    :arg gids: group id of each row
+    :arg ngroups: number of groups
+    :arg rt: type in which the values are reduced
+    :arg op: reduction operator
+    :arg skipNan: whether NaN values are ignored
+
+    :returns: [] rt one value per group
+    */
+    proc groupReduce(const ref values: [?D] ?t, const ref gids: [D] int, ngroups: int,
+                     type rt, param op: string, skipNan: bool = false) throws {
+        const nTasks = here.maxTaskPar;
+        var partials: [PrivateSpace] [0..#ngroups] rt;
+
+        coforall loc in Locales with (ref partials) do on loc {
+            const myD = values.localSubdomain();
+            var taskPartials: [0..#nTasks] [0..#ngroups] rt = groupIdentity(rt, op);
+            coforall task in 0..#nTasks with (ref taskPartials) {
+                ref mine = taskPartials[task];
+                for i in taskRange(myD, task, nTasks) {
+                    const v = values[i];
+                    if isFloatType(t) {
+                        if skipNan && isnan(v) then continue;
+                    }
+                    const g = gids[i];
+                    mine[g] = groupCombine(mine[g], v:rt, op);
+                }
+            }
+            ref myPartial = partials[here.id];
+            forall g in 0..#ngroups with (ref myPartial) {
+                var r = groupIdentity(rt, op);
+                for task in 0..#nTasks do r = groupCombine(r, taskPartials[task][g], op);
+                myPartial[g] = r;
+            }
+        }
+
+        var res = makeDistArray(ngroups, rt);
+        forall g in res.domain with (ref res) {
+            var r = groupIdentity(rt, op);
+            for l in PrivateSpace do r = groupCombine(r, partials[l][g], op);
+            res[g] = r;
+        }
+        return res;
+    }
+
+    /*
+    Mean of the values of each group, ignoring NaN values if skipNan
+    */
+    proc groupMean(const ref values: [?D] ?t, const ref gids: [D] int, ngroups: int,
+                   skipNan: bool = false) throws {
+        const sums = groupReduce(values, gids, ngroups, real, "sum", skipNan);
+        var counts: [0..#ngroups] int;
+        forall (v, g) in zip(values, gids) with (+ reduce counts) {
+            if isFloatType(t) {
+                if !(skipNan && isnan(v)) then counts[g] += 1;
+            } else {
+                counts[g] += 1;
+            }
+        }
+        var res = makeDistArray(ngroups, real);
+        forall (r, s, c) in zip(res, sums, counts) {
+            // as the sort-based mean, NaN for a group with no values
+            r = if c > 0 then s / c:real else nan;
+        }
+        return res;
+    }
+}
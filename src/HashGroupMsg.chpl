@@ -0,0 +1,305 @@
+module HashGroupMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use SymArrayDmap;
+
+    use HashGroup;
+    use ReductionMsg only stringtobool;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const hgmLogger = new Logger(logLevel);
+
+    /*
+    Groups the rows of one or two int64/uint64 key arrays with hash tables
+    instead of a sort.
+
+    :arg reqMsg: request containing (cmd,maxGroups,nkeys,knames)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the group id of each row, the segments and the unique
+              key indices, or "fallback" if there are more than maxGroups groups
+              or the keys are sorted or are not int64/uint64
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hashGroupMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (maxGroupsStr, nkeysStr, rest) = payload.splitMsgToTuple(3);
+        var maxGroups = maxGroupsStr:int;
+        var nkeys = nkeysStr:int;
+        var knames = rest.split();
+        if nkeys < 1 || nkeys > 2 || knames.size != nkeys {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected 1 or 2 key arrays but got %i".format(knames.size));
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var g0 = getGenericTypedArrayEntry(knames[0], st);
+        var g1 = getGenericTypedArrayEntry(knames[nkeys-1], st);
+        if g0.size != g1.size {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected array of size %i, got size %i".format(g0.size, g1.size));
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        // sorted keys are already grouped, which the sort-based grouping finds
+        // without sorting
+        if g0.isSorted() && g1.isSorted() {
+            hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),"keys already sorted");
+            return new MsgTuple("fallback", MsgType.NORMAL);
+        }
+
+        proc group(const ref k0: [?D] ?t0, const ref k1: [D] ?t1, param single: bool): string throws {
+            var fits: bool;
+            const uniq = hashUniqueKeys(k0, k1, single, maxGroups, fits);
+            if !fits {
+                hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                "more than %i groups".format(maxGroups));
+                return "fallback";
+            }
+            const ngroups = uniq.size;
+            var gids = hashGroupIds(k0, k1, single, uniq);
+            const counts = groupCounts(gids, ngroups);
+            var segs = makeDistArray(ngroups, int);
+            segs = (+ scan counts) - counts;
+            var ukeyinds = makeDistArray(ngroups, int);
+            ukeyinds = [u in uniq] u(1);
+
+            var gname = st.nextName();
+            st.addEntry(gname, new shared SymEntry(gids));
+            var sname = st.nextName();
+            st.addEntry(sname, new shared SymEntry(segs));
+            var uname = st.nextName();
+            st.addEntry(uname, new shared SymEntry(ukeyinds));
+            return "created " + st.attrib(gname) + " +created " + st.attrib(sname) +
+                   " +created " + st.attrib(uname);
+        }
+
+        proc groupSecond(const ref k0: [] ?t0): string throws {
+            if nkeys == 1 {
+                return group(k0, k0, true);
+            }
+            select g1.dtype {
+                when DType.Int64 { return group(k0, toSymEntry(g1, int).a, false); }
+                when DType.UInt64 { return group(k0, toSymEntry(g1, uint).a, false); }
+                otherwise {
+                    hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                    "key array dtype %s".format(dtype2str(g1.dtype)));
+                    return "fallback";
+                }
+            }
+        }
+
+        var repMsg: string;
+        select g0.dtype {
+            when DType.Int64 { repMsg = groupSecond(toSymEntry(g0, int).a); }
+            when DType.UInt64 { repMsg = groupSecond(toSymEntry(g0, uint).a); }
+            otherwise {
+                hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                "key array dtype %s".format(dtype2str(g0.dtype)));
+                repMsg = "fallback";
+            }
+        }
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Builds the permutation that orders the rows by group from the group ids
+    returned by hashGroup.
+
+    :arg reqMsg: request containing (cmd,gids,segments)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the permutation
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hashGroupPermutationMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        var (gidsName, segmentsName) = payload.splitMsgToTuple(2);
+        var gids = toSymEntry(getGenericTypedArrayEntry(gidsName, st), int);
+        var segments = toSymEntry(getGenericTypedArrayEntry(segmentsName, st), int);
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(groupPermutation(gids.a, segments.a)));
+        var repMsg = "created " + st.attrib(rname);
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Reduces the values of each group from the group ids returned by hashGroup,
+    without permuting the values.
+
+    :arg reqMsg: request containing (cmd,values,gids,ngroups,operator,skipNan)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) one value per group
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hashReductionMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (valuesName, gidsName, ngroupsStr, op, skipNanStr) = payload.splitMsgToTuple(5);
+        const ngroups = ngroupsStr:int;
+        const skipNan = stringtobool(skipNanStr);
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                        "cmd: %s values: %s gids: %s operator: %s skipNan: %s".format(
+                                  cmd,valuesName,gidsName,op,skipNan));
+        var gVal = getGenericTypedArrayEntry(valuesName, st);
+        var gids = toSymEntry(getGenericTypedArrayEntry(gidsName, st), int);
+        if gVal.size != gids.size {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected array of size %i, got size %i".format(gids.size, gVal.size));
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var rname = st.nextName();
+        var errorMsg = reduceGroups(gVal, gids, ngroups, op, skipNan, rname, st, pn);
+        if !errorMsg.isEmpty() {
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var repMsg = "created " + st.attrib(rname);
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Reduces the values in gVal of each group with op and adds the result to
+    the symbol table as rname.
+
+    :returns: an error message if op is not supported for the values dtype,
+              otherwise an empty string
+    */
+    proc reduceGroups(gVal: borrowed GenSymEntry, gids, ngroups: int, op: string, skipNan: bool,
+                      rname: string, st: borrowed SymTab, pn: string): string throws {
+        proc reduceInts(const ref values: [] ?t): bool throws {
+            select op {
+                when "sum" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, t, "sum"))); }
+                when "prod" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, real, "prod"))); }
+                when "mean" { st.addEntry(rname, new shared SymEntry(groupMean(values, gids.a, ngroups))); }
+                when "min" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, t, "min"))); }
+                when "max" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, t, "max"))); }
+                when "or" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, t, "or"))); }
+                when "and" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, t, "and"))); }
+                when "xor" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, t, "xor"))); }
+                otherwise { return false; }
+            }
+            return true;
+        }
+
+        var found: bool;
+        select gVal.dtype {
+            when DType.Int64 { found = reduceInts(toSymEntry(gVal, int).a); }
+            when DType.UInt64 { found = reduceInts(toSymEntry(gVal, uint).a); }
+            when DType.Float64 {
+                const ref values = toSymEntry(gVal, real).a;
+                found = true;
+                select op {
+                    when "sum" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, real, "sum", skipNan))); }
+                    when "prod" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, real, "prod", skipNan))); }
+                    when "mean" { st.addEntry(rname, new shared SymEntry(groupMean(values, gids.a, ngroups, skipNan))); }
+                    when "min" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, real, "min", skipNan))); }
+                    when "max" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, real, "max", skipNan))); }
+                    otherwise { found = false; }
+                }
+            }
+            when DType.Bool {
+                const ref values = toSymEntry(gVal, bool).a;
+                found = true;
+                select op {
+                    when "sum" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, int, "sum"))); }
+                    when "mean" { st.addEntry(rname, new shared SymEntry(groupMean(values, gids.a, ngroups))); }
+                    when "any" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, bool, "or"))); }
+                    when "all" { st.addEntry(rname, new shared SymEntry(groupReduce(values, gids.a, ngroups, bool, "and"))); }
+                    otherwise { found = false; }
+                }
+            }
+            otherwise {
+                var errorMsg = unrecognizedTypeError(pn, dtype2str(gVal.dtype));
+                hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return errorMsg;
+            }
+        }
+        if !found {
+            var errorMsg = notImplementedError(pn,op,gVal.dtype);
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return errorMsg;
+        }
+        return "";
+    }
+
+    /*
+    Computes several reductions of several value arrays from the group ids
+    returned by hashGroup in one request.
+
+    :arg reqMsg: request containing (cmd,gids,ngroups,skipNan,ncols,[values,ops])
+                 where ops is a comma-separated list of operators
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) one created entry per (values, operator), in request order
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hashAggregateMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (gidsName, ngroupsStr, skipNanStr, ncolsStr, rest) = payload.splitMsgToTuple(5);
+        const ngroups = ngroupsStr:int;
+        const skipNan = stringtobool(skipNanStr);
+        const ncols = ncolsStr:int;
+        var fields = rest.split();
+        if fields.size != 2*ncols {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i values and operators but got %i fields".format(ncols, fields.size));
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var gids = toSymEntry(getGenericTypedArrayEntry(gidsName, st), int);
+        var repMsg: string;
+        for c in 0..#ncols {
+            const valuesName = fields[fields.domain.low + 2*c];
+            var gVal = getGenericTypedArrayEntry(valuesName, st);
+            if gVal.size != gids.size {
+                var errorMsg = incompatibleArgumentsError(pn,
+                                   "Expected array of size %i, got size %i".format(gids.size, gVal.size));
+                hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            for op in fields[fields.domain.low + 2*c + 1].split(",") {
+                var rname = st.nextName();
+                var errorMsg = reduceGroups(gVal, gids, ngroups, op, skipNan, rname, st, pn);
+                if !errorMsg.isEmpty() {
+                    return new MsgTuple(errorMsg, MsgType.ERROR);
+                }
+                if !repMsg.isEmpty() then repMsg += " +";
+                repMsg += "created " + st.attrib(rname);
+            }
+        }
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    proc registerMe() {
+      use CommandMap;
+      registerFunction("hashGroup", hashGroupMsg, getModuleName());
+      registerFunction("hashGroupPermutation", hashGroupPermutationMsg, getModuleName());
+      registerFunction("hashReduction", hashReductionMsg, getModuleName());
+      registerFunction("hashAggregate", hashAggregateMsg, getModuleName());
+    }
+}
@@ -75,7 +75,7 @@ module HistogramMsg
         
         repMsg = "created " + st.attrib(rname);
         hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
 
     proc registerMe() {
@@ -6,10 +6,23 @@ module In1d
     use CommAggregation;
     use RadixSortLSD;
     use Reflection;
+    use PrivateDist;
+    use SymArrayDmap;
+    use Sketches only keyHash;
 
     /* Threshold for choosing between in1d implementation strategies */
     private config const threshold = 2**23;
 
+    /* Bits of the bloom filter per element of the second array */
+    config const bloomBitsPerKey = 16;
+
+    /* Bits set in the bloom filter for each element */
+    private param bloomHashes = 6;
+
+    /* Relative cost of testing an element against the local bloom filter,
+       to sorting and exchanging it */
+    private config const bloomProbeCost = 0.25;
+
     /* For each value in the first array, check membership in the second array.
 
        :arg ar1: array to broadcast in parallel over ar2
@@ -21,16 +34,120 @@ module In1d
        :arg invert: should the result be inverted (not in1d)
        :type invert: bool
 
+       :arg method: one of "hash", "sort", "bloom", or "auto" to choose by in1dMethod
+       :type method: string
+
+       :arg ar2SortedUnique: whether ar2 is known to be sorted without duplicates
+       :type ar2SortedUnique: bool
+
        :returns truth: the distributed boolean array containing the result of ar1 being broadcast over ar2
        :type truth: [] bool
      */
-    proc in1d(ar1: [?aD1] ?t, ar2: [?aD2] t, invert: bool = false): [aD1] bool throws {
-        var truth = if ar2.size <= threshold then in1dAr2PerLocAssoc(ar1, ar2)
-                                             else in1dSort(ar1, ar2);
+    proc in1d(ar1: [?aD1] ?t, ar2: [?aD2] t, invert: bool = false, method: string = "auto",
+              ar2SortedUnique: bool = false): [aD1] bool throws {
+        const m = if method == "auto" then in1dMethod(ar1.size, ar2.size) else method;
+        var truth = if m == "hash" then in1dAr2PerLocAssoc(ar1, ar2)
+                    else if m == "bloom" then in1dBloom(ar1, ar2, ar2SortedUnique)
+                    else in1dSort(ar1, ar2, ar2SortedUnique);
         if invert then truth = !truth;
         return truth;
     }
 
+    /* Chooses the in1d strategy for arrays of sizes n1 and n2. Every locale
+     * builds a set of ar2 if it is no larger than the threshold. Otherwise
+     * the cost per locale of sorting and exchanging both arrays is compared
+     * with that of a bloom filter: each locale receives the filter of ar2,
+     * tests its part of ar1 against it, and sorts only ar2 and the elements
+     * of ar1 that pass.
+     */
+    proc in1dMethod(n1: int, n2: int): string {
+        if n2 <= threshold then return "hash";
+        const sortCost = (n1 + n2):real / numLocales;
+        const filterWords = (n2 * bloomBitsPerKey + 63) / 64;
+        const passing = min(n1, n2) + n1 * bloomFalsePositiveRate();
+        const bloomCost = n1 * bloomProbeCost / numLocales + filterWords + (n2 + passing) / numLocales;
+        return if bloomCost < sortCost then "bloom" else "sort";
+    }
+
+    /* Approximate false positive rate of a filter of bloomBitsPerKey bits per
+       element, ignoring the blocking */
+    private proc bloomFalsePositiveRate(): real {
+        return (1.0 - exp(-bloomHashes:real / bloomBitsPerKey)) ** bloomHashes;
+    }
+
+    /* The bits of a filter word set for an element hash */
+    private inline proc bloomBits(h: uint): uint {
+        var bits = 0: uint;
+        for param j in 0..#bloomHashes do bits |= 1: uint << ((h >> (6 * j)) & 63);
+        return bits;
+    }
+
+    /* Blocked bloom filter of the elements of ar: each element sets
+     * bloomHashes bits of a single word, so it is tested with a single
+     * load. Each locale adds its part of ar to its own filter, and every
+     * locale receives the union of them.
+     */
+    proc bloomFilter(ar: [?D] ?t) throws {
+        const nwords = max(1, (ar.size * bloomBitsPerKey + 63) / 64);
+        overMemLimit(2 * numLocales * nwords * numBytes(uint));
+        var filters: [PrivateSpace] [0..#nwords] uint;
+        coforall loc in Locales with (ref filters) do on loc {
+            var mine: [0..#nwords] atomic uint;
+            forall i in D.localSubdomain() with (ref mine) {
+                const h = keyHash(ar[i]);
+                mine[(h(0) % nwords: uint): int].fetchOr(bloomBits(h(1)));
+            }
+            forall (f, m) in zip(filters[here.id], mine) do f = m.read();
+        }
+        var filter: [0..#nwords] uint;
+        for l in PrivateSpace {
+            const other = filters[l];
+            filter |= other;
+        }
+        coforall loc in Locales with (ref filters) do on loc {
+            filters[here.id] = filter;
+        }
+        return filters;
+    }
+
+    /* in1d that drops the elements of ar1 that are not in the bloom filter
+     * of ar2 on the locale where they are, and sorts only the elements that
+     * pass together with ar2. Suited to an ar1 much larger than ar2, with
+     * few elements in ar2.
+     */
+    proc in1dBloom(ar1: [?aD1] ?t, ar2: [?aD2] t, ar2SortedUnique: bool = false) throws {
+        const filters = bloomFilter(ar2);
+        var maybe: [aD1] bool;
+        coforall loc in Locales with (ref maybe) do on loc {
+            const ref filter = filters[here.id];
+            const nwords = filter.size: uint;
+            forall i in aD1.localSubdomain() with (ref maybe) {
+                const h = keyHash(ar1[i]);
+                const bits = bloomBits(h(1));
+                maybe[i] = (filter[(h(0) % nwords): int] & bits) == bits;
+            }
+        }
+        // gather the elements that pass and test them exactly
+        const passed = + scan maybe;
+        const npassed = if aD1.size == 0 then 0 else passed[aD1.high];
+        var truth: [aD1] bool;
+        if npassed == 0 then return truth;
+        var candidates = makeDistArray(npassed, t);
+        var positions = makeDistArray(npassed, int);
+        forall (i, m, p) in zip(aD1, maybe, passed) with (var cagg = newDstAggregator(t),
+                                                          var pagg = newDstAggregator(int)) {
+            if m {
+                cagg.copy(candidates[p-1], ar1[i]);
+                pagg.copy(positions[p-1], i);
+            }
+        }
+        const found = in1dSort(candidates, ar2, ar2SortedUnique);
+        forall (p, f) in zip(positions, found) with (var agg = newDstAggregator(bool)) {
+            agg.copy(truth[p], f);
+        }
+        return truth;
+    }
+
     /* in1d that uses a per-locale set/associative-domain. Each locale will
      * localize ar2 and put it in the set, so only appropriate in terms of
      * size and space when ar2 is "small".
@@ -60,12 +177,13 @@ module In1d
     /* in1d that uses a sorting strategy. At a high level it uniques both
      * arrays, finds the intersecting values, then maps back to the original
      * domain of ar1. Scales well with time/size, but sort has non-trivial
-     * overhead so typically used when ar2 is "large".
+     * overhead so typically used when ar2 is "large". ar2 is not sorted again
+     * if it is known to be sorted without duplicates.
      */
-    proc in1dSort(ar1: [?aD1] ?t, ar2: [?aD2] t) throws {
+    proc in1dSort(ar1: [?aD1] ?t, ar2: [?aD2] t, ar2SortedUnique: bool = false) throws {
         // Need the inverse index to map back from unique domain to original domain later
         var (u1, _, inv) = uniqueSortWithInverse(ar1);
-        var u2 = uniqueSort(ar2, needCounts=false);
+        var u2 = if ar2SortedUnique then ar2 else uniqueSort(ar2, needCounts=false);
         // Concatenate the two unique arrays
         const ar = concatArrays(u1, u2);
         const D = ar.domain;
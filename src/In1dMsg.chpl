@@ -13,6 +13,7 @@ module In1dMsg
     use ServerErrorStrings;
 
     use In1d;
+    use JoinMsg only keyHashes;
 
     private config const logLevel = ServerConfig.logLevel;
     const iLogger = new Logger(logLevel);
@@ -20,15 +21,14 @@ module In1dMsg
     /* in1d takes two pdarray and returns a bool pdarray
        with the "in"/contains for each element tested against the second pdarray.
        
-       in1dMsg processes the request, considers the size of the arguements, and decides 
-       which implementation
-       of in1d to utilize.
+       in1dMsg processes the request and, unless the method names one, considers
+       the size of the arguements to decide which implementation of in1d to utilize.
     */
     proc in1dMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
         param pn = Reflection.getRoutineName();
         var repMsg: string; // response message
         // split request into fields
-        var (name, sname, flag) = payload.splitMsgToTuple(3);
+        var (name, sname, flag, method) = payload.splitMsgToTuple(4);
         var invert: bool;
         
         if flag == "True" {invert = true;}
@@ -38,6 +38,11 @@ module In1dMsg
             iLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
             return new MsgTuple(errorMsg, MsgType.ERROR);         
         }
+        if !isIn1dMethod(method) {
+            var errorMsg = incompatibleArgumentsError(pn, "Unknown in1d method %s".format(method));
+            iLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
 
         // get next symbol name
         var rname = st.nextName();
@@ -54,14 +59,14 @@ module In1dMsg
                 var ar1 = toSymEntry(gAr1,int);
                 var ar2 = toSymEntry(gAr2,int);
 
-                var truth = in1d(ar1.a, ar2.a, invert);
+                var truth = in1d(ar1.a, ar2.a, invert, method, gAr2.isSorted() && gAr2.isUnique());
                 st.addEntry(rname, new shared SymEntry(truth));
             }
             when (DType.UInt64, DType.UInt64) {
                 var ar1 = toSymEntry(gAr1,uint);
                 var ar2 = toSymEntry(gAr2,uint);
 
-                var truth = in1d(ar1.a, ar2.a, invert);
+                var truth = in1d(ar1.a, ar2.a, invert, method, gAr2.isSorted() && gAr2.isUnique());
                 st.addEntry(rname, new shared SymEntry(truth));
             }
             otherwise {
@@ -72,11 +77,55 @@ module In1dMsg
         }
         repMsg = "created " + st.attrib(rname);
         iLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /* in1dMulti tests each row of the columns of one table for membership in
+       the rows of the columns of another, by the 128-bit hash of each row.
+
+       The request is (invert,method,ncols,names,testnames), and the columns of
+       the tables must be int64, uint64, float64, or bool.
+    */
+    proc in1dMultiMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (flag, method, ncolsStr, rest) = payload.splitMsgToTuple(4);
+        const ncols = ncolsStr:int;
+        var names = rest.split();
+        if flag != "True" && flag != "False" {
+            var errorMsg = "Error: %s: %s".format(pn,flag);
+            iLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if !isIn1dMethod(method) {
+            var errorMsg = incompatibleArgumentsError(pn, "Unknown in1d method %s".format(method));
+            iLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if ncols < 1 || names.size != 2 * ncols {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i columns per table but got %i".format(ncols, names.size));
+            iLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const names1 = names[0..#ncols], names2 = names[ncols..#ncols];
+        const h1 = keyHashes(names1, getGenericTypedArrayEntry(names1[names1.domain.low], st).size, st);
+        const h2 = keyHashes(names2, getGenericTypedArrayEntry(names2[names2.domain.low], st).size, st);
+        var truth = in1d(h1, h2, flag == "True", method);
+
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(truth));
+        var repMsg = "created " + st.attrib(rname);
+        iLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    private proc isIn1dMethod(method: string): bool {
+        return method == "auto" || method == "hash" || method == "sort" || method == "bloom";
     }
 
     proc registerMe() {
       use CommandMap;
       registerFunction("in1d", in1dMsg, getModuleName());
+      registerFunction("in1dMulti", in1dMultiMsg, getModuleName());
     }
 }
@@ -103,7 +103,7 @@ module IndexingMsg
             }
             var repMsg = "created " + st.attrib(rname);
             imLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-            return new MsgTuple(repMsg, MsgType.NORMAL);
+            return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
         }
         
         select(gEnt.dtype) {
@@ -152,7 +152,7 @@ module IndexingMsg
                 var a = st.addEntry(rname, 0, XType);
                 var repMsg = "created " + st.attrib(rname);
                 imLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-                return new MsgTuple(repMsg, MsgType.NORMAL);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
             }
             var ivMin = min reduce iv.a;
             var ivMax = max reduce iv.a;
@@ -188,7 +188,7 @@ module IndexingMsg
                 var a = st.addEntry(rname, 0, XType);
                 var repMsg = "created " + st.attrib(rname);
                 imLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-                return new MsgTuple(repMsg, MsgType.NORMAL);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
             }
             var ivMin = min reduce iv.a;
             var ivMax = max reduce iv.a;
@@ -224,7 +224,7 @@ module IndexingMsg
                 var a = st.addEntry(rname, 0, XType);
                 var repMsg = "created " + st.attrib(rname);
                 imLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-                return new MsgTuple(repMsg, MsgType.NORMAL);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
             }
             // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
             overMemLimit(numBytes(int) * truth.size);
@@ -247,7 +247,7 @@ module IndexingMsg
 
             var repMsg = "created " + st.attrib(rname);
             imLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg); 
-            return new MsgTuple(repMsg, MsgType.NORMAL);
+            return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
         }
         
         select(gX.dtype, gIV.dtype) {
@@ -309,6 +309,7 @@ module IndexingMsg
                                "%s %s %i %s %s".format(cmd, name, idx, dtype2str(dtype), value));
 
         var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        gEnt.modified();
 
         select (gEnt.dtype, dtype) {
              when (DType.Int64, DType.Int64) {
@@ -423,6 +424,7 @@ module IndexingMsg
         var dtype = str2dtype(dtypeStr);
 
         var gX: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        gX.modified();
         var gIV: borrowed GenSymEntry = getGenericTypedArrayEntry(iname, st);
         
         imLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
@@ -576,6 +578,7 @@ module IndexingMsg
         var (name, iname, yname) = payload.splitMsgToTuple(3);
 
         var gX: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        gX.modified();
         var gIV: borrowed GenSymEntry = getGenericTypedArrayEntry(iname, st);
         var gY: borrowed GenSymEntry = getGenericTypedArrayEntry(yname, st);
         
@@ -766,6 +769,7 @@ module IndexingMsg
                                   dtype2str(dtype), value));
         
         var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        gEnt.modified();
 
         select (gEnt.dtype, dtype) {
             when (DType.Int64, DType.Int64) {
@@ -894,6 +898,7 @@ module IndexingMsg
                         "%s %s %i %i %i %s".format(cmd, name, start, stop, stride, yname));
 
         var gX: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        gX.modified();
         var gY: borrowed GenSymEntry = getGenericTypedArrayEntry(yname, st);
 
         // add check to make syre IV and Y are same size
@@ -0,0 +1,260 @@
+/* equi-joins
+ finds the pairs of rows of two tables whose keys are equal, for inner, left,
+ right and outer joins. each row is reduced to a 128-bit hash of its key
+ columns, so that keys of any number of columns are joined as one.
+
+ a hash join copies the rows of the smaller table, looked up by hash, to every
+ locale, where the rows of the larger table find their matches without being
+ moved. a sort-merge join sorts the hashes of both tables together, so that
+ the rows with the same key are next to each other, and pairs the left and
+ right rows of each run of equal keys.
+ */
+module Join
+{
+    use ServerConfig;
+
+    use Map;
+    use Sort;
+    use PrivateDist;
+    use CommAggregation;
+    use SymArrayDmap;
+    use RadixSortLSD;
+    use SipHash;
+    use Reflection;
+    use Logging;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const jLogger = new Logger(logLevel);
+
+    /*
+    Largest number of rows of the smaller table for which method 'auto'
+    chooses a hash join, since every locale holds a copy of them
+    */
+    config const hashJoinMaxRows = 2**22;
+
+    /*
+    Folds the key column col into the hashes of the rows
+    */
+    proc hashColumn(ref hashes: [?D] 2*uint, const ref col: [D] ?t) {
+        forall (h, x) in zip(hashes, col) {
+            // sipHash128 of a value hashes its first 8 bytes
+            const hx = if t == bool then sipHash128(x:int) else sipHash128(x);
+            h = (sipHash128(h(0) ^ hx(0))(0), sipHash128(h(1) ^ hx(1))(1));
+        }
+    }
+
+    /*
+    Whether the unmatched rows of the left (or right) table are kept
+    */
+    inline proc keepsUnmatched(how: string, param left: bool): bool {
+        return how == "outer" || how == (if left then "left" else "right");
+    }
+
+    /*
+    Joins the rows of two tables by sorting their hashes together. The sort is
+    stable and the left rows come first, so in each run of equal hashes the
+    left rows, in order, are followed by the right rows, in order.
+
+    :arg lh: hash of the key of each left row
+    :arg rh: hash of the key of each right row
+    :arg how: one of inner, left, right, outer
+
+    :returns: ([] int, [] int) the left and right row of each pair, -1 for
+              the missing row of an unmatched row
+    */
+    proc sortMergeJoin(const ref lh: [?lD] 2*uint, const ref rh: [?rD] 2*uint, how: string) throws {
+        const nl = lD.size, nr = rD.size, n = nl + nr;
+        var hashes = makeDistArray(n, 2*uint);
+        hashes[0..#nl] = lh;
+        hashes[nl..#nr] = rh;
+        const perm = radixSortLSD_ranks(hashes);
+
+        // hashes in sorted order
+        var h0 = makeDistArray(n, uint);
+        var h1 = makeDistArray(n, uint);
+        {
+            const hs0 = [h in hashes] h(0), hs1 = [h in hashes] h(1);
+            forall (a, b, p) in zip(h0, h1, perm) with (var agg0 = newSrcAggregator(uint),
+                                                       var agg1 = newSrcAggregator(uint)) {
+                agg0.copy(a, hs0[p]);
+                agg1.copy(b, hs1[p]);
+            }
+        }
+
+        // runs of equal hashes
+        const isStart = [i in h0.domain] i == 0 || h0[i] != h0[i-1] || h1[i] != h1[i-1];
+        const runOf = (+ scan isStart) - 1;
+        const nruns = if n == 0 then 0 else runOf[n-1] + 1;
+        var runStarts = makeDistArray(nruns, int);
+        forall (s, i) in zip(isStart, isStart.domain) with (var agg = newDstAggregator(int)) {
+            if s then agg.copy(runStarts[runOf[i]], i);
+        }
+        // number of left rows up to each sorted row
+        const leftUpTo = + scan ([p in perm] p < nl);
+
+        // number of pairs of each run
+        var nLeft = makeDistArray(nruns, int);
+        var nRight = makeDistArray(nruns, int);
+        var nPairs = makeDistArray(nruns, int);
+        forall (r, s, lc, rc, c) in zip(runStarts.domain, runStarts, nLeft, nRight, nPairs) {
+            const e = if r == nruns - 1 then n else runStarts[r+1];
+            lc = leftUpTo[e-1] - (if s == 0 then 0 else leftUpTo[s-1]);
+            rc = e - s - lc;
+            if lc > 0 && rc > 0 {
+                c = lc * rc;
+            } else if rc == 0 {
+                c = if keepsUnmatched(how, true) then lc else 0;
+            } else {
+                c = if keepsUnmatched(how, false) then rc else 0;
+            }
+        }
+        const pairStarts = (+ scan nPairs) - nPairs;
+        const npairs = + reduce nPairs;
+
+        var li = makeDistArray(npairs, int);
+        var ri = makeDistArray(npairs, int);
+        forall (s, lc, rc, c, o) in zip(runStarts, nLeft, nRight, nPairs, pairStarts)
+                with (var lagg = newDstAggregator(int), var ragg = newDstAggregator(int)) {
+            if c > 0 {
+                if lc > 0 && rc > 0 {
+                    for a in 0..#lc {
+                        const l = perm[s + a];
+                        for b in 0..#rc {
+                            lagg.copy(li[o + a * rc + b], l);
+                            ragg.copy(ri[o + a * rc + b], perm[s + lc + b] - nl);
+                        }
+                    }
+                } else {
+                    for a in 0..#c {
+                        const p = perm[s + a];
+                        lagg.copy(li[o + a], if lc > 0 then p else -1);
+                        ragg.copy(ri[o + a], if lc > 0 then -1 else p - nl);
+                    }
+                }
+            }
+        }
+        jLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "sort-merge join of %i and %i rows found %i pairs".format(nl, nr, npairs));
+        return (li, ri);
+    }
+
+    /*
+    Joins the rows of a probe table with the rows of a smaller build table.
+    The build rows, sorted by hash, are copied to every locale along with a
+    map from each hash to its first sorted build row; every probe row then
+    counts and writes its pairs where it is.
+
+    :arg ph: hash of the key of each probe row
+    :arg bh: hash of the key of each build row
+    :arg keepProbe: whether the unmatched probe rows are kept
+    :arg keepBuild: whether the unmatched build rows are kept
+
+    :returns: ([] int, [] int) the probe and build row of each pair, -1 for
+              the missing row of an unmatched row
+    */
+    proc hashJoin(const ref ph: [?pD] 2*uint, const ref bh: [?bD] 2*uint,
+                  keepProbe: bool, keepBuild: bool) throws {
+        const nb = bD.size;
+        overMemLimit(numLocales * nb * (numBytes(int) * 5));
+        var build: [0..#nb] (2*uint, int);
+        forall (b, h, i) in zip(build, bh, bD) do b = (h, i);
+        sort(build);
+
+        var counts = makeDistArray(pD.size, int);
+        var matched: [PrivateSpace] [0..#nb] bool;
+        coforall loc in Locales with (ref counts) do on loc {
+            const myBuild = build;
+            var first: map(2*uint, int);
+            for (j, (h, _)) in zip(0..#nb, myBuild) do first.add(h, j);
+            forall i in counts.localSubdomain() with (ref counts) {
+                var c = 0;
+                if first.contains(ph[i]) {
+                    var j = first[ph[i]];
+                    // the map keeps the first row of each hash
+                    while j < nb && myBuild[j](0) == ph[i] {
+                        c += 1;
+                        j += 1;
+                    }
+                }
+                counts[i] = if c == 0 && keepProbe then 1 else c;
+            }
+        }
+        const starts = (+ scan counts) - counts;
+        const nProbePairs = + reduce counts;
+
+        var probeIdx = makeDistArray(nProbePairs, int);
+        var buildIdx = makeDistArray(nProbePairs, int);
+        coforall loc in Locales with (ref probeIdx, ref buildIdx, ref matched) do on loc {
+            const myBuild = build;
+            var first: map(2*uint, int);
+            for (j, (h, _)) in zip(0..#nb, myBuild) do first.add(h, j);
+            ref myMatched = matched[here.id];
+            forall i in counts.localSubdomain() with (ref myMatched,
+                                                      var pagg = newDstAggregator(int),
+                                                      var bagg = newDstAggregator(int)) {
+                var o = starts[i];
+                if first.contains(ph[i]) {
+                    var j = first[ph[i]];
+                    while j < nb && myBuild[j](0) == ph[i] {
+                        pagg.copy(probeIdx[o], i);
+                        bagg.copy(buildIdx[o], myBuild[j](1));
+                        myMatched[myBuild[j](1)] = true;
+                        o += 1;
+                        j += 1;
+                    }
+                } else if keepProbe {
+                    pagg.copy(probeIdx[o], i);
+                    bagg.copy(buildIdx[o], -1);
+                }
+            }
+        }
+        if !keepBuild {
+            return (probeIdx, buildIdx);
+        }
+
+        // then the unmatched build rows
+        var anyMatched: [0..#nb] bool;
+        forall j in 0..#nb with (ref anyMatched) {
+            for l in PrivateSpace do anyMatched[j] |= matched[l][j];
+        }
+        const unmatched = [m in anyMatched] (!m):int;
+        const restStarts = (+ scan unmatched) - unmatched;
+        const nRest = + reduce unmatched;
+        var allProbe = makeDistArray(nProbePairs + nRest, int);
+        var allBuild = makeDistArray(nProbePairs + nRest, int);
+        allProbe[0..#nProbePairs] = probeIdx;
+        allBuild[0..#nProbePairs] = buildIdx;
+        forall j in 0..#nb with (var pagg = newDstAggregator(int),
+                                 var bagg = newDstAggregator(int)) {
+            if unmatched[j] == 1 {
+                pagg.copy(allProbe[nProbePairs + restStarts[j]], -1);
+                bagg.copy(allBuild[nProbePairs + restStarts[j]], j);
+            }
+        }
+        return (allProbe, allBuild);
+    }
+
+    /*
+    Joins the rows of two tables, by a hash join if method is 'hash', by a
+    sort-merge join if it is 'sort', and if it is 'auto' by a hash join if the
+    smaller table has at most hashJoinMaxRows rows
+
+    :returns: ([] int, [] int) the left and right row of each pair, -1 for
+              the missing row of an unmatched row
+    */
+    proc join(const ref lh: [?lD] 2*uint, const ref rh: [?rD] 2*uint, how: string, method: string) throws {
+        const useHash = method == "hash" ||
+                        (method == "auto" && min(lD.size, rD.size) <= hashJoinMaxRows);
+        if !useHash {
+            return sortMergeJoin(lh, rh, how);
+        }
+        jLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "hash join of %i and %i rows".format(lD.size, rD.size));
+        if rD.size <= lD.size {
+            return hashJoin(lh, rh, keepsUnmatched(how, true), keepsUnmatched(how, false));
+        } else {
+            const (ri, li) = hashJoin(rh, lh, keepsUnmatched(how, false), keepsUnmatched(how, true));
+            return (li, ri);
+        }
+    }
+}
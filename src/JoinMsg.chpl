@@ -0,0 +1,106 @@
+module JoinMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use SymArrayDmap;
+
+    use Join;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const jmLogger = new Logger(logLevel);
+
+    /*
+    Hashes of the rows of the named key columns, which must have size n
+    */
+    proc keyHashes(names, n: int, st: borrowed SymTab) throws {
+        var hashes = makeDistArray(n, 2*uint);
+        for name in names {
+            var g = getGenericTypedArrayEntry(name, st);
+            if g.size != n {
+                throw getErrorWithContext(
+                          msg=incompatibleArgumentsError(getRoutineName(),
+                              "Expected key column of size %i, got size %i".format(n, g.size)),
+                          lineNumber=getLineNumber(),
+                          routineName=getRoutineName(),
+                          moduleName=getModuleName(),
+                          errorClass="ArgumentError");
+            }
+            select g.dtype {
+                when DType.Int64 { hashColumn(hashes, toSymEntry(g, int).a); }
+                when DType.UInt64 { hashColumn(hashes, toSymEntry(g, uint).a); }
+                when DType.Float64 { hashColumn(hashes, toSymEntry(g, real).a); }
+                when DType.Bool { hashColumn(hashes, toSymEntry(g, bool).a); }
+                otherwise {
+                    throw getErrorWithContext(
+                              msg=notImplementedError(getRoutineName(), dtype2str(g.dtype)),
+                              lineNumber=getLineNumber(),
+                              routineName=getRoutineName(),
+                              moduleName=getModuleName(),
+                              errorClass="TypeError");
+                }
+            }
+        }
+        return hashes;
+    }
+
+    /*
+    Joins two tables on equal keys.
+
+    :arg reqMsg: request containing (cmd,how,method,nkeys,leftnames,rightnames)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the left and right row index of each pair, -1 for
+              the missing row of an unmatched row
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc joinMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (how, method, nkeysStr, rest) = payload.splitMsgToTuple(4);
+        const nkeys = nkeysStr:int;
+        var names = rest.split();
+        if nkeys < 1 || names.size != 2 * nkeys {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i key columns per table but got %i".format(nkeys, names.size));
+            jmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if how != "inner" && how != "left" && how != "right" && how != "outer" {
+            var errorMsg = incompatibleArgumentsError(pn, "Unknown join %s".format(how));
+            jmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if method != "auto" && method != "hash" && method != "sort" {
+            var errorMsg = incompatibleArgumentsError(pn, "Unknown join method %s".format(method));
+            jmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const lnames = names[0..#nkeys], rnames = names[nkeys..#nkeys];
+        const lh = keyHashes(lnames, getGenericTypedArrayEntry(lnames[lnames.domain.low], st).size, st);
+        const rh = keyHashes(rnames, getGenericTypedArrayEntry(rnames[rnames.domain.low], st).size, st);
+        var (li, ri) = join(lh, rh, how, method);
+
+        var lname = st.nextName();
+        st.addEntry(lname, new shared SymEntry(li));
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(ri));
+        var repMsg = "created " + st.attrib(lname) + " +created " + st.attrib(rname);
+        jmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    proc registerMe() {
+        use CommandMap;
+        registerFunction("join", joinMsg, getModuleName());
+    }
+}
@@ -59,7 +59,7 @@ module KExtremeMsg
 
                 repMsg = "created " + st.attrib(vname);
                 keLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                return new MsgTuple(repMsg, MsgType.NORMAL);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
             }
             when (DType.Float64) {
                 if !stringtobool(returnIndices) {
@@ -69,7 +69,7 @@ module KExtremeMsg
 
                     repMsg = "created " + st.attrib(vname);
                     keLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                    return new MsgTuple(repMsg, MsgType.NORMAL);
+                    return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
                 } else {
                     var e = toSymEntry(gEnt,real);
                     var aV = computeExtremaIndices(e.a, k:int);
@@ -77,7 +77,7 @@ module KExtremeMsg
 
                     repMsg = "created " + st.attrib(vname);
                     keLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                    return new MsgTuple(repMsg, MsgType.NORMAL);
+                    return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
                 }
             }
             otherwise {
@@ -119,7 +119,7 @@ module KExtremeMsg
 
                 repMsg = "created " + st.attrib(vname);
                 keLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                return new MsgTuple(repMsg, MsgType.NORMAL);
+                return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
            }
            when (DType.Float64) {
                if !stringtobool(returnIndices) {
@@ -130,7 +130,7 @@ module KExtremeMsg
 
                    repMsg = "created " + st.attrib(vname);
                    keLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                   return new MsgTuple(repMsg, MsgType.NORMAL);
+                   return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
                } else {
                    var e = toSymEntry(gEnt,real);
                    var aV = computeExtremaIndices(e.a, k:int, false);
@@ -139,7 +139,7 @@ module KExtremeMsg
 
                    repMsg = "created " + st.attrib(vname);
                    keLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-                   return new MsgTuple(repMsg, MsgType.NORMAL);
+                   return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(vname));
                
                }
            }
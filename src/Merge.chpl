@@ -5,6 +5,8 @@ module Merge {
   use Reflection;
   use ServerConfig;
   use Logging;
+  use SymArrayDmap;
+  use CommAggregation;
   
   private config const logLevel = ServerConfig.logLevel;
   const mLogger = new Logger(logLevel);
@@ -163,5 +165,77 @@ module Merge {
     return (perm, segs, vals);
   }
 
-  
+  /* Amount by which each row of a grouping moves when its groups are moved:
+   * the row at position i of group g moves to starts[first+g] + i - segs[g].
+   * Groups are never empty, so the shift is scattered to the first row of
+   * each group and spread over the rest of the group by a scan.
+   */
+  private proc rowShift(const ref segs: [?sD] int, const ref starts: [] int, first: int, n: int) throws {
+    var delta = makeDistArray(n, int);
+    forall (g, s) in zip(sD, segs) with (ref delta, var agg = newDstAggregator(int)) {
+      const prev = if g == sD.low then 0 else starts[first+g-1] - segs[g-1];
+      agg.copy(delta[s], starts[first+g] - s - prev);
+    }
+    return + scan delta;
+  }
+
+  /* Merges the grouping of n rows with the grouping of m rows appended after
+   * them, without sorting the rows again. The unique keys of the old and new
+   * groupings, concatenated in that order, are grouped by (uperm, useg): since
+   * that grouping is stable, each merged group is the old group of its key, if
+   * any, followed by the new group of its key, if any.
+   *
+   * :arg oldPerm: permutation of the old grouping
+   * :arg oldSegs: segments of the old grouping
+   * :arg newPerm: permutation of the new grouping, relative to the new rows
+   * :arg newSegs: segments of the new grouping
+   * :arg uperm: permutation grouping the old and then the new unique keys
+   * :arg useg: segments of the grouping of the unique keys
+   *
+   * :returns: (perm, segs) the permutation and segments of the n+m rows
+   */
+  proc mergeGroupings(const ref oldPerm: [?oD] int, const ref oldSegs: [?osD] int,
+                      const ref newPerm: [?nD] int, const ref newSegs: [?nsD] int,
+                      const ref uperm: [?uD] int, const ref useg: [?usD] int) throws {
+    const n = oD.size, m = nD.size, nOld = osD.size, nNew = nsD.size;
+    // number of rows of each old and then each new group
+    var sizes = makeDistArray(uD.size, int);
+    forall u in uD with (ref sizes) {
+      if u < nOld {
+        const hi = if u == nOld-1 then n else oldSegs[u+1];
+        sizes[u] = hi - oldSegs[u];
+      } else {
+        const g = u - nOld;
+        const hi = if g == nNew-1 then m else newSegs[g+1];
+        sizes[u] = hi - newSegs[g];
+      }
+    }
+    // the groups follow each other in the order of their keys
+    var sortedSizes = makeDistArray(uD.size, int);
+    forall (s, u) in zip(sortedSizes, uperm) with (var agg = newSrcAggregator(int)) {
+      agg.copy(s, sizes[u]);
+    }
+    const sortedStarts = (+ scan sortedSizes) - sortedSizes;
+    var starts = makeDistArray(uD.size, int);
+    forall (u, s) in zip(uperm, sortedStarts) with (ref starts, var agg = newDstAggregator(int)) {
+      agg.copy(starts[u], s);
+    }
+    var segs = makeDistArray(usD.size, int);
+    forall (s, p) in zip(segs, useg) with (var agg = newSrcAggregator(int)) {
+      agg.copy(s, sortedStarts[p]);
+    }
+
+    var perm = makeDistArray(n + m, int);
+    const oldShift = rowShift(oldSegs, starts, 0, n);
+    forall (i, p, s) in zip(oD, oldPerm, oldShift) with (ref perm, var agg = newDstAggregator(int)) {
+      agg.copy(perm[i+s], p);
+    }
+    const newShift = rowShift(newSegs, starts, nOld, m);
+    forall (i, p, s) in zip(nD, newPerm, newShift) with (ref perm, var agg = newDstAggregator(int)) {
+      agg.copy(perm[i+s], p + n);
+    }
+    mLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                  "merged %i and %i rows into %i groups".format(n, m, segs.size));
+    return (perm, segs);
+  }
 }
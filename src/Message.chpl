@@ -1,6 +1,7 @@
 module Message {
     use IO;
     use FileIO;
+    use CTypes;
     use Reflection;
     use ServerErrors;
 
@@ -13,6 +14,12 @@ module Message {
     record MsgTuple {
         var msg: string;
         var msgType: MsgType;    
+        /*
+         * Binary-encoded descriptors of the entries the reply creates, set
+         * by handlers whose reply is made of "created" parts only, see
+         * serializeBinary
+         */
+        var created: bytes;
     }
 
     /*
@@ -68,6 +75,67 @@ module Message {
                                                         msgFormat=msgFormat, user=user));
    }
 
+    /*
+     * Indicates if the format field of a request asks for a binary-encoded
+     * reply. Clients that negotiated binary replies on connect append
+     * "/BINARY" to the format of the request payload, e.g. "STRING/BINARY".
+     */
+    proc requestsBinaryReply(format: string): bool {
+        return format.endsWith("/BINARY");
+    }
+
+    /*
+     * Generates a binary-encoded reply message, the alternative to the JSON
+     * ReplyMsg for clients that negotiated binary replies. All integers are
+     * little-endian. The layout is
+     *
+     *   msgType: uint8 (0 NORMAL, 1 WARNING, 2 ERROR)
+     *   numEntries: uint16
+     *   numEntries created-entry descriptors, each
+     *     part: uint16, the index of the descriptor among the "+"-delimited parts of the reply
+     *     nameLen: uint16, name: nameLen bytes
+     *     dtypeLen: uint8, dtype: dtypeLen bytes
+     *     size: int64, ndim: uint8, shape: ndim int64, itemsize: int64
+     *   msg: the remaining bytes, UTF-8
+     *
+     * created holds numEntries and the descriptors produced by the command
+     * handler, see createdDescriptors. A reply with descriptors is made of
+     * "created" parts only and is sent without msg, which the client
+     * rebuilds from the descriptors if needed.
+     */
+    proc serializeBinary(msg: string, msgType: MsgType, created: bytes): bytes throws {
+        const msgTypeCode = if msgType == MsgType.NORMAL then 0
+                            else if msgType == MsgType.WARNING then 1
+                            else 2;
+        if created.isEmpty() {
+            return packInt(msgTypeCode, 1) + packInt(0, 2) + msg:bytes;
+        }
+        return packInt(msgTypeCode, 1) + created;
+    }
+
+    /*
+     * Encodes numEntries and the descriptors of created entries, given as
+     * (name, dtype, size, shape, itemsize) tuples, for serializeBinary
+     */
+    proc createdDescriptors(entries): bytes throws {
+        var encoded = packInt(entries.size, 2);
+        for ((name, dtype, size, shape, itemsize), part) in zip(entries, 0..) {
+            encoded += packInt(part, 2) +
+                       packInt(name.numBytes, 2) + name:bytes +
+                       packInt(dtype.numBytes, 1) + dtype:bytes +
+                       packInt(size, 8) + packInt(shape.size, 1);
+            for dim in shape do encoded += packInt(dim, 8);
+            encoded += packInt(itemsize, 8);
+        }
+        return encoded;
+    }
+
+    private proc packInt(x: int, nbytes: int): bytes throws {
+        var buf: [0..#nbytes] uint(8);
+        for i in 0..#nbytes do buf[i] = ((x >> (8*i)) & 0xff):uint(8);
+        return createBytesWithNewBuffer(c_ptrTo(buf[0]), nbytes);
+    }
+
     /*
      * Converts the JSON array to a pdarray
      */
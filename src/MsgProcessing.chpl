@@ -13,8 +13,10 @@ module MsgProcessing
     use MultiTypeSymbolTable;
     use MultiTypeSymEntry;
     use ServerErrorStrings;
+    use GroupingCache;
 
     use AryUtil;
+    use Map;
     
     private config const logLevel = ServerConfig.logLevel;
     const mpLogger = new Logger(logLevel);
@@ -56,13 +58,16 @@ module MsgProcessing
 
         repMsg = "created " + st.attrib(rname);
         mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), repMsg);                                 
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
 
     /* 
-    Parse, execute, and respond to a delete message 
+    Parse, execute, and respond to a delete message. The request either names
+    a single entry or, for deletions deferred by the client, holds the number
+    of entries followed by a JSON list of their names; unknown names in the
+    list are skipped.
 
-    :arg reqMsg: request containing (cmd,name)
+    :arg reqMsg: request containing (cmd,name) or (cmd,numNames,jsonNames)
     :type reqMsg: string 
 
     :arg st: SymTab to act on
@@ -72,6 +77,18 @@ module MsgProcessing
     */
     proc deleteMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
         var repMsg: string; // response message
+        const fields = payload.split(" ", 1);
+        if fields.size == 2 && fields[1].startsWith("[") {
+            var numNames = -1;
+            try { numNames = fields[0]:int; } catch { }
+            if numNames >= 0 {
+                var names = jsonToPdArray(fields[1], numNames);
+                var numDeleted = st.deleteEntry(names);
+                repMsg = "deleted %i of %i".format(numDeleted, numNames);
+                mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+                return new MsgTuple(repMsg, MsgType.NORMAL);
+            }
+        }
         // split request into fields
         var (name) = payload.splitMsgToTuple(1);
         mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), 
@@ -103,6 +120,8 @@ module MsgProcessing
         var (_) = payload.splitMsgToTuple(1); // split request into fields
         mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), "cmd: %s".format(cmd));
         st.clear();
+        // also free the arrays held by the cached groupings
+        groupingCache.clear();
 
         repMsg = "success";
         mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), repMsg);
@@ -204,6 +223,114 @@ module MsgProcessing
         }
     }
 
+    /*
+    Prefix of the client-assigned placeholder names that refer to the results
+    of earlier commands within the same batch
+    */
+    private const batchPlaceholderPrefix = "__batch_";
+
+    /*
+    Commands that are intercepted by the server loop and therefore cannot be
+    executed from within a batch
+    */
+    private proc isBatchable(cmd: string): bool {
+        select cmd {
+            when "array", "arrayChunk", "connect", "disconnect", "noop", "ruok", "shutdown", "batch" {
+                return false;
+            }
+            otherwise {
+                return true;
+            }
+        }
+    }
+
+    /*
+    Parse, execute, and respond to a batch message, which encapsulates 1..n
+    string commands executed in order. Each command is tagged with a placeholder
+    name; if the command creates an entry, later commands in the batch may refer
+    to the entry by the placeholder, which is resolved to the server-side name
+    before the command executes. Processing stops at the first command that
+    returns an error.
+
+    :arg payload: request containing (numCmds, jsonCmds) where jsonCmds is a JSON
+                  list of (placeholder, cmd, args) triples flattened into 3*numCmds strings
+    :type payload: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list of serialized replies, one per executed command
+    */
+    proc batchMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        import CommandMap;
+        var (numCmdsStr, jsonCmds) = payload.splitMsgToTuple(2);
+        var numCmds = try! numCmdsStr:int;
+        var cmds = jsonToPdArray(jsonCmds, 3*numCmds);
+
+        mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                   "cmd: %s numCmds: %i".format(cmd, numCmds));
+
+        // placeholder -> name of the entry created by the corresponding command
+        var resolved = new map(string, string);
+        var replies: [0..#numCmds] string;
+        var numReplies = 0;
+
+        for i in 0..#numCmds {
+            const placeholder = cmds[3*i];
+            const subCmd = cmds[3*i+1];
+            var subArgs = cmds[3*i+2];
+
+            if subArgs.find(batchPlaceholderPrefix) != -1 {
+                for p in resolved.keys() {
+                    subArgs = subArgs.replace(p, resolved[p]);
+                }
+            }
+
+            var repTuple: MsgTuple;
+            try {
+                if !isBatchable(subCmd) || !CommandMap.commandMap.contains(subCmd) {
+                    repTuple = new MsgTuple("Unrecognized batch command: %s".format(subCmd),
+                                            MsgType.ERROR);
+                } else {
+                    if CommandMap.moduleMap.contains(subCmd) then
+                      CommandMap.usedModules.add(CommandMap.moduleMap[subCmd]);
+                    repTuple = CommandMap.commandMap.getBorrowed(subCmd)(subCmd, subArgs, st);
+                }
+            } catch e: ErrorWithMsg {
+                repTuple = new MsgTuple(e.msg, MsgType.ERROR);
+            } catch e: Error {
+                var errorMsg = e.message();
+                if errorMsg.isEmpty() {
+                    errorMsg = "unexpected error";
+                }
+                repTuple = new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+
+            replies[i] = serialize(msg=repTuple.msg, msgType=repTuple.msgType,
+                                   msgFormat=MsgFormat.STRING, user="");
+            numReplies += 1;
+
+            if repTuple.msgType == MsgType.ERROR {
+                mpLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
+                               "batch command %i (%s) failed: %s".format(i, subCmd, repTuple.msg));
+                break;
+            }
+            if repTuple.msg.startsWith("created ") {
+                var (_, name, _) = repTuple.msg.splitMsgToTuple(3);
+                resolved.addOrSet(placeholder, name);
+            }
+        }
+
+        // Map/list JSON formatting is broken in Chpl version 1.24, create manually
+        var repMsg = "[";
+        for i in 0..#numReplies {
+            if i > 0 then repMsg += ",";
+            repMsg += "%jt".format(replies[i]);
+        }
+        repMsg += "]";
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     /* 
     Response to __str__ method in python str convert array data to string 
 
@@ -270,6 +397,7 @@ module MsgProcessing
         var dtype = str2dtype(dtypestr);
 
         var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        gEnt.modified();
 
         mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
                             "cmd: %s value: %s in pdarray %s".format(cmd,name,st.attrib(name)));
@@ -14,6 +14,9 @@ module MultiTypeSymEntry
     private config const logLevel = ServerConfig.logLevel;
     const genLogger = new Logger(logLevel);
 
+    /* Source of the generations of the entries */
+    private var generations: atomic int;
+
     /**
      * Internal Types we can use to build our Symbol type hierarchy.
      * We are making the types a little more concrete than using Strings
@@ -47,6 +50,10 @@ module MultiTypeSymEntry
     class AbstractSymEntry {
         var entryType:SymbolEntryType;
         var assignableTypes:set(SymbolEntryType); // All subclasses should add their type to this set
+        // Unique to the entry and to the current values of its data, so that
+        // results derived from the data (e.g., cached groupings) can be reused
+        // only while it is unchanged
+        var generation: int = generations.fetchAdd(1);
         proc init() {
             this.entryType = SymbolEntryType.AbstractSymEntry;
             this.assignableTypes = new set(SymbolEntryType);
@@ -61,6 +68,14 @@ module MultiTypeSymEntry
             return assignableTypes.contains(entryType);
         }
 
+        /**
+         * Gives the entry a new generation. Must be called by every command
+         * that modifies the data of an existing entry in place.
+         */
+        proc modified() {
+            generation = generations.fetchAdd(1);
+        }
+
         /**
          * This is a hook for the ServerConfig.overMemLimit procedure
          * All concrete classes should override this method
@@ -116,6 +131,11 @@ module MultiTypeSymEntry
         var size: int = 0; // answer to numpy size == num elts
         var ndim: int = 1; // answer to numpy ndim == 1-axis for now
         var shape: 1*int = (0,); // answer to numpy shape == 1*int tuple
+        // The generations at which the data was known to be sorted (in
+        // ascending order) and to have no duplicates, so that both are
+        // forgotten as soon as the data is modified.
+        var sortedGeneration: int = -1;
+        var uniqueGeneration: int = -1;
         
         // not sure yet how to implement numpy data() function
 
@@ -132,6 +152,32 @@ module MultiTypeSymEntry
             return this.size * this.itemsize;
         }
 
+        /* Whether the data is known to be sorted in ascending order
+
+           Only arrays produced by the server (e.g. by sorting or ``arange``)
+           are flagged; arrays read from HDF5 or Parquet files are not, since
+           the files don't record the property.
+         */
+        proc isSorted(): bool {
+            return sortedGeneration == generation;
+        }
+
+        /* Whether the data is known to have no duplicates */
+        proc isUnique(): bool {
+            return uniqueGeneration == generation;
+        }
+
+        /* Records that the data is sorted and, if unique, has no duplicates */
+        proc setSorted(unique: bool = false) {
+            sortedGeneration = generation;
+            if unique then uniqueGeneration = generation;
+        }
+
+        /* Records that the data has no duplicates */
+        proc setUnique() {
+            uniqueGeneration = generation;
+        }
+
         /* Cast this `GenSymEntry` to `borrowed SymEntry(etype)`
 
            This function will halt if the cast fails.
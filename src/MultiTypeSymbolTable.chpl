@@ -8,7 +8,9 @@ module MultiTypeSymbolTable
     use Logging;
     
     use MultiTypeSymEntry;
+    use Message;
     use Map;
+    use List;
     use IO;
     
     private config const logLevel = ServerConfig.logLevel;
@@ -23,22 +25,45 @@ module MultiTypeSymbolTable
         var registry: domain(string);
 
         /*
-          Map indexed by strings
+          Map indexed by strings, safe to access from the concurrently running
+          requests of the server's worker tasks
         */
-        var tab: map(string, shared AbstractSymEntry);
+        var tab: map(string, shared AbstractSymEntry, parSafe=true);
+
+        /*
+          Held by operations that check and then modify the registry or several
+          entries of tab, so that they are atomic with respect to each other
+        */
+        var tableLock: sync bool = true;
+
+        /*
+          Commands hold borrows of the entries they look up until they
+          complete, so entries removed from tab are not freed right away.
+          Each removed entry is kept with the epoch at which it was removed
+          and freed once every command that was running at that time has
+          completed. Commands announce themselves with beginCommand and
+          endCommand, and retireLock guards retired and the running commands.
+        */
+        var epoch: atomic int;
+        var retired: list((int, shared AbstractSymEntry));
+        var runningCommands: domain(int);
+        var startEpochs: [runningCommands] int;
+        var nextCommandId = 0;
+        var retireLock: sync bool = true;
 
         var serverid = "id_" + generateToken(8) + "_";
-        var nid = 0;
+        var nid: atomic int;
 
         /*
         Gives out symbol names.
         */
         proc nextName():string {
-            nid += 1;
-            return serverid + nid:string;
+            return serverid + (nid.fetchAdd(1) + 1):string;
         }
 
         proc regName(name: string, userDefinedName: string) throws {
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
             checkTable(name, "regName");
 
             // check to see if userDefinedName is already defined, with in-place modification, this will be an error
@@ -64,10 +89,60 @@ module MultiTypeSymbolTable
             registry += userDefinedName; // add user defined name to registry
 
             // point at same shared table entry
+            if tab.contains(userDefinedName) then retire(tab.getValue(userDefinedName));
             tab.addOrSet(userDefinedName, tab.getAndRemove(name));
         }
 
+        /*
+        Marks the start of a command, whose borrows of entries stay valid
+        until the matching call to endCommand.
+
+        :returns: id of the command to pass to endCommand
+        */
+        proc beginCommand(): int {
+            retireLock.readFE();
+            defer { retireLock.writeEF(true); }
+            const id = nextCommandId;
+            nextCommandId += 1;
+            runningCommands += id;
+            startEpochs[id] = epoch.read();
+            return id;
+        }
+
+        /*
+        Marks the end of a command and frees the removed entries that no
+        running command can still be using.
+
+        :arg id: id returned by beginCommand
+        :type id: int
+        */
+        proc endCommand(id: int) {
+            retireLock.readFE();
+            defer { retireLock.writeEF(true); }
+            runningCommands -= id;
+            var oldest = max(int);
+            for i in runningCommands do oldest = min(oldest, startEpochs[i]);
+            var stillUsed: list((int, shared AbstractSymEntry));
+            for (removedAt, entry) in retired {
+                if removedAt >= oldest then stillUsed.append((removedAt, entry));
+            }
+            // dropping the other references frees their entries
+            retired = stillUsed;
+        }
+
+        /*
+        Keeps an entry removed from tab until the commands running now,
+        which may hold borrows of it, have completed
+        */
+        proc retire(in entry: shared AbstractSymEntry) {
+            retireLock.readFE();
+            defer { retireLock.writeEF(true); }
+            retired.append((epoch.fetchAdd(1), entry));
+        }
+
         proc unregName(name: string) throws {
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
             checkTable(name, "unregName");
             if registry.contains(name) {
                 mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
@@ -109,6 +184,9 @@ module MultiTypeSymbolTable
                                                         "adding symbol: %s ".format(name));            
             }
 
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
+            if tab.contains(name) then retire(tab.getValue(name));
             tab.addOrSet(name, entry);
             // When we retrieve from table, it comes back as AbstractSymEntry so we need to cast it
             // back to the original type. Since we know it already we can skip isAssignableTo check
@@ -144,6 +222,9 @@ module MultiTypeSymbolTable
                                                         "adding symbol: %s ".format(name));            
             }
 
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
+            if tab.contains(name) then retire(tab.getValue(name));
             tab.addOrSet(name, entry);
             return tab.getBorrowed(name);
         }
@@ -188,11 +269,13 @@ module MultiTypeSymbolTable
         :returns: bool indicating whether the deletion occurred
         */
         proc deleteEntry(name: string): bool throws {
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
             checkTable(name, "deleteEntry");
             if !registry.contains(name) {
                 mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
                                        "Deleting unregistered entry: %s".format(name)); 
-                tab.remove(name);
+                retire(tab.getAndRemove(name));
                 return true;
             } else {
                 mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
@@ -201,18 +284,56 @@ module MultiTypeSymbolTable
             }  
         }
 
+        /*
+        Removes the unregistered entries among names from the symTable in one
+        pass. Unlike deleteEntry(name), names that are not in the symTable are
+        skipped rather than raising an error, since the client may defer the
+        deletion of entries that were already removed by clear().
+
+        :arg names: names of the arrays
+        :type names: [] string
+
+        :returns: number of entries deleted
+        */
+        proc deleteEntry(names: [] string): int throws {
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
+            var numDeleted = 0;
+            for name in names {
+                if !tab.contains(name) {
+                    mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                           "Skipping undefined entry: %s".format(name));
+                } else if registry.contains(name) {
+                    mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                           "Skipping registered entry: %s".format(name));
+                } else {
+                    retire(tab.getAndRemove(name));
+                    numDeleted += 1;
+                }
+            }
+            mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                   "Deleted %i of %i entries".format(numDeleted, names.size));
+            return numDeleted;
+        }
+
         /*
         Clears all unregistered entries from the symTable
         */
         proc clear() throws {
             mtLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
                                            "Clearing all unregistered entries"); 
-            for n in tab.keysToArray() { deleteEntry(n); }
+            tableLock.readFE();
+            defer { tableLock.writeEF(true); }
+            for n in tab.keysToArray() {
+                if !registry.contains(n) then retire(tab.getAndRemove(n));
+            }
         }
 
         
         /**
-         * Returns the AbstractSymEntry associated with the provided name, if the AbstractSymEntry exists
+         * Returns the AbstractSymEntry associated with the provided name, if the AbstractSymEntry exists.
+         * The borrow stays valid until the current command completes, even if the entry is deleted
+         * by a concurrent command in the meantime.
          * :arg name: string to index/query in the sym table
          * :type name: string
 
@@ -224,6 +345,20 @@ module MultiTypeSymbolTable
             return tab.getBorrowed(name);
         }
 
+        /**
+         * Returns the shared AbstractSymEntry associated with the provided name, for
+         * callers that keep the entry beyond the lifetime of its name
+         * :arg name: string to index/query in the sym table
+         * :type name: string
+
+         * :returns: shared AbstractSymEntry or throws on error
+         * :throws: `unkownSymbolError(name)`
+         */
+        proc lookupShared(name: string): shared AbstractSymEntry throws {
+            checkTable(name, "lookupShared");
+            return tab.getValue(name);
+        }
+
         /**
          * checks to see if a symbol is defined if it is not it throws an exception 
         */
@@ -393,6 +528,34 @@ module MultiTypeSymbolTable
             throw new Error("attrib - Unsupported Entry Type %s".format(entry.entryType));
         }
 
+        /*
+        Returns the binary-encoded descriptors of the given entries, for
+        handlers whose reply is "created " + attrib(name) for each of names,
+        so that binary replies carry the attributes of the entries.
+
+        :arg names: names of the entries, in the order of the reply parts
+        :type names: string
+
+        :returns: descriptors (bytes) to pass as the created field of MsgTuple
+        */
+        proc descriptors(names: string...): bytes throws {
+            var entries: [0..#names.size] (string, string, int, 1*int, int);
+            for (name, i) in zip(names, 0..) {
+                checkTable(name, "descriptors");
+                var entry = tab.getBorrowed(name);
+                if entry.isAssignableTo(SymbolEntryType.TypedArraySymEntry) {
+                    var g:GenSymEntry = toGenSymEntry(entry);
+                    entries[i] = (name, dtype2str(g.dtype), g.size, g.shape, g.itemsize);
+                } else if entry.isAssignableTo(SymbolEntryType.SegStringSymEntry) {
+                    var g:SegStringSymEntry = toSegStringSymEntry(entry);
+                    entries[i] = (name, dtype2str(g.dtype), g.size, g.shape, g.itemsize);
+                } else {
+                    throw new Error("descriptors - Unsupported Entry Type %s".format(entry.entryType));
+                }
+            }
+            return createdDescriptors(entries);
+        }
+
         /*
         Attempts to find a sym entry mapped to the provided string, then 
         returns the data in the entry up to the specified threshold.
@@ -534,6 +534,7 @@ module OperatorMsg
 
         // retrieve left and right pdarray objects      
         var left: borrowed GenSymEntry = getGenericTypedArrayEntry(aname, st);
+        left.modified();
         var right: borrowed GenSymEntry = getGenericTypedArrayEntry(bname, st);
 
         omLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
@@ -712,6 +713,7 @@ module OperatorMsg
                                                  cmd,op,aname,dtype2str(dtype),value));
 
         var left: borrowed GenSymEntry = getGenericTypedArrayEntry(aname, st);
+        left.modified();
  
         omLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
                          "op: %t pdarray: %t scalar: %t".format(op,st.attrib(aname),value));
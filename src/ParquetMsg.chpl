@@ -12,6 +12,7 @@ module ParquetMsg {
   use NumPyDType;
   use Sort;
   use CommAggregation;
+  use DynamicIters;
 
   use SegmentedArray;
 
@@ -37,8 +38,25 @@ module ParquetMsg {
   extern var ARROWSTRING: c_int;
   extern var ARROWFLOAT: c_int;
   extern var ARROWDOUBLE: c_int;
+  extern var ARROWDICTIONARY: c_int;
+  extern var ARROWTIMESTAMP: c_int;
+  extern var ARROWTIMESTAMPNS: c_int;
   extern var ARROWERROR: c_int;
 
+  extern var COMPRESSIONNONE: c_int;
+  extern var COMPRESSIONSNAPPY: c_int;
+  extern var COMPRESSIONZSTD: c_int;
+  extern var COMPRESSIONLZ4: c_int;
+  extern var COMPRESSIONGZIP: c_int;
+
+  extern var FILTEREQ: c_int;
+  extern var FILTERNE: c_int;
+  extern var FILTERLT: c_int;
+  extern var FILTERLE: c_int;
+  extern var FILTERGT: c_int;
+  extern var FILTERGE: c_int;
+  extern var FILTERIN: c_int;
+
   enum ArrowTypes { int64, int32, uint64, stringArr,
                     timestamp, boolean, double,
                     float, notimplemented };
@@ -89,122 +107,133 @@ module ParquetMsg {
     return ret;
   }
   
-  proc getSubdomains(lengths: [?FD] int) {
-    var subdoms: [FD] domain(1);
-    var offset = 0;
-    for i in FD {
-      subdoms[i] = {offset..#lengths[i]};
-      offset += lengths[i];
+  /*
+   * The non-empty row groups of the files, in order, each as its file, its
+   * index in the file, its number of rows and its first row across all the
+   * files
+   */
+  proc getRowGroups(filenames: [?FD] string) throws {
+    extern proc c_getNumRowGroups(filename, errMsg): int;
+    extern proc c_getRowGroupSizes(filename, sizes, errMsg): c_int;
+    var fileGroups: [FD] list(int);
+    forall (filename, fileSizes) in zip(filenames, fileGroups) {
+      var pqErr = new parquetErrorMsg();
+      const ngroups = c_getNumRowGroups(filename.localize().c_str(), c_ptrTo(pqErr.errMsg));
+      if ngroups == ARROWERROR then
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      var groupSizes: [0..#ngroups] int;
+      if c_getRowGroupSizes(filename.localize().c_str(), c_ptrTo(groupSizes),
+                            c_ptrTo(pqErr.errMsg)) == ARROWERROR then
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      for size in groupSizes do fileSizes.append(size);
     }
-    return (subdoms, (+ reduce lengths));
-  }
 
-  proc readFilesByName(A: [] ?t, filenames: [] string, sizes: [] int, dsetname: string, ty) throws {
-    extern proc c_readColumnByName(filename, chpl_arr, colNum, numElems, startIdx, batchSize, errMsg): int;
-    var (subdoms, length) = getSubdomains(sizes);
-    var fileOffsets = (+ scan sizes) - sizes;
-    
-    coforall loc in A.targetLocales() do on loc {
-      var locFiles = filenames;
-      var locFiledoms = subdoms;
-      var locOffsets = fileOffsets;
-      
-      try {
-        forall (off, filedom, filename) in zip(locOffsets, locFiledoms, locFiles) {
-          for locdom in A.localSubdomains() {
-            const intersection = domain_intersection(locdom, filedom);
-            
-            if intersection.size > 0 {
-              var pqErr = new parquetErrorMsg();
-              if c_readColumnByName(filename.localize().c_str(), c_ptrTo(A[intersection.low]),
-                                    dsetname.localize().c_str(), intersection.size, intersection.low - off,
-                                    batchSize,
-                                    c_ptrTo(pqErr.errMsg)) == ARROWERROR {
-                pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
-              }
-            }
-          }
-        }
-      } catch e {
-        throw e;
+    var groups: list((int, int, int, int));
+    var start = 0;
+    for (f, groupSizes) in zip(FD, fileGroups) {
+      for (g, size) in zip(0.., groupSizes) {
+        if size > 0 then groups.append((f, g, size, start));
+        start += size;
       }
     }
+    return groups.toArray();
   }
 
-  proc readStrFilesByName(A: [] ?t, filenames: [] string, sizes: [] int, dsetname: string, ty) throws {
-    extern proc c_readColumnByName(filename, chpl_arr, colNum, numElems, startIdx, batchSize, errMsg): int;
-    var (subdoms, length) = getSubdomains(sizes);
-    
-    coforall loc in A.targetLocales() do on loc {
-      var locFiles = filenames;
-      var locFiledoms = subdoms;
+  /*
+   * Reads a column into A. Each locale decodes the row groups holding its
+   * rows in parallel, so that all its cores are busy even when it reads a
+   * few large files, and each task reads only the rows of its row group
+   * that are local.
+   */
+  proc readFilesByName(A: [] ?t, filenames: [] string, sizes: [] int, dsetname: string, ty) throws {
+    extern proc c_readRowGroupRange(filename, chpl_arr, colname, rowGroup, startRow, numRows,
+                                    batchSize, errMsg): int;
+    const groups = getRowGroups(filenames);
 
-      try {
-        forall (filedom, filename) in zip(locFiledoms, locFiles) {
-          for locdom in A.localSubdomains() {
-            const intersection = domain_intersection(locdom, filedom);
-
-            if intersection.size > 0 {
-              var pqErr = new parquetErrorMsg();
-              var col: [filedom] t;
-
-              if c_readColumnByName(filename.localize().c_str(), c_ptrTo(col),
-                                    dsetname.localize().c_str(), intersection.size, 0,
-                                    batchSize, c_ptrTo(pqErr.errMsg)) == ARROWERROR {
-                pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
-              }
-              A[filedom] = col;
+    coforall loc in A.targetLocales() with (ref A) do on loc {
+      const locFiles = filenames;
+      const locGroups = groups;
+
+      forall i in dynamic(0..#locGroups.size, chunkSize=1) with (ref A) {
+        const (f, g, size, start) = locGroups[i];
+        for locdom in A.localSubdomains() {
+          const intersection = domain_intersection(locdom, {start..#size});
+
+          if intersection.size > 0 {
+            var pqErr = new parquetErrorMsg();
+            if c_readRowGroupRange(locFiles[f].localize().c_str(), c_ptrTo(A[intersection.low]),
+                                   dsetname.localize().c_str(), g, intersection.low - start,
+                                   intersection.size, batchSize,
+                                   c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+              pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
             }
           }
         }
-      } catch e {
-        throw e;
       }
     }
   }
 
-  proc calcSizesAndOffset(offsets: [] ?t, filenames: [] string, sizes: [] int, dsetname: string) throws {
-    var (subdoms, length) = getSubdomains(sizes);
+  /*
+   * Reads a string column, writing the length of each string, with its null
+   * terminator, into segs and returning the bytes. Each row group is read
+   * once, in parallel, by the locale of its first row, into a buffer grown
+   * as needed, and copied into place once the number of bytes of every row
+   * group is known.
+   */
+  proc readStrFilesByName(ref segs: [] int, filenames: [] string, dsetname: string) throws {
+    extern proc c_readRowGroupStrings(filename, colname, rowGroup, lengths, bytes,
+                                      batchSize, errMsg): int;
+    extern proc c_free_string(ptr);
+    const groups = getRowGroups(filenames);
+    const gD = groups.domain;
+    var groupBytes: [gD] int;
+    var buffers: [gD] c_void_ptr;
 
-    var byteSizes: [filenames.domain] int;
+    coforall loc in segs.targetLocales() with (ref segs, ref groupBytes, ref buffers) do on loc {
+      const locFiles = filenames;
+      const locGroups = groups;
+      const locdom = segs.localSubdomain();
 
-    coforall loc in offsets.targetLocales() do on loc {
-      var locFiles = filenames;
-      var locFiledoms = subdoms;
-      
-      try {
-        forall (i, filedom, filename) in zip(sizes.domain, locFiledoms, locFiles) {
-          for locdom in offsets.localSubdomains() {
-            const intersection = domain_intersection(locdom, filedom);
-            if intersection.size > 0 {
-              var col: [filedom] t;
-              byteSizes[i] = getStrColSize(filename, dsetname, col);
-              offsets[filedom] = col;
-            }
-          }
+      forall i in dynamic(0..#locGroups.size, chunkSize=1) with (ref segs, ref groupBytes, ref buffers) {
+        const (f, g, size, start) = locGroups[i];
+        if locdom.contains(start) {
+          var pqErr = new parquetErrorMsg();
+          var lengths: [0..#size] int;
+          var buf: c_void_ptr;
+          const nbytes = c_readRowGroupStrings(locFiles[f].localize().c_str(),
+                                               dsetname.localize().c_str(), g,
+                                               c_ptrTo(lengths), c_ptrTo(buf), batchSize,
+                                               c_ptrTo(pqErr.errMsg));
+          if nbytes == ARROWERROR then
+            pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+          segs[start..#size] = lengths;
+          groupBytes[i] = nbytes;
+          buffers[i] = buf;
         }
-      } catch e {
-        throw e;
       }
     }
-    return byteSizes;
-  }
 
-  proc getStrColSize(filename: string, dsetname: string, offsets: [] int) throws {
-    extern proc c_getStringColumnNumBytes(filename, colname, offsets, numElems, startIdx, errMsg): int;
-    var pqErr = new parquetErrorMsg();
+    const byteStarts = (+ scan groupBytes) - groupBytes;
+    var vals = makeDistArray(+ reduce groupBytes, uint(8));
+    coforall loc in segs.targetLocales() with (ref vals) do on loc {
+      const locGroups = groups;
+      const locBytes = groupBytes;
+      const locStarts = byteStarts;
+      const locBuffers = buffers;
+      const locdom = segs.localSubdomain();
 
-    var byteSize = c_getStringColumnNumBytes(filename.localize().c_str(),
-                                             dsetname.localize().c_str(),
-                                             c_ptrTo(offsets),
-                                             offsets.size, 0,
-                                             c_ptrTo(pqErr.errMsg));
-    
-    if byteSize == ARROWERROR then
-      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
-    return byteSize;
+      forall i in dynamic(0..#locGroups.size, chunkSize=1) with (ref vals) {
+        const (_, _, _, start) = locGroups[i];
+        if locdom.contains(start) {
+          var bytes = makeArrayFromPtr(locBuffers[i]: c_ptr(uint(8)), locBytes[i]: uint);
+          vals[locStarts[i]..#locBytes[i]] = bytes;
+          c_free_string(locBuffers[i]);
+        }
+      }
+    }
+    return vals;
   }
-  
+
   proc getArrSize(filename: string) throws {
     extern proc c_getNumRows(chpl_str, errMsg): int;
     var pqErr = new parquetErrorMsg();
@@ -227,7 +256,8 @@ module ParquetMsg {
       pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
     }
     
-    if arrType == ARROWINT64 then return ArrowTypes.int64;
+    // timestamps are read as their int64 values
+    if arrType == ARROWINT64 || arrType == ARROWTIMESTAMP then return ArrowTypes.int64;
     else if arrType == ARROWINT32 then return ArrowTypes.int32;
     else if arrType == ARROWUINT64 then return ArrowTypes.uint64;
     else if arrType == ARROWBOOLEAN then return ArrowTypes.boolean;
@@ -476,7 +506,7 @@ module ParquetMsg {
   proc readAllParquetMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
     var repMsg: string;
     // May need a more robust delimiter then " | "
-    var (strictFlag, ndsetsStr, nfilesStr, allowErrorsFlag, hdfArgPlaceholder, arraysStr) = payload.splitMsgToTuple(6);
+    var (strictFlag, ndsetsStr, nfilesStr, allowErrorsFlag, hdfArgPlaceholder, directReadPlaceholder, arraysStr) = payload.splitMsgToTuple(7);
     var strictTypes: bool = true;
     if (strictFlag.toLower().strip() == "false") {
       strictTypes = false;
@@ -555,7 +585,6 @@ module ParquetMsg {
     var fileErrorMsg:string = "";
     var sizes: [filedom] int;
     var types: [dsetdom] ArrowTypes;
-    var byteSizes: [filedom] int;
 
     var rnames: list((string, string, string)); // tuple (dsetName, item type, id)
     
@@ -607,11 +636,10 @@ module ParquetMsg {
           rnames.append((dsetname, "pdarray", valName));
         } else if ty == ArrowTypes.stringArr {
           var entrySeg = new shared SymEntry(len, int);
-          byteSizes = calcSizesAndOffset(entrySeg.a, filenames, sizes, dsetname);
+          var vals = readStrFilesByName(entrySeg.a, filenames, dsetname);
           entrySeg.a = (+ scan entrySeg.a) - entrySeg.a;
           
-          var entryVal = new shared SymEntry((+ reduce byteSizes), uint(8));
-          readStrFilesByName(entryVal.a, filenames, byteSizes, dsetname, ty);
+          var entryVal = new shared SymEntry(vals);
           
           var stringsEntry = assembleSegStringFromParts(entrySeg, entryVal, st);
           rnames.append((dsetname, "seg_string", "%s+%t".format(stringsEntry.name, stringsEntry.nBytes)));
@@ -633,6 +661,404 @@ module ParquetMsg {
     return new MsgTuple(repMsg,MsgType.NORMAL);
   }
 
+  /*
+   * A predicate of a filtered read: a column compared with one value, or
+   * with a list of values for "in", held as the type the column is read as
+   */
+  record parquetFilter {
+    var column: string;
+    var op: c_int;
+    var ty: ArrowTypes;
+    var vD: domain(1);
+    var strs: [vD] string;
+    var ints: [vD] int;
+    var uints: [vD] uint;
+    var reals: [vD] real;
+    var bools: [vD] bool;
+  }
+
+  /*
+   * The rows a filtered read keeps from a file: each row group that may hold
+   * rows satisfying every predicate, with its number of rows and of kept
+   * rows, and, for the row groups not kept whole, their kept rows in
+   * increasing order, starting at rowStarts in rows
+   */
+  record parquetFilePlan {
+    var gD: domain(1);
+    var groups, numRows, kept, rowStarts: [gD] int;
+    var rD: domain(1);
+    var rows: [rD] int;
+  }
+
+  proc toFilterOp(op: string): c_int throws {
+    select op {
+      when "==" do return FILTEREQ;
+      when "!=" do return FILTERNE;
+      when "<" do return FILTERLT;
+      when "<=" do return FILTERLE;
+      when ">" do return FILTERGT;
+      when ">=" do return FILTERGE;
+      when "in" do return FILTERIN;
+      otherwise {
+        throw getErrorWithContext(
+                 msg="Unrecognized filter comparison %s".format(op),
+                 getLineNumber(), getRoutineName(), getModuleName(),
+                 errorClass="IllegalArgumentError");
+      }
+    }
+  }
+
+  /*
+   * Parses the predicates of a filtered read, each given by its column, its
+   * comparison, its number of values and its values, typed by the column in
+   * the file filename
+   */
+  proc parseParquetFilters(fields: [?D] string, filename: string) throws {
+    var filters: list(parquetFilter);
+    var i = D.low;
+    while i <= D.high {
+      var f: parquetFilter;
+      f.column = fields[i];
+      f.op = toFilterOp(fields[i+1]);
+      const n = fields[i+2]:int;
+      f.ty = getArrType(filename, f.column);
+      f.vD = {0..#n};
+      f.strs = fields[i+3..#n];
+      for (j, v) in zip(f.vD, f.strs) {
+        select f.ty {
+          when ArrowTypes.int64, ArrowTypes.int32, ArrowTypes.timestamp do f.ints[j] = v:int;
+          when ArrowTypes.uint64 do f.uints[j] = v:uint;
+          when ArrowTypes.double, ArrowTypes.float do f.reals[j] = v:real;
+          when ArrowTypes.boolean do f.bools[j] = v.toLower():bool;
+        }
+      }
+      filters.append(f);
+      i += 3 + n;
+    }
+    return filters.toArray();
+  }
+
+  private proc filterValues(ref f: parquetFilter, ref cstrs: [] c_string): c_void_ptr {
+    select f.ty {
+      when ArrowTypes.uint64 do return c_ptrTo(f.uints): c_void_ptr;
+      when ArrowTypes.double, ArrowTypes.float do return c_ptrTo(f.reals): c_void_ptr;
+      when ArrowTypes.boolean do return c_ptrTo(f.bools): c_void_ptr;
+      when ArrowTypes.stringArr do return c_ptrTo(cstrs): c_void_ptr;
+      otherwise do return c_ptrTo(f.ints): c_void_ptr;
+    }
+  }
+
+  /*
+   * Opens a file once for the calls that plan or read a filtered read,
+   * returning the open file, to be closed with c_closeParquetFile, and its
+   * number of row groups
+   */
+  proc openParquetFile(filename: string): (c_void_ptr, int) throws {
+    extern proc c_openParquetFile(filename, file, errMsg): int;
+    var pqErr = new parquetErrorMsg();
+    var file: c_void_ptr;
+    const ngroups = c_openParquetFile(filename.localize().c_str(), c_ptrTo(file),
+                                      c_ptrTo(pqErr.errMsg));
+    if ngroups == ARROWERROR then
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    return (file, ngroups);
+  }
+
+  /*
+   * Whether the statistics or dictionary page of a row group show that
+   * some of its rows may satisfy the predicate f
+   */
+  proc rowGroupMayMatch(file: c_void_ptr, rowGroup: int, ref f: parquetFilter): bool throws {
+    extern proc c_rowGroupMayMatch(file, colname, rowGroup, op, values, nvalues, errMsg): c_int;
+    var pqErr = new parquetErrorMsg();
+    var cstrs: [f.vD] c_string = [s in f.strs] s.c_str();
+    const res = c_rowGroupMayMatch(file, f.column.localize().c_str(),
+                                   rowGroup, f.op, filterValues(f, cstrs), f.vD.size,
+                                   c_ptrTo(pqErr.errMsg));
+    if res == ARROWERROR then
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    return res == 1;
+  }
+
+  /*
+   * Clears the mask of the rows of a row group that do not satisfy the
+   * predicate f
+   */
+  proc filterRowGroup(file: c_void_ptr, rowGroup: int, ref f: parquetFilter, ref mask: [] bool) throws {
+    extern proc c_filterRowGroup(file, colname, rowGroup, op, values, nvalues, mask,
+                                 batchSize, errMsg): c_int;
+    var pqErr = new parquetErrorMsg();
+    var cstrs: [f.vD] c_string = [s in f.strs] s.c_str();
+    if c_filterRowGroup(file, f.column.localize().c_str(), rowGroup,
+                        f.op, filterValues(f, cstrs), f.vD.size, c_ptrTo(mask), batchSize,
+                        c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    }
+  }
+
+  /*
+   * Finds the rows of a file that satisfy every predicate, skipping the row
+   * groups that the statistics or dictionary pages rule out
+   */
+  proc planParquetFile(filename: string, ref filters: [] parquetFilter): parquetFilePlan throws {
+    extern proc c_getRowGroupNumRows(file, rowGroup, errMsg): int;
+    extern proc c_closeParquetFile(file);
+    var pqErr = new parquetErrorMsg();
+    const (file, ngroups) = openParquetFile(filename);
+    defer { c_closeParquetFile(file); }
+
+    var groups, numRows, kept, rowStarts, rows: list(int);
+    for g in 0..#ngroups {
+      const n = c_getRowGroupNumRows(file, g, c_ptrTo(pqErr.errMsg));
+      if n == ARROWERROR then
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      var mayMatch = n > 0;
+      for f in filters {
+        if !mayMatch then break;
+        mayMatch = rowGroupMayMatch(file, g, f);
+      }
+      if !mayMatch then continue;
+
+      var mask: [0..#n] bool = true;
+      for f in filters do filterRowGroup(file, g, f, mask);
+      const k = + reduce mask;
+      if k == 0 then continue;
+      groups.append(g);
+      numRows.append(n);
+      kept.append(k);
+      rowStarts.append(rows.size);
+      if k < n {
+        for (j, m) in zip(mask.domain, mask) do if m then rows.append(j);
+      }
+    }
+
+    var plan: parquetFilePlan;
+    plan.gD = {0..#groups.size};
+    plan.groups = groups.toArray();
+    plan.numRows = numRows.toArray();
+    plan.kept = kept.toArray();
+    plan.rowStarts = rowStarts.toArray();
+    plan.rD = {0..#rows.size};
+    plan.rows = rows.toArray();
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                   "%s: kept %i of %i row groups".format(filename, groups.size, ngroups));
+    return plan;
+  }
+
+  // the locale that reads the file at position i of a filtered read
+  private inline proc fileLocale(i: int) {
+    return Locales[i % numLocales];
+  }
+
+  // the kept rows of a row group, or nil for all of them
+  private inline proc keptRows(ref plan: parquetFilePlan, g: int) {
+    return if plan.kept[g] == plan.numRows[g] then c_nil: c_ptr(int)
+                                              else c_ptrTo(plan.rows[plan.rowStarts[g]]);
+  }
+
+  proc readFilteredFiles(A: [] ?t, filenames: [?FD] string, plans: [FD] parquetFilePlan,
+                         fileOffsets: [FD] int, dsetname: string) throws {
+    extern proc c_readRowGroupByName(file, chpl_arr, colname, rowGroup, rows, nrows,
+                                     batchSize, errMsg): int;
+    extern proc c_closeParquetFile(file);
+    forall (i, filename) in zip(FD, filenames) with (ref A) {
+      on fileLocale(i - FD.low) {
+        var plan = plans[i];
+        const size = + reduce plan.kept;
+        if size > 0 {
+          const (file, _) = openParquetFile(filename);
+          defer { c_closeParquetFile(file); }
+          var col: [0..#size] t;
+          var o = 0;
+          for g in plan.gD {
+            var pqErr = new parquetErrorMsg();
+            if c_readRowGroupByName(file, c_ptrTo(col[o]),
+                                    dsetname.localize().c_str(), plan.groups[g],
+                                    keptRows(plan, g), plan.kept[g], batchSize,
+                                    c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+              pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+            }
+            o += plan.kept[g];
+          }
+          A[fileOffsets[i]..#size] = col;
+        }
+      }
+    }
+  }
+
+  proc readFilteredStrFiles(filenames: [?FD] string, plans: [FD] parquetFilePlan,
+                            fileOffsets: [FD] int, len: int, dsetname: string,
+                            st: borrowed SymTab) throws {
+    extern proc c_getRowGroupStringNumBytes(file, colname, rowGroup, rows, nrows,
+                                            chpl_lengths, batchSize, errMsg): int;
+    extern proc c_readRowGroupByName(file, chpl_arr, colname, rowGroup, rows, nrows,
+                                     batchSize, errMsg): int;
+    extern proc c_closeParquetFile(file);
+    // the files are kept open, on the locales that read them, for both passes
+    var files: [FD] c_void_ptr = c_nil;
+    defer {
+      forall i in FD {
+        on fileLocale(i - FD.low) {
+          if files[i] != c_nil then c_closeParquetFile(files[i]);
+        }
+      }
+    }
+    var entrySeg = new shared SymEntry(len, int);
+    var byteSizes: [FD] int;
+    forall (i, filename) in zip(FD, filenames) with (ref entrySeg, ref byteSizes, ref files) {
+      on fileLocale(i - FD.low) {
+        var plan = plans[i];
+        const size = + reduce plan.kept;
+        if size > 0 {
+          const (file, _) = openParquetFile(filename);
+          files[i] = file;
+          var lengths: [0..#size] int;
+          var o = 0;
+          var nbytes = 0;
+          for g in plan.gD {
+            var pqErr = new parquetErrorMsg();
+            const groupBytes = c_getRowGroupStringNumBytes(files[i], dsetname.localize().c_str(),
+                                                           plan.groups[g], keptRows(plan, g),
+                                                           plan.kept[g], c_ptrTo(lengths[o]),
+                                                           batchSize, c_ptrTo(pqErr.errMsg));
+            if groupBytes == ARROWERROR then
+              pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+            nbytes += groupBytes;
+            o += plan.kept[g];
+          }
+          entrySeg.a[fileOffsets[i]..#size] = lengths;
+          byteSizes[i] = nbytes;
+        }
+      }
+    }
+    entrySeg.a = (+ scan entrySeg.a) - entrySeg.a;
+
+    const byteOffsets = (+ scan byteSizes) - byteSizes;
+    var entryVal = new shared SymEntry((+ reduce byteSizes), uint(8));
+    forall (i, filename) in zip(FD, filenames) with (ref entryVal) {
+      on fileLocale(i - FD.low) {
+        var plan = plans[i];
+        const nbytes = byteSizes[i];
+        if nbytes > 0 {
+          var vals: [0..#nbytes] uint(8);
+          var o = 0;
+          for g in plan.gD {
+            var pqErr = new parquetErrorMsg();
+            const groupBytes = c_readRowGroupByName(files[i], c_ptrTo(vals[o]),
+                                                    dsetname.localize().c_str(), plan.groups[g],
+                                                    keptRows(plan, g), plan.kept[g], batchSize,
+                                                    c_ptrTo(pqErr.errMsg));
+            if groupBytes == ARROWERROR then
+              pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+            o += groupBytes;
+          }
+          entryVal.a[byteOffsets[i]..#nbytes] = vals;
+        }
+      }
+    }
+    return assembleSegStringFromParts(entrySeg, entryVal, st);
+  }
+
+  /*
+   * Reads the named columns of the rows of Parquet files that satisfy every
+   * one of a list of predicates. Row groups whose statistics or dictionary
+   * pages show that none of their rows can satisfy a predicate are skipped,
+   * as are the files none of whose row groups remain, and the predicates are
+   * evaluated on the rows of the other row groups before the columns are
+   * decoded, so that only the rows satisfying them are stored.
+   *
+   * The payload is the number of columns, of files and of predicate fields,
+   * followed by the json lists of the column names, the filenames and the
+   * predicate fields separated by " | ", where each predicate is given by its
+   * column, its comparison (one of ==, !=, <, <=, >, >=, in), its number of
+   * values and its values.
+   */
+  proc readFilteredParquetMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+    var (ndsetsStr, nfilesStr, nfieldsStr, arraysStr) = payload.splitMsgToTuple(4);
+    var repMsg: string;
+    try {
+      const ndsets = ndsetsStr:int, nfiles = nfilesStr:int, nfields = nfieldsStr:int;
+      var (jsondsets, jsonfiles, jsonfields) = arraysStr.splitMsgToTuple(" | ", 3);
+      var dsetnames = jsonToPdArray(jsondsets, ndsets);
+      var filelist = jsonToPdArray(jsonfiles, nfiles);
+      var fields = jsonToPdArray(jsonfields, nfields);
+
+      var FD = filelist.domain;
+      var filenames: [FD] string = filelist;
+      if nfiles == 1 {
+        var tmp = glob(filelist[0]);
+        if tmp.size == 0 {
+          var errorMsg = "The wildcarded filename %s either corresponds to files inaccessible to Arkouda or files of an invalid format".format(filelist[0]);
+          pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        // Glob returns filenames in weird order. Sort for consistency
+        sort(tmp);
+        FD = tmp.domain;
+        filenames = tmp;
+      }
+
+      var filters = parseParquetFilters(fields, filenames[FD.low]);
+      var plans: [FD] parquetFilePlan;
+      forall (i, filename) in zip(FD, filenames) with (ref plans) {
+        on fileLocale(i - FD.low) {
+          var myFilters = filters;
+          plans[i] = planParquetFile(filename, myFilters);
+        }
+      }
+      const sizes = [p in plans] + reduce p.kept;
+      const fileOffsets = (+ scan sizes) - sizes;
+      const len = + reduce sizes;
+      pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                     "kept %i rows from %i of %i files".format(len, + reduce (sizes > 0):int, FD.size));
+
+      var rnames: list((string, string, string)); // tuple (dsetName, item type, id)
+      for dsetname in dsetnames {
+        const ty = getArrType(filenames[FD.low], dsetname);
+        if ty == ArrowTypes.int64 || ty == ArrowTypes.int32 || ty == ArrowTypes.timestamp {
+          var entryVal = new shared SymEntry(len, int);
+          readFilteredFiles(entryVal.a, filenames, plans, fileOffsets, dsetname);
+          var valName = st.nextName();
+          st.addEntry(valName, entryVal);
+          rnames.append((dsetname, "pdarray", valName));
+        } else if ty == ArrowTypes.uint64 {
+          var entryVal = new shared SymEntry(len, uint);
+          readFilteredFiles(entryVal.a, filenames, plans, fileOffsets, dsetname);
+          var valName = st.nextName();
+          st.addEntry(valName, entryVal);
+          rnames.append((dsetname, "pdarray", valName));
+        } else if ty == ArrowTypes.boolean {
+          var entryVal = new shared SymEntry(len, bool);
+          readFilteredFiles(entryVal.a, filenames, plans, fileOffsets, dsetname);
+          var valName = st.nextName();
+          st.addEntry(valName, entryVal);
+          rnames.append((dsetname, "pdarray", valName));
+        } else if ty == ArrowTypes.stringArr {
+          var stringsEntry = readFilteredStrFiles(filenames, plans, fileOffsets, len, dsetname, st);
+          rnames.append((dsetname, "seg_string", "%s+%t".format(stringsEntry.name, stringsEntry.nBytes)));
+        } else if ty == ArrowTypes.double || ty == ArrowTypes.float {
+          var entryVal = new shared SymEntry(len, real);
+          readFilteredFiles(entryVal.a, filenames, plans, fileOffsets, dsetname);
+          var valName = st.nextName();
+          st.addEntry(valName, entryVal);
+          rnames.append((dsetname, "pdarray", valName));
+        } else {
+          var errorMsg = "DType %s not supported for Parquet reading".format(ty);
+          pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+      }
+      var fileErrors: list(string);
+      repMsg = _buildReadAllMsgJson(rnames, false, 0, fileErrors, st);
+    } catch e: Error {
+      var errorMsg = "Filtered Parquet read failed: %s".format(e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+    return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
   proc getDatasets(filename) throws {
     extern proc c_getDatasetNames(filename, dsetResult, errMsg): int(32);
     extern proc strlen(a): int;
@@ -732,6 +1158,199 @@ module ParquetMsg {
     }
   }
 
+  proc toCompression(codec: string): c_int throws {
+    select codec.toLower() {
+      when "none" do return COMPRESSIONNONE;
+      when "snappy" do return COMPRESSIONSNAPPY;
+      when "zstd" do return COMPRESSIONZSTD;
+      when "lz4" do return COMPRESSIONLZ4;
+      when "gzip" do return COMPRESSIONGZIP;
+      otherwise {
+        throw getErrorWithContext(
+                 msg="Unrecognized Parquet compression %s".format(codec),
+                 lineNumber=getLineNumber(),
+                 routineName=getRoutineName(),
+                 moduleName=getModuleName(),
+                 errorClass='IllegalArgumentError');
+      }
+    }
+  }
+
+  /*
+   * Copies the bytes and offsets of the strings at the indices locDom, which
+   * must be local, into newly allocated buffers on this locale, which the
+   * caller must free. The offsets are relative to the first string and
+   * followed by the number of bytes.
+   */
+  private proc toLocalStringBuffers(ss: borrowed SegString, locDom): (c_void_ptr, c_void_ptr) throws {
+    ref A = ss.offsets.a;
+    const startValIdx = if locDom.size > 0 then A[locDom.low] else 0;
+    const endValIdx = if locDom.size == 0 then startValIdx
+                      else if locDom.high == A.domain.high then ss.values.size
+                      else A[locDom.high + 1];
+    const nbytes = endValIdx - startValIdx;
+
+    var valsPtr = c_malloc(uint(8), max(nbytes, 1));
+    var localVals = makeArrayFromPtr(valsPtr, nbytes:uint);
+    ref olda = ss.values.a;
+    forall (localVal, valIdx) in zip(localVals, startValIdx..#nbytes) with (var agg = newSrcAggregator(uint(8))) {
+      agg.copy(localVal, olda[valIdx]);
+    }
+
+    var offsPtr = c_malloc(int, locDom.size + 1);
+    var locOffsets = makeArrayFromPtr(offsPtr, (locDom.size + 1):uint);
+    locOffsets[0..#locDom.size] = A[locDom] - startValIdx;
+    locOffsets[locDom.size] = nbytes;
+    return (valsPtr: c_void_ptr, offsPtr: c_void_ptr);
+  }
+
+  /*
+   * Writes columns of equal size as one Parquet table per locale, each file
+   * holding every column of the locale's rows and written in a single pass.
+   * The payload is the number of columns, the row group size (0 for the
+   * default), the compression codec, one space-free "kind:name" descriptor
+   * per column, where kind is pdarray or str, and a json list of the column
+   * names followed by the filename prefix.
+   */
+  proc writeParquetTableMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+    extern proc c_writeMultiColumnToParquet(filename, ncols, colnames, dtypes, data, offsets,
+                                            numelems, rowGroupSize, compression, errMsg): int;
+    var (ncolsStr, rowGroupStr, codec, rest) = payload.splitMsgToTuple(4);
+    const ncols = ncolsStr:int;
+    var rowGroupSize = rowGroupStr:int;
+    if rowGroupSize <= 0 then rowGroupSize = ROWGROUPS;
+    var fields = rest.split(" ", ncols);
+    var names: [0..#ncols+1] string;
+    try {
+      names = jsonToPdArray(fields[fields.domain.low + ncols], ncols+1);
+    } catch {
+      var errorMsg = "Could not decode json column names and filename " +
+        "(%i columns: %s)".format(ncols, fields[fields.domain.low + ncols]);
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+    const filename = names[ncols];
+
+    var warnFlag: bool;
+    try {
+      const compression = toCompression(codec);
+      var kinds, entryNames: [0..#ncols] string;
+      var dtypes: [0..#ncols] int;
+      var size = -1;
+      for i in 0..#ncols {
+        var spec = fields[fields.domain.low + i].split(":");
+        kinds[i] = spec[spec.domain.low];
+        entryNames[i] = spec[spec.domain.low + 1];
+        var colSize: int;
+        select kinds[i] {
+          when "pdarray" {
+            var entry = getGenericTypedArrayEntry(entryNames[i], st);
+            colSize = entry.size;
+            select entry.dtype {
+              when DType.Int64 do dtypes[i] = ARROWINT64:int;
+              when DType.UInt64 do dtypes[i] = ARROWUINT64:int;
+              when DType.Float64 do dtypes[i] = ARROWDOUBLE:int;
+              when DType.Bool do dtypes[i] = ARROWBOOLEAN:int;
+              otherwise {
+                throw getErrorWithContext(
+                         msg="Unsupported dtype %s for Parquet".format(dtype2str(entry.dtype)),
+                         lineNumber=getLineNumber(),
+                         routineName=getRoutineName(),
+                         moduleName=getModuleName(),
+                         errorClass='IllegalArgumentError');
+              }
+            }
+          }
+          when "str" {
+            colSize = getSegString(entryNames[i], st).size;
+            dtypes[i] = ARROWSTRING:int;
+          }
+          otherwise {
+            throw getErrorWithContext(
+                     msg="Unrecognized Parquet column kind %s".format(kinds[i]),
+                     lineNumber=getLineNumber(),
+                     routineName=getRoutineName(),
+                     moduleName=getModuleName(),
+                     errorClass='IllegalArgumentError');
+          }
+        }
+        if size == -1 {
+          size = colSize;
+        } else if size != colSize {
+          throw getErrorWithContext(
+                   msg="Parquet columns must each have the same length",
+                   lineNumber=getLineNumber(),
+                   routineName=getRoutineName(),
+                   moduleName=getModuleName(),
+                   errorClass='IllegalArgumentError');
+        }
+      }
+
+      // every column of this size has the same local subdomains
+      const D = makeDistDom(size);
+      var filenames: [0..#D.targetLocales().size] string;
+      for i in 0..#D.targetLocales().size {
+        var suffix = '%04i'.format(i): string;
+        filenames[i] = filename + "_LOCALE" + suffix + ".parquet";
+      }
+      var matchingFilenames = glob("%s_LOCALE*%s".format(filename, ".parquet"));
+      warnFlag = processParquetFilenames(filenames, matchingFilenames, TRUNCATE);
+
+      coforall (loc, idx) in zip(D.targetLocales(), filenames.domain) do on loc {
+        var pqErr = new parquetErrorMsg();
+        const myFilename = filenames[idx];
+        const locDom = D.localSubdomain();
+        const myNames = names;
+        const myDtypes = dtypes;
+        var cnames: [0..#ncols] c_string;
+        var data, offsets: [0..#ncols] c_void_ptr;
+        defer {
+          for i in 0..#ncols {
+            c_free(data[i]);
+            c_free(offsets[i]);
+          }
+        }
+        for i in 0..#ncols {
+          cnames[i] = myNames[i].c_str();
+          if kinds[i] == "str" {
+            var segString = getSegString(entryNames[i], st);
+            (data[i], offsets[i]) = toLocalStringBuffers(segString, locDom);
+          } else {
+            var entry = getGenericTypedArrayEntry(entryNames[i], st);
+            select entry.dtype {
+              when DType.Int64 do data[i] = toLocalBuffer(toSymEntry(entry, int).a[locDom]);
+              when DType.UInt64 do data[i] = toLocalBuffer(toSymEntry(entry, uint).a[locDom]);
+              when DType.Float64 do data[i] = toLocalBuffer(toSymEntry(entry, real).a[locDom]);
+              when DType.Bool do data[i] = toLocalBuffer(toSymEntry(entry, bool).a[locDom]);
+            }
+          }
+        }
+        if c_writeMultiColumnToParquet(myFilename.localize().c_str(), ncols, c_ptrTo(cnames),
+                                       c_ptrTo(myDtypes), c_ptrTo(data), c_ptrTo(offsets),
+                                       locDom.size, rowGroupSize, compression,
+                                       c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+          pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+        }
+      }
+    } catch e: FileNotFoundError {
+      var errorMsg = "Unable to open %s for writing: %s".format(filename,e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    } catch e: Error {
+      var errorMsg = "problem writing to file %s".format(e);
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+    if warnFlag {
+      var warnMsg = "Warning: possibly overwriting existing files matching filename pattern";
+      return new MsgTuple(warnMsg, MsgType.WARNING);
+    } else {
+      var repMsg = "wrote table to file";
+      pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+  }
+
   proc lspqMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
     // reqMsg: "lshdf [<json_filename>]"
     var repMsg: string;
@@ -810,11 +1429,291 @@ module ParquetMsg {
     return new MsgTuple(repMsg, MsgType.NORMAL);
   }
 
+  /*
+   * Copies a distributed array into a newly allocated buffer on this
+   * locale, which the caller must free
+   */
+  private proc toLocalBuffer(A: [?D] ?t): c_void_ptr {
+    var ptr = c_malloc(t, max(D.size, 1));
+    var localA = makeArrayFromPtr(ptr, D.size:uint);
+    localA = A;
+    return ptr: c_void_ptr;
+  }
+
+  /*
+   * Serializes columns into an Arrow IPC stream holding a single record batch.
+   * The payload is the number of columns, followed by one space-free
+   * "kind:name[:name]" descriptor per column, where kind is one of pdarray,
+   * datetime, str or category (followed by the codes and categories names),
+   * and a json list of the column names.
+   */
+  proc toArrowIPCMsg(cmd: string, payload: string, st: borrowed SymTab): bytes throws {
+    extern proc c_writeArrowIPC(ncols, colnames, dtypes, numelems, data, offsets, nbytes,
+                                dictData, dictOffsets, dictSizes, dictNbytes,
+                                result, resultSize, errMsg): int;
+    extern proc c_free_string(ptr);
+    try {
+      var (ncolsStr, rest) = payload.splitMsgToTuple(2);
+      const ncols = ncolsStr:int;
+      var fields = rest.split(" ", ncols);
+      var colnames = jsonToPdArray(fields[fields.domain.low + ncols], ncols);
+
+      var cnames: [0..#ncols] c_string;
+      var dtypes, nbytes, dictSizes, dictNbytes: [0..#ncols] int;
+      var data, offsets, dictData, dictOffsets: [0..#ncols] c_void_ptr;
+      defer {
+        for i in 0..#ncols {
+          c_free(data[i]);
+          c_free(offsets[i]);
+          c_free(dictData[i]);
+          c_free(dictOffsets[i]);
+        }
+      }
+
+      var numelems = -1;
+      for i in 0..#ncols {
+        var spec = fields[fields.domain.low + i].split(":");
+        const low = spec.domain.low;
+        var size: int;
+        cnames[i] = colnames[i].c_str();
+        select spec[low] {
+          when "pdarray", "datetime" {
+            var entry = getGenericTypedArrayEntry(spec[low+1], st);
+            overMemLimit(entry.size * entry.itemsize);
+            size = entry.size;
+            select entry.dtype {
+              when DType.Int64 {
+                data[i] = toLocalBuffer(toSymEntry(entry, int).a);
+                dtypes[i] = if spec[low] == "datetime" then ARROWTIMESTAMPNS:int else ARROWINT64:int;
+              }
+              when DType.UInt64 {
+                data[i] = toLocalBuffer(toSymEntry(entry, uint).a);
+                dtypes[i] = ARROWUINT64:int;
+              }
+              when DType.Float64 {
+                data[i] = toLocalBuffer(toSymEntry(entry, real).a);
+                dtypes[i] = ARROWDOUBLE:int;
+              }
+              when DType.Bool {
+                data[i] = toLocalBuffer(toSymEntry(entry, bool).a);
+                dtypes[i] = ARROWBOOLEAN:int;
+              }
+              otherwise {
+                throw getErrorWithContext(
+                         msg="Unsupported dtype %s for Arrow IPC".format(dtype2str(entry.dtype)),
+                         getLineNumber(), getRoutineName(), getModuleName(),
+                         errorClass="IllegalArgumentError");
+              }
+            }
+          }
+          when "str" {
+            var segString = getSegString(spec[low+1], st);
+            overMemLimit(segString.nBytes + 8*segString.size);
+            size = segString.size;
+            data[i] = toLocalBuffer(segString.values.a);
+            offsets[i] = toLocalBuffer(segString.offsets.a);
+            nbytes[i] = segString.nBytes;
+            dtypes[i] = ARROWSTRING:int;
+          }
+          when "category" {
+            var codes = getGenericTypedArrayEntry(spec[low+1], st);
+            var categories = getSegString(spec[low+2], st);
+            overMemLimit(8*codes.size + categories.nBytes + 8*categories.size);
+            size = codes.size;
+            data[i] = toLocalBuffer(toSymEntry(codes, int).a);
+            dictData[i] = toLocalBuffer(categories.values.a);
+            dictOffsets[i] = toLocalBuffer(categories.offsets.a);
+            dictSizes[i] = categories.size;
+            dictNbytes[i] = categories.nBytes;
+            dtypes[i] = ARROWDICTIONARY:int;
+          }
+          otherwise {
+            throw getErrorWithContext(
+                     msg="Unrecognized Arrow IPC column kind %s".format(spec[low]),
+                     getLineNumber(), getRoutineName(), getModuleName(),
+                     errorClass="IllegalArgumentError");
+          }
+        }
+        if numelems == -1 {
+          numelems = size;
+        } else if numelems != size {
+          throw getErrorWithContext(
+                   msg="Arrow IPC columns must have equal size",
+                   getLineNumber(), getRoutineName(), getModuleName(),
+                   errorClass="IllegalArgumentError");
+        }
+      }
+
+      var pqErr = new parquetErrorMsg();
+      var result: c_void_ptr;
+      var resultSize: int;
+      defer {
+        c_free_string(result);
+      }
+      if c_writeArrowIPC(ncols, c_ptrTo(cnames), c_ptrTo(dtypes), max(numelems, 0),
+                         c_ptrTo(data), c_ptrTo(offsets), c_ptrTo(nbytes),
+                         c_ptrTo(dictData), c_ptrTo(dictOffsets), c_ptrTo(dictSizes),
+                         c_ptrTo(dictNbytes), c_ptrTo(result), c_ptrTo(resultSize),
+                         c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      }
+      return createBytesWithNewBuffer(result: c_ptr(uint(8)), resultSize);
+    } catch e: Error {
+      var errorMsg = "Error: %s".format(e.message());
+      pqLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+      return errorMsg.encode(); // return as bytes
+    }
+  }
+
+  /*
+   * Creates one array per column of the Arrow IPC stream sent as the binary
+   * payload, returning a json list with one [name, kind, created...] list per
+   * column, where kind is one of pdarray, datetime, str or category
+   */
+  proc fromArrowIPCMsg(cmd: string, args: string, payload: bytes, st: borrowed SymTab): MsgTuple throws {
+    extern proc c_readArrowIPC(buf, size, handle, ncols, nrows, errMsg): int;
+    extern proc c_getArrowIPCColumnInfo(handle, col, dtype, nbytes, dictSize, dictNbytes,
+                                        colname, errMsg): int;
+    extern proc c_readArrowIPCColumn(handle, col, data, offsets, dictData, dictOffsets,
+                                     errMsg): int;
+    extern proc c_freeArrowIPC(handle);
+    extern proc c_free_string(ptr);
+    extern proc strlen(a): int;
+
+    var handle: c_void_ptr;
+    var ncols, nrows: int;
+    var pqErr = new parquetErrorMsg();
+    if c_readArrowIPC(payload.c_str(), payload.size, c_ptrTo(handle), c_ptrTo(ncols),
+                      c_ptrTo(nrows), c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+      pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+    }
+    defer {
+      c_freeArrowIPC(handle);
+    }
+
+    /*
+     * Reads a column into local buffers and copies them into new distributed
+     * arrays, returning the created message of each
+     */
+    proc readColumn(col: int, type t, size: int, ref a: [] t) throws {
+      var ptr = c_malloc(t, max(size, 1));
+      defer {
+        c_free(ptr);
+      }
+      if c_readArrowIPCColumn(handle, col, ptr, c_nil, c_nil, c_nil,
+                              c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      }
+      a = makeArrayFromPtr(ptr, size:uint);
+    }
+
+    proc readStrings(col: int, size: int, nbytes: int, dictSize: int, dictNbytes: int,
+                     ref codes: [] int) throws {
+      const n = if dictSize >= 0 then dictSize else size;
+      const nb = if dictSize >= 0 then dictNbytes else nbytes;
+      var vals = c_malloc(uint(8), max(nb, 1));
+      var offs = c_malloc(int, max(n, 1));
+      var cods = c_malloc(int, max(size, 1));
+      defer {
+        c_free(vals);
+        c_free(offs);
+        c_free(cods);
+      }
+      var rc: int;
+      if dictSize >= 0 then
+        rc = c_readArrowIPCColumn(handle, col, cods, c_nil, vals, offs, c_ptrTo(pqErr.errMsg));
+      else
+        rc = c_readArrowIPCColumn(handle, col, vals, offs, c_nil, c_nil, c_ptrTo(pqErr.errMsg));
+      if rc == ARROWERROR then
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      if dictSize >= 0 then
+        codes = makeArrayFromPtr(cods, size:uint);
+      var offsets = makeArrayFromPtr(offs, n:uint);
+      var values = makeArrayFromPtr(vals, nb:uint);
+      var segString = getSegString(offsets, values, st);
+      return "created " + st.attrib(segString.name) + "+created bytes.size %t".format(segString.nBytes);
+    }
+
+    var repMsg = "[";
+    for col in 0..#ncols {
+      var dtype, nbytes, dictSize, dictNbytes: int;
+      var cname: c_ptr(uint(8));
+      if c_getArrowIPCColumnInfo(handle, col, c_ptrTo(dtype), c_ptrTo(nbytes), c_ptrTo(dictSize),
+                                 c_ptrTo(dictNbytes), c_ptrTo(cname),
+                                 c_ptrTo(pqErr.errMsg)) == ARROWERROR {
+        pqErr.parquetError(getLineNumber(), getRoutineName(), getModuleName());
+      }
+      var colname: string;
+      try! colname = createStringWithNewBuffer(cname, strlen(cname));
+      c_free_string(cname);
+
+      var items: list(string);
+      items.append(colname);
+      if dtype == ARROWSTRING {
+        overMemLimit(2*(nbytes + 8*nrows));
+        var unused: [0..#0] int;
+        items.append("str");
+        items.append(readStrings(col, nrows, nbytes, -1, 0, unused));
+      } else if dtype == ARROWDICTIONARY {
+        overMemLimit(2*(8*nrows + dictNbytes + 8*dictSize));
+        var codes = new shared SymEntry(nrows, int);
+        items.append("category");
+        var rname = st.nextName();
+        var catsMsg = readStrings(col, nrows, 0, dictSize, dictNbytes, codes.a);
+        st.addEntry(rname, codes);
+        items.append("created " + st.attrib(rname));
+        items.append(catsMsg);
+      } else {
+        var rname = st.nextName();
+        if dtype == ARROWINT64 || dtype == ARROWTIMESTAMPNS {
+          overMemLimit(2*8*nrows);
+          var entry = new shared SymEntry(nrows, int);
+          readColumn(col, int, nrows, entry.a);
+          st.addEntry(rname, entry);
+        } else if dtype == ARROWUINT64 {
+          overMemLimit(2*8*nrows);
+          var entry = new shared SymEntry(nrows, uint);
+          readColumn(col, uint, nrows, entry.a);
+          st.addEntry(rname, entry);
+        } else if dtype == ARROWDOUBLE {
+          overMemLimit(2*8*nrows);
+          var entry = new shared SymEntry(nrows, real);
+          readColumn(col, real, nrows, entry.a);
+          st.addEntry(rname, entry);
+        } else {
+          overMemLimit(2*nrows);
+          var entry = new shared SymEntry(nrows, bool);
+          readColumn(col, bool, nrows, entry.a);
+          st.addEntry(rname, entry);
+        }
+        items.append(if dtype == ARROWTIMESTAMPNS then "datetime" else "pdarray");
+        items.append("created " + st.attrib(rname));
+      }
+
+      if col > 0 then repMsg += ",";
+      repMsg += "[";
+      var first = true;
+      for i in items {
+        if !first then repMsg += ",";
+        first = false;
+        repMsg += Q + i.replace(Q, ESCAPED_QUOTES, -1) + Q;
+      }
+      repMsg += "]";
+    }
+    repMsg += "]";
+    pqLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+    return new MsgTuple(repMsg, MsgType.NORMAL);
+  }
+
   proc registerMe() {
     use CommandMap;
     registerFunction("readAllParquet", readAllParquetMsg, getModuleName());
+    registerFunction("readFilteredParquet", readFilteredParquetMsg, getModuleName());
     registerFunction("writeParquet", toparquetMsg, getModuleName());
+    registerFunction("writeParquetTable", writeParquetTableMsg, getModuleName());
     registerFunction("lspq", lspqMsg, getModuleName());
+    registerBinaryFunction("arrowIPC", toArrowIPCMsg, getModuleName());
+    registerPayloadFunction("fromArrowIPC", fromArrowIPCMsg, getModuleName());
     ServerConfig.appendToConfigStr("ARROW_VERSION", getVersionInfo());
   }
 
@@ -116,7 +116,7 @@ module RandMsg
 
         repMsg = "created " + st.attrib(rname);
         randLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
 
     proc randomNormalMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
@@ -132,7 +132,7 @@ module RandMsg
 
         var repMsg = "created " + st.attrib(rname);
         randLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
     
     proc registerMe() {
@@ -31,9 +31,10 @@ module ReductionMsg
         param pn = Reflection.getRoutineName();
         var repMsg: string = ""; // response message
         // split request into fields
-        var (reductionop, name) = payload.splitMsgToTuple(2);
+        // arg is the ddof of var and std and the q of quantile
+        var (reductionop, name, arg) = payload.splitMsgToTuple(3);
         rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
-                         "cmd: %s reductionop: %s name: %s".format(cmd,reductionop,name));
+                         "cmd: %s reductionop: %s name: %s arg: %s".format(cmd,reductionop,name,arg));
 
         var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
        
@@ -80,9 +81,26 @@ module ReductionMsg
                         var (maxVal, maxLoc) = maxloc reduce zip(e.a,e.aD);
                         repMsg = "int64 %i".format(maxLoc);
                     }
+                    when "var" {
+                        var val = varianceOf(e.a, arg:int);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "std" {
+                        var val = sqrt(varianceOf(e.a, arg:int));
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "median" {
+                        var val = quantileOf(e.a, 0.5);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "quantile" {
+                        var val = quantileOf(e.a, arg:real);
+                        repMsg = "float64 %.17r".format(val);
+                    }
                     when "is_sorted" {
                         ref ea = e.a;
-                        var sorted = isSorted(ea);
+                        var sorted = e.isSorted() || isSorted(ea);
+                        if sorted then e.setSorted();
                         var val: string;
                         if sorted {val = "True";} else {val = "False";}
                         repMsg = "bool %s".format(val);
@@ -140,9 +158,26 @@ module ReductionMsg
                         var (maxVal, maxLoc) = maxloc reduce zip(e.a,e.aD);
                         repMsg = "uint64 %i".format(maxLoc);
                     }
+                    when "var" {
+                        var val = varianceOf(e.a, arg:int);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "std" {
+                        var val = sqrt(varianceOf(e.a, arg:int));
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "median" {
+                        var val = quantileOf(e.a, 0.5);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "quantile" {
+                        var val = quantileOf(e.a, arg:real);
+                        repMsg = "float64 %.17r".format(val);
+                    }
                     when "is_sorted" {
                         ref ea = e.a;
-                        var sorted = isSorted(ea);
+                        var sorted = e.isSorted() || isSorted(ea);
+                        if sorted then e.setSorted();
                         var val: string;
                         if sorted {val = "True";} else {val = "False";}
                         repMsg = "bool %s".format(val);
@@ -194,8 +229,25 @@ module ReductionMsg
                         var (maxVal, maxLoc) = maxloc reduce zip(e.a,e.aD);
                         repMsg = "int64 %i".format(maxLoc);
                     }
+                    when "var" {
+                        var val = varianceOf(e.a, arg:int);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "std" {
+                        var val = sqrt(varianceOf(e.a, arg:int));
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "median" {
+                        var val = quantileOf(e.a, 0.5);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "quantile" {
+                        var val = quantileOf(e.a, arg:real);
+                        repMsg = "float64 %.17r".format(val);
+                    }
                     when "is_sorted" {
-                        var sorted = isSorted(e.a);
+                        var sorted = e.isSorted() || isSorted(e.a);
+                        if sorted then e.setSorted();
                         var val:string;
                         if sorted {val = "True";} else {val = "False";}
                         repMsg = "bool %s".format(val);
@@ -241,6 +293,14 @@ module ReductionMsg
                         if (| reduce e.a) { val = "True"; } else { val = "False"; }
                         repMsg = "bool %s".format(val);
                     }
+                    when "var" {
+                        var val = varianceOf(e.a, arg:int);
+                        repMsg = "float64 %.17r".format(val);
+                    }
+                    when "std" {
+                        var val = sqrt(varianceOf(e.a, arg:int));
+                        repMsg = "float64 %.17r".format(val);
+                    }
                     otherwise {
                         var errorMsg = notImplementedError(pn,reductionop,gEnt.dtype);
                         rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
@@ -258,6 +318,38 @@ module ReductionMsg
         return new MsgTuple(repMsg, MsgType.NORMAL);          
     }
 
+    /* Variance of the values of a, with divisor a.size - ddof, computed in
+       one pass by reducing the (count, mean, sum of squared deviations) of
+       the values with Welford's update */
+    proc varianceOf(const ref a: [] ?t, ddof: int): real throws {
+      const (_, n, _, m2) = ResettingWelfordScanOp reduce [v in a] (false, 1, v:real, 0.0);
+      return if n - ddof > 0 then m2 / (n - ddof) else nan;
+    }
+
+    /* q-th quantile of the values of a, selected from their sorted order
+       and interpolated linearly between the two nearest values */
+    proc quantileOf(const ref a: [?D] ?t, q: real): real throws {
+      if D.size == 0 then return nan;
+      if isFloatType(t) {
+        if (| reduce isnan(a)) then return nan;
+      }
+      const ranks = radixSortLSD_ranks(a);
+      const (lo, hi, frac) = quantilePositions(D.size, q);
+      return interpolate(a[ranks[D.low + lo]]:real, a[ranks[D.low + hi]]:real, frac);
+    }
+
+    /* Positions, in sorted order, of the two values of n between which the
+       q-th quantile lies, and the fraction of the way between them */
+    inline proc quantilePositions(n: int, q: real): (int, int, real) {
+      const pos = q * (n - 1);
+      const lo = floor(pos): int;
+      return (lo, min(lo + 1, n - 1), pos - lo);
+    }
+
+    inline proc interpolate(lo: real, hi: real, frac: real): real {
+      return if frac == 0.0 then lo else lo + (hi - lo) * frac;
+    }
+
     proc countReductionMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
         param pn = Reflection.getRoutineName();
       // reqMsg: segmentedReduction values segments operator
@@ -280,7 +372,7 @@ module ReductionMsg
 
       var repMsg = "created " + st.attrib(rname);
       rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);       
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }
 
     proc segCount(segments:[?D] int, upper: int):[D] int {
@@ -304,7 +396,8 @@ module ReductionMsg
         // 'values_name' is the segmented array of values to be reduced
         // 'segments_name' is the sement offsets
         // 'op' is the reduction operator
-        var (values_name, segments_name, op, skip_nan) = payload.splitMsgToTuple(4);
+        // 'arg' is the ddof of var and std and the q of quantile
+        var (values_name, segments_name, op, skip_nan, arg) = payload.splitMsgToTuple(5);
         var skipNan = stringtobool(skip_nan);
       
         var rname = st.nextName();
@@ -319,6 +412,25 @@ module ReductionMsg
             rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg); 
             return new MsgTuple(errorMsg, MsgType.ERROR);        
         }
+        var errorMsg = reduceSegments(gVal, segments, op, arg, skipNan, rname, st, pn);
+        if !errorMsg.isEmpty() {
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+       var repMsg = "created " + st.attrib(rname);
+       rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+       return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Reduces each segment of the values in gVal with op and adds the result to
+    the symbol table as rname. arg is the ddof of var and std and the q of
+    quantile, and is ignored by the other operators.
+
+    :returns: an error message if op is not supported for the values dtype,
+              otherwise an empty string
+    */
+    proc reduceSegments(gVal: borrowed GenSymEntry, segments, op: string, arg: string, skipNan: bool,
+                        rname: string, st: borrowed SymTab, pn: string): string throws {
         select (gVal.dtype) {
             when (DType.Int64) {
                 var values = toSymEntry(gVal, int);
@@ -367,10 +479,26 @@ module ReductionMsg
                         var res = segNumUnique(values.a, segments.a);
                         st.addEntry(rname, new shared SymEntry(res));
                     }
+                    when "var" {
+                        var res = segVar(values.a, segments.a, arg:int);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "std" {
+                        var res = sqrt(segVar(values.a, segments.a, arg:int));
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "median" {
+                        var res = segQuantile(values.a, segments.a, 0.5);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "quantile" {
+                        var res = segQuantile(values.a, segments.a, arg:real);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
                     otherwise {
                         var errorMsg = notImplementedError(pn,op,gVal.dtype);
                         rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
-                        return new MsgTuple(errorMsg, MsgType.ERROR);
+                        return errorMsg;
                     }
                 }
             }
@@ -421,10 +549,26 @@ module ReductionMsg
                         var res = segNumUnique(values.a, segments.a);
                         st.addEntry(rname, new shared SymEntry(res));
                     }
+                    when "var" {
+                        var res = segVar(values.a, segments.a, arg:int);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "std" {
+                        var res = sqrt(segVar(values.a, segments.a, arg:int));
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "median" {
+                        var res = segQuantile(values.a, segments.a, 0.5);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "quantile" {
+                        var res = segQuantile(values.a, segments.a, arg:real);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
                     otherwise {
                         var errorMsg = notImplementedError(pn,op,gVal.dtype);
                         rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
-                        return new MsgTuple(errorMsg, MsgType.ERROR);  
+                        return errorMsg;  
                     }                       
                 }    
             }
@@ -459,10 +603,26 @@ module ReductionMsg
                         var (vals, locs) = segArgmax(values.a, segments.a);
                         st.addEntry(rname, new shared SymEntry(locs));
                     }
+                    when "var" {
+                        var res = segVar(values.a, segments.a, arg:int, skipNan);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "std" {
+                        var res = sqrt(segVar(values.a, segments.a, arg:int, skipNan));
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "median" {
+                        var res = segQuantile(values.a, segments.a, 0.5, skipNan);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
+                    when "quantile" {
+                        var res = segQuantile(values.a, segments.a, arg:real, skipNan);
+                        st.addEntry(rname, new shared SymEntry(res));
+                    }
                     otherwise {
                         var errorMsg = notImplementedError(pn,op,gVal.dtype);
                         rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);         
-                        return new MsgTuple(errorMsg, MsgType.ERROR);
+                        return errorMsg;
                     }
                }
            }
@@ -488,19 +648,116 @@ module ReductionMsg
                    otherwise {
                        var errorMsg = notImplementedError(pn,op,gVal.dtype);
                        rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
-                       return new MsgTuple(errorMsg, MsgType.ERROR);                 
+                       return errorMsg;                 
                    }
                }
            }
            otherwise {
                var errorMsg = unrecognizedTypeError(pn, dtype2str(gVal.dtype));
                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
-               return new MsgTuple(errorMsg, MsgType.ERROR);
+               return errorMsg;
            }
        }
-       var repMsg = "created " + st.attrib(rname);
-       rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-       return new MsgTuple(repMsg, MsgType.NORMAL);
+       return "";
+    }
+
+    /*
+    Computes several reductions of several value arrays over the same
+    segments in one request. Each values array is permuted to grouped order
+    once, by perm unless it is "none", and all its reductions are computed
+    from the permuted copy. The argmin and argmax are returned as indices
+    into the unpermuted values.
+
+    :arg reqMsg: request containing (cmd,perm,segments,skipNan,ncols,[values,ops])
+                 where ops is a comma-separated list of operators, each
+                 followed by :arg if it takes an argument
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) one created entry per (values, operator), in request order
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc segmentedAggregateMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (perm_name, segments_name, skip_nan, ncolsStr, rest) = payload.splitMsgToTuple(5);
+        var skipNan = stringtobool(skip_nan);
+        var ncols = ncolsStr:int;
+        var fields = rest.split();
+        if fields.size != 2*ncols {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i values and operators but got %i fields".format(ncols, fields.size));
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var segments = toSymEntry(getGenericTypedArrayEntry(segments_name, st), int);
+        const hasPerm = perm_name != "none";
+        var perm = if hasPerm then toSymEntry(getGenericTypedArrayEntry(perm_name, st), int)
+                              else segments;
+
+        // gather the values into grouped order
+        proc permuted(gVal: borrowed GenSymEntry): shared GenSymEntry throws {
+            proc gather(const ref values: [?D] ?t): shared GenSymEntry throws {
+                var res = makeDistArray(D.size, t);
+                forall (r, p) in zip(res, perm.a) with (var agg = newSrcAggregator(t)) {
+                    agg.copy(r, values[p]);
+                }
+                return new shared SymEntry(res);
+            }
+            select gVal.dtype {
+                when DType.Int64 { return gather(toSymEntry(gVal, int).a); }
+                when DType.UInt64 { return gather(toSymEntry(gVal, uint).a); }
+                when DType.Float64 { return gather(toSymEntry(gVal, real).a); }
+                when DType.Bool { return gather(toSymEntry(gVal, bool).a); }
+                otherwise {
+                    throw getErrorWithContext(
+                        msg=unrecognizedTypeError(pn, dtype2str(gVal.dtype)),
+                        lineNumber=getLineNumber(),
+                        routineName=getRoutineName(),
+                        moduleName=getModuleName(),
+                        errorClass="TypeError");
+                }
+            }
+        }
+
+        var repMsg: string;
+        for c in 0..#ncols {
+            const values_name = fields[fields.domain.low + 2*c];
+            const ops = fields[fields.domain.low + 2*c + 1].split(",");
+            var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(values_name, st);
+            if hasPerm && gVal.size != perm.size {
+                var errorMsg = incompatibleArgumentsError(pn,
+                                   "Expected array of size %i, got size %i".format(perm.size, gVal.size));
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            var pVal: shared GenSymEntry?;
+            if hasPerm then pVal = permuted(gVal);
+            const vals: borrowed GenSymEntry = if hasPerm then pVal!.borrow() else gVal;
+            for opArg in ops {
+                // an operator that takes an argument is sent as op:arg
+                var (op, _, arg) = opArg.partition(":");
+                var rname = st.nextName();
+                rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                               "values_name: %s operator: %s skipNan: %s".format(values_name,op,skipNan));
+                var errorMsg = reduceSegments(vals, segments, op, arg, skipNan, rname, st, pn);
+                if !errorMsg.isEmpty() {
+                    return new MsgTuple(errorMsg, MsgType.ERROR);
+                }
+                if hasPerm && (op == "argmin" || op == "argmax") {
+                    // map the locations in grouped order back to the original order
+                    ref locs = toSymEntry(getGenericTypedArrayEntry(rname, st), int).a;
+                    forall l in locs with (var agg = newSrcAggregator(int)) {
+                        agg.copy(l, perm.a[l]);
+                    }
+                }
+                if !repMsg.isEmpty() then repMsg += " +";
+                repMsg += "created " + st.attrib(rname);
+            }
+        }
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
           
@@ -696,6 +953,142 @@ module ReductionMsg
       return res;
     }
 
+    /* Variance of each segment, with divisor (size - ddof), computed in one
+       pass by a scan that accumulates the (count, mean, sum of squared
+       deviations) of the values with Welford's update and resets at the
+       segment boundaries. Segments with no more than ddof values are NaN. */
+    proc segVar(values:[?vD] ?t, segments:[?D] int, ddof: int, skipNan=false): [D] real throws {
+      var res: [D] real = nan;
+      if (D.size == 0) { return res; }
+      var flagvalues: [vD] (bool, int, real, real);
+      forall (fv, val) in zip(flagvalues, values) {
+        fv = (false, 1, val:real, 0.0);
+        if isFloatType(t) {
+          if skipNan && isnan(val) then fv = (false, 0, 0.0, 0.0);
+        }
+      }
+      forall s in segments with (var agg = newDstAggregator(bool)) {
+        if s <= vD.high then agg.copy(flagvalues[s][0], true);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((3*numBytes(real)+1) * flagvalues.size);
+      const scanresult = ResettingWelfordScanOp scan flagvalues;
+      // Read the state at the last element of each segment
+      var stats: [D] (bool, int, real, real);
+      forall (i, st, low) in zip(D, stats, segments) with (var agg = newSrcAggregator((bool, int, real, real))) {
+        const vi = if i < D.high then segments[i+1] - 1 else vD.high;
+        if (vi >= low) {
+          agg.copy(st, scanresult[vi]);
+        }
+      }
+      forall (r, (_, n, _, m2)) in zip(res, stats) {
+        if (n - ddof > 0) {
+          r = m2 / (n - ddof);
+        }
+      }
+      return res;
+    }
+
+    /* Combines the (count, mean, sum of squared deviations) of two runs of
+       values into those of all the values of both runs */
+    inline proc welfordCombine(a: (int, real, real), b: (int, real, real)): (int, real, real) {
+      const (na, ma, m2a) = a;
+      const (nb, mb, m2b) = b;
+      if nb == 0 then return a;
+      if na == 0 then return b;
+      const n = na + nb;
+      const delta = mb - ma;
+      return (n, ma + delta * nb / n, m2a + m2b + delta * delta * na * nb / n);
+    }
+
+    /* Performs a scan of (count, mean, sum of squared deviations) states,
+     * controlled by a reset flag in the same way as ResettingPlusScanOp.
+     * Without any reset, it reduces the values to their variance in one
+     * pass. */
+    class ResettingWelfordScanOp: ReduceScanOp {
+      type eltType;
+      /* value is a tuple comprising a reset flag, as in ResettingPlusScanOp,
+         followed by the count, mean and sum of squared deviations of the
+         values accumulated since the last reset */
+      var value: eltType;
+
+      proc identity {
+        return (false, 0, 0.0, 0.0);
+      }
+
+      proc accumulate(x) {
+        const (reset, n, m, m2) = x;
+        const (hasReset, vn, vm, vm2) = value;
+        const (rn, rm, rm2) = if reset then (n, m, m2)
+                                       else welfordCombine((vn, vm, vm2), (n, m, m2));
+        value = (hasReset | reset, rn, rm, rm2);
+      }
+
+      proc accumulateOntoState(ref state, x) {
+        const (prevReset, n, m, m2) = x;
+        const (hasReset, sn, sm, sm2) = state;
+        const (rn, rm, rm2) = if hasReset then (sn, sm, sm2)
+                                          else welfordCombine((n, m, m2), (sn, sm, sm2));
+        state = (hasReset | prevReset, rn, rm, rm2);
+      }
+
+      proc combine(x) {
+        const (xHasReset, n, m, m2) = x.value;
+        const (hasReset, vn, vm, vm2) = value;
+        const (rn, rm, rm2) = if hasReset then (vn, vm, vm2)
+                                          else welfordCombine((n, m, m2), (vn, vm, vm2));
+        value = (hasReset | xHasReset, rn, rm, rm2);
+      }
+
+      proc generate() {
+        return value;
+      }
+
+      proc clone() {
+        return new unmanaged ResettingWelfordScanOp(eltType=eltType);
+      }
+    }
+
+    /* q-th quantile of each segment, selected from the values sorted within
+       their segments and interpolated linearly between the two nearest
+       values. Segments that are empty, or that contain NaN values and
+       skipNan is false, are NaN. */
+    proc segQuantile(values:[?vD] ?t, segments:[?D] int, q: real, skipNan=false): [D] real throws {
+      var res: [D] real = nan;
+      if (D.size == 0) { return res; }
+      const keys = expandKeys(vD, segments);
+      var counts = segCount(segments, vD.size);
+      var nancounts: [D] int;
+      var sorted: [vD] t;
+      if isFloatType(t) {
+        var nanflags: [vD] bool = isnan(values);
+        nancounts = segSum(nanflags, segments);
+        // NaN values sort after all others within their segment
+        var noNans: [vD] t = [v in values] if isnan(v) then inf else v;
+        sorted = sortWithinSegments(noNans, keys);
+      } else {
+        sorted = sortWithinSegments(values, keys);
+      }
+      var lows, highs: [D] t;
+      var fracs: [D] real;
+      var valid: [D] bool;
+      forall (low, c, nn, l, h, f, ok) in zip(segments, counts, nancounts, lows, highs, fracs, valid)
+        with (var agg = newSrcAggregator(t)) {
+        const n = if skipNan then c - nn else c;
+        if n > 0 && (skipNan || nn == 0) {
+          const (lo, hi, frac) = quantilePositions(n, q);
+          agg.copy(l, sorted[low + lo]);
+          agg.copy(h, sorted[low + hi]);
+          f = frac;
+          ok = true;
+        }
+      }
+      forall (r, l, h, f, ok) in zip(res, lows, highs, fracs, valid) {
+        if ok then r = interpolate(l:real, h:real, f);
+      }
+      return res;
+    }
+
     proc segMin(values:[?vD] ?t, segments:[?D] int, skipNan=false): [D] t throws {
       var res: [D] t = max(t);
       if (D.size == 0) { return res; }
@@ -1025,6 +1418,27 @@ module ReductionMsg
       return keys;
     }
 
+    /* Sorts the values by segment, given as the key of each value, and by
+       value within each segment */
+    proc sortWithinSegments(values: [?kD] ?t, keys: [kD] int): [kD] t throws {
+      var firstIV = radixSortLSD_ranks(values);
+      var intermediate: [kD] int;
+      forall (ii, idx) in zip(intermediate, firstIV) with (var agg = newSrcAggregator(int)) {
+          agg.copy(ii, keys[idx]);
+      }
+      // the sort is stable, so values stay sorted within each key
+      var deltaIV = radixSortLSD_ranks(intermediate);
+      var IV: [kD] int;
+      forall (IVi, idx) in zip(IV, deltaIV) with (var agg = newSrcAggregator(int)) {
+          agg.copy(IVi, firstIV[idx]);
+      }
+      var sorted: [kD] t;
+      forall (s, idx) in zip(sorted, IV) with (var agg = newSrcAggregator(t)) {
+          agg.copy(s, values[idx]);
+      }
+      return sorted;
+    }
+
     proc segNumUnique(values: [?kD] ?t, segments: [?sD] int) throws {
       var res: [sD] int;
       if (sD.size == 0) {
@@ -1132,6 +1546,7 @@ module ReductionMsg
     proc registerMe() {
       use CommandMap;
       registerFunction("segmentedReduction", segmentedReductionMsg, getModuleName());
+      registerFunction("segmentedAggregate", segmentedAggregateMsg, getModuleName());
       registerFunction("reduction", reductionMsg, getModuleName());
       registerFunction("countReduction", countReductionMsg, getModuleName());
     }
@@ -0,0 +1,258 @@
+/*
+ * Scheduling of client requests onto a pool of worker tasks. The server
+ * receives requests on a ROUTER socket, queues them per user, and starts them
+ * on up to serverWorkers concurrent tasks, taking the users in round-robin
+ * order so that one user's long-running commands do not starve the others.
+ *
+ * The requests sent over one socket run one at a time and in order, so each
+ * client receives its replies in the order of its requests. The requests of
+ * one user sent over different sockets (e.g., by the asyncio client) run
+ * concurrently only if they are read-only, and commands that affect every
+ * user's entries, such as clear, run alone.
+ */
+module RequestScheduler {
+    use CTypes;
+    use Map;
+    use List;
+    use Reflection;
+    use Logging;
+    use ServerConfig;
+    use ZMQ only;
+    use Message;
+
+    require "zmq.h";
+
+    private config const logLevel = ServerConfig.logLevel;
+    const rsLogger = new Logger(logLevel);
+
+    /*
+     * A request received from the client connected on the socket identified
+     * by identity
+     */
+    record Job {
+        var identity: bytes;
+        var msg: RequestMsg;
+        var payload: bytes;
+    }
+
+    /*
+     * The serialized reply to a Job, sent by the main task
+     */
+    record Reply {
+        var job: Job;
+        var reply: bytes;
+    }
+
+    /*
+     * Commands that only read the symbol table and the entries they refer to,
+     * so a user's requests for them may run concurrently
+     */
+    proc isReadOnly(cmd: string): bool {
+        select cmd {
+            when "str", "repr", "info", "getconfig", "getmemused", "getCmdMap", "tondarray",
+                 "tondarrayChunk", "reduction", "[int]", "lsany", "getfiletype", "arrowIPC",
+                 "ruok", "noop" {
+                return true;
+            }
+            otherwise {
+                return false;
+            }
+        }
+    }
+
+    /*
+     * Commands that affect the entries of every user, which therefore run
+     * once all running commands have completed, with no other command running
+     */
+    proc isExclusive(cmd: string): bool {
+        return cmd == "clear" || cmd == "shutdown";
+    }
+
+    /*
+     * Commands answered by the main task as soon as they are received, without
+     * waiting for a worker, unless the socket has earlier requests outstanding
+     */
+    proc isImmediate(cmd: string): bool {
+        return cmd == "ruok" || cmd == "noop";
+    }
+
+    class Scheduler {
+        const numWorkers: int;
+
+        /* queued jobs of each user, in order of receipt */
+        var queues: map(string, list(Job));
+
+        /* users with queued jobs, in round-robin order */
+        var users: list(string);
+        var nextUser = 0;
+
+        /* sockets with a running job */
+        var busy: domain(bytes, parSafe=false);
+
+        /* number of queued and running jobs of each socket */
+        var outstanding: map(bytes, int);
+
+        /* number of running read-only and other jobs of each user */
+        var readers: map(string, int);
+        var writers: map(string, int);
+        var numRunning = 0;
+
+        /* replies of completed jobs, appended by the workers */
+        var completed: list(Reply, parSafe=true);
+
+        proc init(numWorkers: int) {
+            this.numWorkers = max(numWorkers, 1);
+        }
+
+        /*
+         * Queues a job behind the jobs of the same user
+         */
+        proc enqueue(in job: Job) throws {
+            const user = job.msg.user;
+            if !queues.contains(user) {
+                queues.add(user, new list(Job));
+                users.append(user);
+            }
+            if !readers.contains(user) {
+                readers.add(user, 0);
+                writers.add(user, 0);
+            }
+            queues[user].append(job);
+            if outstanding.contains(job.identity) {
+                outstanding[job.identity] += 1;
+            } else {
+                outstanding.add(job.identity, 1);
+            }
+            rsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                           "queued %s for user %s (%i running)".format(job.msg.cmd, user, numRunning));
+        }
+
+        /*
+         * Returns the next job that may start, taking the users in round-robin
+         * order, and marks it running. Exclusive jobs are returned only once no
+         * other job is running, and then hold back the jobs queued after them.
+         */
+        proc next(): (bool, Job) throws {
+            var none: Job;
+            for k in 0..#users.size {
+                const u = (nextUser + k) % users.size;
+                const user = users[u];
+                ref queue = queues[user];
+                var seen: domain(bytes, parSafe=false);
+                for i in 0..#queue.size {
+                    const identity = queue[i].identity;
+                    // the socket's earlier job must complete first
+                    if busy.contains(identity) || seen.contains(identity) {
+                        seen += identity;
+                        continue;
+                    }
+                    seen += identity;
+                    const cmd = queue[i].msg.cmd;
+                    if isExclusive(cmd) {
+                        if numRunning > 0 then return (false, none);
+                    } else if numRunning >= numWorkers {
+                        return (false, none);
+                    } else if writers[user] > 0 || (!isReadOnly(cmd) && readers[user] > 0) {
+                        continue;
+                    }
+                    var job = queue.pop(i);
+                    if queue.isEmpty() {
+                        queues.remove(user);
+                        users.pop(u);
+                        nextUser = u;
+                    } else {
+                        nextUser = u + 1;
+                    }
+                    start(job);
+                    return (true, job);
+                }
+            }
+            return (false, none);
+        }
+
+        /*
+         * Marks a job running
+         */
+        proc start(const ref job: Job) throws {
+            const user = job.msg.user;
+            busy += job.identity;
+            if isReadOnly(job.msg.cmd) {
+                readers.addOrSet(user, readers[user] + 1);
+            } else {
+                writers.addOrSet(user, writers[user] + 1);
+            }
+            numRunning += 1;
+        }
+
+        /*
+         * Marks a job no longer running
+         */
+        proc finish(const ref job: Job) throws {
+            const user = job.msg.user;
+            busy -= job.identity;
+            outstanding[job.identity] -= 1;
+            if outstanding[job.identity] == 0 then outstanding.remove(job.identity);
+            if isReadOnly(job.msg.cmd) {
+                readers.addOrSet(user, readers[user] - 1);
+            } else {
+                writers.addOrSet(user, writers[user] - 1);
+            }
+            numRunning -= 1;
+        }
+
+        /*
+         * Called by a worker once a job has completed
+         */
+        proc complete(const ref job: Job, in reply: bytes) {
+            completed.append(new Reply(job, reply));
+        }
+
+        /*
+         * Returns the replies of the jobs completed since the last call and
+         * marks the jobs no longer running
+         */
+        proc takeCompleted(): list(Reply) throws {
+            var replies: list(Reply);
+            while !completed.isEmpty() {
+                var reply = completed.pop(0);
+                finish(reply.job);
+                replies.append(reply);
+            }
+            return replies;
+        }
+
+        /*
+         * Whether the socket identified by identity has queued or running
+         * jobs, whose replies must be sent before any later reply to it
+         */
+        proc hasOutstanding(identity: bytes): bool {
+            return outstanding.contains(identity);
+        }
+
+        proc idle(): bool {
+            return numRunning == 0;
+        }
+    }
+
+    private extern record zmq_pollitem_t {
+        var socket: c_void_ptr;
+        var fd: c_int;
+        var events: c_short;
+        var revents: c_short;
+    }
+    private extern const ZMQ_POLLIN: c_short;
+    private extern proc zmq_poll(items: c_ptr(zmq_pollitem_t), nitems: c_int, timeout: c_long): c_int;
+
+    /*
+     * Waits up to timeout milliseconds, or indefinitely if timeout is -1, for
+     * a request to arrive on socket. Returns whether a request can be received.
+     */
+    proc pollRequest(ref socket: ZMQ.Socket, timeout: int): bool {
+        var item: zmq_pollitem_t;
+        item.socket = socket.classRef!.socket;
+        item.fd = 0;
+        item.events = ZMQ_POLLIN;
+        item.revents = 0;
+        return zmq_poll(c_ptrTo(item), 1, timeout:c_long) > 0;
+    }
+}
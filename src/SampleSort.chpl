@@ -0,0 +1,175 @@
+/* range-partitioned sample sort
+ argsorts a block distributed array by splitting the keys into one range per
+ locale, chosen from a regular sample of the keys, moving every key to the
+ locale of its range in a single all-to-all exchange, and sorting each range
+ where it lands with a comparison sort. where the LSD radix sort exchanges the
+ keys once per digit, so that wide keys cost many exchanges, the sample sort
+ exchanges them once whatever their width.
+
+ keys are sorted together with their index, which makes the sort stable and
+ keeps the ranges balanced even when many keys are equal.
+ */
+module SampleSort
+{
+    use ServerConfig;
+
+    private use Sort;
+    use BlockDist;
+    use CommAggregation;
+    use CTypes;
+    private use RadixSortLSD only numTasks, Tasks, calcBlock;
+    use Reflection;
+    use Logging;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const sampleLogger = new Logger(logLevel);
+
+    /*
+    Number of keys sampled per locale to choose the ranges
+    */
+    config const sampleSortOversample = 64;
+
+    record KeyIndexComparator {
+      inline proc compare(a, b) {
+        if a < b then return -1;
+        if b < a then return 1;
+        return 0;
+      }
+    }
+
+    /* The key compared in place of a key of type t */
+    proc orderKeyType(type t) type {
+      if t == real then return uint; else return t;
+    }
+
+    // Reals are compared by their bits, with the whole key inverted if it is
+    // negative and only the sign bit if not, so that they sort as the radix
+    // sort sorts them
+    inline proc orderKey(in key: real): uint {
+      var keyu: uint;
+      c_memcpy(c_ptrTo(keyu), c_ptrTo(key), numBytes(key.type));
+      return if keyu >> (numBits(uint)-1) == 1 then ~keyu else keyu | (1:uint << (numBits(uint)-1));
+    }
+
+    inline proc orderKey(key) {
+      return key;
+    }
+
+    // range of a (key, index) pair: the number of splitters not above it
+    inline proc rangeOf(const ref p, const ref splitters: [?sD]): int {
+      var lo = 0, hi = sD.size;
+      while lo < hi {
+        const mid = (lo + hi) / 2;
+        if p < splitters[mid] then hi = mid; else lo = mid + 1;
+      }
+      return lo;
+    }
+
+    // (range,loc,task) = (range * numLocales * numTasks) + (loc * numTasks) + task;
+    private inline proc calcGlobalIndex(r: int, loc: int, task: int): int {
+      return ((r * numLocales * numTasks) + (loc * numTasks) + task);
+    }
+
+    /* Sample sort a block distributed array
+       returning a permutation vector as a block distributed array */
+    proc sampleSort_ranks(a: [?aD] ?t): [aD] int throws {
+      type kt = orderKeyType(t);
+      const n = aD.size;
+      var ranks: [aD] int;
+      if n == 0 then return ranks;
+
+      // choose numLocales-1 splitters from a regular sample
+      const m = min(n, numLocales * sampleSortOversample);
+      var sampleInds: [0..#m] int = [j in 0..#m] aD.low + (j * n) / m;
+      var sampleKeys: [0..#m] t;
+      forall (k, i) in zip(sampleKeys, sampleInds) with (var agg = newSrcAggregator(t)) {
+        agg.copy(k, a[i]);
+      }
+      var sample = [(k, i) in zip(sampleKeys, sampleInds)] (orderKey(k), i);
+      sort(sample, comparator=new KeyIndexComparator());
+      const nRanges = numLocales;
+      var splitters: [0..#(nRanges-1)] (kt, int);
+      for r in 1..<nRanges do splitters[r-1] = sample[(r * m) / nRanges];
+
+      // count the keys of each range on each locale/task
+      var gD = newBlockDom({0..#(nRanges * numLocales * numTasks)});
+      var globalCounts: [gD] int;
+      coforall loc in Locales with (ref globalCounts) {
+        on loc {
+          const mySplitters = splitters;
+          const lD = aD.localSubdomain();
+          coforall task in Tasks with (ref globalCounts) {
+            var taskCounts: [0..#nRanges] int;
+            for i in calcBlock(task, lD.low, lD.high) {
+              taskCounts[rangeOf((orderKey(a.localAccess[i]), i), mySplitters)] += 1;
+            }
+            var aggregator = newDstAggregator(int);
+            for r in 0..#nRanges {
+              aggregator.copy(globalCounts[calcGlobalIndex(r, loc.id, task)], taskCounts[r]);
+            }
+            aggregator.flush();
+          }
+        }
+      }
+      var globalStarts = + scan globalCounts;
+      globalStarts -= globalCounts;
+
+      // move every key, with its index, to its position in its range
+      var pD = newBlockDom({0..#n});
+      var pairs: [pD] (kt, int);
+      coforall loc in Locales with (ref pairs) {
+        on loc {
+          const mySplitters = splitters;
+          const lD = aD.localSubdomain();
+          coforall task in Tasks with (ref pairs) {
+            var taskPos: [0..#nRanges] int;
+            {
+              var aggregator = newSrcAggregator(int);
+              for r in 0..#nRanges {
+                aggregator.copy(taskPos[r], globalStarts[calcGlobalIndex(r, loc.id, task)]);
+              }
+              aggregator.flush();
+            }
+            var aggregator = newDstAggregator((kt, int));
+            for i in calcBlock(task, lD.low, lD.high) {
+              const p = (orderKey(a.localAccess[i]), i);
+              const r = rangeOf(p, mySplitters);
+              aggregator.copy(pairs[taskPos[r]], p);
+              taskPos[r] += 1;
+            }
+            aggregator.flush();
+          }
+        }
+      }
+
+      // sort each range on its locale
+      coforall loc in Locales with (ref ranks) {
+        on loc {
+          const r = loc.id;
+          const lo = globalStarts[calcGlobalIndex(r, 0, 0)];
+          const hi = if r == nRanges - 1 then n else globalStarts[calcGlobalIndex(r + 1, 0, 0)];
+          if hi > lo {
+            var myPairs: [0..#(hi - lo)] (kt, int) = pairs[lo..<hi];
+            sort(myPairs, comparator=new KeyIndexComparator());
+            forall (j, (_, i)) in zip(lo..<hi, myPairs) with (var agg = newDstAggregator(int)) {
+              agg.copy(ranks[aD.low + j], i);
+            }
+          }
+          try! sampleLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                                  "locid: %t sorted %t keys".format(loc.id, hi - lo));
+        }
+      }
+      return ranks;
+    }
+
+    /* Sample sort a block distributed array
+       returning sorted keys as a block distributed array */
+    proc sampleSort_keys(a: [?aD] ?t): [aD] t throws {
+      const ranks = sampleSort_ranks(a);
+      var sorted: [aD] t;
+      forall (s, i) in zip(sorted, ranks) with (var agg = newSrcAggregator(t)) {
+        agg.copy(s, a[i]);
+      }
+      return sorted;
+    }
+}
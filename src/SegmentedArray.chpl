@@ -1210,15 +1210,16 @@ module SegmentedArray {
   }
 
   /* Test array of strings for membership in another array (set) of strings. Returns
-     a boolean vector the same size as the first array. */
-  proc in1d(mainStr: SegString, testStr: SegString, invert=false) throws where useHash {
+     a boolean vector the same size as the first array. The method is passed on to
+     the in1d of the string hashes. */
+  proc in1d(mainStr: SegString, testStr: SegString, invert=false, method="auto") throws where useHash {
     use In1d;
     // Early exit for zero-length result
     if (mainStr.size == 0) {
       var truth: [mainStr.offsets.aD] bool;
       return truth;
     }
-    return in1d(mainStr.hash(), testStr.hash(), invert);
+    return in1d(mainStr.hash(), testStr.hash(), invert, method);
   }
 
   proc concat(s1: [] int, v1: [] uint(8), s2: [] int, v2: [] uint(8)) throws {
@@ -1236,12 +1237,17 @@ module SegmentedArray {
 
   private config const in1dSortThreshold = 64;
   
-  proc in1d(mainStr: SegString, testStr: SegString, invert=false) throws where !useHash {
+  proc in1d(mainStr: SegString, testStr: SegString, invert=false, method="auto") throws where !useHash {
     var truth: [mainStr.offsets.aD] bool;
     // Early exit for zero-length result
     if (mainStr.size == 0) {
       return truth;
     }
+    // the hash and bloom methods test the string hashes
+    if (method == "hash" || method == "bloom") {
+      use In1d;
+      return in1d(mainStr.hash(), testStr.hash(), invert, method);
+    }
     if (testStr.size <= in1dSortThreshold) {
       for i in 0..#testStr.size {
         truth |= (mainStr == testStr[i]);
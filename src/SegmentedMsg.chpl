@@ -602,7 +602,7 @@ module SegmentedMsg {
             }
             var repMsg = "created " + st.attrib(name1) + "+created " + st.attrib(name2);
             smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-            return new MsgTuple(repMsg, MsgType.NORMAL);
+            return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(name1, name2));
         }
         otherwise {
             var errorMsg = notImplementedError(pn, objtype);
@@ -931,13 +931,13 @@ module SegmentedMsg {
 
       repMsg = "created %s".format(st.attrib(rname));
       smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(), repMsg);
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
   }
 
   proc segIn1dMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
       var pn = Reflection.getRoutineName();
       var repMsg: string;
-      var (mainObjtype, mainName, testObjtype, testName, invertStr) = payload.splitMsgToTuple(5);
+      var (mainObjtype, mainName, testObjtype, testName, invertStr, method) = payload.splitMsgToTuple(6);
 
       // check to make sure symbols defined
       st.checkTable(mainName);
@@ -951,6 +951,11 @@ module SegmentedMsg {
           smLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
           return new MsgTuple(errorMsg, MsgType.ERROR);
       }
+      if method != "auto" && method != "hash" && method != "sort" && method != "bloom" {
+          var errorMsg = "Invalid argument in %s: %s (expected auto, hash, sort, or bloom)".format(pn, method);
+          smLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
     
       var rname = st.nextName();
  
@@ -959,7 +964,7 @@ module SegmentedMsg {
               var mainStr = getSegString(mainName, st);
               var testStr = getSegString(testName, st);
               var e = st.addEntry(rname, mainStr.size, bool);
-              e.a = in1d(mainStr, testStr, invert);
+              e.a = in1d(mainStr, testStr, invert, method);
           }
           otherwise {
               var errorMsg = unrecognizedTypeError(pn, "("+mainObjtype+", "+testObjtype+")");
@@ -970,7 +975,7 @@ module SegmentedMsg {
 
       repMsg = "created " + st.attrib(rname);
       smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
   }
 
   proc segGroupMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
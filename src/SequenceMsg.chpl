@@ -49,13 +49,14 @@ module SequenceMsg {
         forall (ei, i) in zip(ea,ead) {
             ei = start + (i * stride);
         }
+        if stride > 0 then e.setSorted(unique=true);
 
         smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
                                       "compute time = %i sec".format(Time.getCurrentTime() - t1));
 
         repMsg = "created " + st.attrib(rname);
         smLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
     }            
 
     /* 
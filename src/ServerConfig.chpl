@@ -33,6 +33,11 @@ module ServerConfig
     */
     config const perLocaleMemLimit = 90;
 
+    /*
+    Maximum number of client requests that are processed concurrently
+    */
+    config const serverWorkers = 4;
+
     /*
     Arkouda version
     */
@@ -104,6 +109,8 @@ module ServerConfig
             const logLevel: LogLevel;
             const regexMaxCaptures: int;
             const byteorder: string;
+            const binaryReplies: bool;
+            const serverWorkers: int;
         }
 
         var (Zmajor, Zminor, Zmicro) = ZMQ.version;
@@ -125,7 +132,9 @@ module ServerConfig
             authenticate = authenticate,
             logLevel = logLevel,
             regexMaxCaptures = regexMaxCaptures,
-            byteorder = try! getByteorder()
+            byteorder = try! getByteorder(),
+            binaryReplies = true,
+            serverWorkers = serverWorkers
         );
         return try! "%jt".format(cfg);
 
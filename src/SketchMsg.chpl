@@ -0,0 +1,295 @@
+module SketchMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use SegmentedArray;
+    use SymArrayDmap;
+
+    use Sketches;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const skmLogger = new Logger(logLevel);
+
+    /*
+    Smallest and largest precisions of HyperLogLog sketches
+    */
+    private const minPrecision = 4, maxPrecision = 18;
+
+    /*
+    Hashes of the values of the named pdarray or Strings, as used by the
+    sketches
+    */
+    private proc valueHashes(name: string, objtype: string, st: borrowed SymTab) throws {
+        select objtype {
+            when "str" {
+                return getSegString(name, st).hash();
+            }
+            when "pdarray" {
+                var g = getGenericTypedArrayEntry(name, st);
+                // check there's enough room for the hashes
+                overMemLimit(2 * numBytes(uint) * g.size);
+                select g.dtype {
+                    when DType.Int64 {
+                        return [x in toSymEntry(g, int).a] keyHash(x);
+                    }
+                    when DType.UInt64 {
+                        return [x in toSymEntry(g, uint).a] keyHash(x);
+                    }
+                    when DType.Float64 {
+                        return [x in toSymEntry(g, real).a] keyHash(x);
+                    }
+                    when DType.Bool {
+                        return [x in toSymEntry(g, bool).a] keyHash(x);
+                    }
+                    otherwise {
+                        throw getErrorWithContext(
+                                  msg=dtype2str(g.dtype),
+                                  lineNumber=getLineNumber(),
+                                  routineName=getRoutineName(),
+                                  moduleName=getModuleName(),
+                                  errorClass="TypeError");
+                    }
+                }
+            }
+            otherwise {
+                throw getErrorWithContext(
+                          msg=unrecognizedTypeError(getRoutineName(), objtype),
+                          lineNumber=getLineNumber(),
+                          routineName=getRoutineName(),
+                          moduleName=getModuleName(),
+                          errorClass="TypeError");
+            }
+        }
+    }
+
+    private proc precisionError(pn: string, p: int): MsgTuple throws {
+        var errorMsg = incompatibleArgumentsError(pn,
+                           "HyperLogLog precision must be between %i and %i, got %i".format(
+                           minPrecision, maxPrecision, p));
+        skmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+        return new MsgTuple(errorMsg, MsgType.ERROR);
+    }
+
+    /*
+    Builds the HyperLogLog registers of a pdarray or Strings, or of each of
+    its groups if the permutation and segments of a grouping are given.
+
+    :arg reqMsg: request containing (cmd,name,objtype,precision,[perm,segments])
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the uint8 registers
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hllBuildMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (name, objtype, pStr, permName, segName) = payload.splitMsgToTuple(5);
+        const p = pStr:int;
+        if p < minPrecision || p > maxPrecision then return precisionError(pn, p);
+        const hashes = valueHashes(name, objtype, st);
+        var rname = st.nextName();
+        if permName == "" {
+            st.addEntry(rname, new shared SymEntry(hllRegisters(hashes, p)));
+        } else {
+            var perm = toSymEntry(getGenericTypedArrayEntry(permName, st), int);
+            var segs = toSymEntry(getGenericTypedArrayEntry(segName, st), int);
+            if perm.size != hashes.size {
+                var errorMsg = incompatibleArgumentsError(pn,
+                                   "Expected array of size %i, got size %i".format(perm.size, hashes.size));
+                skmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            st.addEntry(rname, new shared SymEntry(groupedHllRegisters(hashes, perm.a, segs.a, p)));
+        }
+        var repMsg = "created " + st.attrib(rname);
+        skmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Estimates the number of distinct values of each sketch of a HyperLogLog
+    registers array.
+
+    :arg reqMsg: request containing (cmd,registers,precision)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the int64 estimates
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hllEstimateMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (regName, pStr) = payload.splitMsgToTuple(2);
+        const p = pStr:int;
+        if p < minPrecision || p > maxPrecision then return precisionError(pn, p);
+        var regs = toSymEntry(getGenericTypedArrayEntry(regName, st), uint(8));
+        if regs.size % (1 << p) != 0 {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "%i registers are not sketches of precision %i".format(regs.size, p));
+            skmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(hllEstimates(regs.a, p)));
+        var repMsg = "created " + st.attrib(rname);
+        skmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Merges the HyperLogLog registers of a second sketch into the first, in
+    place, keeping the larger of each pair of registers.
+
+    :arg reqMsg: request containing (cmd,registers,otherRegisters)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) "success"
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc hllMergeMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (name, otherName) = payload.splitMsgToTuple(2);
+        var gEnt = getGenericTypedArrayEntry(name, st);
+        var regs = toSymEntry(gEnt, uint(8));
+        var other = toSymEntry(getGenericTypedArrayEntry(otherName, st), uint(8));
+        if regs.size != other.size {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i registers, got %i".format(regs.size, other.size));
+            skmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        gEnt.modified();
+        regs.a = max(regs.a, other.a);
+        var repMsg = "success";
+        skmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Builds the Count-Min counters of a pdarray or Strings.
+
+    :arg reqMsg: request containing (cmd,name,objtype,depth,width)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the int64 counters
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc cmsBuildMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (name, objtype, depthStr, widthStr) = payload.splitMsgToTuple(4);
+        const depth = depthStr:int, width = widthStr:int;
+        if depth < 1 || width < 1 {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Count-Min depth and width must be positive, got %i and %i".format(depth, width));
+            skmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const hashes = valueHashes(name, objtype, st);
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(cmsCounters(hashes, depth, width)));
+        var repMsg = "created " + st.attrib(rname);
+        skmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Checks that counters has depth rows of width counters
+    */
+    private proc countersShapeError(pn: string, counters, depth: int, width: int): string throws {
+        if counters.size != depth * width {
+            var errorMsg = incompatibleArgumentsError(pn,
+                               "Expected %i counters, got %i".format(depth * width, counters.size));
+            skmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return errorMsg;
+        }
+        return "";
+    }
+
+    /*
+    Estimates the count of each value of a pdarray or Strings with
+    Count-Min counters.
+
+    :arg reqMsg: request containing (cmd,name,objtype,counters,depth,width)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the int64 estimates
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc cmsEstimateMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (name, objtype, cname, depthStr, widthStr) = payload.splitMsgToTuple(5);
+        const depth = depthStr:int, width = widthStr:int;
+        var counters = toSymEntry(getGenericTypedArrayEntry(cname, st), int);
+        const errorMsg = countersShapeError(pn, counters, depth, width);
+        if errorMsg != "" then return new MsgTuple(errorMsg, MsgType.ERROR);
+        const hashes = valueHashes(name, objtype, st);
+        var rname = st.nextName();
+        st.addEntry(rname, new shared SymEntry(cmsEstimates(hashes, counters.a, depth, width)));
+        var repMsg = "created " + st.attrib(rname);
+        skmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(rname));
+    }
+
+    /*
+    Finds the values of a pdarray or Strings with the largest counts
+    estimated by Count-Min counters.
+
+    :arg reqMsg: request containing (cmd,name,objtype,counters,depth,width,capacity)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: (MsgTuple) the index of a row of each value found and its
+              estimated count, by decreasing count
+    :throws: `UndefinedSymbolError(name)`
+    */
+    proc heavyHittersMsg(cmd: string, payload: string, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        var (name, objtype, cname, depthStr, widthStr, capacityStr) = payload.splitMsgToTuple(6);
+        const depth = depthStr:int, width = widthStr:int, capacity = capacityStr:int;
+        var counters = toSymEntry(getGenericTypedArrayEntry(cname, st), int);
+        const errorMsg = countersShapeError(pn, counters, depth, width);
+        if errorMsg != "" then return new MsgTuple(errorMsg, MsgType.ERROR);
+        const hashes = valueHashes(name, objtype, st);
+        var (idx, est) = heavyHitters(hashes, counters.a, depth, width, max(capacity, 1));
+        var iname = st.nextName();
+        st.addEntry(iname, new shared SymEntry(idx));
+        var ename = st.nextName();
+        st.addEntry(ename, new shared SymEntry(est));
+        var repMsg = "created " + st.attrib(iname) + " +created " + st.attrib(ename);
+        skmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    proc registerMe() {
+        use CommandMap;
+        registerFunction("hllBuild", hllBuildMsg, getModuleName());
+        registerFunction("hllEstimate", hllEstimateMsg, getModuleName());
+        registerFunction("hllMerge", hllMergeMsg, getModuleName());
+        registerFunction("cmsBuild", cmsBuildMsg, getModuleName());
+        registerFunction("cmsEstimate", cmsEstimateMsg, getModuleName());
+        registerFunction("heavyHitters", heavyHittersMsg, getModuleName());
+    }
+}
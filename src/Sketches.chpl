@@ -0,0 +1,357 @@
+/* approximate sketches
+ HyperLogLog sketches estimate the number of distinct values of an array, or
+ of each group of a grouped array, and Count-Min sketches estimate how often
+ each value occurs, which is used to find the most frequent values.
+
+ the sketches are built from 128-bit hashes of the values. every task of every
+ locale builds a sketch of its share of the rows, and the sketches are merged
+ on each locale and then across locales, so building a sketch never sorts or
+ moves the values. sketches of different arrays are merged the same way:
+ HyperLogLog registers by their maximum and Count-Min counters by their sum.
+ */
+module Sketches
+{
+    use ServerConfig;
+
+    use Map;
+    use List;
+    use Sort;
+    use BitOps;
+    use PrivateDist;
+    use CommAggregation;
+    use SymArrayDmap;
+    use SipHash;
+    use Reflection;
+    use Logging;
+
+    private config const logLevel = ServerConfig.logLevel;
+    const skLogger = new Logger(logLevel);
+
+    /*
+    Hash of a value, or the value itself if it already is a hash
+    */
+    inline proc keyHash(x: 2*uint): 2*uint {
+        return x;
+    }
+
+    // sipHash128 of a value hashes its first 8 bytes
+    inline proc keyHash(x: bool): 2*uint {
+        return sipHash128(x:int);
+    }
+
+    inline proc keyHash(x): 2*uint {
+        return sipHash128(x);
+    }
+
+    /*
+    Indices of the local subdomain processed by task t of nTasks
+    */
+    proc taskRange(const ref myD, t: int, nTasks: int): range {
+        const lo = myD.low + myD.size * t / nTasks;
+        const hi = myD.low + myD.size * (t + 1) / nTasks - 1;
+        return lo..hi;
+    }
+
+    /*
+    Adds the 64-bit hash h to the HyperLogLog registers regs[offset..#2**p]:
+    the first p bits of h choose the register, which keeps the largest
+    position of the first set bit in the remaining bits
+    */
+    inline proc hllAdd(ref regs: [] uint(8), offset: int, h: uint, p: int) {
+        const r = offset + (h >> (64 - p)): int;
+        const w = h << p;
+        const rank = (if w == 0 then 64 - p + 1 else clz(w): int + 1): uint(8);
+        if rank > regs[r] then regs[r] = rank;
+    }
+
+    /*
+    Estimated number of distinct values added to the HyperLogLog registers
+    regs[offset..#2**p], using linear counting for small estimates
+    */
+    proc hllEstimate(const ref regs: [] uint(8), offset: int, p: int): real {
+        const m = 1 << p;
+        var sum = 0.0;
+        var zeros = 0;
+        for r in offset..#m {
+            sum += 2.0 ** (-(regs[r]: real));
+            if regs[r] == 0 then zeros += 1;
+        }
+        const alpha = if m == 16 then 0.673
+                      else if m == 32 then 0.697
+                      else if m == 64 then 0.709
+                      else 0.7213 / (1.0 + 1.079 / m);
+        var e = alpha * m * m / sum;
+        if e <= 2.5 * m && zeros > 0 then e = m * log(m: real / zeros);
+        return e;
+    }
+
+    /*
+    HyperLogLog registers of the values
+
+    :arg values: values, or their hashes
+    :arg p: precision, the log2 of the number of registers
+
+    :returns: [] uint(8) the 2**p registers
+    */
+    proc hllRegisters(const ref values: [?D] ?t, p: int) throws {
+        const m = 1 << p;
+        var localRegs: [PrivateSpace] [0..#m] uint(8);
+
+        coforall loc in Locales with (ref localRegs) do on loc {
+            const myD = values.localSubdomain();
+            const nTasks = here.maxTaskPar;
+            var taskRegs: [0..#nTasks] [0..#m] uint(8);
+            coforall task in 0..#nTasks with (ref taskRegs) {
+                ref mine = taskRegs[task];
+                for i in taskRange(myD, task, nTasks) do hllAdd(mine, 0, keyHash(values[i])(0), p);
+            }
+            ref myRegs = localRegs[here.id];
+            forall r in 0..#m with (ref myRegs) {
+                for task in 0..#nTasks do myRegs[r] = max(myRegs[r], taskRegs[task][r]);
+            }
+        }
+
+        var regs = makeDistArray(m, uint(8));
+        forall r in regs.domain with (ref regs) {
+            var x: uint(8);
+            for l in PrivateSpace do x = max(x, localRegs[l][r]);
+            regs[r] = x;
+        }
+        return regs;
+    }
+
+    /*
+    Index of the group of row i of the grouped rows
+    */
+    private proc groupOf(const ref segments: [?sD] int, i: int): int {
+        var lo = sD.low, hi = sD.high;
+        while lo < hi {
+            const mid = (lo + hi + 1) / 2;
+            if segments[mid] <= i then lo = mid; else hi = mid - 1;
+        }
+        return lo;
+    }
+
+    /*
+    HyperLogLog registers of the values of each group. The rows are taken in
+    grouped order, so every task only sees the groups of a range of rows.
+    The groups that lie entirely in the rows of a task are written by that
+    task alone; the first and last groups of each task, which other tasks may
+    share, are merged once all the tasks are done.
+
+    :arg values: values, or their hashes
+    :arg perm: permutation that groups the values
+    :arg segments: index of the first row of each group in grouped order
+    :arg p: precision, the log2 of the number of registers per group
+
+    :returns: [] uint(8) the 2**p registers of each group, one after another
+    */
+    proc groupedHllRegisters(const ref values: [?D] ?t, const ref perm: [D] int,
+                             const ref segments: [?sD] int, p: int) throws {
+        const m = 1 << p;
+        const ngroups = sD.size;
+        // check there's enough room for the registers and a copy of them
+        overMemLimit(2 * ngroups * m + numBytes(uint) * D.size * 2);
+        var regs = makeDistArray(ngroups * m, uint(8));
+        if D.size == 0 then return regs;
+
+        // hashes of the values in grouped order
+        const hashes = [x in values] keyHash(x)(0);
+        var grouped = makeDistArray(D.size, uint);
+        forall (g, i) in zip(grouped, perm) with (var agg = newSrcAggregator(uint)) {
+            agg.copy(g, hashes[i]);
+        }
+
+        const nTasks = here.maxTaskPar;
+        var edgeGroups: [PrivateSpace] [0..#nTasks, 0..1] int = -1;
+        var edgeRegs: [PrivateSpace] [0..#nTasks, 0..1] [0..#m] uint(8);
+        coforall loc in Locales with (ref regs, ref edgeGroups, ref edgeRegs) do on loc {
+            const myD = grouped.localSubdomain();
+            ref myEdgeGroups = edgeGroups[here.id];
+            ref myEdgeRegs = edgeRegs[here.id];
+            coforall task in 0..#nTasks with (ref regs, ref myEdgeGroups, ref myEdgeRegs) {
+                const rows = taskRange(myD, task, nTasks);
+                if rows.size > 0 {
+                    const first = groupOf(segments, rows.low);
+                    const last = groupOf(segments, rows.high);
+                    var mine: [0..#(last - first + 1) * m] uint(8);
+                    var g = first;
+                    var next = if g < sD.high then segments[g+1] else D.high + 1;
+                    for i in rows {
+                        while i >= next {
+                            g += 1;
+                            next = if g < sD.high then segments[g+1] else D.high + 1;
+                        }
+                        hllAdd(mine, (g - first) * m, grouped[i], p);
+                    }
+                    if last - first > 1 {
+                        const n = (last - first - 1) * m;
+                        regs[(first + 1) * m..#n] = mine[m..#n];
+                    }
+                    myEdgeGroups[task, 0] = first;
+                    myEdgeRegs[task, 0] = mine[0..#m];
+                    if last > first {
+                        myEdgeGroups[task, 1] = last;
+                        myEdgeRegs[task, 1] = mine[(last - first) * m..#m];
+                    }
+                }
+            }
+        }
+
+        for l in PrivateSpace {
+            for (task, side) in {0..#nTasks, 0..1} {
+                const g = edgeGroups[l][task, side];
+                if g >= 0 {
+                    const ref edge = edgeRegs[l][task, side];
+                    forall r in 0..#m with (ref regs) {
+                        regs[g * m + r] = max(regs[g * m + r], edge[r]);
+                    }
+                }
+            }
+        }
+        return regs;
+    }
+
+    /*
+    Estimated number of distinct values of each sketch of regs, made of the
+    2**p registers of each sketch one after another
+    */
+    proc hllEstimates(const ref regs: [?D] uint(8), p: int) throws {
+        const m = 1 << p;
+        var est = makeDistArray(D.size / m, int);
+        forall (e, s) in zip(est, est.domain) {
+            e = round(hllEstimate(regs, s * m, p)): int;
+        }
+        return est;
+    }
+
+    /*
+    Column of the Count-Min counters of row r that counts the value of hash h
+    */
+    inline proc cmsColumn(h: 2*uint, r: int, width: int): int {
+        return ((h(0) + (r: uint) * h(1)) % (width: uint)): int;
+    }
+
+    /*
+    Estimated count of the value of hash h: the smallest of its counters
+    */
+    inline proc cmsEstimate(const ref counters: [] int, h: 2*uint, depth: int, width: int): int {
+        var est = max(int);
+        for r in 0..#depth do est = min(est, counters[counters.domain.low + r * width + cmsColumn(h, r, width)]);
+        return est;
+    }
+
+    /*
+    Count-Min counters of the values
+
+    :arg values: values, or their hashes
+    :arg depth: number of rows of counters
+    :arg width: number of counters in each row
+
+    :returns: [] int the depth rows of width counters, one after another
+    */
+    proc cmsCounters(const ref values: [?D] ?t, depth: int, width: int) throws {
+        var counts: [0..#depth * width] int;
+        forall x in values with (+ reduce counts) {
+            const h = keyHash(x);
+            for r in 0..#depth do counts[r * width + cmsColumn(h, r, width)] += 1;
+        }
+        var counters = makeDistArray(depth * width, int);
+        counters = counts;
+        return counters;
+    }
+
+    /*
+    Estimated count of each value
+    */
+    proc cmsEstimates(const ref values: [?D] ?t, const ref counters: [] int,
+                      depth: int, width: int) throws {
+        var est = makeDistArray(D.size, int);
+        coforall loc in Locales with (ref est) do on loc {
+            const myCounters: [0..#depth * width] int = counters;
+            forall i in est.localSubdomain() with (ref est) {
+                est[i] = cmsEstimate(myCounters, keyHash(values[i]), depth, width);
+            }
+        }
+        return est;
+    }
+
+    /*
+    Keeps the capacity values with the largest estimated counts
+    */
+    private proc pruneCandidates(ref cands: map(2*uint, (int, int)), capacity: int): int throws {
+        var byCount: [0..#cands.size] (int, int, 2*uint);
+        for (c, (h, (est, i))) in zip(byCount, cands.items()) do c = (-est, i, h);
+        sort(byCount);
+        cands.clear();
+        for (negEst, i, h) in byCount[0..#min(capacity, byCount.size)] do cands.add(h, (-negEst, i));
+        return if byCount.size > capacity then -byCount[capacity - 1](0) else 0;
+    }
+
+    /*
+    Finds the values with the largest estimated counts. Every task keeps the
+    values of its rows whose estimates are among the largest it has seen,
+    pruning them to the capacity values with the largest estimates whenever
+    it keeps twice as many; the values kept by the tasks are then merged.
+
+    :arg values: values, or their hashes
+    :arg counters: Count-Min counters of at least the values
+    :arg depth: number of rows of counters
+    :arg width: number of counters in each row
+    :arg capacity: number of values to find
+
+    :returns: ([] int, [] int) the index of a row of each value found and
+              its estimated count, by decreasing count
+    */
+    proc heavyHitters(const ref values: [?D] ?t, const ref counters: [] int,
+                      depth: int, width: int, capacity: int) throws {
+        var localCands: [PrivateSpace] list((2*uint, (int, int)));
+
+        coforall loc in Locales with (ref localCands) do on loc {
+            const myCounters: [0..#depth * width] int = counters;
+            const myD = values.localSubdomain();
+            const nTasks = here.maxTaskPar;
+            var taskCands: [0..#nTasks] map(2*uint, (int, int));
+            coforall task in 0..#nTasks with (ref taskCands) {
+                ref mine = taskCands[task];
+                var threshold = 0;
+                for i in taskRange(myD, task, nTasks) {
+                    const h = keyHash(values[i]);
+                    if mine.contains(h) then continue;
+                    const est = cmsEstimate(myCounters, h, depth, width);
+                    if est <= threshold then continue;
+                    mine.add(h, (est, i));
+                    if mine.size > 2 * capacity then threshold = pruneCandidates(mine, capacity);
+                }
+            }
+            var merged: map(2*uint, (int, int));
+            for tc in taskCands {
+                for (h, c) in tc.items() {
+                    if !merged.add(h, c) then merged[h] = min(merged[h], c);
+                }
+            }
+            pruneCandidates(merged, capacity);
+            for (h, c) in merged.items() do localCands[here.id].append((h, c));
+        }
+
+        var merged: map(2*uint, (int, int));
+        for l in PrivateSpace {
+            for (h, c) in localCands[l].toArray() {
+                if !merged.add(h, c) then merged[h] = min(merged[h], c);
+            }
+        }
+        var byCount: [0..#merged.size] (int, int);
+        for (b, (est, i)) in zip(byCount, merged.values()) do b = (-est, i);
+        sort(byCount);
+        const n = min(capacity, byCount.size);
+        var idx = makeDistArray(n, int);
+        var est = makeDistArray(n, int);
+        forall (x, e, j) in zip(idx, est, idx.domain) {
+            x = byCount[j](1);
+            e = -byCount[j](0);
+        }
+        skLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "found %i of %i candidates".format(n, byCount.size));
+        return (idx, est);
+    }
+}
@@ -11,6 +11,7 @@ module SortMsg
     use MultiTypeSymEntry;
     use ServerErrorStrings;
     use RadixSortLSD;
+    use SampleSort;
     use AryUtil;
     use Logging;
     use Message;
@@ -58,7 +59,8 @@ module SortMsg
                  cmd, name, sortedName, gEnt.dtype));
 
       proc doSort(a: [?D] ?t) throws {
-        select algorithm {
+        const algo = if algorithm == SortingAlgorithm.Auto then chooseSortAlgorithm(a) else algorithm;
+        select algo {
           when SortingAlgorithm.TwoArrayRadixSort {
             var b: [D] t = a;
             Sort.TwoArrayRadixSort.twoArrayRadixSort(b, comparator=myDefaultComparator);
@@ -67,6 +69,9 @@ module SortMsg
           when SortingAlgorithm.RadixSortLSD {
             return radixSortLSD_keys(a);
           }
+          when SortingAlgorithm.SampleSort {
+            return sampleSort_keys(a);
+          }
           otherwise {
             throw getErrorWithContext(
                                       msg="Unrecognized sorting algorithm: %s".format(algorithm:string),
@@ -83,18 +88,24 @@ module SortMsg
       select (gEnt.dtype) {
           when (DType.Int64) {
               var e = toSymEntry(gEnt, int);
-              var sorted = doSort(e.a);
-              st.addEntry(sortedName, new shared SymEntry(sorted));
+              var sorted = if e.isSorted() then e.a else doSort(e.a);
+              var se = new shared SymEntry(sorted);
+              se.setSorted(unique=e.isUnique());
+              st.addEntry(sortedName, se);
           }// end when(DType.Int64)
           when (DType.UInt64) {
               var e = toSymEntry(gEnt, uint);
-              var sorted = doSort(e.a);
-              st.addEntry(sortedName, new shared SymEntry(sorted));
+              var sorted = if e.isSorted() then e.a else doSort(e.a);
+              var se = new shared SymEntry(sorted);
+              se.setSorted(unique=e.isUnique());
+              st.addEntry(sortedName, se);
           }// end when(DType.UInt64)
           when (DType.Float64) {
               var e = toSymEntry(gEnt, real);
-              var sorted = doSort(e.a);
-              st.addEntry(sortedName, new shared SymEntry(sorted));
+              var sorted = if e.isSorted() then e.a else doSort(e.a);
+              var se = new shared SymEntry(sorted);
+              se.setSorted(unique=e.isUnique());
+              st.addEntry(sortedName, se);
           }// end when(DType.Float64)
           otherwise {
               var errorMsg = notImplementedError(pn,gEnt.dtype);
@@ -106,7 +117,7 @@ module SortMsg
 
       repMsg = "created " + st.attrib(sortedName);
       sortLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);      
-      return new MsgTuple(repMsg, MsgType.NORMAL);
+      return new MsgTuple(repMsg, MsgType.NORMAL, st.descriptors(sortedName));
     }// end sortMsg()
 
     proc registerMe() {
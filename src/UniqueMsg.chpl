@@ -99,16 +99,22 @@ module UniqueMsg
                     /*     if returnCounts {st.addEntry(cname, new shared SymEntry(aC));} */
                     /* } */
 
-                    var (aV,aC) = uniqueSort(e.a);
-                    st.addEntry(vname, new shared SymEntry(aV));
+                    var (aV,aC) = if e.isSorted() && e.size > 0 then uniqueFromSorted(e.a)
+                                                                else uniqueSort(e.a);
+                    var ve = new shared SymEntry(aV);
+                    ve.setSorted(unique=true);
+                    st.addEntry(vname, ve);
                     if returnCounts {
                         st.addEntry(cname, new shared SymEntry(aC));
                     }
                   } when (DType.UInt64) {
                     var e = toSymEntry(gEnt,uint);
 
-                    var (aV,aC) = uniqueSort(e.a);
-                    st.addEntry(vname, new shared SymEntry(aV));
+                    var (aV,aC) = if e.isSorted() && e.size > 0 then uniqueFromSorted(e.a)
+                                                                else uniqueSort(e.a);
+                    var ve = new shared SymEntry(aV);
+                    ve.setSorted(unique=true);
+                    st.addEntry(vname, ve);
                     if returnCounts {
                         st.addEntry(cname, new shared SymEntry(aC));
                     }
@@ -20,6 +20,7 @@ use Reflection;
 use SymArrayDmap;
 use ServerErrorStrings;
 use Message;
+use RequestScheduler;
 
 use CommandMap, ServerRegistration;
 
@@ -132,6 +133,7 @@ proc main() {
      */
     proc registerServerCommands() {
         registerBinaryFunction("tondarray", tondarrayMsg);
+        registerBinaryFunction("tondarrayChunk", tondarrayChunkMsg);
         registerFunction("create", createMsg);
         registerFunction("delete", deleteMsg);
         registerFunction("set", setMsg);
@@ -145,11 +147,13 @@ proc main() {
         registerFunction("lsany", lsAnyMsg);
         registerFunction("readany", readAnyMsg);
         registerFunction("getfiletype", getFileTypeMsg);
+        registerFunction("batch", batchMsg);
 
         // For a few specialized cmds we're going to add dummy functions, so they
         // get added to the client listing of available commands. They will be
         // intercepted in the cmd processing select statement and processed specially
         registerFunction("array", akMsgSign);
+        registerFunction("arrayChunk", akMsgSign);
         registerFunction("connect", akMsgSign);
         registerFunction("disconnect", akMsgSign);
         registerFunction("noop", akMsgSign);
@@ -169,7 +173,7 @@ proc main() {
 
     // create and connect ZMQ socket
     var context: ZMQ.Context;
-    var socket : ZMQ.Socket = context.socket(ZMQ.REP);
+    var socket : ZMQ.Socket = context.socket(ZMQ.ROUTER);
 
     // configure token authentication if applicable
     if authenticate {
@@ -196,22 +200,35 @@ proc main() {
     t1.start();
 
     /*
-    Following processing of incoming message, sends a message back to the client.
+    Sends a reply to the client connected on the socket identified by identity.
+    The ROUTER socket routes the reply by the identity frame, which is followed
+    by the empty delimiter frame of the REQ/REP envelope.
 
-    :arg repMsg: either a string or bytes to be sent
+    :arg identity: identity of the client socket, received with the request
+    :arg repMsg: the serialized reply
     */
-    proc sendRepMsg(repMsg: ?t) throws where t==string || t==bytes {
+    proc sendRepMsg(identity: bytes, repMsg: bytes) throws {
         repCount += 1;
+        socket.send(identity, ZMQ.SNDMORE);
+        socket.send(b"", ZMQ.SNDMORE);
+        socket.send(repMsg);
+    }
+
+    /*
+    Serializes a string reply as a JSON-formatted ReplyMsg or, if the client
+    negotiated binary replies and requested one, binary-encoded
+    */
+    proc formatReply(msg: string, msgType: MsgType, user: string, binaryReply: bool,
+                     created: bytes = b""): bytes throws {
         if trace {
-          if t==bytes {
-              asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
-                                                        "repMsg: <binary-data>");
-          } else {
-              asLogger.info(getModuleName(),getRoutineName(),getLineNumber(), 
-                                                        "repMsg: %s".format(repMsg));
-          }
+            asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                                                        "repMsg: %s".format(msg));
+        }
+        if binaryReply {
+            return serializeBinary(msg, msgType, created);
+        } else {
+            return serialize(msg=msg, msgType=msgType, msgFormat=MsgFormat.STRING, user=user):bytes;
         }
-        socket.send(repMsg);
     }
 
     /*
@@ -239,62 +256,39 @@ proc main() {
     }
     
     /*
-    Sets the shutdownServer boolean to true and sends the shutdown command to socket,
-    which stops the arkouda_server listener thread and closes socket.
+    Sets the shutdownServer boolean to true and sends the shutdown reply to the
+    client, which stops the arkouda_server listener loop.
     */
-    proc shutdown(user: string) {
+    proc shutdown(const ref job: Job) throws {
         if saveUsedModules then
           writeUsedModules();
         shutdownServer = true;
-        repCount += 1;
-        socket.send(serialize(msg="shutdown server (%i req)".format(repCount), 
-                         msgType=MsgType.NORMAL,msgFormat=MsgFormat.STRING, user=user));
+        sendRepMsg(job.identity, serialize(msg="shutdown server (%i req)".format(repCount + 1), 
+                         msgType=MsgType.NORMAL,msgFormat=MsgFormat.STRING, user=job.msg.user):bytes);
+        if (trace) {
+            asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                                 "<<< shutdown initiated by %s".format(job.msg.user));
+        }
     }
-    
-    while !shutdownServer {
-        // receive message on the zmq socket
-        var reqMsgRaw = socket.recv(bytes);
-
-        reqCount += 1;
 
+    /*
+    Executes the request of a job and returns the serialized reply. Runs on the
+    worker task started for the job, except for the exclusive commands, which
+    run on the main task, so any error is returned as an error reply.
+    */
+    proc processRequest(const ref job: Job): bytes {
+        const user = job.msg.user;
+        const token = job.msg.token;
+        const cmd = job.msg.cmd;
+        const args = job.msg.args;
+        const binaryReply = requestsBinaryReply(job.msg.format);
         var s0 = t1.elapsed();
-        
-        /*
-         * Separate the first tuple, which is a string binary containing the JSON binary
-         * string encapsulating user, token, cmd, message format and args from the 
-         * remaining payload.
-         */
-        var (rawRequest, _) = reqMsgRaw.splitMsgToTuple(b"BINARY_PAYLOAD",2);
-        var payload = if reqMsgRaw.endsWith(b"BINARY_PAYLOAD") then socket.recv(bytes) else b"";
-        var user, token, cmd: string;
-
-        // parse requests, execute requests, format responses
-        try {
-            /*
-             * Decode the string binary containing the JSON-formatted request string. 
-             * If there is an error, discontinue processing message and send an error
-             * message back to the client.
-             */
-            var request : string;
-
-            try! {
-                request = rawRequest.decode();
-            } catch e: DecodeError {
-                asLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
-                       "illegal byte sequence in command: %t".format(
-                                          rawRequest.decode(decodePolicy.replace)));
-                sendRepMsg(serialize(msg=unknownError(e.message()),msgType=MsgType.ERROR,
-                                                 msgFormat=MsgFormat.STRING, user="Unknown"));
-            }
 
-            // deserialize the decoded, JSON-formatted cmdStr into a RequestMsg
-            var msg: RequestMsg  = extractRequest(request);
-            user   = msg.user;
-            token  = msg.token;
-            cmd    = msg.cmd;
-            var format = msg.format;
-            var args   = msg.args;
+        // keep the entries this request borrows alive until it completes
+        const commandId = st.beginCommand();
+        defer { st.endCommand(commandId); }
 
+        try {
             /*
              * If authentication is enabled with the --authenticate flag, authenticate
              * the user which for now consists of matching the submitted token
@@ -306,7 +300,7 @@ proc main() {
 
             if (trace) {
               try {
-                if (cmd != "array") {
+                if (cmd != "array" && cmd != "arrayChunk" && !commandMapPayload.contains(cmd)) {
                   asLogger.info(getModuleName(), getRoutineName(), getLineNumber(),
                                                      ">>> %t %t".format(cmd, args));
                 } else {
@@ -318,22 +312,12 @@ proc main() {
               }
             }
 
-            // If cmd is shutdown, don't bother generating a repMsg
-            if cmd == "shutdown" {
-                shutdown(user=user);
-                if (trace) {
-                    asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
-                                         "<<< shutdown initiated by %s took %.17r sec".format(user, 
-                                                   t1.elapsed() - s0));
-                }
-                break;
-            }
-
             /*
              * For messages that return a string repTuple is filled. For binary
-             * messages the message is sent directly to minimize copies.
+             * messages the reply is returned directly to minimize copies.
              */
             var repTuple: MsgTuple;
+            var repMsg: bytes;
             
             /**
              * Command processing: Look for our specialized, default commands first, then check the command maps
@@ -341,7 +325,8 @@ proc main() {
              *  up in the client.print_server_commands() function, but we need to intercept & process them as appropriate
              */
             select cmd {
-                when "array"   { repTuple = arrayMsg(cmd, args, payload, st); }
+                when "array"   { repTuple = arrayMsg(cmd, args, job.payload, st); }
+                when "arrayChunk" { repTuple = arrayChunkMsg(cmd, args, job.payload, st); }
                 when "connect" {
                     if authenticate {
                         repTuple = new MsgTuple("connected to arkouda server tcp://*:%i as user %s with token %s".format(
@@ -367,8 +352,15 @@ proc main() {
                     } else if commandMapBinary.contains(cmd) { // Binary response commands require different handling
                         if moduleMap.contains(cmd) then
                           usedModules.add(moduleMap[cmd]);
-                        var binaryRepMsg = commandMapBinary.getBorrowed(cmd)(cmd, args, st);
-                        sendRepMsg(binaryRepMsg);
+                        repMsg = commandMapBinary.getBorrowed(cmd)(cmd, args, st);
+                        if trace {
+                            asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                                                        "repMsg: <binary-data>");
+                        }
+                    } else if commandMapPayload.contains(cmd) { // Commands receiving a binary payload
+                        if moduleMap.contains(cmd) then
+                          usedModules.add(moduleMap[cmd]);
+                        repTuple = commandMapPayload.getBorrowed(cmd)(cmd, args, job.payload, st);
                     } else {
                       repTuple = new MsgTuple("Unrecognized command: %s".format(cmd), MsgType.ERROR);
                       asLogger.error(getModuleName(),getRoutineName(),getLineNumber(),repTuple.msg);
@@ -377,16 +369,14 @@ proc main() {
             }
 
             /*
-             * If the reply message is a string send it now
+             * If the reply message is a string serialize it now
              */          
             if !repTuple.msg.isEmpty() {
-                sendRepMsg(serialize(msg=repTuple.msg,msgType=repTuple.msgType,
-                                                              msgFormat=MsgFormat.STRING, user=user));
+                repMsg = formatReply(repTuple.msg, repTuple.msgType, user, binaryReply, repTuple.created);
             }
 
             /*
-             * log that the request message has been handled and reply message has been sent along with 
-             * the time to do so
+             * log that the request message has been handled along with the time to do so
              */
             if trace {
                 asLogger.info(getModuleName(),getRoutineName(),getLineNumber(), 
@@ -396,30 +386,120 @@ proc main() {
                 asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
                     "bytes of memory used after command %t".format(getMemUsed():uint * numLocales:uint));
             }
+            return repMsg;
         } catch (e: ErrorWithMsg) {
-            // Generate a ReplyMsg of type ERROR and serialize to a JSON-formatted string
-            sendRepMsg(serialize(msg=e.msg,msgType=MsgType.ERROR, msgFormat=MsgFormat.STRING, 
-                                                        user=user));
             if trace {
-                asLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
+                try! asLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
                     "<<< %s resulted in error %s in  %.17r sec".format(cmd, e.msg, t1.elapsed() - s0));
             }
+            // Generate a ReplyMsg of type ERROR and serialize it in the requested format
+            return try! formatReply(e.msg, MsgType.ERROR, user, binaryReply);
         } catch (e: Error) {
-            // Generate a ReplyMsg of type ERROR and serialize to a JSON-formatted string
             var errorMsg = e.message();
             
             if errorMsg.isEmpty() {
                 errorMsg = "unexpected error";
             }
 
-            sendRepMsg(serialize(msg=errorMsg,msgType=MsgType.ERROR, 
-                                                         msgFormat=MsgFormat.STRING, user=user));
             if trace {
-                asLogger.error(getModuleName(), getRoutineName(), getLineNumber(), 
+                try! asLogger.error(getModuleName(), getRoutineName(), getLineNumber(), 
                     "<<< %s resulted in error: %s in %.17r sec".format(cmd, e.message(),
                                                                                  t1.elapsed() - s0));
             }
+            // Generate a ReplyMsg of type ERROR and serialize it in the requested format
+            return try! formatReply(errorMsg, MsgType.ERROR, user, binaryReply);
+        }
+    }
+
+    /*
+     * Requests are queued per user and run on up to serverWorkers worker tasks,
+     * see RequestScheduler. Only the main task receives and sends on the socket.
+     */
+    var scheduler = new owned Scheduler(serverWorkers);
+
+    // wait for the running requests before leaving main
+    sync {
+      while !shutdownServer {
+        // send the replies of the requests that completed
+        for reply in scheduler.takeCompleted() {
+            sendRepMsg(reply.job.identity, reply.reply);
+        }
+
+        // start the queued requests that may run now
+        while !shutdownServer {
+            var (found, job) = scheduler.next();
+            if !found then break;
+            if job.msg.cmd == "shutdown" {
+                shutdown(job);
+            } else if isExclusive(job.msg.cmd) {
+                sendRepMsg(job.identity, processRequest(job));
+                scheduler.finish(job);
+            } else {
+                begin with (in job) {
+                    scheduler.complete(job, processRequest(job));
+                }
+            }
+        }
+        if shutdownServer then break;
+
+        // wait for the next request, or briefly if requests are running
+        if !pollRequest(socket, if scheduler.idle() then -1 else 1) then continue;
+
+        /*
+         * Receive the envelope of the next request: the identity of the client
+         * socket, the empty delimiter and the request, which is followed by a
+         * payload frame if it ends with BINARY_PAYLOAD
+         */
+        var identity = socket.recv(bytes);
+        var delimiter = socket.recv(bytes);
+        var reqMsgRaw = socket.recv(bytes);
+
+        reqCount += 1;
+
+        /*
+         * Separate the first tuple, which is a string binary containing the JSON binary
+         * string encapsulating user, token, cmd, message format and args from the 
+         * remaining payload.
+         */
+        var (rawRequest, _) = reqMsgRaw.splitMsgToTuple(b"BINARY_PAYLOAD",2);
+        var payload = if reqMsgRaw.endsWith(b"BINARY_PAYLOAD") then socket.recv(bytes) else b"";
+
+        try {
+            /*
+             * Decode the string binary containing the JSON-formatted request string
+             * and deserialize it into a RequestMsg. If there is an error, discontinue
+             * processing message and send an error message back to the client.
+             */
+            var request : string;
+
+            try {
+                request = rawRequest.decode();
+            } catch e: DecodeError {
+                asLogger.error(getModuleName(),getRoutineName(),getLineNumber(),
+                       "illegal byte sequence in command: %t".format(
+                                          rawRequest.decode(decodePolicy.replace)));
+                sendRepMsg(identity, serialize(msg=unknownError(e.message()),msgType=MsgType.ERROR,
+                                                 msgFormat=MsgFormat.STRING, user="Unknown"):bytes);
+                continue;
+            }
+
+            var job = new Job(identity, extractRequest(request), payload);
+
+            /*
+             * Answer the liveness checks without waiting for the running requests,
+             * unless the socket has earlier requests outstanding: the replies to a
+             * socket must be sent in the order of its requests
+             */
+            if isImmediate(job.msg.cmd) && !scheduler.hasOutstanding(identity) {
+                sendRepMsg(identity, processRequest(job));
+            } else {
+                scheduler.enqueue(job);
+            }
+        } catch (e: Error) {
+            sendRepMsg(identity, serialize(msg=e.message(), msgType=MsgType.ERROR,
+                                                 msgFormat=MsgFormat.STRING, user="Unknown"):bytes);
         }
+      }
     }
 
     t1.stop();
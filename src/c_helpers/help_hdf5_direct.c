@@ -0,0 +1,87 @@
+/**
+ * External C functions for reading the data of contiguous HDF5 datasets
+ * directly from their files. A contiguous dataset without filters stores
+ * its elements as one block of bytes, so when they are stored with the
+ * in-memory type they can be copied into an array with plain preads.
+ */
+#include "c_helpers/help_hdf5_direct.h"
+
+#include <errno.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+/**
+ * C function to retrieve the offset in its file of the data of a dataset
+ * stored contiguously, without filters or external storage, with the
+ * memory type mem_type. Returns -1 if the dataset has to be read through
+ * the HDF5 library.
+ */
+int64_t c_contiguous_data_offset(hid_t dataset, hid_t mem_type)
+{
+    int64_t offset = -1;
+    hid_t plist = H5Dget_create_plist(dataset);
+    hid_t file_type = H5Dget_type(dataset);
+    if (plist >= 0 && file_type >= 0 &&
+        H5Pget_layout(plist) == H5D_CONTIGUOUS &&
+        H5Pget_nfilters(plist) == 0 &&
+        H5Pget_external_count(plist) == 0 &&
+        H5Tequal(file_type, mem_type) > 0)
+    {
+        haddr_t addr = H5Dget_offset(dataset);
+        if (addr != HADDR_UNDEF)
+        {
+            offset = (int64_t)addr;
+        }
+    }
+    if (file_type >= 0)
+    {
+        H5Tclose(file_type);
+    }
+    if (plist >= 0)
+    {
+        H5Pclose(plist);
+    }
+    return offset;
+}
+
+/**
+ * C function to read nbytes at offset of a file into buf, with preads of
+ * readahead bytes, asking the kernel to read ahead the next one while
+ * each is copied. Returns the number of bytes read, which is less than
+ * nbytes if the file could not be read.
+ */
+int64_t c_pread_contiguous(const char *filename, int64_t offset, int64_t nbytes,
+                           void *buf, int64_t readahead)
+{
+    int fd = open(filename, O_RDONLY);
+    if (fd < 0)
+    {
+        return -1;
+    }
+#ifdef POSIX_FADV_SEQUENTIAL
+    posix_fadvise(fd, (off_t)offset, (off_t)nbytes, POSIX_FADV_SEQUENTIAL);
+#endif
+    int64_t done = 0;
+    while (done < nbytes)
+    {
+        int64_t len = (nbytes - done < readahead) ? nbytes - done : readahead;
+#ifdef POSIX_FADV_WILLNEED
+        if (done + len < nbytes)
+        {
+            posix_fadvise(fd, (off_t)(offset + done + len), (off_t)readahead, POSIX_FADV_WILLNEED);
+        }
+#endif
+        ssize_t r = pread(fd, (char *)buf + done, (size_t)len, (off_t)(offset + done));
+        if (r < 0 && errno == EINTR)
+        {
+            continue;
+        }
+        if (r <= 0)
+        {
+            break;
+        }
+        done += r;
+    }
+    close(fd);
+    return done;
+}
@@ -0,0 +1,21 @@
+/**
+ * Function prototypes for HDF5 helper functions to read the data of
+ * contiguous datasets directly from their files, bypassing the HDF5
+ * library and its chunk cache.
+ * See HDF5Msg.read_files_into_distributed_array
+ */
+
+#ifndef _AK_HDF5_DIRECT_HELPER_H_
+#define _AK_HDF5_DIRECT_HELPER_H_
+
+#include "hdf5.h"
+#include <stdint.h>
+
+/* C function to retrieve the file offset of the data of a dataset that can be read directly */
+int64_t c_contiguous_data_offset(hid_t dataset, hid_t mem_type);
+
+/* C function to read a range of bytes of a file with preads and read-ahead */
+int64_t c_pread_contiguous(const char *filename, int64_t offset, int64_t nbytes,
+                           void *buf, int64_t readahead);
+
+#endif
@@ -1,3 +1,4 @@
+from unittest import mock
 from base_test import ArkoudaTest
 from context import arkouda as ak
 
@@ -65,6 +66,32 @@ class ClientTest(ArkoudaTest):
         self.assertTrue('arkoudaVersion' in config)
         self.assertTrue('INFO', config['logLevel'])
         
+    def test_binary_replies(self):
+        '''
+        Tests that binary replies are negotiated on connect and decoded
+        into the same results as JSON-formatted replies
+        '''
+        self.assertTrue(ak.client.get_config()['binaryReplies'])
+        self.assertTrue(ak.client._binary_replies)
+        a = ak.arange(10)
+        self.assertEqual(10, a.size)
+        self.assertEqual(ak.int64, a.dtype)
+        s = ak.array(['one', 'two', 'three'])
+        self.assertListEqual(['one', 'two', 'three'], s.to_ndarray().tolist())
+        with self.assertRaises(RuntimeError):
+            ak.pdarray.attach('not_a_registered_name')
+
+        ak.client.binaryReplies = False
+        try:
+            ak.disconnect()
+            ak.connect(server=ArkoudaTest.server, port=ArkoudaTest.port)
+            self.assertFalse(ak.client._binary_replies)
+            self.assertListEqual(list(range(10)), ak.arange(10).to_ndarray().tolist())
+        finally:
+            ak.client.set_defaults()
+            ak.disconnect()
+            ak.connect(server=ArkoudaTest.server, port=ArkoudaTest.port)
+
     def test_client_context(self):   
         '''
         Tests the ak.client.context method
@@ -139,4 +166,125 @@ class ClientTest(ArkoudaTest):
         expected_cmds = ["connect", "array", "create", "tondarray", "info", "str"]
         cmds = ak.client.get_server_commands()
         for cmd in expected_cmds:
-            self.assertTrue(cmd in cmds)
\ No newline at end of file
+            self.assertTrue(cmd in cmds)
+
+    def test_batch(self):
+        '''
+        Tests that commands queued by ak.batch() produce the same results
+        as unbatched commands and that server-side errors are raised when
+        the batch is sent
+        '''
+        a = ak.arange(10)
+        with ak.batch():
+            b = a * a
+            c = b + a
+            d = ak.abs(c)
+            self.assertTrue(c._is_pending())
+        self.assertFalse(d._is_pending())
+        self.assertListEqual([i*i + i for i in range(10)], d.to_ndarray().tolist())
+
+        # attribute access sends the queued commands
+        with ak.batch():
+            e = a + a
+            self.assertEqual(10, e.size)
+            self.assertListEqual([2*i for i in range(10)], e.to_ndarray().tolist())
+
+        with self.assertRaises(RuntimeError):
+            with ak.batch():
+                f = a + a
+                f + ak.arange(5)
+
+    def test_deferred_delete(self):
+        '''
+        Tests that the deletion of out-of-scope pdarrays is deferred until
+        the next command or until deleteThreshold deletions are pending
+        '''
+        a = ak.arange(10)
+        name = (a + 1).name
+        self.assertIn(name, ak.client._pending_deletes)
+        self.assertNotIn(name, ak.list_symbol_table())
+        self.assertFalse(ak.client._pending_deletes)
+
+        ak.client.deleteThreshold = 3
+        try:
+            names = [(a + i).name for i in range(3)]
+            self.assertFalse(ak.client._pending_deletes)
+            symbols = ak.list_symbol_table()
+            self.assertFalse(any(n in symbols for n in names))
+        finally:
+            ak.client.set_defaults()
+
+        # read-only commands are not sent in a batch with the deletions
+        name = (a + 1).name
+        with mock.patch('arkouda.client._send_with_deletes') as send_with_deletes:
+            str(a)
+            self.assertFalse(send_with_deletes.called)
+        self.assertFalse(ak.client._pending_deletes)
+        self.assertNotIn(name, ak.list_symbol_table())
+
+    def test_aio(self):
+        '''
+        Tests that several ak.aio requests can be in flight at once and that
+        server-side errors are raised by the awaitable
+        '''
+        import asyncio
+        a = ak.arange(10)
+        b = ak.array([3, 1, 2, 3, 1])
+
+        async def run():
+            return await asyncio.gather(ak.aio.to_ndarray(a),
+                                        ak.aio.generic_msg(cmd='getconfig'),
+                                        ak.aio.GroupBy(b),
+                                        ak.aio.to_ndarray(a + a))
+        nda, config, g, nda2 = asyncio.run(run())
+        self.assertListEqual(list(range(10)), nda.tolist())
+        self.assertListEqual([2*i for i in range(10)], nda2.tolist())
+        self.assertIn('numLocales', config)
+        self.assertListEqual([1, 2, 3], g.unique_keys.to_ndarray().tolist())
+
+        async def fail():
+            return await ak.aio.generic_msg(cmd='tondarray', args='not_a_name',
+                                            recv_binary=True)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(fail())
+        ak.aio.close()
+
+    def test_aio_chunked_to_ndarray(self):
+        '''
+        Tests that ak.aio.to_ndarray streams arrays larger than
+        client.transferChunkBytes in chunks
+        '''
+        import asyncio
+        a = ak.arange(1000)
+        b = ak.array([True, False] * 50)
+        ak.client.transferChunkBytes = 64
+        ak.client.transferWindow = 3
+        try:
+            async def run():
+                return await asyncio.gather(ak.aio.to_ndarray(a), ak.aio.to_ndarray(b))
+            nda, ndb = asyncio.run(run())
+            self.assertListEqual(list(range(1000)), nda.tolist())
+            self.assertListEqual([True, False] * 50, ndb.tolist())
+        finally:
+            ak.client.set_defaults()
+            ak.aio.close()
+
+    def test_concurrent_requests(self):
+        '''
+        Tests that requests sent concurrently over several sockets are
+        each answered with the result of the request
+        '''
+        import asyncio
+        self.assertGreaterEqual(ak.client.get_config()['serverWorkers'], 1)
+        arrays = [ak.arange(i, i + 30) % (i + 2) for i in range(8)]
+
+        async def run():
+            return await asyncio.gather(*[ak.aio.GroupBy(a) for a in arrays],
+                                        *[ak.aio.to_ndarray(a) for a in arrays])
+        results = asyncio.run(run())
+        for i, a in enumerate(arrays):
+            self.assertListEqual(list(range(i + 2)),
+                                 results[i].unique_keys.to_ndarray().tolist())
+            self.assertListEqual(a.to_ndarray().tolist(), results[i + 8].tolist())
+        self.assertEqual('imok', ak.client.ruok())
+        ak.aio.close()
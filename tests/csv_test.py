@@ -0,0 +1,62 @@
+import glob, os
+import numpy as np
+import pandas as pd
+
+from base_test import ArkoudaTest
+from context import arkouda as ak
+
+'''
+Tests reading columns of CSV files with ak.read_csv
+'''
+class CSVTest(ArkoudaTest):
+
+    def tearDown(self):
+        for f in glob.glob('csv_test*'):
+            os.remove(f)
+
+    def test_read_csv(self):
+        # enough rows that the lines straddle the byte ranges of the tasks
+        n = 10000
+        df = pd.DataFrame({'ints': np.arange(n) - 500,
+                           'floats': np.arange(n) / 4,
+                           'bools': np.arange(n) % 3 == 0,
+                           'strs': ['s,"%d"' % (i % 17) if i % 5 else '' for i in range(n)]})
+        for i in range(3):
+            df[i * n // 3:(i + 1) * n // 3].to_csv(f'csv_test{i}.csv', index=False)
+
+        res = ak.read_csv('csv_test*.csv')
+        self.assertListEqual(['ints', 'floats', 'bools', 'strs'], list(res.keys()))
+        self.assertEqual(ak.int64, res['ints'].dtype)
+        self.assertEqual(ak.float64, res['floats'].dtype)
+        self.assertEqual(ak.bool, res['bools'].dtype)
+        for col in df.columns:
+            self.assertListEqual(df[col].tolist(), res[col].to_ndarray().tolist())
+
+        res = ak.read_csv('csv_test*.csv', columns=['strs', 'ints'], dtypes={'ints': ak.float64})
+        self.assertListEqual(['strs', 'ints'], list(res.keys()))
+        self.assertEqual(ak.float64, res['ints'].dtype)
+        self.assertListEqual(df['ints'].tolist(), res['ints'].to_ndarray().tolist())
+
+        ints = ak.read_csv('csv_test0.csv', columns='ints')
+        self.assertListEqual(df['ints'][:n // 3].tolist(), ints.to_ndarray().tolist())
+
+    def test_read_csv_delimiter_and_missing(self):
+        with open('csv_test.tsv', 'w') as f:
+            f.write('a\tb\tc\r\n1\t\tTrue\r\n2\t2.5\tfalse\r\n\r\n3\t-1\tTRUE\r\n')
+        res = ak.read_csv('csv_test.tsv', delimiter='\t')
+        self.assertListEqual([1, 2, 3], res['a'].to_ndarray().tolist())
+        self.assertTrue(np.isnan(res['b'][0]))
+        self.assertListEqual([2.5, -1.0], res['b'][1:].to_ndarray().tolist())
+        self.assertListEqual([True, False, True], res['c'].to_ndarray().tolist())
+
+        strs = ak.read_csv('csv_test.tsv', columns='c', dtypes={'c': 'str'}, delimiter='\t')
+        self.assertListEqual(['True', 'false', 'TRUE'], strs.to_ndarray().tolist())
+
+        with self.assertRaises(RuntimeError):
+            ak.read_csv('csv_test.tsv', columns='c', dtypes={'c': ak.int64}, delimiter='\t')
+        with self.assertRaises(RuntimeError):
+            ak.read_csv('csv_test.tsv', columns='d', delimiter='\t')
+        with self.assertRaises(ValueError):
+            ak.read_csv('csv_test.tsv', delimiter='\t\t')
+        with self.assertRaises(ValueError):
+            ak.read_csv('csv_test.tsv', dtypes={'a': ak.uint8}, delimiter='\t')
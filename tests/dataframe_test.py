@@ -1,4 +1,5 @@
 import pandas as pd  # type: ignore
+from unittest import mock
 
 from base_test import ArkoudaTest
 from context import arkouda as ak
@@ -120,6 +121,47 @@ class DataFrameTest(ArkoudaTest):
         df = ak.DataFrame.from_pandas(ref_df)
         self.assertTrue(((ref_df == df.to_pandas()).all()).all())
 
+    def test_arrow_round_trip(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        ref_df = pd.DataFrame({'name': ['Alice', 'Bob', 'Alice', 'Carol'],
+                               'group': pd.Categorical(['x', 'y', 'x', 'z']),
+                               'when': pd.to_datetime([0, 10**9, 2 * 10**9, 3 * 10**9]),
+                               'count': [1, 2, 3, 4],
+                               'flag': [True, False, True, True],
+                               'amount': [0.5, 0.6, 1.1, 1.2]})
+
+        df = ak.DataFrame.from_pandas(ref_df)
+        self.assertIsInstance(df['group'], ak.Categorical)
+        self.assertIsInstance(df['when'], ak.Datetime)
+        self.assertListEqual(df['name'].to_ndarray().tolist(), ref_df['name'].tolist())
+
+        table = df.to_arrow()
+        self.assertListEqual(table.column_names, list(ref_df.columns))
+
+        pd_df = df.to_pandas()
+        for col in ref_df.columns:
+            self.assertListEqual(pd_df[col].tolist(), ref_df[col].tolist())
+
+    def test_arrow_without_server_support(self):
+        # a server built without Parquet support has no Arrow IPC commands
+        ref_df = pd.DataFrame({'name': ['Alice', 'Bob', 'Alice', 'Carol'],
+                               'count': [1, 2, 3, 4],
+                               'amount': [0.5, 0.6, 1.1, 1.2]})
+        with mock.patch('arkouda.dataframe._server_has_command', return_value=False):
+            df = ak.DataFrame.from_pandas(ref_df)
+            pd_df = df.to_pandas()
+            for col in ref_df.columns:
+                self.assertListEqual(pd_df[col].tolist(), ref_df[col].tolist())
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                return
+            with self.assertRaises(RuntimeError):
+                df.to_arrow()
+
 
     def test_drop(self):
         # create an arkouda df.
@@ -278,6 +320,12 @@ class DataFrameTest(ArkoudaTest):
         self.assertListEqual(c.index.to_pandas().tolist(), ['Alice', 'Carol', 'Bob'])
         self.assertListEqual(c.values.to_ndarray().tolist(), [3, 1, 2])
 
+        res = gb.agg({'amount': ['sum', 'max'], 'day': 'min'})
+        self.assertIsInstance(res['amount']['sum'], ak.Series)
+        self.assertListEqual(res['amount']['sum'].index.to_pandas().tolist(), ['Alice', 'Carol', 'Bob'])
+        self.assertListEqual(res['amount']['max'].values.to_ndarray().tolist(), [1.1, 1.2, 4.3])
+        self.assertListEqual(res['day']['min'].values.to_ndarray().tolist(), [5, 5, 5])
+
     def test_to_pandas(self):
         username = ak.array(['Alice', 'Bob', 'Alice', 'Carol', 'Bob', 'Alice'])
         userid = ak.array([111, 222, 111, 333, 222, 111])
@@ -407,3 +455,29 @@ class DataFrameTest(ArkoudaTest):
         df_copy = df.copy(deep=False)
         df_copy.__setitem__('userID', ak.array([1, 2, 1, 3, 2, 1]))
         self.assertEqual(df.__repr__(), df_copy.__repr__())
+
+    def test_merge(self):
+        left = ak.DataFrame({'userID': ak.array([111, 222, 333, 111]),
+                             'name': ak.array(['Alice', 'Bob', 'Carol', 'Alice']),
+                             'amount': ak.array([0.5, 1.5, 2.5, 3.5])})
+        right = ak.DataFrame({'userID': ak.array([111, 222, 444]),
+                              'name': ak.array(['a', 'b', 'd']),
+                              'item': ak.array([1, 2, 4])})
+        merged = left.merge(right, on='userID')
+        self.assertListEqual(['userID', 'name_x', 'amount', 'name_y', 'item'], merged.columns)
+        pdf = merged.to_pandas().sort_values(['amount']).reset_index(drop=True)
+        self.assertListEqual([111, 222, 111], pdf['userID'].tolist())
+        self.assertListEqual(['Alice', 'Bob', 'Alice'], pdf['name_x'].tolist())
+        self.assertListEqual(['a', 'b', 'a'], pdf['name_y'].tolist())
+
+        outer = left.merge(right, on='userID', how='outer').to_pandas()
+        outer = outer.sort_values(['userID', 'amount']).reset_index(drop=True)
+        self.assertListEqual([111, 111, 222, 333, 444], outer['userID'].tolist())
+        self.assertListEqual(['a', 'a', 'b', '', 'd'], outer['name_y'].tolist())
+        self.assertListEqual([1, 1, 2, 0, 4], outer['item'].tolist())
+        self.assertTrue(pd.isna(outer['amount'][4]))
+
+        multi = left.merge(right, left_on=['userID', 'name'], right_on=['item', 'name'], how='left')
+        self.assertEqual(4, len(multi))
+        with self.assertRaises(ValueError):
+            left.merge(right)
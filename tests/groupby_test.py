@@ -4,6 +4,7 @@ from context import arkouda as ak
 from arkouda.dtypes import float64, int64
 from base_test import ArkoudaTest
 from arkouda.groupbyclass import GroupByReductionType
+from arkouda.pdarrayclass import RegistrationError
 
 SIZE = 100
 GROUPS = 8
@@ -52,7 +53,8 @@ def compare_keys(pdkeys, akkeys, levels, pdvals, akvals) -> int:
             if not np.allclose(pdkeys[l], akkeys[l].to_ndarray()):
                 print("Different keys")
                 return 1
-    if not np.allclose(pdvals, akvals):
+    # groups too small for var and std are NaN in both
+    if not np.allclose(pdvals, akvals, equal_nan=True):
         print(f"Different values (abs diff = {np.abs(pdvals - akvals).sum()})")
         return 1
     return 0
@@ -412,6 +414,215 @@ class GroupByTest(ArkoudaTest):
         g = ak.GroupBy(ak.zeros(0, dtype=ak.int64))
         str(g.segments)  # passing condition, if this was deleted it will cause the test to fail
 
+    def test_hash_method(self):
+        d = make_arrays()
+        akdf = {k:ak.array(v) for k, v in d.items()}
+        for keys in (akdf['keys'], akdf['keys2'], [akdf['keys'], akdf['keys2']]):
+            sg = ak.GroupBy(keys)
+            hg = ak.GroupBy(keys, method='hash')
+            self.assertEqual('hash', hg.method)
+            if isinstance(keys, list):
+                for sk, hk in zip(sg.unique_keys, hg.unique_keys):
+                    self.assertListEqual(sk.to_ndarray().tolist(), hk.to_ndarray().tolist())
+            else:
+                self.assertListEqual(sg.unique_keys.to_ndarray().tolist(),
+                                     hg.unique_keys.to_ndarray().tolist())
+            self.assertListEqual(sg.segments.to_ndarray().tolist(), hg.segments.to_ndarray().tolist())
+            for op in ('sum', 'prod', 'min', 'max', 'argmin', 'argmax'):
+                _, sv = sg.aggregate(akdf['int64'], op)
+                _, hv = hg.aggregate(akdf['int64'], op)
+                self.assertTrue(np.allclose(sv.to_ndarray(), hv.to_ndarray()))
+            _, sv = sg.mean(akdf['float64'])
+            _, hv = hg.mean(akdf['float64'])
+            self.assertTrue(np.allclose(sv.to_ndarray(), hv.to_ndarray()))
+            _, counts = hg.count()
+            self.assertListEqual(sg.broadcast(counts).to_ndarray().tolist(),
+                                 hg.broadcast(counts).to_ndarray().tolist())
+            self.assertListEqual(sg.permutation.to_ndarray().tolist(),
+                                 hg.permutation.to_ndarray().tolist())
+
+        s = ak.array(['a', 'b', 'a', 'b', 'c'])
+        labels, values = ak.GroupBy(s, method='hash').sum(ak.arange(s.size))
+        self.assertDictEqual({'a': 2, 'b': 4, 'c': 4},
+                             {l: v for l, v in zip(labels.to_ndarray(), values.to_ndarray())})
+
+        # more groups than HashMaxGroups falls back to sorting
+        ak.GroupBy.HashMaxGroups = 4
+        try:
+            g = ak.GroupBy(akdf['keys'], method='hash')
+            self.assertEqual('sort', g.method)
+        finally:
+            ak.GroupBy.HashMaxGroups = 2**18
+
+        # float and bool keys fall back to sorting
+        for keys in (ak.array([0.5, 1.5, 0.5]), ak.array([True, False, True])):
+            g = ak.GroupBy(keys, method='hash')
+            self.assertEqual('sort', g.method)
+            self.assertEqual(2, g.ngroups)
+
+        # the mean of a group of NaN values is NaN, as when sorting
+        _, means = ak.GroupBy(ak.array([0, 0, 1]), method='hash').mean(ak.array([np.nan, np.nan, 1.0]))
+        self.assertTrue(np.isnan(means[0]))
+        self.assertEqual(1.0, means[1])
+
+        with self.assertRaises(ValueError):
+            ak.GroupBy(akdf['keys'], method='radix')
+
+    def test_agg(self):
+        d = make_arrays()
+        akdf = {k:ak.array(v) for k, v in d.items()}
+        ops = ['sum', 'min', 'max', 'mean', 'argmin', 'argmax']
+        for method in ('sort', 'hash'):
+            g = ak.GroupBy([akdf['keys'], akdf['keys2']], method=method)
+            keys, res = g.agg({'i': (akdf['int64'], ops), 'f': (akdf['float64'], ['sum', 'mean']),
+                               'b': (akdf['bool'], 'any'), 'u': (akdf['uint64'], 'nunique')})
+            self.assertEqual(2, len(keys))
+            for op in ops:
+                _, expected = g.aggregate(akdf['int64'], op)
+                self.assertTrue(np.allclose(expected.to_ndarray(), res['i'][op].to_ndarray()))
+            for op in ('sum', 'mean'):
+                _, expected = g.aggregate(akdf['float64'], op)
+                self.assertTrue(np.allclose(expected.to_ndarray(), res['f'][op].to_ndarray()))
+            self.assertListEqual(g.any(akdf['bool'])[1].to_ndarray().tolist(),
+                                 res['b']['any'].to_ndarray().tolist())
+            self.assertListEqual(g.nunique(akdf['uint64'])[1].to_ndarray().tolist(),
+                                 res['u']['nunique'].to_ndarray().tolist())
+
+        with self.assertRaises(ValueError):
+            self.igb.agg({'v': (self.ivalues, 'median_of_medians')})
+        with self.assertRaises(RuntimeError):
+            self.igb.agg({'v': (self.bvalues, 'prod')})
+
+    def test_var_std_quantile(self):
+        d = make_arrays()
+        df = pd.DataFrame(d)
+        akdf = {k:ak.array(v) for k, v in d.items()}
+        g = ak.GroupBy(akdf['keys'])
+        pdg = df.groupby('keys')
+        for vname in ('int64', 'uint64', 'float64'):
+            for ddof in (0, 1):
+                _, v = g.var(akdf[vname], ddof=ddof)
+                self.assertTrue(np.allclose(pdg[vname].var(ddof=ddof).values,
+                                            v.to_ndarray(), equal_nan=True))
+                _, s = g.std(akdf[vname], ddof=ddof)
+                self.assertTrue(np.allclose(pdg[vname].std(ddof=ddof).values,
+                                            s.to_ndarray(), equal_nan=True))
+            _, m = g.median(akdf[vname])
+            self.assertTrue(np.allclose(pdg[vname].median().values, m.to_ndarray()))
+            for q in (0.0, 0.3, 0.75, 1.0):
+                _, qv = g.quantile(akdf[vname], q)
+                self.assertTrue(np.allclose(pdg[vname].quantile(q).values, qv.to_ndarray()))
+
+        keys = ak.array([0, 0, 0, 1, 1, 2])
+        vals = ak.array([1.0, np.nan, 3.0, np.nan, np.nan, 4.0])
+        g = ak.GroupBy(keys)
+        _, m = g.median(vals)
+        self.assertTrue(np.allclose([2.0, np.nan, 4.0], m.to_ndarray(), equal_nan=True))
+        _, m = g.median(vals, skipna=False)
+        self.assertTrue(np.allclose([np.nan, np.nan, 4.0], m.to_ndarray(), equal_nan=True))
+        _, v = g.var(vals)
+        self.assertTrue(np.allclose([2.0, np.nan, np.nan], v.to_ndarray(), equal_nan=True))
+
+        _, res = g.agg({'v': (vals, ['var', 'median', 'quantile'])}, ddof=0, q=0.0)
+        self.assertTrue(np.allclose([1.0, np.nan, 0.0], res['v']['var'].to_ndarray(),
+                                    equal_nan=True))
+        self.assertTrue(np.allclose([1.0, np.nan, 4.0], res['v']['quantile'].to_ndarray(),
+                                    equal_nan=True))
+        with self.assertRaises(ValueError):
+            g.quantile(vals, 1.5)
+
+    def test_grouping_cache(self):
+        keys = ak.array([3, 1, 2, 3, 1, 3])
+        g = ak.GroupBy(keys)
+        g2 = ak.GroupBy(keys)
+        self.assertListEqual(g.permutation.to_ndarray().tolist(),
+                             g2.permutation.to_ndarray().tolist())
+        self.assertListEqual([1, 2, 3], g2.unique_keys.to_ndarray().tolist())
+        self.assertListEqual([0, 2, 3], g2.segments.to_ndarray().tolist())
+
+        # cache hits return copies, which can be modified independently
+        g2.segments[1] = 1
+        g3 = ak.GroupBy(keys)
+        self.assertListEqual([0, 2, 3], g.segments.to_ndarray().tolist())
+        self.assertListEqual([0, 2, 3], g3.segments.to_ndarray().tolist())
+
+        # modifying the keys in place must not return the stale grouping
+        keys[0] = 0
+        g3 = ak.GroupBy(keys)
+        self.assertListEqual([0, 1, 2, 3], g3.unique_keys.to_ndarray().tolist())
+        self.assertListEqual([2, 1, 1, 2], g3.count()[1].to_ndarray().tolist())
+
+        s = ak.array(['b', 'a', 'b'])
+        k = keys[:3]
+        ak.GroupBy([s, k])
+        g4 = ak.GroupBy([s, k])
+        self.assertListEqual(['a', 'b', 'b'], g4.unique_keys[0].to_ndarray().tolist())
+
+        ak.GroupBy.UseGroupingCache = False
+        try:
+            g5 = ak.GroupBy(keys)
+            self.assertListEqual([0, 1, 2, 3], g5.unique_keys.to_ndarray().tolist())
+        finally:
+            ak.GroupBy.UseGroupingCache = True
+
+    def test_register_attach(self):
+        keys = ak.array([3, 1, 2, 3, 1, 3])
+        vals = ak.arange(6)
+        g = ak.GroupBy(keys).register('test_groupby')
+        self.assertTrue(g.is_registered())
+        g2 = ak.GroupBy.attach('test_groupby')
+        self.assertEqual(1, g2.nkeys)
+        self.assertEqual(3, g2.ngroups)
+        self.assertListEqual(g.sum(vals)[1].to_ndarray().tolist(),
+                             g2.sum(vals)[1].to_ndarray().tolist())
+        g.unregister()
+        self.assertFalse(g.is_registered())
+
+        s = ak.array(['b', 'a', 'b', 'c', 'a', 'a'])
+        ak.GroupBy([keys, s]).register('test_groupby2')
+        g3 = ak.GroupBy.attach('test_groupby2')
+        self.assertEqual(2, g3.nkeys)
+        self.assertListEqual(['a', 'b', 'a', 'b', 'c'], g3.unique_keys[1].to_ndarray().tolist())
+        ak.GroupBy.unregister_groupby_by_name('test_groupby2')
+        self.assertFalse(g3.is_registered())
+        with self.assertRaises(RegistrationError):
+            ak.GroupBy.attach('test_groupby2')
+
+    def test_update(self):
+        d = make_arrays()
+        akdf = {k:ak.array(v) for k, v in d.items()}
+        half = SIZE // 2
+        for keys in (['keys'], ['keys', 'keys2']):
+            old = [akdf[k][:half] for k in keys]
+            new = [akdf[k][half:] for k in keys]
+            g = ak.GroupBy(old[0] if len(keys) == 1 else old)
+            _, counts = g.count()
+            _, sums = g.sum(akdf['int64'][:half])
+            _, mins = g.min(akdf['float64'][:half])
+            g.update(new[0] if len(keys) == 1 else new)
+
+            full = ak.GroupBy(akdf[keys[0]] if len(keys) == 1 else [akdf[k] for k in keys])
+            self.assertListEqual(full.permutation.to_ndarray().tolist(),
+                                 g.permutation.to_ndarray().tolist())
+            self.assertListEqual(full.segments.to_ndarray().tolist(),
+                                 g.segments.to_ndarray().tolist())
+            self.assertListEqual(full.count()[1].to_ndarray().tolist(),
+                                 g.update_count(counts)[1].to_ndarray().tolist())
+            self.assertListEqual(full.sum(akdf['int64'])[1].to_ndarray().tolist(),
+                                 g.update_aggregate(akdf['int64'][half:], sums, 'sum')[1]
+                                 .to_ndarray().tolist())
+            self.assertTrue(np.allclose(full.min(akdf['float64'])[1].to_ndarray(),
+                                        g.update_aggregate(akdf['float64'][half:], mins, 'min')[1]
+                                        .to_ndarray()))
+
+        s = ak.array(['b', 'a', 'b'])
+        g = ak.GroupBy(s).update(ak.array(['c', 'a']))
+        self.assertListEqual(ak.GroupBy(ak.array(['b', 'a', 'b', 'c', 'a'])).permutation.to_ndarray().tolist(),
+                             g.permutation.to_ndarray().tolist())
+        with self.assertRaises(ValueError):
+            g.update_aggregate(ak.arange(2), ak.arange(2), 'mean')
+        with self.assertRaises(ValueError):
+            g.update([ak.arange(2), ak.arange(2)])
 
 def to_tuple_dict(labels, values):
     # transforms labels from list of arrays into a list of tuples by index and builds a dictionary
@@ -552,6 +552,27 @@ class IOTest(ArkoudaTest):
         self.assertTrue((a['integers'] == ak.arange(len(inttypes)*N)).all())
         self.assertTrue(np.allclose(a['floats'].to_ndarray(), np.arange(len(floattypes)*N, dtype=np.float64)))
     
+    def testDirectRead(self):
+        N = 1000
+        prefix = '{}/direct-read-test'.format(IOTest.io_test_dir)
+        for i in range(2):
+            with h5py.File('{}-{}'.format(prefix, i), 'w') as f:
+                # contiguous and read directly, except for the big endian and chunked ones
+                f.create_dataset('contiguous', data=np.arange(i*N, (i+1)*N, dtype=np.int64))
+                f.create_dataset('bigendian', data=np.arange(i*N, (i+1)*N, dtype='>i8'))
+                f.create_dataset('chunked', data=np.arange(i*N, (i+1)*N, dtype=np.float64),
+                                 chunks=(100,), compression='gzip')
+        for direct_io in (True, False):
+            a = ak.read(prefix+'*', direct_io=direct_io)
+            self.assertListEqual(list(range(2*N)), a['contiguous'].to_ndarray().tolist())
+            self.assertListEqual(list(range(2*N)), a['bigendian'].to_ndarray().tolist())
+            self.assertListEqual(list(range(2*N)), a['chunked'].to_ndarray().tolist())
+
+        strings = ak.array(['s{}'.format(i) for i in range(N)])
+        strings.save('{}/direct-read-strings'.format(IOTest.io_test_dir), dataset='strings')
+        r = ak.read('{}/direct-read-strings*'.format(IOTest.io_test_dir), direct_io=True)
+        self.assertListEqual(strings.to_ndarray().tolist(), r.to_ndarray().tolist())
+
     def testTo_ndarray(self):
         ones = ak.ones(10)
         n_ones = ones.to_ndarray()
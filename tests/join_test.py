@@ -128,3 +128,33 @@ class JoinTest(ArkoudaTest):
             ak.join_on_eq_with_dt(self.a1,self.a1,self.t1,self.t1*10,8,"ab_dt")
         with self.assertRaises(ValueError):
             ak.join_on_eq_with_dt(self.a1,self.a1,self.t1,self.t1*10,8,"abs_dt",-1)            
+
+    def test_join_keys(self):
+        left = ak.array([1, 2, 2, 3, 5])
+        right = ak.array([2, 3, 3, 4])
+        expected = {'inner': {(1, 0), (2, 0), (3, 1), (3, 2)}}
+        expected['left'] = expected['inner'] | {(0, -1), (4, -1)}
+        expected['right'] = expected['inner'] | {(-1, 3)}
+        expected['outer'] = expected['left'] | expected['right']
+        for how, pairs in expected.items():
+            for method in ('hash', 'sort', 'auto'):
+                l, r = ak.join_keys(left, right, how=how, method=method)
+                self.assertSetEqual(pairs, set(zip(l.to_ndarray().tolist(), r.to_ndarray().tolist())))
+
+    def test_join_keys_multi(self):
+        left = [ak.array([1, 1, 2, 2]), ak.array(['a', 'b', 'a', 'b'])]
+        right = [ak.array([2, 1, 1]), ak.Categorical(ak.array(['a', 'b', 'c']))]
+        l, r = ak.join_keys(left, right)
+        self.assertSetEqual({(2, 0), (1, 1)}, set(zip(l.to_ndarray().tolist(), r.to_ndarray().tolist())))
+
+        keys = ak.randint(0, 1000, 10000)
+        values = ak.randint(0, 1000, 500)
+        hl, hr = ak.join_keys([keys, keys % 3], [values, values % 3], how='outer', method='hash')
+        sl, sr = ak.join_keys([keys, keys % 3], [values, values % 3], how='outer', method='sort')
+        self.assertSetEqual(set(zip(hl.to_ndarray().tolist(), hr.to_ndarray().tolist())),
+                            set(zip(sl.to_ndarray().tolist(), sr.to_ndarray().tolist())))
+
+        with self.assertRaises(TypeError):
+            ak.join_keys(ak.array([1, 2]), ak.array(['1', '2']))
+        with self.assertRaises(ValueError):
+            ak.join_keys(ak.array([1, 2]), ak.array([1, 2]), how='cross')
@@ -1,7 +1,7 @@
-import unittest, json
+import unittest, json, struct
 from context import arkouda
 from arkouda.message import RequestMessage, MessageFormat, ReplyMessage, \
-     MessageType
+     MessageType, CreatedReply
 
 class MessageTest(unittest.TestCase):
 
@@ -87,4 +87,30 @@ class MessageTest(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             ReplyMessage.fromdict({ 'msg' : 'normal result', 'msgType': 'NORMAL'})
-    
\ No newline at end of file
+    
+
+    def testBinaryReplyMessage(self):
+        msg = RequestMessage(user='user1', token='token', cmd='create',
+                             replyFormat=MessageFormat.BINARY)
+        self.assertEqual('{"user": "user1", "token": "token", "cmd": "create", "format": "STRING/BINARY", "args": ""}',
+                         json.dumps(msg.asdict()))
+
+        # replies made of created entries only carry no text
+        descriptors = struct.pack('<HH', 0, 4) + b'id_1' + struct.pack('<B', 5) + b'int64' + \
+                      struct.pack('<qBqq', 10, 1, 10, 8) + \
+                      struct.pack('<HH', 1, 4) + b'id_2' + struct.pack('<B', 4) + b'bool' + \
+                      struct.pack('<qBqq', 3, 1, 3, 1)
+        reply = ReplyMessage.frombinary(struct.pack('<BH', 0, 2) + descriptors)
+        self.assertEqual(MessageType.NORMAL, reply.msgType)
+        self.assertEqual('created id_1 int64 10 1 (10) 8+created id_2 bool 3 1 (3) 1', reply.msg)
+        self.assertIsInstance(reply.msg, CreatedReply)
+        left, right = reply.msg.split('+')
+        self.assertEqual({0: ('id_1', 'int64', 10, 1, [10], 8)}, left.entries)
+        self.assertEqual({0: ('id_2', 'bool', 3, 1, [3], 1)}, right.entries)
+
+        reply = ReplyMessage.frombinary(struct.pack('<BH', 2, 0) + b'Error: unknown symbol')
+        self.assertEqual(ReplyMessage(msg='Error: unknown symbol', msgType=MessageType.ERROR, user=''),
+                         reply)
+
+        with self.assertRaises(ValueError):
+            ReplyMessage.frombinary(struct.pack('<BH', 0, 1) + b'id')
@@ -314,6 +314,33 @@ class OperatorsTest(ArkoudaTest):
         self.assertEqual("array([False False False ... False False False])", ak.isnan(ak.linspace(0, 10, 20)).__repr__())
         ak.client.pdarrayIterThresh = ak.client.pdarrayIterThreshDefVal  # Don't forget to set this back for other tests.
 
+    def test_lazy_evaluation(self):
+        '''
+        Tests that expressions evaluated lazily via fused server commands match
+        eager evaluation
+        '''
+        a = ak.arange(-10, 10)
+        b = ak.linspace(1, 5, 20)
+        c = ak.arange(20) % 3 == 0
+
+        eager = [a*b + a - 1, (a // 3) % 4, a / 7 + b ** 2, ak.abs(a) + ak.exp(b),
+                 ak.where(c, a, 5) >= a - 2, (a > 0) & c, c + a, ak.sin(b) * ak.cos(a)]
+        with ak.lazy():
+            lazy = [a*b + a - 1, (a // 3) % 4, a / 7 + b ** 2, ak.abs(a) + ak.exp(b),
+                    ak.where(c, a, 5) >= a - 2, (a > 0) & c, c + a, ak.sin(b) * ak.cos(a)]
+        for e, l in zip(eager, lazy):
+            self.assertTrue('_expr' in l.__dict__)
+            self.assertEqual(e.dtype, l.dtype)
+            self.assertTrue(np.allclose(e.to_ndarray(), l.to_ndarray(), equal_nan=True))
+            self.assertFalse('_expr' in l.__dict__)
+
+        # uint64 operations are evaluated eagerly
+        u = ak.arange(10, dtype=ak.uint64)
+        with ak.lazy():
+            v = u + u
+            ak.evaluate(v)
+        self.assertListEqual((2*np.arange(10)).tolist(), v.to_ndarray().tolist())
+
 
 
 if __name__ == '__main__':
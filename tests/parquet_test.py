@@ -159,6 +159,83 @@ class ParquetTest(ArkoudaTest):
         for key in ak_dict:
             self.assertTrue((ak_vals[key] == ak_dict[key]).all())
 
+    def test_read_parquet_filters(self):
+        ts = ak.arange(100)
+        ts.save_parquet("pq_testfilter", "ts")
+        (ts % 7).save_parquet("pq_testfilter", "key", mode='append')
+        ak.array([f"s{i}" for i in range(100)]).save_parquet("pq_testfilter", "name", mode='append')
+
+        res = ak.read_parquet("pq_testfilter*", ['ts', 'name'],
+                              filters=[('ts', '>=', 90), ('key', 'in', [0, 1])])
+        expected = [i for i in range(90, 100) if i % 7 in (0, 1)]
+        self.assertListEqual(expected, res['ts'].to_ndarray().tolist())
+        self.assertListEqual([f"s{i}" for i in expected], res['name'].to_ndarray().tolist())
+
+        self.assertListEqual(['s3'], ak.read_parquet("pq_testfilter*", 'name',
+                                                     filters=[('name', '==', 's3')]).to_ndarray().tolist())
+        # statistics rule out every row group
+        self.assertEqual(0, ak.read_parquet("pq_testfilter*", 'ts', filters=[('ts', '>', 1000)]).size)
+        self.assertListEqual(list(range(100)), ak.read_parquet("pq_testfilter*", 'ts').to_ndarray().tolist())
+
+        with self.assertRaises(ValueError):
+            ak.read_parquet("pq_testfilter*", 'ts', filters=[('ts', '~', 1)])
+        with self.assertRaises(RuntimeError):
+            ak.read_parquet("pq_testfilter*", 'ts', filters=[('ts', '==', 'one')])
+
+        for f in glob.glob('pq_test*'):
+            os.remove(f)
+
+    def test_read_parquet_timestamp_filters(self):
+        import pandas as pd
+        times = pd.date_range('2022-01-01', periods=10, freq='D')
+        # version 2.6 keeps the nanosecond timestamps that filters compare with
+        pd.DataFrame({'t': times, 'v': np.arange(10)}).to_parquet('pq_testtime.parquet', index=False,
+                                                                  row_group_size=4, version='2.6')
+        res = ak.read_parquet('pq_testtime*', ['t', 'v'], filters=[('t', '>=', times[6])])
+        self.assertListEqual([6, 7, 8, 9], res['v'].to_ndarray().tolist())
+        self.assertListEqual(times[6:].asi8.tolist(), res['t'].to_ndarray().tolist())
+
+        for f in glob.glob('pq_test*'):
+            os.remove(f)
+
+    def test_save_all_parquet_table(self):
+        df = ak.DataFrame({'ts': ak.arange(100), 'flt': ak.linspace(0, 1, 100),
+                           'flag': ak.arange(100) % 2 == 0,
+                           'name': ak.array([f"s{i}" for i in range(100)])})
+        for compression in [None, 'snappy', 'zstd']:
+            df.to_parquet("pq_testtable", row_group_size=16, compression=compression)
+            res = ak.read("pq_testtable*")
+            self.assertListEqual(sorted(df.columns), sorted(res.keys()))
+            for col in df.columns:
+                self.assertListEqual(df[col].to_ndarray().tolist(), res[col].to_ndarray().tolist())
+
+        # the row group statistics written with the table prune filtered reads
+        res = ak.read_parquet("pq_testtable*", 'name', filters=[('ts', '<', 3)])
+        self.assertListEqual(['s0', 's1', 's2'], res.to_ndarray().tolist())
+
+        with self.assertRaises(ValueError):
+            ak.save_all([ak.arange(10)], "pq_testtable", file_format='Parquet', mode='append')
+        with self.assertRaises(ValueError):
+            ak.save_all([ak.arange(10)], "pq_testtable", file_format='Parquet', compression='brotli')
+        with self.assertRaises(RuntimeError):
+            ak.save_all([ak.arange(10), ak.arange(5)], "pq_testtable", file_format='Parquet')
+
+        for f in glob.glob('pq_test*'):
+            os.remove(f)
+
+    def test_read_row_groups(self):
+        # many row groups per file, some straddling the locale boundaries
+        ints = ak.arange(1000)
+        strs = ak.array(['x' * (i % 13) for i in range(1000)])
+        ak.save_all({'ints': ints, 'strs': strs}, "pq_testgroups", file_format='Parquet',
+                    row_group_size=7)
+        res = ak.read("pq_testgroups*")
+        self.assertListEqual(ints.to_ndarray().tolist(), res['ints'].to_ndarray().tolist())
+        self.assertListEqual(strs.to_ndarray().tolist(), res['strs'].to_ndarray().tolist())
+
+        for f in glob.glob('pq_test*'):
+            os.remove(f)
+
     def test_null_strings(self):
         datadir = 'resources/parquet-testing'
         basename = 'null-strings.parquet'
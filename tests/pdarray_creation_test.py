@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import datetime as dt
 from collections import deque
+from unittest import mock
 from base_test import ArkoudaTest
 from context import arkouda as ak
 
@@ -670,3 +671,55 @@ class PdarrayCreationTest(ArkoudaTest):
             npa += 1
             self.assertTrue(np.all(a == i+1))
             self.assertTrue(np.all(npa == i+1))
+
+    def test_chunked_transfer(self):
+        N = 1000
+        ak.client.transferChunkBytes = 64
+        ak.client.transferWindow = 3
+        try:
+            for a in (np.random.randint(-N, N, N), np.random.uniform(size=N),
+                      np.random.randint(0, 2, N).astype(bool),
+                      np.random.randint(1, N, N).newbyteorder().byteswap()):
+                aka = ak.array(a)
+                self.assertEqual(N, aka.size)
+                self.assertTrue(np.array_equal(a, aka.to_ndarray()))
+
+            aka = ak.arange(N)
+            out = np.empty(N, dtype=np.int64)
+            self.assertIs(out, aka.to_ndarray(out=out))
+            self.assertListEqual(list(range(N)), out.tolist())
+
+            buf = bytearray(N * 8)
+            aka.to_ndarray(out=buf)
+            self.assertListEqual(list(range(N)), np.frombuffer(buf, dtype=np.int64).tolist())
+
+            with self.assertRaises(ValueError):
+                aka.to_ndarray(out=np.empty(N, dtype=np.float64))
+            with self.assertRaises(ValueError):
+                aka.to_ndarray(out=np.empty(N - 1, dtype=np.int64))
+        finally:
+            ak.client.set_defaults()
+
+    def test_chunked_to_ndarray_requests(self):
+        # every element is requested once, in chunks of transferChunkBytes
+        N = 1000
+        aka = ak.arange(N)
+        ak.client.transferChunkBytes = 64
+        stream = ak.client._stream_chunks
+        requests = []
+
+        def spy(cmd, chunks, on_reply, recv_binary=False):
+            chunks = list(chunks)
+            requests.extend(args for args, _ in chunks)
+            stream(cmd, iter(chunks), on_reply, recv_binary=recv_binary)
+
+        try:
+            with mock.patch('arkouda.client._stream_chunks', spy):
+                self.assertListEqual(list(range(N)), aka.to_ndarray().tolist())
+                out = np.zeros(N, dtype=np.int64)
+                aka.to_ndarray(out=out)
+                self.assertListEqual(list(range(N)), out.tolist())
+        finally:
+            ak.client.set_defaults()
+        self.assertEqual(2 * (N * 8 // 64), len(requests))
+        self.assertEqual(f'{aka.name} 992 8', requests[-1])
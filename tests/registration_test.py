@@ -285,6 +285,28 @@ class RegistrationTest(ArkoudaTest):
         self.assertTrue('keep' in ak.list_registry())
         cleanup()
 
+    def test_metadata_cache(self):
+        """
+        Tests that cached info entries and registry are invalidated by registration changes
+        """
+        cleanup()
+        a = ak.ones(10, dtype=ak.int64)
+        info = json.loads(a.info())[0]
+        self.assertEqual(info, ak.client._metadata_cache.entries[a.name])
+        self.assertEqual(info, json.loads(a.info())[0])
+        self.assertFalse(a.is_registered())
+        self.assertIsNotNone(ak.client._metadata_cache.registry)
+
+        a.register('keep')
+        self.assertIsNone(ak.client._metadata_cache.registry)
+        self.assertTrue(a.is_registered())
+        self.assertTrue(json.loads(a.info())[0]['registered'])
+
+        a.unregister()
+        self.assertFalse(a.is_registered())
+        self.assertFalse(json.loads(a.info())[0]['registered'])
+        cleanup()
+
     def test_string_registration_suite(self):
         cleanup()
         # Initial registration should set name
@@ -312,6 +312,33 @@ class SetOpsTest(ArkoudaTest):
         answer = ak.array([x < 2 for x in vals])
         self.assertTrue((answer == ak.in1d(stringsOne,stringsTwo)).all())
 
+    def test_in1d_methods(self):
+        a = ak.randint(0, 2**20, 100000)
+        b = ak.randint(0, 2**20, 1000)
+        expected = ak.in1d(a, b, method='sort').to_ndarray()
+        for method in ('auto', 'hash', 'bloom'):
+            self.assertListEqual(expected.tolist(), ak.in1d(a, b, method=method).to_ndarray().tolist())
+        self.assertFalse((ak.in1d(a, b, invert=True, method='bloom').to_ndarray() == expected).any())
+
+        stringsOne = ak.array(['String {}'.format(i % 7) for i in range(50)])
+        stringsTwo = ak.array(['String {}'.format(i) for i in range(0, 7, 2)])
+        answer = [i % 7 % 2 == 0 for i in range(50)]
+        for method in ('auto', 'hash', 'sort', 'bloom'):
+            self.assertListEqual(answer, ak.in1d(stringsOne, stringsTwo, method=method).to_ndarray().tolist())
+            self.assertListEqual(answer, ak.in1d(ak.Categorical(stringsOne), stringsTwo,
+                                                 method=method).to_ndarray().tolist())
+        with self.assertRaises(ValueError):
+            ak.in1d(a, b, method='bitmap')
+
+    def test_in1dmulti_methods(self):
+        a = [ak.arange(10) % 3, ak.array(['x', 'y'] * 5)]
+        b = [ak.array([0, 1, 2]), ak.array(['x', 'x', 'y'])]
+        answer = [(i % 3, 'xy'[i % 2]) in {(0, 'x'), (1, 'x'), (2, 'y')} for i in range(10)]
+        for method in ('auto', 'hash', 'sort', 'bloom'):
+            self.assertListEqual(answer, ak.alignment.in1dmulti(a, b, method=method).to_ndarray().tolist())
+        inA, inB = ak.alignment.in1dmulti(a, b, symmetric=True)
+        self.assertListEqual([True, True, True], inB.to_ndarray().tolist())
+
     def test_multiarray_validation(self):
         x = [ak.arange(3), ak.arange(3), ak.arange(3)]
         y = [ak.arange(2), ak.arange(2)]
@@ -0,0 +1,79 @@
+import numpy as np
+
+from base_test import ArkoudaTest
+from context import arkouda as ak
+
+'''
+Tests the HyperLogLog and Count-Min sketches
+'''
+class SketchTest(ArkoudaTest):
+
+    def setUp(self):
+        ArkoudaTest.setUp(self)
+        self.values = ak.randint(0, 5000, 100000)
+        self.nunique = ak.unique(self.values).size
+
+    def test_approx_nunique(self):
+        est = ak.approx_nunique(self.values)
+        self.assertLess(abs(est - self.nunique), 0.05 * self.nunique)
+        self.assertEqual(10, ak.approx_nunique(ak.arange(1000) % 10))
+        strings = ak.array(['a', 'b', 'c', 'a', 'b'])
+        self.assertEqual(3, ak.approx_nunique(strings))
+        self.assertEqual(3, ak.approx_nunique(ak.array([0.5, 1.5, 0.5, 2.5])))
+        bools = ak.arange(1000) % 3 == 0
+        self.assertEqual(2, ak.approx_nunique(bools))
+        self.assertEqual(1, ak.approx_nunique(bools[bools]))
+        with self.assertRaises(RuntimeError):
+            ak.approx_nunique(self.values, precision=30)
+
+    def test_hyperloglog_merge(self):
+        h = ak.HyperLogLog(self.values[:50000])
+        h.update(self.values[50000:])
+        self.assertEqual(ak.HyperLogLog(self.values).estimate(), h.estimate())
+
+        h.register('test_hll')
+        self.assertTrue(h.is_registered())
+        h2 = ak.HyperLogLog.attach('test_hll')
+        self.assertEqual(h.precision, h2.precision)
+        h2.update(ak.arange(10**6, 10**6 + 5000))
+        self.assertEqual(h2.estimate(), ak.HyperLogLog.attach('test_hll').estimate())
+        h2.unregister()
+        self.assertFalse(h.is_registered())
+        with self.assertRaises(ValueError):
+            h.merge(ak.HyperLogLog(self.values, precision=8))
+
+    def test_groupby_approx_nunique(self):
+        keys = self.values % 7
+        g = ak.GroupBy(keys)
+        _, exact = g.nunique(self.values)
+        _, est = g.approx_nunique(self.values, precision=12)
+        self.assertTrue(np.allclose(exact.to_ndarray(), est.to_ndarray(), rtol=0.05))
+
+        g = ak.GroupBy(ak.array([1, 0, 1, 2, 1]))
+        _, est = g.approx_nunique(ak.array(['x', 'y', 'x', 'z', 'z']))
+        self.assertListEqual([1, 2, 1], est.to_ndarray().tolist())
+
+    def test_heavy_hitters(self):
+        values = ak.concatenate([ak.arange(1000), ak.full(300, 7, dtype=ak.int64), ak.full(200, 42, dtype=ak.int64),
+                                 ak.full(100, 3, dtype=ak.int64)])
+        keys, counts = ak.heavy_hitters(values, 3)
+        self.assertListEqual([7, 42, 3], keys.to_ndarray().tolist())
+        self.assertListEqual([301, 201, 101], counts.to_ndarray().tolist())
+
+        strings = ak.array(['a', 'b', 'b', 'c', 'b', 'c'])
+        keys, counts = ak.heavy_hitters(strings, 2)
+        self.assertListEqual(['b', 'c'], keys.to_ndarray().tolist())
+        self.assertListEqual([3, 2], counts.to_ndarray().tolist())
+
+    def test_count_min_merge(self):
+        first = ak.concatenate([ak.arange(100), ak.full(50, 5, dtype=ak.int64)])
+        second = ak.concatenate([ak.arange(100), ak.full(80, 9, dtype=ak.int64)])
+        cms = ak.CountMinSketch(first).register('test_cms')
+        cms2 = ak.CountMinSketch.attach('test_cms')
+        cms2.merge(ak.CountMinSketch(second))
+        keys, counts = ak.CountMinSketch.attach('test_cms').heavy_hitters(2)
+        self.assertListEqual([9, 5], keys.to_ndarray().tolist())
+        self.assertListEqual([82, 52], counts.to_ndarray().tolist())
+        self.assertListEqual([2, 82], cms2.estimate(ak.array([0, 9])).to_ndarray().tolist())
+        cms2.unregister()
+        self.assertFalse(cms.is_registered())
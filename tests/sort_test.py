@@ -68,3 +68,44 @@ class SortTest(ArkoudaTest):
             # Test attempt to sort Strings object, which is unsupported
             with self.assertRaises(TypeError):
                 ak.sort(ak.array(['String {}'.format(i) for i in range(0,10)]), algo)
+
+    def test_sorted_fast_paths(self):
+        s = ak.sort(ak.randint(0, 100, 1000))
+        self.assertListEqual(ak.arange(1000).to_ndarray().tolist(), ak.argsort(s).to_ndarray().tolist())
+        self.assertListEqual(ak.arange(1000).to_ndarray().tolist(),
+                             ak.coargsort([s, ak.arange(1000)]).to_ndarray().tolist())
+        u, c = ak.unique(s, return_counts=True)
+        self.assertEqual(1000, c.sum())
+        self.assertTrue(ak.is_sorted(u))
+        g = ak.GroupBy(s)
+        self.assertListEqual(u.to_ndarray().tolist(), g.unique_keys.to_ndarray().tolist())
+
+        # modifying the array forgets that it is sorted
+        s[0] = 1000
+        self.assertFalse(ak.is_sorted(s))
+        self.assertEqual(0, ak.argsort(s)[-1])
+        self.assertEqual(1000, ak.unique(s)[-1])
+
+        r = ak.arange(10)
+        self.assertListEqual([2, 3, 4], ak.intersect1d(r, ak.array([4, 2, 2, 3, 11])).to_ndarray().tolist())
+        self.assertListEqual([0, 1, 5, 6, 7, 8, 9],
+                             ak.setdiff1d(r, ak.array([4, 2, 2, 3, 11])).to_ndarray().tolist())
+        self.assertListEqual([False, True, True], ak.in1d(ak.array([-1, 3, 9]), r).to_ndarray().tolist())
+        r[5] = 2
+        self.assertListEqual([2, 3, 4], ak.intersect1d(r, ak.array([4, 2, 2, 3, 11])).to_ndarray().tolist())
+
+    def test_sample_sort(self):
+        # both sorts are stable, so they give the same permutation
+        ints = ak.randint(-2**40, 2**40, 10000) % 1000
+        floats = ak.randint(-1000, 1000, 10000, dtype=ak.float64)
+        uints = ak.randint(0, 2**63, 10000, dtype=ak.uint64)
+        for a in (ints, floats, uints):
+            expected = ak.argsort(a, ak.SortingAlgorithm.RadixSortLSD).to_ndarray().tolist()
+            for algo in (ak.SortingAlgorithm.SampleSort, ak.SortingAlgorithm.Auto):
+                self.assertListEqual(expected, ak.argsort(a, algo).to_ndarray().tolist())
+                self.assertListEqual(ak.sort(a).to_ndarray().tolist(), ak.sort(a, algo).to_ndarray().tolist())
+
+        strings = ak.array(['b', 'a', 'c', 'a', 'b'])
+        expected = ak.coargsort([strings, ints[:5]]).to_ndarray().tolist()
+        self.assertListEqual(expected, ak.coargsort([strings, ints[:5]],
+                                                    ak.SortingAlgorithm.SampleSort).to_ndarray().tolist())
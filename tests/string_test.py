@@ -510,6 +510,25 @@ class StringTest(ArkoudaTest):
         self.assertEqual("['string 0', 'string 1', 'string 2', ... , 'string 98', 'string 99', 'string 100']",
                          str(strings))
 
+    def test_to_ndarray_formats(self):
+        words = ['hello', '', 'wörld', 'ab', '日本語']
+        strings = ak.array(words)
+        self.assertListEqual(words, strings.to_ndarray().tolist())
+        self.assertEqual('<U3', strings[3:].to_ndarray().dtype.str)
+        self.assertListEqual([w.encode() for w in words],
+                             strings.to_ndarray(format='bytes').tolist())
+        obj = strings.to_ndarray(format='object')
+        self.assertEqual(object, obj.dtype)
+        self.assertListEqual(words, obj.tolist())
+        with self.assertRaises(ValueError):
+            strings.to_ndarray(format='unicode')
+
+        try:
+            import pyarrow
+        except ImportError:
+            return
+        self.assertListEqual(words, strings.to_arrow().to_pylist())
+
     def test_flatten(self):
         orig = ak.array(['one|two', 'three|four|five', 'six'])
         flat, mapping = orig.flatten('|', return_segments=True)
@@ -14,7 +14,8 @@ class SummarizationTest(ArkoudaTest):
         self.pda = ak.array(self.na)
     
     def testStd(self):
-        self.assertEqual(self.na.std(), self.pda.std())      
+        self.assertAlmostEqual(self.na.std(), self.pda.std())
+        self.assertAlmostEqual(self.na.std(ddof=1), self.pda.std(ddof=1))
         
     def testMin(self):
         self.assertEqual(self.na.min(), self.pda.min())   
@@ -26,7 +27,18 @@ class SummarizationTest(ArkoudaTest):
         self.assertEqual(self.na.mean(), self.pda.mean())   
         
     def testVar(self):
-        self.assertEqual(self.na.var(), self.pda.var())   
+        self.assertAlmostEqual(self.na.var(), self.pda.var())
+        self.assertAlmostEqual(self.na.var(ddof=1), self.pda.var(ddof=1))
+
+    def testMedian(self):
+        self.assertEqual(np.median(self.na), self.pda.median())
+        self.assertEqual(np.median(self.na[:-1]), ak.median(self.pda[:-1]))
+
+    def testQuantile(self):
+        for q in (0.0, 0.1, 0.5, 0.9, 1.0):
+            self.assertAlmostEqual(np.quantile(self.na, q), self.pda.quantile(q))
+        with self.assertRaises(ValueError):
+            ak.quantile(self.pda, -0.5)
 
     def testAny(self):
         self.assertEqual(self.na.any(), self.pda.any()) 